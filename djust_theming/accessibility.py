@@ -10,7 +10,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 
 from .presets import ColorScale, get_preset, THEME_PRESETS
-from .theme_packs import get_design_system, get_all_design_systems
+from .theme_packs import get_design_system, design_systems_view
 
 
 @dataclass
@@ -46,7 +46,7 @@ class AccessibilityValidator:
     AAA_LARGE = 4.5
     
     def __init__(self):
-        self.design_systems = get_all_design_systems()
+        self.design_systems = design_systems_view()
         self.color_presets = THEME_PRESETS
         
     def hsl_to_rgb(self, color_scale: ColorScale) -> Tuple[float, float, float]:
@@ -7,7 +7,14 @@ class DjustThemingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self):
+        from django.core.signals import setting_changed
+
         from . import checks  # noqa: F401 -- triggers @register
+        from .cache import on_setting_changed, warm_css_cache
+        from .manager import get_theme_config
         from .registry import get_registry
 
         get_registry().discover()
+        setting_changed.connect(on_setting_changed, dispatch_uid="djust_theming_css_cache")
+        if get_theme_config().get("warm_css_cache", False):
+            warm_css_cache()
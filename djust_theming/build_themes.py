@@ -6,17 +6,43 @@ eliminating runtime CSS generation overhead for production deployments.
 """
 
 import logging
+import multiprocessing
 import os
 import json
+from itertools import product
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 from .design_system_css import generate_design_system_css, generate_all_combinations_css
 from .presets import THEME_PRESETS
-from .theme_packs import get_all_design_systems
+from .theme_css_generator import minify_css
+from .theme_packs import design_systems_view
+
+
+def _build_single(design_name: str, preset_name: str, minify: bool) -> Tuple[str, str]:
+    """
+    Generate and optionally minify the CSS for one theme combination.
+
+    Runs in a worker process, so it only returns the filename and CSS;
+    the parent process does all file writes.
+    """
+    css = generate_design_system_css(
+        design_system_name=design_name,
+        color_preset_name=preset_name,
+        include_base_styles=True,
+        include_utilities=True
+    )
+    if minify:
+        css = minify_css(css)
+
+    filename = f"{design_name}-{preset_name}"
+    if minify:
+        filename += ".min"
+    filename += ".css"
+    return filename, css
 
 
 class BuildTimeGenerator:
@@ -24,10 +50,11 @@ class BuildTimeGenerator:
     
     def __init__(
         self,
-        output_dir: str = "static/themes",
+        output_dir: Union[str, Path] = "static/themes",
         minify: bool = True,
         include_source_maps: bool = False,
-        generate_manifest: bool = True
+        generate_manifest: bool = True,
+        processes: Optional[int] = 1
     ):
         """
         Initialize build-time generator.
@@ -37,11 +64,16 @@ class BuildTimeGenerator:
             minify: Whether to minify generated CSS
             include_source_maps: Generate CSS source maps for debugging
             generate_manifest: Create a manifest.json with theme metadata
+            processes: Worker processes for theme generation (1 = serial,
+                None = CPU count). Workers are forked so they inherit Django
+                settings and registered themes; without ``fork`` (Windows)
+                generation stays serial.
         """
         self.output_dir = Path(output_dir)
         self.minify = minify
         self.include_source_maps = include_source_maps
         self.generate_manifest = generate_manifest
+        self.processes = processes
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -50,42 +82,7 @@ class BuildTimeGenerator:
         """Basic CSS minification."""
         if not self.minify:
             return css
-            
-        # Remove comments
-        lines = []
-        in_comment = False
-        i = 0
-        while i < len(css):
-            if not in_comment and i < len(css) - 1 and css[i:i+2] == '/*':
-                in_comment = True
-                i += 2
-            elif in_comment and i < len(css) - 1 and css[i:i+2] == '*/':
-                in_comment = False
-                i += 2
-            elif not in_comment:
-                lines.append(css[i])
-                i += 1
-            else:
-                i += 1
-        
-        css = ''.join(lines)
-        
-        # Remove extra whitespace
-        css = ' '.join(css.split())
-        
-        # Remove spaces around certain characters
-        replacements = [
-            (' {', '{'), ('{ ', '{'),
-            (' }', '}'), ('} ', '}'),
-            (' :', ':'), (': ', ':'),
-            (' ;', ';'), ('; ', ';'),
-            (', ', ','), (' ,', ','),
-        ]
-        
-        for old, new in replacements:
-            css = css.replace(old, new)
-            
-        return css
+        return minify_css(css)
         
     def _generate_source_map(self, css: str, filename: str) -> str:
         """Generate a basic source map for debugging."""
@@ -112,48 +109,43 @@ class BuildTimeGenerator:
             List of (filename, file_path) tuples for generated files
         """
         generated_files = []
-        design_systems = get_all_design_systems()
+        design_systems = design_systems_view()
         
         logger.info("Generating %d theme combinations...", len(design_systems) * len(THEME_PRESETS))
         
-        for design_name in design_systems.keys():
-            for preset_name in THEME_PRESETS.keys():
-                # Generate CSS for this combination
-                css = generate_design_system_css(
-                    design_system_name=design_name,
-                    color_preset_name=preset_name,
-                    include_base_styles=True,
-                    include_utilities=True
-                )
-                
-                # Minify if requested
-                if self.minify:
-                    css = self._minify_css(css)
-                
-                # Generate filename
-                filename = f"{design_name}-{preset_name}"
-                if self.minify:
-                    filename += ".min"
-                filename += ".css"
+        # CSS generation and minification are CPU-bound, so fan the
+        # combinations out to worker processes and write files here.
+        jobs = [
+            (design_name, preset_name, self.minify)
+            for design_name, preset_name in product(design_systems.keys(), THEME_PRESETS.keys())
+        ]
+        if self.processes == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            results = [_build_single(*job) for job in jobs]
+        else:
+            # Fork explicitly: spawn/forkserver workers would re-import the
+            # package without Django settings or user-registered themes.
+            with multiprocessing.get_context("fork").Pool(self.processes) as pool:
+                results = pool.starmap(_build_single, jobs)
+        
+        for filename, css in results:
+            # Write CSS file
+            css_path = self.output_dir / filename
+            with open(css_path, 'w') as f:
+                f.write(css)
                 
-                # Write CSS file
-                css_path = self.output_dir / filename
-                with open(css_path, 'w') as f:
-                    f.write(css)
+            # Generate source map if requested
+            if self.include_source_maps:
+                source_map_content = self._generate_source_map(css, filename)
+                source_map_path = self.output_dir / f"{filename}.map"
+                with open(source_map_path, 'w') as f:
+                    f.write(source_map_content)
                     
-                # Generate source map if requested
-                if self.include_source_maps:
-                    source_map_content = self._generate_source_map(css, filename)
-                    source_map_path = self.output_dir / f"{filename}.map"
-                    with open(source_map_path, 'w') as f:
-                        f.write(source_map_content)
-                        
-                    # Add source map reference to CSS
-                    with open(css_path, 'a') as f:
-                        f.write(f"\n/*# sourceMappingURL={filename}.map */")
-                
-                generated_files.append((filename, str(css_path)))
-                logger.info("  Generated %s", filename)
+                # Add source map reference to CSS
+                with open(css_path, 'a') as f:
+                    f.write(f"\n/*# sourceMappingURL={filename}.map */")
+            
+            generated_files.append((filename, str(css_path)))
+            logger.info("  Generated %s", filename)
         
         return generated_files
         
@@ -166,7 +158,7 @@ class BuildTimeGenerator:
         """
         logger.info("Generating combined theme bundle...")
         
-        design_systems = get_all_design_systems()
+        design_systems = design_systems_view()
         css_parts = []
         
         # CSS Layers declaration
@@ -259,7 +251,7 @@ class BuildTimeGenerator:
             
         logger.info("Generating theme manifest...")
         
-        design_systems = get_all_design_systems()
+        design_systems = design_systems_view()
         
         # Build manifest data
         manifest = {
@@ -527,10 +519,11 @@ if (typeof module !== 'undefined' && module.exports) {
 
 
 def build_themes(
-    output_dir: str = "static/themes",
+    output_dir: Union[str, Path] = "static/themes",
     minify: bool = True,
     source_maps: bool = False,
-    manifest: bool = True
+    manifest: bool = True,
+    processes: Optional[int] = 1
 ) -> Dict[str, str]:
     """
     Convenience function to build all themes.
@@ -540,6 +533,8 @@ def build_themes(
         minify: Whether to minify CSS
         source_maps: Generate source maps for debugging
         manifest: Generate manifest.json
+        processes: Worker processes for theme generation (1 = serial,
+            None = CPU count)
         
     Returns:
         Dictionary of generated artifacts
@@ -548,7 +543,8 @@ def build_themes(
         output_dir=output_dir,
         minify=minify,
         include_source_maps=source_maps,
-        generate_manifest=manifest
+        generate_manifest=manifest,
+        processes=processes
     )
     
     return generator.build_all()
@@ -8,8 +8,18 @@ scratch every time.
 
 Call ``clear_css_cache()`` during development (or from a management command)
 to force regeneration after modifying theme definitions.
+
+``vary_on_theme`` applies the same idea to views: it caches a view's
+response per (path, theme state) for pages whose HTML only depends on the
+active theme.
 """
 
+from functools import wraps
+
+# Settings that feed into generated CSS. Changing one at runtime (e.g. with
+# ``override_settings`` in tests) drops the caches; see on_setting_changed().
+CSS_SETTINGS = frozenset({"LIVEVIEW_CONFIG", "DJUST_THEMES"})
+
 
 def clear_css_cache():
     """Clear all CSS generation caches.
@@ -17,19 +27,160 @@ def clear_css_cache():
     Calls ``cache_clear()`` on every cached convenience function:
 
     * ``css_generator.generate_theme_css``
+    * ``css_generator.render_theme_css``
     * ``theme_css_generator.generate_theme_css``
+    * ``theme_css_generator.generate_theme_critical_css``
+    * ``theme_css_generator.generate_theme_deferred_css``
+    * ``theme_css_generator._theme_vars_css`` (per-design-system ``:root`` block)
     * ``pack_css_generator.generate_pack_css``
+    * ``pack_css_generator.generate_pack_critical_css``
+    * ``pack_css_generator.generate_pack_deferred_css``
     * ``design_system_css.generate_design_system_css``
 
     Safe to call at any time; subsequent CSS generation calls will simply
     repopulate the cache on demand.
     """
     from .css_generator import generate_theme_css as _color_css
+    from .css_generator import render_theme_css as _color_vars
     from .theme_css_generator import generate_theme_css as _theme_css
+    from .theme_css_generator import generate_theme_critical_css as _theme_critical
+    from .theme_css_generator import generate_theme_deferred_css as _theme_deferred
+    from .theme_css_generator import _theme_vars_css
     from .pack_css_generator import generate_pack_css as _pack_css
+    from .pack_css_generator import generate_pack_critical_css as _pack_critical
+    from .pack_css_generator import generate_pack_deferred_css as _pack_deferred
     from .design_system_css import generate_design_system_css as _ds_css
 
     _color_css.cache_clear()
+    _color_vars.cache_clear()
     _theme_css.cache_clear()
+    _theme_critical.cache_clear()
+    _theme_deferred.cache_clear()
+    _theme_vars_css.cache_clear()
     _pack_css.cache_clear()
+    _pack_critical.cache_clear()
+    _pack_deferred.cache_clear()
     _ds_css.cache_clear()
+
+
+def warm_css_cache():
+    """Pre-generate theme CSS for the configured default theme and preset.
+
+    Fills the full, critical and deferred CSS caches with the configured
+    ``css_prefix`` so the first request is served from cache. Called from
+    ``AppConfig.ready()`` when the ``warm_css_cache`` config option is set.
+    Only the default combination is warmed: there are thousands of
+    (theme, preset) pairs and the caches keep a few hundred entries.
+    """
+    from .manager import (
+        ThemeState,
+        generate_critical_css_for_state,
+        generate_css_for_state,
+        generate_deferred_css_for_state,
+        get_css_prefix,
+        get_theme_config,
+    )
+
+    config = get_theme_config()
+    state = ThemeState(
+        theme=config["theme"],
+        preset=config["preset"],
+        mode="light",
+        resolved_mode="light",
+    )
+    css_prefix = get_css_prefix()
+    generate_css_for_state(state, css_prefix=css_prefix)
+    generate_critical_css_for_state(state, css_prefix=css_prefix)
+    generate_deferred_css_for_state(state, css_prefix=css_prefix)
+
+
+def on_setting_changed(*, setting, **kwargs):
+    """``setting_changed`` receiver: clear CSS caches when a CSS setting changes."""
+    if setting in CSS_SETTINGS:
+        clear_css_cache()
+
+
+def theme_cache_key(request) -> str:
+    """Cache-key fragment for the request's resolved theme state."""
+    from .manager import get_theme_manager
+
+    state = get_theme_manager(request).get_state()
+    return f"{state.theme}.{state.preset}.{state.pack or ''}.{state.resolved_mode}"
+
+
+def _cache_if_shareable(cache, key, request, response, timeout) -> None:
+    """Store ``response`` unless it may contain per-user content."""
+    meta = request.META
+    # CSRF_COOKIE_USED before Django 4.1, CSRF_COOKIE_NEEDS_UPDATE since.
+    if (
+        response.cookies
+        or meta.get("CSRF_COOKIE_USED")
+        or meta.get("CSRF_COOKIE_NEEDS_UPDATE")
+    ):
+        return
+    session = getattr(request, "session", None)
+    if session is not None and getattr(session, "accessed", False):
+        return
+    cache.set(key, response, timeout)
+
+
+def vary_on_theme(timeout: int, *, cache_alias: str = "default"):
+    """
+    Cache a view's response per URL and theme state.
+
+    For views whose output depends only on the URL and the active theme
+    (design system, preset, pack and resolved mode), not on the user.
+    Only successful GET/HEAD responses that set no cookies are cached;
+    responses that used the CSRF token or touched the session (and so may
+    carry per-user content) are never cached.
+    Every response gets ``Vary: Cookie``, because theme state comes from
+    cookies and downstream caches must not share pages across themes.
+
+    Usage::
+
+        @vary_on_theme(60 * 15)
+        def landing(request):
+            ...
+
+    Args:
+        timeout: Cache lifetime in seconds.
+        cache_alias: Name of the Django cache to use.
+    """
+    from django.core.cache import caches
+    from django.utils.cache import patch_vary_headers
+    from django.utils.encoding import iri_to_uri
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                response = view(request, *args, **kwargs)
+                patch_vary_headers(response, ["Cookie"])
+                return response
+
+            cache = caches[cache_alias]
+            key = (
+                f"djust_theming.view.{request.method}"
+                f".{iri_to_uri(request.build_absolute_uri())}"
+                f".{theme_cache_key(request)}"
+            )
+            response = cache.get(key)
+            if response is not None:
+                return response
+
+            response = view(request, *args, **kwargs)
+            patch_vary_headers(response, ["Cookie"])
+            if response.status_code == 200 and not response.streaming:
+                if callable(getattr(response, "render", None)):
+                    # Checked after rendering: the template may use
+                    # {% csrf_token %} or the session.
+                    response.add_post_render_callback(
+                        lambda r: _cache_if_shareable(cache, key, request, r, timeout)
+                    )
+                else:
+                    _cache_if_shareable(cache, key, request, response, timeout)
+            return response
+
+        return wrapper
+
+    return decorator
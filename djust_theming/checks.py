@@ -163,3 +163,81 @@ def check_design_system_valid(app_configs, **kwargs):
         )
 
     return errors
+
+
+@register(Tags.compatibility)
+def check_design_system_animation_values(app_configs, **kwargs):
+    """Warn about animation effects the CSS generator does not recognise.
+
+    Unknown ``entrance_effect`` / ``click_effect`` values silently render as
+    ``none``, so a typo in a registered design system disables the animation.
+    Checked once at startup rather than on each render.
+    """
+    from .theme_css_generator import _CLICK_ANIMATIONS, _ENTRANCE_ANIMATIONS
+
+    warnings = []
+    fields = (
+        ("entrance_effect", _ENTRANCE_ANIMATIONS),
+        ("click_effect", _CLICK_ANIMATIONS),
+    )
+    for name, ds in get_registry().list_themes().items():
+        for field, known in fields:
+            value = getattr(ds.animation, field)
+            if value not in known:
+                warnings.append(
+                    Warning(
+                        f'Design system "{name}" has animation.{field}="{value}", '
+                        f"which is not a recognised effect; it will render as none.",
+                        hint=f"Use one of: {', '.join(known)}",
+                        id="djust_theming.W004",
+                    )
+                )
+
+    return warnings
+
+
+_CACHED_LOADER = "django.template.loaders.cached.Loader"
+
+
+def _uses_cached_loader(loaders) -> bool:
+    """True if any entry (or nested ``(loader, [...])`` tuple) is cached.Loader."""
+    for loader in loaders:
+        name = loader[0] if isinstance(loader, (list, tuple)) else loader
+        if name == _CACHED_LOADER:
+            return True
+    return False
+
+
+@register(Tags.compatibility)
+def check_cached_template_loader(app_configs, **kwargs):
+    """Warn when explicit template loaders bypass Django's cached loader.
+
+    Theme components render the same small templates many times per page.
+    Django wraps its loaders in ``cached.Loader`` automatically unless
+    ``OPTIONS["loaders"]`` is set explicitly; this check only fires in that
+    case (and not under DEBUG, where uncached loaders are often intended).
+    """
+    errors = []
+    if settings.DEBUG:
+        return errors
+
+    for template_config in getattr(settings, "TEMPLATES", []):
+        if template_config.get("BACKEND") != "django.template.backends.django.DjangoTemplates":
+            continue
+        loaders = template_config.get("OPTIONS", {}).get("loaders")
+        if loaders and not _uses_cached_loader(loaders):
+            errors.append(
+                Warning(
+                    "TEMPLATES sets OPTIONS['loaders'] without "
+                    "django.template.loaders.cached.Loader. Theme component "
+                    "templates will be re-read from disk on every render.",
+                    hint=(
+                        "Wrap the loaders: [(\"django.template.loaders.cached.Loader\", "
+                        "[...your loaders...])], or remove OPTIONS['loaders'] to "
+                        "use Django's cached default."
+                    ),
+                    id="djust_theming.W003",
+                )
+            )
+
+    return errors
@@ -6,11 +6,17 @@ All functions are pure — no side effects or class dependencies.
 """
 
 import colorsys
+from functools import lru_cache
 from typing import Tuple
 
 
+@lru_cache(maxsize=4096)
 def hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
-    """Convert HSL (h: 0-360, s: 0-100, l: 0-100) to RGB (0-255 each)."""
+    """Convert HSL (h: 0-360, s: 0-100, l: 0-100) to RGB (0-255 each).
+
+    Memoized: theme palettes reuse a few hundred distinct colors, and
+    contrast checks and hex/rgb exports convert the same ones repeatedly.
+    """
     # colorsys uses HLS order (not HSL), with all values in 0-1 range
     r, g, b = colorsys.hls_to_rgb(h / 360.0, l / 100.0, s / 100.0)
     return (round(r * 255), round(g * 255), round(b * 255))
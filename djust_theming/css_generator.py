@@ -13,7 +13,45 @@ from .design_tokens import (
     generate_design_tokens_root_css,
 )
 from .manager import get_theme_config
-from .presets import ThemeTokens, get_preset
+from .presets import COLOR_TOKEN_FIELDS, ThemeTokens, get_preset
+
+# "--card-foreground" etc., one per ThemeTokens color field.
+_COLOR_VAR_NAMES = tuple(f"--{name.replace('_', '-')}" for name in COLOR_TOKEN_FIELDS)
+
+# shadcn/ui compatibility aliases as (variable, index into COLOR_TOKEN_FIELDS).
+_SHADCN_ALIASES = tuple(
+    (f"--{var}", COLOR_TOKEN_FIELDS.index(field))
+    for var, field in (
+        ("sidebar-background", "background"),
+        ("sidebar-foreground", "foreground"),
+        ("sidebar-primary", "primary"),
+        ("sidebar-primary-foreground", "primary_foreground"),
+        ("sidebar-accent", "accent"),
+        ("sidebar-accent-foreground", "accent_foreground"),
+        ("sidebar-border", "border"),
+        ("sidebar-ring", "ring"),
+        ("chart-1", "primary"),
+        ("chart-2", "secondary"),
+        ("chart-3", "accent"),
+        ("chart-4", "success"),
+        ("chart-5", "warning"),
+        ("chart-6", "info"),
+    )
+)
+
+
+@lru_cache(maxsize=256)
+def _color_declarations(hsl: tuple[str, ...], indent: str) -> str:
+    """Render the color + shadcn alias declarations for one token set.
+
+    Keyed by the token set's HSL column, so every preset/mode pair is
+    formatted once and later renders reuse the finished block.
+    """
+    lines = [f"{indent}{var}: {value};" for var, value in zip(_COLOR_VAR_NAMES, hsl)]
+
+    # shadcn/ui compatibility aliases (extended tokens)
+    lines.extend(f"{indent}{var}: {hsl[index]};" for var, index in _SHADCN_ALIASES)
+    return "\n".join(lines)
 
 
 class ThemeCSSGenerator:
@@ -45,79 +83,16 @@ class ThemeCSSGenerator:
 
     def _tokens_to_css_vars(self, tokens: ThemeTokens, indent: str = "  ") -> str:
         """Convert ThemeTokens to CSS custom property declarations."""
-        lines = []
-
-        # Color tokens
-        color_mappings = [
-            ("background", tokens.background),
-            ("foreground", tokens.foreground),
-            ("card", tokens.card),
-            ("card-foreground", tokens.card_foreground),
-            ("popover", tokens.popover),
-            ("popover-foreground", tokens.popover_foreground),
-            ("primary", tokens.primary),
-            ("primary-foreground", tokens.primary_foreground),
-            ("secondary", tokens.secondary),
-            ("secondary-foreground", tokens.secondary_foreground),
-            ("muted", tokens.muted),
-            ("muted-foreground", tokens.muted_foreground),
-            ("accent", tokens.accent),
-            ("accent-foreground", tokens.accent_foreground),
-            ("destructive", tokens.destructive),
-            ("destructive-foreground", tokens.destructive_foreground),
-            ("success", tokens.success),
-            ("success-foreground", tokens.success_foreground),
-            ("warning", tokens.warning),
-            ("warning-foreground", tokens.warning_foreground),
-            ("info", tokens.info),
-            ("info-foreground", tokens.info_foreground),
-            ("link", tokens.link),
-            ("link-hover", tokens.link_hover),
-            ("code", tokens.code),
-            ("code-foreground", tokens.code_foreground),
-            ("selection", tokens.selection),
-            ("selection-foreground", tokens.selection_foreground),
-            ("brand", tokens.brand),
-            ("brand-foreground", tokens.brand_foreground),
-            ("border", tokens.border),
-            ("input", tokens.input),
-            ("ring", tokens.ring),
-            ("surface-1", tokens.surface_1),
-            ("surface-2", tokens.surface_2),
-            ("surface-3", tokens.surface_3),
-        ]
-
-        for name, color in color_mappings:
-            lines.append(f"{indent}--{name}: {color.to_hsl()};")
-
-        # shadcn/ui compatibility aliases (extended tokens)
-        shadcn_mappings = [
-            ("sidebar-background", tokens.background),
-            ("sidebar-foreground", tokens.foreground),
-            ("sidebar-primary", tokens.primary),
-            ("sidebar-primary-foreground", tokens.primary_foreground),
-            ("sidebar-accent", tokens.accent),
-            ("sidebar-accent-foreground", tokens.accent_foreground),
-            ("sidebar-border", tokens.border),
-            ("sidebar-ring", tokens.ring),
-            ("chart-1", tokens.primary),
-            ("chart-2", tokens.secondary),
-            ("chart-3", tokens.accent),
-            ("chart-4", tokens.success),
-            ("chart-5", tokens.warning),
-            ("chart-6", tokens.info),
-        ]
-
-        for name, color in shadcn_mappings:
-            lines.append(f"{indent}--{name}: {color.to_hsl()};")
+        css = _color_declarations(tokens.hsl_values, indent)
 
         # Extra CSS custom properties (brand-specific variables)
         if self.preset.extra_css_vars:
-            lines.append("")
+            lines = [css, ""]
             for name, value in self.preset.extra_css_vars.items():
                 lines.append(f"{indent}--{name}: {value};")
+            css = "\n".join(lines)
 
-        return "\n".join(lines)
+        return css
 
     def _generate_light_mode(self) -> str:
         """Generate :root light mode variables.
@@ -727,3 +702,25 @@ def generate_theme_css(
         include_design_tokens=include_design_tokens,
     )
     return generator.generate_css()
+
+
+@lru_cache(maxsize=64)
+def render_theme_css(preset_name: str = "default", mode: str = "light") -> str:
+    """
+    Return the color custom-property declarations for one preset mode (cached).
+
+    Unlike ``generate_theme_css`` this is just the variable block (colors
+    plus shadcn aliases, no selectors), e.g. for an inline ``style``
+    attribute or a scoped container. Use ``clear_css_cache()`` to
+    invalidate during development.
+
+    Args:
+        preset_name: Name of the theme preset
+        mode: "light" or "dark"; anything else falls back to light
+
+    Returns:
+        Newline-separated ``--name: value;`` declarations
+    """
+    preset = get_preset(preset_name)
+    tokens = preset.dark if mode == "dark" else preset.light
+    return _color_declarations(tokens.hsl_values, "")
@@ -9,7 +9,7 @@ from functools import lru_cache
 from typing import Optional, Dict, Any
 from .presets import ThemeTokens, get_preset
 from .theme_packs import (
-    DesignSystem, get_design_system, get_all_design_systems,
+    DesignSystem, get_design_system, design_systems_view,
     TypographyStyle, LayoutStyle, SurfaceStyle, IconStyle, 
     AnimationStyle, InteractionStyle
 )
@@ -380,7 +380,7 @@ def generate_all_combinations_css() -> Dict[str, str]:
     from .presets import THEME_PRESETS
     
     combinations = {}
-    design_systems = get_all_design_systems()
+    design_systems = design_systems_view()
     
     for design_name in design_systems.keys():
         for preset_name in THEME_PRESETS.keys():
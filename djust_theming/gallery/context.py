@@ -5,10 +5,17 @@ Each component gets a section with display name, description, and a list of
 example dicts containing the kwargs that will be passed to its template tag.
 """
 
-from dataclasses import fields as dataclass_fields
+import json
+from functools import lru_cache
 
 from djust_theming.contracts import COMPONENT_CONTRACTS
-from djust_theming.presets import ColorScale, ThemePreset, ThemeTokens, get_preset, list_presets
+from djust_theming.presets import (
+    COLOR_TOKEN_FIELDS,
+    ThemePreset,
+    ThemeTokens,
+    get_preset,
+    list_presets,
+)
 from djust_theming.theme_packs import DESIGN_SYSTEMS, DesignSystem
 
 
@@ -353,12 +360,10 @@ def serialize_tokens(tokens: ThemeTokens) -> dict:
     Returns:
         Dict mapping field names to ``{"h": int, "s": int, "l": int}``.
     """
-    result = {}
-    for f in dataclass_fields(tokens):
-        value = getattr(tokens, f.name)
-        if isinstance(value, ColorScale):
-            result[f.name] = {"h": value.h, "s": value.s, "l": value.lightness}
-    return result
+    return {
+        name: {"h": color.h, "s": color.s, "l": color.lightness}
+        for name, color in zip(COLOR_TOKEN_FIELDS, tokens.colors)
+    }
 
 
 def serialize_preset(preset: ThemePreset) -> dict:
@@ -385,6 +390,27 @@ def serialize_all_presets() -> dict:
     }
 
 
+@lru_cache(maxsize=256)
+def _preset_json(preset: ThemePreset) -> str:
+    # ThemePreset hashes by identity, so a re-registered preset is a new key.
+    return json.dumps(serialize_preset(preset))
+
+
+def serialize_all_presets_json() -> str:
+    """JSON for :func:`serialize_all_presets`, reusing each preset's encoding.
+
+    Byte-identical to ``json.dumps(serialize_all_presets())``; the per-preset
+    JSON is cached, so only the outer object is assembled per call.
+    """
+    from djust_theming.presets import THEME_PRESETS
+
+    items = ", ".join(
+        f"{json.dumps(name)}: {_preset_json(preset)}"
+        for name, preset in THEME_PRESETS.items()
+    )
+    return f"{{{items}}}"
+
+
 def serialize_design_system(ds: DesignSystem) -> dict:
     """Serialize a DesignSystem to a JSON-friendly structure."""
     return {
@@ -18,7 +18,12 @@ from django.http import (
 from django.template.loader import render_to_string
 from django.views.decorators.clickjacking import xframe_options_sameorigin
 
-from .context import build_gallery_context, serialize_all_design_systems, serialize_all_presets, serialize_preset
+from .context import (
+    build_gallery_context,
+    serialize_all_design_systems,
+    serialize_all_presets_json,
+    serialize_preset,
+)
 from djust_theming.theme_packs import DESIGN_SYSTEMS
 from .storybook import build_storybook_detail_context, build_storybook_index_context
 from djust_theming.contracts import COMPONENT_CONTRACTS
@@ -95,7 +100,7 @@ def editor_view(request):
     ctx.update(_template_sample_data())
 
     # Serialize all presets and design systems for JS initialization
-    ctx["preset_data_json"] = json.dumps(serialize_all_presets())
+    ctx["preset_data_json"] = serialize_all_presets_json()
     ctx["design_systems_json"] = json.dumps(serialize_all_design_systems())
     ctx["design_systems"] = DESIGN_SYSTEMS
 
@@ -6,9 +6,10 @@ designed for users with visual impairments or low vision conditions.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 
-from .presets import ColorScale, ThemeTokens, ThemePreset
+from .presets import _DEPENDENT_CACHE_CLEARS, ColorScale, ThemeTokens, ThemePreset
 
 
 class HighContrastPresets:
@@ -26,158 +27,164 @@ class HighContrastPresets:
         if mode == "light":
             # High contrast light mode - very dark text on very light backgrounds
             return ThemeTokens(
-                background=ColorScale(0, 0, 100),  # Pure white
-                foreground=ColorScale(0, 0, 0),    # Pure black
-                card=ColorScale(0, 0, 98),         # Near white
-                card_foreground=ColorScale(0, 0, 0),
-                popover=ColorScale(0, 0, 100),
-                popover_foreground=ColorScale(0, 0, 0),
+                background=ColorScale.of(0, 0, 100),  # Pure white
+                foreground=ColorScale.of(0, 0, 0),    # Pure black
+                card=ColorScale.of(0, 0, 98),         # Near white
+                card_foreground=ColorScale.of(0, 0, 0),
+                popover=ColorScale.of(0, 0, 100),
+                popover_foreground=ColorScale.of(0, 0, 0),
                 
                 # High contrast primary - keep base hue but max saturation/contrast
-                primary=ColorScale(base_tokens.primary.h, 100, 25),  # Very dark, saturated
-                primary_foreground=ColorScale(0, 0, 100),           # White text
+                primary=ColorScale.of(base_tokens.primary.h, 100, 25),  # Very dark, saturated
+                primary_foreground=ColorScale.of(0, 0, 100),           # White text
                 
                 # High contrast secondary
-                secondary=ColorScale(0, 0, 10),    # Very dark gray
-                secondary_foreground=ColorScale(0, 0, 100),
+                secondary=ColorScale.of(0, 0, 10),    # Very dark gray
+                secondary_foreground=ColorScale.of(0, 0, 100),
                 
                 # Muted with higher contrast
-                muted=ColorScale(0, 0, 90),        # Light gray background
-                muted_foreground=ColorScale(0, 0, 15),  # Very dark text
+                muted=ColorScale.of(0, 0, 90),        # Light gray background
+                muted_foreground=ColorScale.of(0, 0, 15),  # Very dark text
                 
                 # Accent with high contrast
-                accent=ColorScale(base_tokens.accent.h, 100, 20),
-                accent_foreground=ColorScale(0, 0, 100),
+                accent=ColorScale.of(base_tokens.accent.h, 100, 20),
+                accent_foreground=ColorScale.of(0, 0, 100),
                 
                 # Status colors with maximum contrast
-                destructive=ColorScale(0, 100, 30),    # Dark red
-                destructive_foreground=ColorScale(0, 0, 100),
+                destructive=ColorScale.of(0, 100, 30),    # Dark red
+                destructive_foreground=ColorScale.of(0, 0, 100),
                 
-                success=ColorScale(120, 100, 25),     # Dark green
-                success_foreground=ColorScale(0, 0, 100),
+                success=ColorScale.of(120, 100, 25),     # Dark green
+                success_foreground=ColorScale.of(0, 0, 100),
                 
-                warning=ColorScale(45, 100, 30),      # Dark amber
-                warning_foreground=ColorScale(0, 0, 0),  # Black for better contrast
+                warning=ColorScale.of(45, 100, 30),      # Dark amber
+                warning_foreground=ColorScale.of(0, 0, 0),  # Black for better contrast
 
-                info=ColorScale(199, 100, 25),           # Dark blue
-                info_foreground=ColorScale(0, 0, 100),
+                info=ColorScale.of(199, 100, 25),           # Dark blue
+                info_foreground=ColorScale.of(0, 0, 100),
 
-                link=ColorScale(base_tokens.primary.h, 100, 25),
-                link_hover=ColorScale(base_tokens.primary.h, 100, 15),
+                link=ColorScale.of(base_tokens.primary.h, 100, 25),
+                link_hover=ColorScale.of(base_tokens.primary.h, 100, 15),
 
-                code=ColorScale(0, 0, 90),
-                code_foreground=ColorScale(0, 0, 0),
+                code=ColorScale.of(0, 0, 90),
+                code_foreground=ColorScale.of(0, 0, 0),
 
-                selection=ColorScale(base_tokens.primary.h, 100, 80),
-                selection_foreground=ColorScale(0, 0, 0),
+                selection=ColorScale.of(base_tokens.primary.h, 100, 80),
+                selection_foreground=ColorScale.of(0, 0, 0),
 
-                brand=ColorScale(base_tokens.primary.h, 100, 25),
-                brand_foreground=ColorScale(0, 0, 100),
+                brand=ColorScale.of(base_tokens.primary.h, 100, 25),
+                brand_foreground=ColorScale.of(0, 0, 100),
 
                 # UI elements with high contrast
-                border=ColorScale(0, 0, 20),          # Very dark borders
-                input=ColorScale(0, 0, 95),           # Light input background
-                ring=ColorScale(base_tokens.primary.h, 100, 30),  # High contrast focus
+                border=ColorScale.of(0, 0, 20),          # Very dark borders
+                input=ColorScale.of(0, 0, 95),           # Light input background
+                ring=ColorScale.of(base_tokens.primary.h, 100, 30),  # High contrast focus
 
-                surface_1=ColorScale(0, 0, 99),
-                surface_2=ColorScale(0, 0, 97),
-                surface_3=ColorScale(0, 0, 95),
+                surface_1=ColorScale.of(0, 0, 99),
+                surface_2=ColorScale.of(0, 0, 97),
+                surface_3=ColorScale.of(0, 0, 95),
             )
         else:
             # High contrast dark mode - very light text on very dark backgrounds
             return ThemeTokens(
-                background=ColorScale(0, 0, 0),      # Pure black
-                foreground=ColorScale(0, 0, 100),    # Pure white
-                card=ColorScale(0, 0, 3),            # Near black
-                card_foreground=ColorScale(0, 0, 100),
-                popover=ColorScale(0, 0, 0),
-                popover_foreground=ColorScale(0, 0, 100),
+                background=ColorScale.of(0, 0, 0),      # Pure black
+                foreground=ColorScale.of(0, 0, 100),    # Pure white
+                card=ColorScale.of(0, 0, 3),            # Near black
+                card_foreground=ColorScale.of(0, 0, 100),
+                popover=ColorScale.of(0, 0, 0),
+                popover_foreground=ColorScale.of(0, 0, 100),
                 
                 # High contrast primary
-                primary=ColorScale(base_tokens.primary.h, 100, 75),  # Bright, saturated
-                primary_foreground=ColorScale(0, 0, 0),              # Black text
+                primary=ColorScale.of(base_tokens.primary.h, 100, 75),  # Bright, saturated
+                primary_foreground=ColorScale.of(0, 0, 0),              # Black text
                 
                 # High contrast secondary
-                secondary=ColorScale(0, 0, 90),      # Very light gray
-                secondary_foreground=ColorScale(0, 0, 0),
+                secondary=ColorScale.of(0, 0, 90),      # Very light gray
+                secondary_foreground=ColorScale.of(0, 0, 0),
                 
                 # Muted with higher contrast  
-                muted=ColorScale(0, 0, 10),          # Dark background
-                muted_foreground=ColorScale(0, 0, 85), # Light text
+                muted=ColorScale.of(0, 0, 10),          # Dark background
+                muted_foreground=ColorScale.of(0, 0, 85), # Light text
                 
                 # Accent with high contrast
-                accent=ColorScale(base_tokens.accent.h, 100, 80),
-                accent_foreground=ColorScale(0, 0, 0),
+                accent=ColorScale.of(base_tokens.accent.h, 100, 80),
+                accent_foreground=ColorScale.of(0, 0, 0),
                 
                 # Status colors with maximum contrast
-                destructive=ColorScale(0, 100, 70),   # Bright red
-                destructive_foreground=ColorScale(0, 0, 0),
+                destructive=ColorScale.of(0, 100, 70),   # Bright red
+                destructive_foreground=ColorScale.of(0, 0, 0),
                 
-                success=ColorScale(120, 100, 75),    # Bright green
-                success_foreground=ColorScale(0, 0, 0),
+                success=ColorScale.of(120, 100, 75),    # Bright green
+                success_foreground=ColorScale.of(0, 0, 0),
                 
-                warning=ColorScale(45, 100, 70),     # Bright amber
-                warning_foreground=ColorScale(0, 0, 0),
+                warning=ColorScale.of(45, 100, 70),     # Bright amber
+                warning_foreground=ColorScale.of(0, 0, 0),
 
-                info=ColorScale(199, 100, 75),       # Bright blue
-                info_foreground=ColorScale(0, 0, 0),
+                info=ColorScale.of(199, 100, 75),       # Bright blue
+                info_foreground=ColorScale.of(0, 0, 0),
 
-                link=ColorScale(base_tokens.primary.h, 100, 75),
-                link_hover=ColorScale(base_tokens.primary.h, 100, 85),
+                link=ColorScale.of(base_tokens.primary.h, 100, 75),
+                link_hover=ColorScale.of(base_tokens.primary.h, 100, 85),
 
-                code=ColorScale(0, 0, 10),
-                code_foreground=ColorScale(0, 0, 100),
+                code=ColorScale.of(0, 0, 10),
+                code_foreground=ColorScale.of(0, 0, 100),
 
-                selection=ColorScale(base_tokens.primary.h, 100, 30),
-                selection_foreground=ColorScale(0, 0, 100),
+                selection=ColorScale.of(base_tokens.primary.h, 100, 30),
+                selection_foreground=ColorScale.of(0, 0, 100),
 
-                brand=ColorScale(base_tokens.primary.h, 100, 75),
-                brand_foreground=ColorScale(0, 0, 0),
+                brand=ColorScale.of(base_tokens.primary.h, 100, 75),
+                brand_foreground=ColorScale.of(0, 0, 0),
 
                 # UI elements with high contrast
-                border=ColorScale(0, 0, 80),         # Very light borders
-                input=ColorScale(0, 0, 5),           # Dark input background
-                ring=ColorScale(base_tokens.primary.h, 100, 70), # High contrast focus
+                border=ColorScale.of(0, 0, 80),         # Very light borders
+                input=ColorScale.of(0, 0, 5),           # Dark input background
+                ring=ColorScale.of(base_tokens.primary.h, 100, 70), # High contrast focus
 
-                surface_1=ColorScale(0, 0, 3),
-                surface_2=ColorScale(0, 0, 6),
-                surface_3=ColorScale(0, 0, 10),
+                surface_1=ColorScale.of(0, 0, 3),
+                surface_2=ColorScale.of(0, 0, 6),
+                surface_3=ColorScale.of(0, 0, 10),
             )
 
 
+def _build_high_contrast_preset(preset_name: str, base_preset: ThemePreset) -> ThemePreset:
+    """Build the high contrast variant of a single preset."""
+    hc_name = f"{preset_name}_hc"
+    return ThemePreset(
+        name=hc_name,
+        display_name=f"{base_preset.display_name} (High Contrast)",
+        description=f"High contrast version of {base_preset.display_name} for enhanced accessibility",
+        light=HighContrastPresets.create_high_contrast_tokens(base_preset, "light"),
+        dark=HighContrastPresets.create_high_contrast_tokens(base_preset, "dark"),
+        radius=base_preset.radius,
+    )
+
+
 def generate_high_contrast_presets() -> Dict[str, ThemePreset]:
     """Generate high contrast versions of all existing presets."""
     
     from .presets import THEME_PRESETS
     
-    high_contrast_presets = {}
-    
-    for preset_name, base_preset in THEME_PRESETS.items():
-        hc_name = f"{preset_name}_hc"
-        
-        high_contrast_presets[hc_name] = ThemePreset(
-            name=hc_name,
-            display_name=f"{base_preset.display_name} (High Contrast)",
-            description=f"High contrast version of {base_preset.display_name} for enhanced accessibility",
-            light=HighContrastPresets.create_high_contrast_tokens(base_preset, "light"),
-            dark=HighContrastPresets.create_high_contrast_tokens(base_preset, "dark"),
-            radius=base_preset.radius,
-        )
-        
-    return high_contrast_presets
+    return {
+        f"{preset_name}_hc": _build_high_contrast_preset(preset_name, base_preset)
+        for preset_name, base_preset in THEME_PRESETS.items()
+    }
 
 
 def get_high_contrast_preset(name: str) -> ThemePreset:
-    """Get a specific high contrast preset."""
-    presets = generate_high_contrast_presets()
-    
-    if name in presets:
-        return presets[name]
-        
-    # Try adding _hc suffix if not found
-    hc_name = f"{name}_hc"
-    if hc_name in presets:
-        return presets[hc_name]
+    """Get a specific high contrast preset.
+
+    Only the requested variant is built (and only its base preset loaded),
+    rather than generating high contrast versions of every preset.
+    """
+    from .presets import THEME_PRESETS
+
+    base_name = name[:-3] if name.endswith("_hc") else None
+    if base_name is None or base_name not in THEME_PRESETS:
+        # Try adding _hc suffix if not found
+        base_name = name
+    base_preset = THEME_PRESETS.get(base_name)
+    if base_preset is not None:
+        return _build_high_contrast_preset(base_name, base_preset)
         
     raise ValueError(f"High contrast preset '{name}' not found")
 
@@ -190,80 +197,80 @@ HIGH_CONTRAST_PRESETS = {
         display_name="Monochrome High Contrast",
         description="Maximum contrast black and white theme for severe visual impairments",
         light=ThemeTokens(
-            background=ColorScale(0, 0, 100),      # Pure white
-            foreground=ColorScale(0, 0, 0),        # Pure black
-            card=ColorScale(0, 0, 100),
-            card_foreground=ColorScale(0, 0, 0),
-            popover=ColorScale(0, 0, 100),
-            popover_foreground=ColorScale(0, 0, 0),
-            primary=ColorScale(0, 0, 0),           # Black
-            primary_foreground=ColorScale(0, 0, 100), # White
-            secondary=ColorScale(0, 0, 20),        # Very dark gray
-            secondary_foreground=ColorScale(0, 0, 100),
-            muted=ColorScale(0, 0, 95),            # Light gray
-            muted_foreground=ColorScale(0, 0, 0),
-            accent=ColorScale(0, 0, 0),
-            accent_foreground=ColorScale(0, 0, 100),
-            destructive=ColorScale(0, 0, 0),       # Black (no red for colorblind)
-            destructive_foreground=ColorScale(0, 0, 100),
-            success=ColorScale(0, 0, 0),
-            success_foreground=ColorScale(0, 0, 100),
-            warning=ColorScale(0, 0, 0),
-            warning_foreground=ColorScale(0, 0, 100),
-            info=ColorScale(0, 0, 0),
-            info_foreground=ColorScale(0, 0, 100),
-            link=ColorScale(0, 0, 0),
-            link_hover=ColorScale(0, 0, 20),
-            code=ColorScale(0, 0, 95),
-            code_foreground=ColorScale(0, 0, 0),
-            selection=ColorScale(0, 0, 0),
-            selection_foreground=ColorScale(0, 0, 100),
-            brand=ColorScale(0, 0, 0),
-            brand_foreground=ColorScale(0, 0, 100),
-            border=ColorScale(0, 0, 0),            # Black borders
-            input=ColorScale(0, 0, 100),           # White inputs
-            ring=ColorScale(0, 0, 0),              # Black focus
-            surface_1=ColorScale(0, 0, 99),
-            surface_2=ColorScale(0, 0, 97),
-            surface_3=ColorScale(0, 0, 95),
+            background=ColorScale.of(0, 0, 100),      # Pure white
+            foreground=ColorScale.of(0, 0, 0),        # Pure black
+            card=ColorScale.of(0, 0, 100),
+            card_foreground=ColorScale.of(0, 0, 0),
+            popover=ColorScale.of(0, 0, 100),
+            popover_foreground=ColorScale.of(0, 0, 0),
+            primary=ColorScale.of(0, 0, 0),           # Black
+            primary_foreground=ColorScale.of(0, 0, 100), # White
+            secondary=ColorScale.of(0, 0, 20),        # Very dark gray
+            secondary_foreground=ColorScale.of(0, 0, 100),
+            muted=ColorScale.of(0, 0, 95),            # Light gray
+            muted_foreground=ColorScale.of(0, 0, 0),
+            accent=ColorScale.of(0, 0, 0),
+            accent_foreground=ColorScale.of(0, 0, 100),
+            destructive=ColorScale.of(0, 0, 0),       # Black (no red for colorblind)
+            destructive_foreground=ColorScale.of(0, 0, 100),
+            success=ColorScale.of(0, 0, 0),
+            success_foreground=ColorScale.of(0, 0, 100),
+            warning=ColorScale.of(0, 0, 0),
+            warning_foreground=ColorScale.of(0, 0, 100),
+            info=ColorScale.of(0, 0, 0),
+            info_foreground=ColorScale.of(0, 0, 100),
+            link=ColorScale.of(0, 0, 0),
+            link_hover=ColorScale.of(0, 0, 20),
+            code=ColorScale.of(0, 0, 95),
+            code_foreground=ColorScale.of(0, 0, 0),
+            selection=ColorScale.of(0, 0, 0),
+            selection_foreground=ColorScale.of(0, 0, 100),
+            brand=ColorScale.of(0, 0, 0),
+            brand_foreground=ColorScale.of(0, 0, 100),
+            border=ColorScale.of(0, 0, 0),            # Black borders
+            input=ColorScale.of(0, 0, 100),           # White inputs
+            ring=ColorScale.of(0, 0, 0),              # Black focus
+            surface_1=ColorScale.of(0, 0, 99),
+            surface_2=ColorScale.of(0, 0, 97),
+            surface_3=ColorScale.of(0, 0, 95),
         ),
         dark=ThemeTokens(
-            background=ColorScale(0, 0, 0),        # Pure black
-            foreground=ColorScale(0, 0, 100),      # Pure white
-            card=ColorScale(0, 0, 0),
-            card_foreground=ColorScale(0, 0, 100),
-            popover=ColorScale(0, 0, 0),
-            popover_foreground=ColorScale(0, 0, 100),
-            primary=ColorScale(0, 0, 100),         # White
-            primary_foreground=ColorScale(0, 0, 0), # Black
-            secondary=ColorScale(0, 0, 80),        # Very light gray
-            secondary_foreground=ColorScale(0, 0, 0),
-            muted=ColorScale(0, 0, 5),             # Very dark gray
-            muted_foreground=ColorScale(0, 0, 100),
-            accent=ColorScale(0, 0, 100),
-            accent_foreground=ColorScale(0, 0, 0),
-            destructive=ColorScale(0, 0, 100),     # White (no red for colorblind)
-            destructive_foreground=ColorScale(0, 0, 0),
-            success=ColorScale(0, 0, 100),
-            success_foreground=ColorScale(0, 0, 0),
-            warning=ColorScale(0, 0, 100),
-            warning_foreground=ColorScale(0, 0, 0),
-            info=ColorScale(0, 0, 100),
-            info_foreground=ColorScale(0, 0, 0),
-            link=ColorScale(0, 0, 100),
-            link_hover=ColorScale(0, 0, 80),
-            code=ColorScale(0, 0, 5),
-            code_foreground=ColorScale(0, 0, 100),
-            selection=ColorScale(0, 0, 100),
-            selection_foreground=ColorScale(0, 0, 0),
-            brand=ColorScale(0, 0, 100),
-            brand_foreground=ColorScale(0, 0, 0),
-            border=ColorScale(0, 0, 100),          # White borders
-            input=ColorScale(0, 0, 0),             # Black inputs
-            ring=ColorScale(0, 0, 100),            # White focus
-            surface_1=ColorScale(0, 0, 3),
-            surface_2=ColorScale(0, 0, 6),
-            surface_3=ColorScale(0, 0, 10),
+            background=ColorScale.of(0, 0, 0),        # Pure black
+            foreground=ColorScale.of(0, 0, 100),      # Pure white
+            card=ColorScale.of(0, 0, 0),
+            card_foreground=ColorScale.of(0, 0, 100),
+            popover=ColorScale.of(0, 0, 0),
+            popover_foreground=ColorScale.of(0, 0, 100),
+            primary=ColorScale.of(0, 0, 100),         # White
+            primary_foreground=ColorScale.of(0, 0, 0), # Black
+            secondary=ColorScale.of(0, 0, 80),        # Very light gray
+            secondary_foreground=ColorScale.of(0, 0, 0),
+            muted=ColorScale.of(0, 0, 5),             # Very dark gray
+            muted_foreground=ColorScale.of(0, 0, 100),
+            accent=ColorScale.of(0, 0, 100),
+            accent_foreground=ColorScale.of(0, 0, 0),
+            destructive=ColorScale.of(0, 0, 100),     # White (no red for colorblind)
+            destructive_foreground=ColorScale.of(0, 0, 0),
+            success=ColorScale.of(0, 0, 100),
+            success_foreground=ColorScale.of(0, 0, 0),
+            warning=ColorScale.of(0, 0, 100),
+            warning_foreground=ColorScale.of(0, 0, 0),
+            info=ColorScale.of(0, 0, 100),
+            info_foreground=ColorScale.of(0, 0, 0),
+            link=ColorScale.of(0, 0, 100),
+            link_hover=ColorScale.of(0, 0, 80),
+            code=ColorScale.of(0, 0, 5),
+            code_foreground=ColorScale.of(0, 0, 100),
+            selection=ColorScale.of(0, 0, 100),
+            selection_foreground=ColorScale.of(0, 0, 0),
+            brand=ColorScale.of(0, 0, 100),
+            brand_foreground=ColorScale.of(0, 0, 0),
+            border=ColorScale.of(0, 0, 100),          # White borders
+            input=ColorScale.of(0, 0, 0),             # Black inputs
+            ring=ColorScale.of(0, 0, 100),            # White focus
+            surface_1=ColorScale.of(0, 0, 3),
+            surface_2=ColorScale.of(0, 0, 6),
+            surface_3=ColorScale.of(0, 0, 10),
         ),
         radius=8,
     ),
@@ -274,93 +281,105 @@ HIGH_CONTRAST_PRESETS = {
         display_name="Yellow on Black",
         description="Classic high contrast theme with yellow text on black background",
         light=ThemeTokens(
-            background=ColorScale(0, 0, 0),        # Black background in light mode
-            foreground=ColorScale(60, 100, 50),    # Yellow text
-            card=ColorScale(0, 0, 5),
-            card_foreground=ColorScale(60, 100, 50),
-            popover=ColorScale(0, 0, 0),
-            popover_foreground=ColorScale(60, 100, 50),
-            primary=ColorScale(60, 100, 50),       # Yellow
-            primary_foreground=ColorScale(0, 0, 0), # Black
-            secondary=ColorScale(60, 50, 30),      # Darker yellow
-            secondary_foreground=ColorScale(0, 0, 0),
-            muted=ColorScale(0, 0, 10),
-            muted_foreground=ColorScale(60, 80, 60),
-            accent=ColorScale(60, 100, 50),
-            accent_foreground=ColorScale(0, 0, 0),
-            destructive=ColorScale(60, 100, 50),   # Yellow for errors too
-            destructive_foreground=ColorScale(0, 0, 0),
-            success=ColorScale(60, 100, 50),
-            success_foreground=ColorScale(0, 0, 0),
-            warning=ColorScale(60, 100, 50),
-            warning_foreground=ColorScale(0, 0, 0),
-            info=ColorScale(60, 100, 50),
-            info_foreground=ColorScale(0, 0, 0),
-            link=ColorScale(60, 100, 50),
-            link_hover=ColorScale(60, 100, 60),
-            code=ColorScale(0, 0, 5),
-            code_foreground=ColorScale(60, 100, 50),
-            selection=ColorScale(60, 100, 50),
-            selection_foreground=ColorScale(0, 0, 0),
-            brand=ColorScale(60, 100, 50),
-            brand_foreground=ColorScale(0, 0, 0),
-            border=ColorScale(60, 100, 50),
-            input=ColorScale(0, 0, 5),
-            ring=ColorScale(60, 100, 50),
-            surface_1=ColorScale(0, 0, 3),
-            surface_2=ColorScale(0, 0, 6),
-            surface_3=ColorScale(0, 0, 10),
+            background=ColorScale.of(0, 0, 0),        # Black background in light mode
+            foreground=ColorScale.of(60, 100, 50),    # Yellow text
+            card=ColorScale.of(0, 0, 5),
+            card_foreground=ColorScale.of(60, 100, 50),
+            popover=ColorScale.of(0, 0, 0),
+            popover_foreground=ColorScale.of(60, 100, 50),
+            primary=ColorScale.of(60, 100, 50),       # Yellow
+            primary_foreground=ColorScale.of(0, 0, 0), # Black
+            secondary=ColorScale.of(60, 50, 30),      # Darker yellow
+            secondary_foreground=ColorScale.of(0, 0, 0),
+            muted=ColorScale.of(0, 0, 10),
+            muted_foreground=ColorScale.of(60, 80, 60),
+            accent=ColorScale.of(60, 100, 50),
+            accent_foreground=ColorScale.of(0, 0, 0),
+            destructive=ColorScale.of(60, 100, 50),   # Yellow for errors too
+            destructive_foreground=ColorScale.of(0, 0, 0),
+            success=ColorScale.of(60, 100, 50),
+            success_foreground=ColorScale.of(0, 0, 0),
+            warning=ColorScale.of(60, 100, 50),
+            warning_foreground=ColorScale.of(0, 0, 0),
+            info=ColorScale.of(60, 100, 50),
+            info_foreground=ColorScale.of(0, 0, 0),
+            link=ColorScale.of(60, 100, 50),
+            link_hover=ColorScale.of(60, 100, 60),
+            code=ColorScale.of(0, 0, 5),
+            code_foreground=ColorScale.of(60, 100, 50),
+            selection=ColorScale.of(60, 100, 50),
+            selection_foreground=ColorScale.of(0, 0, 0),
+            brand=ColorScale.of(60, 100, 50),
+            brand_foreground=ColorScale.of(0, 0, 0),
+            border=ColorScale.of(60, 100, 50),
+            input=ColorScale.of(0, 0, 5),
+            ring=ColorScale.of(60, 100, 50),
+            surface_1=ColorScale.of(0, 0, 3),
+            surface_2=ColorScale.of(0, 0, 6),
+            surface_3=ColorScale.of(0, 0, 10),
         ),
         dark=ThemeTokens(
-            background=ColorScale(0, 0, 0),        # Still black
-            foreground=ColorScale(60, 100, 50),    # Still yellow
-            card=ColorScale(0, 0, 5),
-            card_foreground=ColorScale(60, 100, 50),
-            popover=ColorScale(0, 0, 0),
-            popover_foreground=ColorScale(60, 100, 50),
-            primary=ColorScale(60, 100, 50),
-            primary_foreground=ColorScale(0, 0, 0),
-            secondary=ColorScale(60, 50, 30),
-            secondary_foreground=ColorScale(0, 0, 0),
-            muted=ColorScale(0, 0, 10),
-            muted_foreground=ColorScale(60, 80, 60),
-            accent=ColorScale(60, 100, 50),
-            accent_foreground=ColorScale(0, 0, 0),
-            destructive=ColorScale(60, 100, 50),
-            destructive_foreground=ColorScale(0, 0, 0),
-            success=ColorScale(60, 100, 50),
-            success_foreground=ColorScale(0, 0, 0),
-            warning=ColorScale(60, 100, 50),
-            warning_foreground=ColorScale(0, 0, 0),
-            info=ColorScale(60, 100, 50),
-            info_foreground=ColorScale(0, 0, 0),
-            link=ColorScale(60, 100, 50),
-            link_hover=ColorScale(60, 100, 60),
-            code=ColorScale(0, 0, 5),
-            code_foreground=ColorScale(60, 100, 50),
-            selection=ColorScale(60, 100, 50),
-            selection_foreground=ColorScale(0, 0, 0),
-            brand=ColorScale(60, 100, 50),
-            brand_foreground=ColorScale(0, 0, 0),
-            border=ColorScale(60, 100, 50),
-            input=ColorScale(0, 0, 5),
-            ring=ColorScale(60, 100, 50),
-            surface_1=ColorScale(0, 0, 3),
-            surface_2=ColorScale(0, 0, 6),
-            surface_3=ColorScale(0, 0, 10),
+            background=ColorScale.of(0, 0, 0),        # Still black
+            foreground=ColorScale.of(60, 100, 50),    # Still yellow
+            card=ColorScale.of(0, 0, 5),
+            card_foreground=ColorScale.of(60, 100, 50),
+            popover=ColorScale.of(0, 0, 0),
+            popover_foreground=ColorScale.of(60, 100, 50),
+            primary=ColorScale.of(60, 100, 50),
+            primary_foreground=ColorScale.of(0, 0, 0),
+            secondary=ColorScale.of(60, 50, 30),
+            secondary_foreground=ColorScale.of(0, 0, 0),
+            muted=ColorScale.of(0, 0, 10),
+            muted_foreground=ColorScale.of(60, 80, 60),
+            accent=ColorScale.of(60, 100, 50),
+            accent_foreground=ColorScale.of(0, 0, 0),
+            destructive=ColorScale.of(60, 100, 50),
+            destructive_foreground=ColorScale.of(0, 0, 0),
+            success=ColorScale.of(60, 100, 50),
+            success_foreground=ColorScale.of(0, 0, 0),
+            warning=ColorScale.of(60, 100, 50),
+            warning_foreground=ColorScale.of(0, 0, 0),
+            info=ColorScale.of(60, 100, 50),
+            info_foreground=ColorScale.of(0, 0, 0),
+            link=ColorScale.of(60, 100, 50),
+            link_hover=ColorScale.of(60, 100, 60),
+            code=ColorScale.of(0, 0, 5),
+            code_foreground=ColorScale.of(60, 100, 50),
+            selection=ColorScale.of(60, 100, 50),
+            selection_foreground=ColorScale.of(0, 0, 0),
+            brand=ColorScale.of(60, 100, 50),
+            brand_foreground=ColorScale.of(0, 0, 0),
+            border=ColorScale.of(60, 100, 50),
+            input=ColorScale.of(0, 0, 5),
+            ring=ColorScale.of(60, 100, 50),
+            surface_1=ColorScale.of(0, 0, 3),
+            surface_2=ColorScale.of(0, 0, 6),
+            surface_3=ColorScale.of(0, 0, 10),
         ),
         radius=0,  # Sharp corners for high contrast
     )
 }
 
 
-def get_all_high_contrast_presets() -> Dict[str, ThemePreset]:
-    """Get all high contrast presets (generated + pre-defined)."""
+@lru_cache(maxsize=1)
+def _all_high_contrast_presets() -> Dict[str, ThemePreset]:
     presets = generate_high_contrast_presets()
     presets.update(HIGH_CONTRAST_PRESETS)
     return presets
 
 
+_DEPENDENT_CACHE_CLEARS.append(_all_high_contrast_presets.cache_clear)
+
+
+def get_all_high_contrast_presets() -> Dict[str, ThemePreset]:
+    """Get all high contrast presets (generated + pre-defined).
+
+    The variants are generated once and reused until THEME_PRESETS changes;
+    each call returns a new dict so callers may modify it.
+    """
+    return dict(_all_high_contrast_presets())
+
+
 if __name__ == "__main__":
     import logging
 
@@ -7,13 +7,13 @@ and visual debugging capabilities for theme development.
 
 from typing import Dict, List, Any, Optional
 import json
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.template.response import TemplateResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 
 from .presets import get_preset, THEME_PRESETS
-from .theme_packs import get_design_system, get_all_design_systems
+from .theme_packs import get_design_system, design_systems_view
 from .design_system_css import generate_design_system_css
 
 
@@ -21,7 +21,7 @@ class ThemeInspector:
     """Runtime theme inspection and debugging utilities."""
     
     def __init__(self):
-        self.design_systems = get_all_design_systems()
+        self.design_systems = design_systems_view()
         self.color_presets = THEME_PRESETS
         
     def get_theme_info(
@@ -317,7 +317,12 @@ def theme_inspector_api(request):
 
 
 def theme_css_api(request):
-    """API endpoint to get CSS for a theme combination."""
+    """API endpoint to get CSS for a theme combination.
+
+    Pass ``?format=css`` to get the stylesheet itself as ``text/css``
+    instead of the JSON envelope (e.g. for swapping a ``<style>`` on
+    theme change).
+    """
     
     design = request.GET.get('design', 'minimalist')
     color = request.GET.get('color', 'default')
@@ -325,6 +330,9 @@ def theme_css_api(request):
     try:
         css = generate_design_system_css(design, color)
         
+        if request.GET.get('format') == 'css':
+            return HttpResponse(css, content_type="text/css")
+        
         return JsonResponse({
             "combination": f"{design}-{color}",
             "css": css,
@@ -6,6 +6,7 @@ Usage:
     python manage.py djust_theme export-colors [--preset blue] [--format json]
     python manage.py djust_theme list-presets
     python manage.py djust_theme generate-examples
+    python manage.py djust_theme collect-css [--preset blue] [--all-presets]
 """
 
 from django.core.management.base import BaseCommand, CommandError
@@ -294,6 +295,36 @@ class Command(BaseCommand):
             help='Override themes directory'
         )
 
+        # collect-css subcommand
+        collect_parser = subparsers.add_parser(
+            'collect-css',
+            help='Pre-render theme CSS to static files for serving without Python'
+        )
+        collect_parser.add_argument(
+            '--theme',
+            type=str,
+            default=None,
+            help='Design system to render (default: LIVEVIEW_CONFIG theme)'
+        )
+        collect_parser.add_argument(
+            '--preset',
+            type=str,
+            action='append',
+            dest='presets',
+            help='Color preset to render; repeatable (default: LIVEVIEW_CONFIG preset)'
+        )
+        collect_parser.add_argument(
+            '--all-presets',
+            action='store_true',
+            help='Render every registered color preset'
+        )
+        collect_parser.add_argument(
+            '--output-dir',
+            type=str,
+            default='static/djust_theming/themes',
+            help='Output directory (default: static/djust_theming/themes)'
+        )
+
     def handle(self, *args, **options):
         subcommand = options.get('subcommand')
 
@@ -325,6 +356,8 @@ class Command(BaseCommand):
             self.handle_check_compat(options)
         elif subcommand == 'marketplace-info':
             self.handle_marketplace_info(options)
+        elif subcommand == 'collect-css':
+            self.handle_collect_css(options)
         else:
             raise CommandError(f"Unknown subcommand: {subcommand}")
 
@@ -448,6 +481,48 @@ class Command(BaseCommand):
         except Exception as e:
             raise CommandError(f"Failed to generate examples: {e}")
 
+    def handle_collect_css(self, options):
+        """Write generated theme CSS to static files.
+
+        Each file holds exactly what the theme.css view would serve for that
+        (theme, preset) pair, so production can serve it from the static
+        file server/CDN instead of generating CSS per request.
+        """
+        from pathlib import Path
+
+        from djust_theming.manager import get_css_prefix, get_theme_config
+        from djust_theming.theme_css_generator import generate_theme_css
+
+        config = get_theme_config()
+        registry = get_registry()
+        theme = options['theme'] or config['theme']
+
+        if options['all_presets']:
+            presets = sorted(registry.list_presets())
+        else:
+            presets = options['presets'] or [config['preset']]
+
+        unknown = [name for name in presets if not registry.has_preset(name)]
+        if unknown:
+            raise CommandError(
+                f"Unknown preset(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(sorted(registry.list_presets().keys()))}"
+            )
+
+        output_dir = Path(options['output_dir'])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        css_prefix = get_css_prefix()
+
+        for preset in presets:
+            css = generate_theme_css(theme, preset, css_prefix)
+            path = output_dir / f"{theme}-{preset}.css"
+            path.write_text(css, encoding='utf-8')
+            self.stdout.write(f"  {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Wrote {len(presets)} theme stylesheet(s) to {output_dir}")
+        )
+
     def handle_shadcn_import(self, options):
         """Import a shadcn theme from JSON file."""
         input_file = options['input_file']
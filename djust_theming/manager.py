@@ -4,13 +4,20 @@ Theme state management for djust.
 Manages theme preset and mode preferences, with session persistence.
 """
 
+import hashlib
+import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 from django.conf import settings
 from django.http import HttpRequest
 
 from .presets import ThemePreset, get_preset
+from .registry import get_registry
+from .theme_packs import get_theme_pack
+
+logger = logging.getLogger(__name__)
 
 ThemeMode = Literal["light", "dark", "system"]
 
@@ -43,6 +50,9 @@ DEFAULT_CONFIG = {
     "critical_css": True,  # Split CSS into critical (inlined) and deferred (async-loaded)
     "themes_dir": "themes/",  # User theme directory, relative to BASE_DIR
     "direction": "auto",  # Text direction: "ltr", "rtl", or "auto" (detect from LANGUAGE_CODE)
+    "minify_css": False,  # Strip comments and whitespace from generated theme CSS
+    "warm_css_cache": False,  # Pre-generate the default theme's CSS in AppConfig.ready()
+    "gzip_css": False,  # Serve theme CSS views pre-gzipped to clients that accept gzip
 }
 
 
@@ -133,6 +143,18 @@ def generate_css_for_state(state: "ThemeState", css_prefix: str = "") -> str:
     )
 
 
+@lru_cache(maxsize=256)
+def get_css_version(css: str) -> str:
+    """
+    Return a short content hash of generated CSS for versioned asset URLs.
+
+    Keyed on the CSS string itself, so entries never go stale: the
+    generators return the same cached string object until their caches are
+    cleared, and the string's hash is computed only once.
+    """
+    return hashlib.sha1(css.encode()).hexdigest()[:12]
+
+
 def generate_critical_css_for_state(state: "ThemeState", css_prefix: str = "") -> str:
     """
     Generate critical CSS for a given theme state (for inline delivery).
@@ -150,17 +172,15 @@ def generate_critical_css_for_state(state: "ThemeState", css_prefix: str = "") -
     """
     if state.pack:
         try:
-            from .pack_css_generator import ThemePackCSSGenerator
+            from .pack_css_generator import generate_pack_critical_css
 
-            gen = ThemePackCSSGenerator(pack_name=state.pack)
-            return gen.theme_generator.generate_critical_css()
+            return generate_pack_critical_css(state.pack)
         except ValueError:
             pass
 
-    from .theme_css_generator import CompleteThemeCSSGenerator
+    from .theme_css_generator import generate_theme_critical_css
 
-    gen = CompleteThemeCSSGenerator(state.theme, state.preset, css_prefix=css_prefix)
-    return gen.generate_critical_css()
+    return generate_theme_critical_css(state.theme, state.preset, css_prefix)
 
 
 def generate_deferred_css_for_state(state: "ThemeState", css_prefix: str = "") -> str:
@@ -180,17 +200,15 @@ def generate_deferred_css_for_state(state: "ThemeState", css_prefix: str = "") -
     """
     if state.pack:
         try:
-            from .pack_css_generator import ThemePackCSSGenerator
+            from .pack_css_generator import generate_pack_deferred_css
 
-            gen = ThemePackCSSGenerator(pack_name=state.pack)
-            return gen.theme_generator.generate_deferred_css()
+            return generate_pack_deferred_css(state.pack)
         except ValueError:
             pass
 
-    from .theme_css_generator import CompleteThemeCSSGenerator
+    from .theme_css_generator import generate_theme_deferred_css
 
-    gen = CompleteThemeCSSGenerator(state.theme, state.preset, css_prefix=css_prefix)
-    return gen.generate_deferred_css()
+    return generate_theme_deferred_css(state.theme, state.preset, css_prefix)
 
 
 def get_theme_manager(request: HttpRequest | None = None) -> "ThemeManager":
@@ -232,6 +250,9 @@ class ThemeManager:
         self.request = request
         self.config = get_theme_config()
         self._session_key = self.config["session_key"]
+        self._state: ThemeState | None = None
+        # Resolved component/layout templates (see template_resolver).
+        self._templates: dict = {}
 
     @property
     def session(self):
@@ -248,6 +269,7 @@ class ThemeManager:
 
     def _set_session_data(self, data: dict) -> None:
         """Save theme data to session."""
+        self._state = None
         if self.session and self.config["persist_in_session"]:
             self.session[self._session_key] = data
 
@@ -255,13 +277,19 @@ class ThemeManager:
         """
         Get current theme state.
 
+        The state is resolved once per manager (and so once per request
+        via ``get_theme_manager``) and reset whenever a setter writes the
+        session.
+
         Returns:
             ThemeState with current theme, preset and mode
         """
-        from .registry import get_registry
-        import logging
-        logger = logging.getLogger(__name__)
+        if self._state is None:
+            self._state = self._resolve_state()
+        return self._state
 
+    def _resolve_state(self) -> ThemeState:
+        """Resolve theme state from cookies, session and config."""
         registry = get_registry()
         session_data = self._get_session_data()
 
@@ -291,7 +319,6 @@ class ThemeManager:
 
         # If pack is set, override theme and preset from pack
         if pack:
-            from .theme_packs import get_theme_pack
             theme_pack = get_theme_pack(pack)
             if theme_pack:
                 theme = theme_pack.design_theme
@@ -331,8 +358,6 @@ class ThemeManager:
         Returns:
             True if theme was valid and set
         """
-        from .registry import get_registry
-
         if not get_registry().has_theme(theme_name):
             return False
 
@@ -351,8 +376,6 @@ class ThemeManager:
         Returns:
             True if preset was valid and set
         """
-        from .registry import get_registry
-
         if not get_registry().has_preset(preset_name):
             return False
 
@@ -405,18 +428,17 @@ class ThemeManager:
 
     def get_available_presets(self) -> list[dict]:
         """Get list of available preset metadata."""
-        from .registry import get_registry
-
+        active = self.get_state().preset
         return [
             {
                 "name": preset.name,
                 "display_name": preset.display_name,
                 "description": preset.description,
-                "is_active": preset.name == self.get_state().preset,
+                "is_active": preset.name == active,
                 "primary_hsl": preset.dark.primary.to_hsl(),
                 "primary_hsl_light": preset.light.primary.to_hsl(),
             }
-            for preset in get_registry().list_presets().values()
+            for preset in get_registry().presets.values()
         ]
 
     def get_context(self) -> dict:
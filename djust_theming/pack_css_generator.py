@@ -8,8 +8,18 @@ and all other styling dimensions from a ThemePack.
 from functools import lru_cache
 
 from .manager import get_theme_config
-from .theme_packs import ThemePack, get_theme_pack, get_design_system
-from .theme_css_generator import CompleteThemeCSSGenerator
+from .theme_packs import (
+    AnimationStyle,
+    DesignSystem,
+    IconStyle,
+    IllustrationStyle,
+    InteractionStyle,
+    PatternStyle,
+    ThemePack,
+    get_design_system,
+    get_theme_pack,
+)
+from .theme_css_generator import CompleteThemeCSSGenerator, _finish_css
 
 
 class ThemePackCSSGenerator:
@@ -79,100 +89,126 @@ class ThemePackCSSGenerator:
     def _generate_design_system_vars(self) -> str:
         """Generate :root CSS variables from the pack's DesignSystem."""
         ds = get_design_system(self.pack.design_theme)
-        if not ds:
-            return ""
-
-        typo = ds.typography
-        layout = ds.layout
-        surface = ds.surface
-        anim = ds.animation
-
-        shape_map = {
-            "sharp": "0px",
-            "rounded": "var(--border-radius-md)",
-            "pill": "9999px",
-            "organic": "var(--border-radius-lg)",
-        }
-
-        lines = [
-            ":root {",
-            "  /* Design System: Typography */",
-            f"  --font-heading: {typo.heading_font};",
-            f"  --font-body: {typo.body_font};",
-            f"  --font-size-base: {typo.base_size};",
-            f"  --font-scale: {typo.heading_scale};",
-            f"  --line-height: {typo.line_height};",
-            f"  --font-weight-heading: {typo.heading_weight};",
-            f"  --font-weight-section: {typo.section_heading_weight};",
-            f"  --font-weight-body: {typo.body_weight};",
-            f"  --letter-spacing: {typo.letter_spacing};",
-            f"  --body-line-height: {typo.body_line_height};",
-            f"  --prose-max-width: {typo.prose_max_width};",
-            f"  --badge-radius: {typo.badge_radius};",
-            "",
-            "  /* Design System: Layout */",
-            f"  --space-unit: {layout.space_unit};",
-            f"  --space-scale: {layout.space_scale};",
-            f"  --border-radius-sm: {layout.border_radius_sm};",
-            f"  --border-radius-md: {layout.border_radius_md};",
-            f"  --border-radius-lg: {layout.border_radius_lg};",
-            f"  /* Aliases for djust-components compatibility */",
-            f"  --radius: {layout.border_radius_md};",
-            f"  --radius-sm: {layout.border_radius_sm};",
-            f"  --radius-md: {layout.border_radius_md};",
-            f"  --radius-lg: {layout.border_radius_lg};",
-            f"  --container-width: {layout.container_width};",
-            f"  --grid-gap: {layout.grid_gap};",
-            f"  --section-spacing: {layout.section_spacing};",
-            f"  --button-radius: {shape_map.get(layout.button_shape, layout.border_radius_md)};",
-            f"  --card-radius: {shape_map.get(layout.card_shape, layout.border_radius_lg)};",
-            f"  --input-radius: {shape_map.get(layout.input_shape, layout.border_radius_sm)};",
-            "",
-            "  /* Design System: Hero */",
-            f"  --hero-padding-top: {layout.hero_padding_top};",
-            f"  --hero-padding-bottom: {layout.hero_padding_bottom};",
-            f"  --hero-line-height: {layout.hero_line_height};",
-            f"  --hero-max-width: {layout.hero_max_width};",
-            "",
-            "  /* Design System: Surfaces */",
-            f"  --shadow-sm: {surface.shadow_sm};",
-            f"  --shadow-md: {surface.shadow_md};",
-            f"  --shadow-lg: {surface.shadow_lg};",
-            f"  --border-width: {surface.border_width};",
-            f"  --border-style: {surface.border_style};",
-            f"  --backdrop-blur: {surface.backdrop_blur};",
-        ]
+        return _design_system_vars_css(ds) if ds else ""
 
-        # Glass surface treatment gets card opacity + blur
-        if surface.surface_treatment == "glass":
-            lines.extend([
-                "  --card-opacity: 0.7;",
-                f"  --card-blur: {surface.backdrop_blur};",
-            ])
+    def _generate_icon_css(self) -> str:
+        """Generate CSS for icon styling."""
+        return _icon_css(self.pack.icon_style)
 
-        lines.extend([
-            "",
-            "  /* Design System: Animation */",
-            f"  --duration-fast: {anim.duration_fast};",
-            f"  --duration-normal: {anim.duration_normal};",
-            f"  --duration-slow: {anim.duration_slow};",
-            f"  --easing: {anim.easing};",
-        ])
+    def _generate_animation_css(self) -> str:
+        """Generate CSS for animations and transitions."""
+        return _animation_css(self.pack.animation_style)
 
-        if anim.hover_scale != 1.0:
-            lines.append(f"  --hover-scale: {anim.hover_scale};")
-        if anim.hover_translate_y != "0px":
-            lines.append(f"  --hover-translate-y: {anim.hover_translate_y};")
+    def _generate_pattern_css(self) -> str:
+        """Generate CSS for background patterns."""
+        return _pattern_css(self.pack.pattern_style)
 
-        lines.append("}")
-        return "\n".join(lines)
+    def _generate_interaction_css(self) -> str:
+        """Generate CSS for user interactions."""
+        return _interaction_css(self.pack.interaction_style)
 
-    def _generate_icon_css(self) -> str:
-        """Generate CSS for icon styling."""
-        icon = self.pack.icon_style
+    def _generate_illustration_css(self) -> str:
+        """Generate CSS for illustrations and images."""
+        return _illustration_css(self.pack.illustration_style)
+
+
+# Per-section builders are cached on the (frozen) style objects, so packs
+# that share a style reuse its CSS and a pack cache miss only re-joins them.
+
+@lru_cache(maxsize=128)
+def _design_system_vars_css(ds: DesignSystem) -> str:
+    """Generate :root CSS variables from the pack's DesignSystem."""
+    typo = ds.typography
+    layout = ds.layout
+    surface = ds.surface
+    anim = ds.animation
+
+    shape_map = {
+        "sharp": "0px",
+        "rounded": "var(--border-radius-md)",
+        "pill": "9999px",
+        "organic": "var(--border-radius-lg)",
+    }
+
+    lines = [
+        ":root {",
+        "  /* Design System: Typography */",
+        f"  --font-heading: {typo.heading_font};",
+        f"  --font-body: {typo.body_font};",
+        f"  --font-size-base: {typo.base_size};",
+        f"  --font-scale: {typo.heading_scale};",
+        f"  --line-height: {typo.line_height};",
+        f"  --font-weight-heading: {typo.heading_weight};",
+        f"  --font-weight-section: {typo.section_heading_weight};",
+        f"  --font-weight-body: {typo.body_weight};",
+        f"  --letter-spacing: {typo.letter_spacing};",
+        f"  --body-line-height: {typo.body_line_height};",
+        f"  --prose-max-width: {typo.prose_max_width};",
+        f"  --badge-radius: {typo.badge_radius};",
+        "",
+        "  /* Design System: Layout */",
+        f"  --space-unit: {layout.space_unit};",
+        f"  --space-scale: {layout.space_scale};",
+        f"  --border-radius-sm: {layout.border_radius_sm};",
+        f"  --border-radius-md: {layout.border_radius_md};",
+        f"  --border-radius-lg: {layout.border_radius_lg};",
+        f"  /* Aliases for djust-components compatibility */",
+        f"  --radius: {layout.border_radius_md};",
+        f"  --radius-sm: {layout.border_radius_sm};",
+        f"  --radius-md: {layout.border_radius_md};",
+        f"  --radius-lg: {layout.border_radius_lg};",
+        f"  --container-width: {layout.container_width};",
+        f"  --grid-gap: {layout.grid_gap};",
+        f"  --section-spacing: {layout.section_spacing};",
+        f"  --button-radius: {shape_map.get(layout.button_shape, layout.border_radius_md)};",
+        f"  --card-radius: {shape_map.get(layout.card_shape, layout.border_radius_lg)};",
+        f"  --input-radius: {shape_map.get(layout.input_shape, layout.border_radius_sm)};",
+        "",
+        "  /* Design System: Hero */",
+        f"  --hero-padding-top: {layout.hero_padding_top};",
+        f"  --hero-padding-bottom: {layout.hero_padding_bottom};",
+        f"  --hero-line-height: {layout.hero_line_height};",
+        f"  --hero-max-width: {layout.hero_max_width};",
+        "",
+        "  /* Design System: Surfaces */",
+        f"  --shadow-sm: {surface.shadow_sm};",
+        f"  --shadow-md: {surface.shadow_md};",
+        f"  --shadow-lg: {surface.shadow_lg};",
+        f"  --border-width: {surface.border_width};",
+        f"  --border-style: {surface.border_style};",
+        f"  --backdrop-blur: {surface.backdrop_blur};",
+    ]
+
+    # Glass surface treatment gets card opacity + blur
+    if surface.surface_treatment == "glass":
+        lines.extend([
+            "  --card-opacity: 0.7;",
+            f"  --card-blur: {surface.backdrop_blur};",
+        ])
 
-        # Base icon CSS that applies to all SVGs
-        base_css = f"""
+    lines.extend([
+        "",
+        "  /* Design System: Animation */",
+        f"  --duration-fast: {anim.duration_fast};",
+        f"  --duration-normal: {anim.duration_normal};",
+        f"  --duration-slow: {anim.duration_slow};",
+        f"  --easing: {anim.easing};",
+    ])
+
+    if anim.hover_scale != 1.0:
+        lines.append(f"  --hover-scale: {anim.hover_scale};")
+    if anim.hover_translate_y != "0px":
+        lines.append(f"  --hover-translate-y: {anim.hover_translate_y};")
+
+    lines.append("}")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=128)
+def _icon_css(icon: IconStyle) -> str:
+    """Generate CSS for icon styling."""
+    # Base icon CSS that applies to all SVGs
+    base_css = f"""
 :root {{
   --icon-stroke-width: {icon.stroke_width};
   --icon-corner-rounding: {icon.corner_rounding};
@@ -185,10 +221,10 @@ svg {{
 }}
 """
 
-        # Style-specific CSS modifications with !important to override inline SVG attributes
-        style_css = ""
-        if icon.style == "filled":
-            style_css = """
+    # Style-specific CSS modifications with !important to override inline SVG attributes
+    style_css = ""
+    if icon.style == "filled":
+        style_css = """
 /* Filled icon style */
 svg {
   fill: currentColor !important;
@@ -199,8 +235,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {
   stroke: none !important;
 }
 """
-        elif icon.style == "outlined":
-            style_css = f"""
+    elif icon.style == "outlined":
+        style_css = f"""
 /* Outlined icon style */
 svg {{
   fill: none !important;
@@ -214,8 +250,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   stroke: currentColor !important;
 }}
 """
-        elif icon.style == "rounded":
-            style_css = f"""
+    elif icon.style == "rounded":
+        style_css = f"""
 /* Rounded icon style */
 svg {{
   fill: currentColor !important;
@@ -233,8 +269,8 @@ svg rect {{
   rx: 2 !important;
 }}
 """
-        elif icon.style == "sharp":
-            style_css = f"""
+    elif icon.style == "sharp":
+        style_css = f"""
 /* Sharp icon style */
 svg {{
   fill: currentColor !important;
@@ -249,8 +285,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   stroke-width: {icon.stroke_width} !important;
 }}
 """
-        elif icon.style == "thin":
-            style_css = f"""
+    elif icon.style == "thin":
+        style_css = f"""
 /* Thin icon style */
 svg {{
   fill: none !important;
@@ -266,36 +302,36 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
 }}
 """
 
-        return base_css + style_css
+    return base_css + style_css
 
-    def _generate_animation_css(self) -> str:
-        """Generate CSS for animations and transitions."""
-        anim = self.pack.animation_style
 
-        hover_css = ""
-        if anim.hover_effect == "lift":
-            hover_css = f"""
+@lru_cache(maxsize=128)
+def _animation_css(anim: AnimationStyle) -> str:
+    """Generate CSS for animations and transitions."""
+    hover_css = ""
+    if anim.hover_effect == "lift":
+        hover_css = f"""
 .btn:hover, .card:hover {{
   transform: translateY({anim.hover_translate_y});
   box-shadow: 0 8px 16px rgba(0,0,0,0.1);
 }}
 """
-        elif anim.hover_effect == "scale":
-            hover_css = f"""
+    elif anim.hover_effect == "scale":
+        hover_css = f"""
 .btn:hover, .card:hover {{
   transform: scale({anim.hover_scale});
 }}
 """
-        elif anim.hover_effect == "glow":
-            hover_css = """
+    elif anim.hover_effect == "glow":
+        hover_css = """
 .btn:hover, .card:hover {
   box-shadow: 0 0 20px hsla(var(--primary), 0.5);
 }
 """
 
-        click_css = ""
-        if anim.click_effect == "ripple":
-            click_css = """
+    click_css = ""
+    if anim.click_effect == "ripple":
+        click_css = """
 .btn:active {
   position: relative;
   overflow: hidden;
@@ -316,8 +352,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   }
 }
 """
-        elif anim.click_effect == "pulse":
-            click_css = """
+    elif anim.click_effect == "pulse":
+        click_css = """
 .btn:active {
   animation: pulse 0.3s ease-out;
 }
@@ -327,8 +363,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   50% { transform: scale(0.95); }
 }
 """
-        elif anim.click_effect == "bounce":
-            click_css = """
+    elif anim.click_effect == "bounce":
+        click_css = """
 .btn:active {
   animation: bounce 0.4s ease-out;
 }
@@ -340,9 +376,9 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
 }
 """
 
-        entrance_css = ""
-        if anim.entrance_effect == "fade":
-            entrance_css = """
+    entrance_css = ""
+    if anim.entrance_effect == "fade":
+        entrance_css = """
 @keyframes entrance-fade {{
   from {{ opacity: 0; }}
   to {{ opacity: 1; }}
@@ -352,8 +388,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   animation: entrance-fade {duration_fast} {easing};
 }}
 """.format(duration_fast=anim.duration_fast, easing=anim.easing)
-        elif anim.entrance_effect == "slide":
-            entrance_css = """
+    elif anim.entrance_effect == "slide":
+        entrance_css = """
 @keyframes entrance-slide {{
   from {{
     opacity: 0;
@@ -369,8 +405,8 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
   animation: entrance-slide {duration_normal} {easing};
 }}
 """.format(duration_normal=anim.duration_normal, easing=anim.easing)
-        elif anim.entrance_effect == "scale":
-            entrance_css = """
+    elif anim.entrance_effect == "scale":
+        entrance_css = """
 @keyframes entrance-scale {{
   from {{
     opacity: 0;
@@ -387,7 +423,7 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
 }}
 """.format(duration_fast=anim.duration_fast, easing=anim.easing)
 
-        return f"""
+    return f"""
 :root {{
   --anim-duration-fast: {anim.duration_fast};
   --anim-duration-normal: {anim.duration_normal};
@@ -422,13 +458,13 @@ svg path, svg circle, svg rect, svg polygon, svg line {{
 }}
 """
 
-    def _generate_pattern_css(self) -> str:
-        """Generate CSS for background patterns."""
-        pattern = self.pack.pattern_style
 
-        pattern_bg = ""
-        if pattern.background_pattern == "dots":
-            pattern_bg = f"""
+@lru_cache(maxsize=128)
+def _pattern_css(pattern: PatternStyle) -> str:
+    """Generate CSS for background patterns."""
+    pattern_bg = ""
+    if pattern.background_pattern == "dots":
+        pattern_bg = f"""
 body::before {{
   content: '';
   position: fixed;
@@ -440,8 +476,8 @@ body::before {{
   z-index: -1;
 }}
 """
-        elif pattern.background_pattern == "grid":
-            pattern_bg = f"""
+    elif pattern.background_pattern == "grid":
+        pattern_bg = f"""
 body::before {{
   content: '';
   position: fixed;
@@ -454,8 +490,8 @@ body::before {{
   z-index: -1;
 }}
 """
-        elif pattern.background_pattern == "noise":
-            pattern_bg = f"""
+    elif pattern.background_pattern == "noise":
+        pattern_bg = f"""
 body::before {{
   content: '';
   position: fixed;
@@ -466,8 +502,8 @@ body::before {{
   z-index: -1;
 }}
 """
-        elif pattern.background_pattern == "gradient":
-            pattern_bg = f"""
+    elif pattern.background_pattern == "gradient":
+        pattern_bg = f"""
 body::before {{
   content: '';
   position: fixed;
@@ -480,17 +516,17 @@ body::before {{
 }}
 """
 
-        surface_css = ""
-        if pattern.surface_style == "glass":
-            surface_css = f"""
+    surface_css = ""
+    if pattern.surface_style == "glass":
+        surface_css = f"""
 .card, .modal, .dropdown {{
   background: hsla(var(--card), 0.8);
   backdrop-filter: blur({pattern.backdrop_blur});
   -webkit-backdrop-filter: blur({pattern.backdrop_blur});
 }}
 """
-        elif pattern.surface_style == "neumorphic":
-            surface_css = """
+    elif pattern.surface_style == "neumorphic":
+        surface_css = """
 .card {
   background: hsl(var(--background));
   box-shadow:
@@ -499,69 +535,69 @@ body::before {{
 }
 """
 
-        return f"""
+    return f"""
 {pattern_bg}
 
 {surface_css}
 """
 
-    def _generate_interaction_css(self) -> str:
-        """Generate CSS for user interactions."""
-        interact = self.pack.interaction_style
-
-        button_hover = ""
-        if interact.button_hover == "lift":
-            button_hover = "transform: translateY(-2px); box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
-        elif interact.button_hover == "scale":
-            button_hover = "transform: scale(1.05);"
-        elif interact.button_hover == "glow":
-            button_hover = "box-shadow: 0 0 16px hsla(var(--primary), 0.5);"
-        elif interact.button_hover == "darken":
-            button_hover = "filter: brightness(0.9);"
-
-        link_hover = ""
-        if interact.link_hover == "underline":
-            link_hover = "text-decoration: underline;"
-        elif interact.link_hover == "color":
-            link_hover = "color: hsl(var(--primary));"
-        elif interact.link_hover == "background":
-            link_hover = "background-color: hsla(var(--primary), 0.1);"
-
-        card_hover = ""
-        if interact.card_hover == "lift":
-            card_hover = "transform: translateY(-4px); box-shadow: 0 8px 16px rgba(0,0,0,0.1);"
-        elif interact.card_hover == "scale":
-            card_hover = "transform: scale(1.02);"
-        elif interact.card_hover == "border":
-            card_hover = "border-color: hsl(var(--primary));"
-        elif interact.card_hover == "shadow":
-            card_hover = "box-shadow: 0 4px 12px rgba(0,0,0,0.1);"
-
-        focus_css = ""
-        if interact.focus_style == "ring":
-            focus_css = f"""
+
+@lru_cache(maxsize=128)
+def _interaction_css(interact: InteractionStyle) -> str:
+    """Generate CSS for user interactions."""
+    button_hover = ""
+    if interact.button_hover == "lift":
+        button_hover = "transform: translateY(-2px); box-shadow: 0 4px 8px rgba(0,0,0,0.1);"
+    elif interact.button_hover == "scale":
+        button_hover = "transform: scale(1.05);"
+    elif interact.button_hover == "glow":
+        button_hover = "box-shadow: 0 0 16px hsla(var(--primary), 0.5);"
+    elif interact.button_hover == "darken":
+        button_hover = "filter: brightness(0.9);"
+
+    link_hover = ""
+    if interact.link_hover == "underline":
+        link_hover = "text-decoration: underline;"
+    elif interact.link_hover == "color":
+        link_hover = "color: hsl(var(--primary));"
+    elif interact.link_hover == "background":
+        link_hover = "background-color: hsla(var(--primary), 0.1);"
+
+    card_hover = ""
+    if interact.card_hover == "lift":
+        card_hover = "transform: translateY(-4px); box-shadow: 0 8px 16px rgba(0,0,0,0.1);"
+    elif interact.card_hover == "scale":
+        card_hover = "transform: scale(1.02);"
+    elif interact.card_hover == "border":
+        card_hover = "border-color: hsl(var(--primary));"
+    elif interact.card_hover == "shadow":
+        card_hover = "box-shadow: 0 4px 12px rgba(0,0,0,0.1);"
+
+    focus_css = ""
+    if interact.focus_style == "ring":
+        focus_css = f"""
 *:focus-visible {{
   outline: none;
   box-shadow: 0 0 0 2px hsl(var(--background)),
               0 0 0 calc(2px + {interact.focus_ring_width}) hsl(var(--ring));
 }}
 """
-        elif interact.focus_style == "outline":
-            focus_css = f"""
+    elif interact.focus_style == "outline":
+        focus_css = f"""
 *:focus-visible {{
   outline: {interact.focus_ring_width} solid hsl(var(--ring));
   outline-offset: 2px;
 }}
 """
-        elif interact.focus_style == "glow":
-            focus_css = """
+    elif interact.focus_style == "glow":
+        focus_css = """
 *:focus-visible {
   outline: none;
   box-shadow: 0 0 0 3px hsla(var(--ring), 0.3);
 }
 """
-        elif interact.focus_style == "underline":
-            focus_css = """
+    elif interact.focus_style == "underline":
+        focus_css = """
 *:focus-visible {
   outline: none;
   text-decoration: underline;
@@ -571,7 +607,7 @@ body::before {{
 }
 """
 
-        return f"""
+    return f"""
 .btn:hover {{
   {button_hover}
 }}
@@ -591,21 +627,21 @@ button, a, .clickable {{
 }}
 """
 
-    def _generate_illustration_css(self) -> str:
-        """Generate CSS for illustrations and images."""
-        illust = self.pack.illustration_style
-
-        filter_css = ""
-        if illust.image_filter == "grayscale":
-            filter_css = "filter: grayscale(100%);"
-        elif illust.image_filter == "sepia":
-            filter_css = "filter: sepia(60%);"
-        elif illust.image_filter == "vibrant":
-            filter_css = "filter: saturate(1.3) contrast(1.1);"
-        elif illust.image_filter == "duotone":
-            filter_css = "filter: grayscale(100%) contrast(1.2) brightness(0.9);"
-
-        return f"""
+
+@lru_cache(maxsize=128)
+def _illustration_css(illust: IllustrationStyle) -> str:
+    """Generate CSS for illustrations and images."""
+    filter_css = ""
+    if illust.image_filter == "grayscale":
+        filter_css = "filter: grayscale(100%);"
+    elif illust.image_filter == "sepia":
+        filter_css = "filter: sepia(60%);"
+    elif illust.image_filter == "vibrant":
+        filter_css = "filter: saturate(1.3) contrast(1.1);"
+    elif illust.image_filter == "duotone":
+        filter_css = "filter: grayscale(100%) contrast(1.2) brightness(0.9);"
+
+    return f"""
 img, .illustration {{
   border-radius: {illust.image_border_radius};
   {filter_css}
@@ -627,7 +663,8 @@ def generate_pack_css(pack_name: str) -> str:
     Generate complete CSS for a theme pack (cached).
 
     Results are cached by pack_name. Use ``clear_css_cache()``
-    to invalidate during development.
+    to invalidate during development. When the ``minify_css`` config
+    option is set, the cached string is minified.
 
     Args:
         pack_name: Name of the theme pack
@@ -636,4 +673,26 @@ def generate_pack_css(pack_name: str) -> str:
         Complete CSS string for the theme pack
     """
     generator = ThemePackCSSGenerator(pack_name)
-    return generator.generate_css()
+    return _finish_css(generator.generate_css())
+
+
+@lru_cache(maxsize=64)
+def generate_pack_critical_css(pack_name: str) -> str:
+    """
+    Generate critical (first-paint) CSS for a theme pack (cached).
+
+    Raises:
+        ValueError: If the pack does not exist (not cached).
+    """
+    return _finish_css(ThemePackCSSGenerator(pack_name).theme_generator.generate_critical_css())
+
+
+@lru_cache(maxsize=64)
+def generate_pack_deferred_css(pack_name: str) -> str:
+    """
+    Generate deferred (async-loaded) CSS for a theme pack (cached).
+
+    Raises:
+        ValueError: If the pack does not exist (not cached).
+    """
+    return _finish_css(ThemePackCSSGenerator(pack_name).theme_generator.generate_deferred_css())
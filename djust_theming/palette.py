@@ -134,10 +134,15 @@ def _clamp(val: float, lo: float, hi: float) -> int:
     return round(max(lo, min(hi, val)))
 
 
+# Shared foreground candidates for _pick_fg_on (interned, built once).
+_NEAR_WHITE = ColorScale.of(0, 0, 98)
+_NEAR_BLACK = ColorScale.of(0, 0, 4)
+
+
 def _pick_fg_on(bg: ColorScale) -> ColorScale:
     """Return near-white or near-black, whichever has more contrast on *bg*."""
-    white = ColorScale(0, 0, 98)
-    black = ColorScale(0, 0, 4)
+    white = _NEAR_WHITE
+    black = _NEAR_BLACK
     if _contrast_ratio(white, bg) >= _contrast_ratio(black, bg):
         return white
     return black
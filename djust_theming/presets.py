@@ -5,36 +5,99 @@ Based on shadcn/ui theming system with CSS custom properties.
 Each preset is defined in its own file under themes/.
 """
 
-from dataclasses import dataclass
-from typing import Tuple
+from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
+from operator import attrgetter
 
-@dataclass
+from .colors import hex_to_hsl, hsl_to_hex, hsl_to_rgb, rgb_to_hsl
+
+
+@dataclass(frozen=True)
 class ColorScale:
-    """HSL color representation for CSS custom properties."""
+    """HSL color representation for CSS custom properties.
+
+    Instances are immutable so identical triples can be shared between
+    presets; use :meth:`of` to get the canonical instance for a triple.
+    Slotted: thousands are created across presets and palettes, so there is
+    no per-instance ``__dict__``.
+    """
+
+    # Declared by hand rather than with slots=True so the cached CSS strings
+    # (formatted once in __post_init__; instances are immutable) get slots
+    # without becoming dataclass fields, keeping fields()/asdict() to h/s/l.
+    __slots__ = ("h", "s", "lightness", "_hsl", "_hsl_func")
 
     h: int  # Hue 0-360
     s: int  # Saturation 0-100
     lightness: int  # Lightness 0-100
 
+    def __post_init__(self):
+        object.__setattr__(self, "_hsl", f"{self.h} {self.s}% {self.lightness}%")
+        object.__setattr__(
+            self, "_hsl_func", f"hsl({self.h}, {self.s}%, {self.lightness}%)"
+        )
+
+    @classmethod
+    def of(cls, h: int, s: int, lightness: int) -> "ColorScale":
+        """Return the shared (interned) ColorScale for ``(h, s, lightness)``."""
+        key = _pack_hsl(h, s, lightness)
+        color = _COLOR_INTERN.get(key)
+        if color is None:
+            color = _COLOR_INTERN.setdefault(key, cls(h, s, lightness))
+        return color
+
+    @classmethod
+    def from_packed(cls, value: int) -> "ColorScale":
+        """Create ColorScale from an int produced by :attr:`packed`."""
+        return cls.of(value >> 14, (value >> 7) & 0x7F, value & 0x7F)
+
+    def __eq__(self, other):
+        # Interned colors (see of()) compare by identity without building tuples.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.h == other.h
+            and self.s == other.s
+            and self.lightness == other.lightness
+        )
+
+    def __reduce__(self):
+        # Unpickle through of(): shares the interned instance and skips
+        # re-formatting the CSS strings.
+        return (ColorScale.of, (self.h, self.s, self.lightness))
+
+    @property
+    def packed(self) -> int:
+        """Return the color packed into one int (H: 9 bits, S: 7, L: 7).
+
+        Raises:
+            ValueError: If a component is not an int in range (H 0-360,
+                S and L 0-100), since it would alias another color.
+        """
+        key = _pack_hsl(self.h, self.s, self.lightness)
+        if type(key) is not int:
+            raise ValueError(f"Cannot pack out-of-range HSL color {self!r}")
+        return key
+
     def to_hsl(self) -> str:
         """Return HSL values for CSS variable (without hsl() wrapper)."""
-        return f"{self.h} {self.s}% {self.lightness}%"
+        return self._hsl
 
     def to_hsl_func(self) -> str:
         """Return complete hsl() function."""
-        return f"hsl({self.h}, {self.s}%, {self.lightness}%)"
+        return self._hsl_func
 
     def to_hex(self) -> str:
         """Return hex color string, e.g. '#3b82f6'."""
-        from .colors import hsl_to_hex
-
         return hsl_to_hex(self.h, self.s, self.lightness)
 
-    def to_rgb(self) -> Tuple[int, int, int]:
+    def to_rgb(self) -> tuple[int, int, int]:
         """Return RGB tuple (0-255 each)."""
-        from .colors import hsl_to_rgb
-
         return hsl_to_rgb(self.h, self.s, self.lightness)
 
     def to_rgb_func(self) -> str:
@@ -45,16 +108,12 @@ class ColorScale:
     @classmethod
     def from_hex(cls, hex_str: str) -> "ColorScale":
         """Create ColorScale from hex string (#RRGGBB or #RGB)."""
-        from .colors import hex_to_hsl
-
         h, s, l = hex_to_hsl(hex_str)
         return cls(h, s, l)
 
     @classmethod
     def from_rgb(cls, r: int, g: int, b: int) -> "ColorScale":
         """Create ColorScale from RGB values (0-255 each)."""
-        from .colors import rgb_to_hsl
-
         h, s, l = rgb_to_hsl(r, g, b)
         return cls(h, s, l)
 
@@ -67,7 +126,23 @@ class ColorScale:
         return ColorScale(self.h, new_saturation, self.lightness)
 
 
-@dataclass
+def _pack_hsl(h: int, s: int, lightness: int) -> int | tuple:
+    """Key for the intern table: the packed int when the triple fits 9/7/7 bits."""
+    if (
+        type(h) is int and type(s) is int and type(lightness) is int
+        and 0 <= h <= 360 and 0 <= s <= 100 and 0 <= lightness <= 100
+    ):
+        return (h << 14) | (s << 7) | lightness
+    return (h, s, lightness)
+
+
+# Flyweight table backing ColorScale.of(), keyed by packed HSL int. Theme
+# literals repeat the same triples (pure white, near-black, shared accents)
+# many times over.
+_COLOR_INTERN: dict[int | tuple, ColorScale] = {}
+
+
+@dataclass(frozen=True)
 class ThemeTokens:
     """
     Complete token set for a theme mode.
@@ -152,8 +227,43 @@ class ThemeTokens:
     surface_2: ColorScale
     surface_3: ColorScale
 
+    def __eq__(self, other):
+        # Presets built from interned colors share ColorScale objects, so
+        # most fields match on identity; tuple comparison checks `is` first.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.colors == other.colors
+
+    def __getstate__(self):
+        # Only the fields; cached properties are rebuilt on demand.
+        state = self.__dict__
+        return {name: state[name] for name in COLOR_TOKEN_FIELDS}
+
+    @cached_property
+    def colors(self) -> tuple[ColorScale, ...]:
+        """All colors as one flat tuple, in COLOR_TOKEN_FIELDS order."""
+        return _get_token_colors(self)
 
-@dataclass
+    @cached_property
+    def hsl_values(self) -> tuple[str, ...]:
+        """Every color as an HSL string, in COLOR_TOKEN_FIELDS order.
+
+        Tokens are immutable, so this is formatted once per instance and
+        reused for every CSS block (light, dark, media query) and request.
+        """
+        return tuple(color.to_hsl() for color in self.colors)
+
+
+# Column order for ThemeTokens colors. Consumers that emit every token (CSS
+# generators, exporters) zip this with ThemeTokens.hsl_values instead of
+# spelling out one attribute lookup per field.
+COLOR_TOKEN_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(ThemeTokens))
+_get_token_colors = attrgetter(*COLOR_TOKEN_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
 class SurfaceTreatment:
     """Surface styling treatments for glass panels, gradients, and noise effects."""
 
@@ -174,9 +284,14 @@ class SurfaceTreatment:
     noise_opacity: float = 0.03
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemePreset:
-    """A complete theme with light and dark mode tokens."""
+    """A complete theme with light and dark mode tokens.
+
+    Immutable; use ``dataclasses.replace`` to derive a variant. Presets
+    compare by value and are hashable (the dict fields are left out of the
+    hash), so they can be used as cache keys.
+    """
 
     name: str
     display_name: str
@@ -194,18 +309,23 @@ class ThemePreset:
     # Use this for brand-specific variables like --color-brand-rust,
     # --background-image-grid-pattern, --animation-pulse-slow, etc.
     # These are emitted in the base :root block.
-    extra_css_vars: dict | None = None
+    extra_css_vars: dict | None = field(default=None, hash=False)
 
     # Per-mode brand CSS variables for light and dark modes.
     # Use these for brand surface colors that need to differ between modes
     # (e.g., --color-brand-dark: #0B0F19 in dark, #f8fafc in light).
     # If None, extra_css_vars is used for both modes.
-    extra_css_vars_light: dict | None = None
-    extra_css_vars_dark: dict | None = None
+    extra_css_vars_light: dict | None = field(default=None, hash=False)
+    extra_css_vars_dark: dict | None = field(default=None, hash=False)
 
     # Surface treatment for glass panels, gradients, etc.
     surface: SurfaceTreatment | None = None
 
+    def __post_init__(self):
+        # Names double as registry and cache keys; interning them lets
+        # lookups keyed by preset.name compare by identity.
+        object.__setattr__(self, "name", sys.intern(self.name))
+
 
 # =============================================================================
 # Theme Imports — each theme is defined in its own file under themes/
@@ -279,7 +399,49 @@ from .themes.adaptive import PRESET as ADAPTIVE_THEME  # noqa: E402
 # Preset Registry
 # =============================================================================
 
-THEME_PRESETS: dict[str, ThemePreset] = {
+class _PresetDict(dict):
+    """The THEME_PRESETS dict; modifying it clears the preset lookup memos.
+
+    A plain dict for every read; assigning, deleting or updating presets
+    (``THEME_PRESETS[name] = preset``) invalidates the get_preset() /
+    list_presets() caches.
+    """
+
+    def __setitem__(self, name: str, preset: ThemePreset) -> None:
+        # Built-in keys are interned as source literals; intern runtime
+        # registrations too so lookups hit the identity fast path.
+        super().__setitem__(sys.intern(name), preset)
+        _clear_lookup_caches()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        _clear_lookup_caches()
+
+    def update(self, *args, **kwargs) -> None:
+        for name, preset in dict(*args, **kwargs).items():
+            self[name] = preset
+
+    def setdefault(self, name: str, default=None):
+        if name not in self:
+            self[name] = default
+        return self[name]
+
+    def pop(self, name: str, *default):
+        preset = super().pop(name, *default)
+        _clear_lookup_caches()
+        return preset
+
+    def popitem(self):
+        item = super().popitem()
+        _clear_lookup_caches()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        _clear_lookup_caches()
+
+
+THEME_PRESETS: dict[str, ThemePreset] = _PresetDict({
     "default": DEFAULT_THEME,
     "shadcn": SHADCN_THEME,
     "blue": BLUE_THEME,
@@ -342,21 +504,49 @@ THEME_PRESETS: dict[str, ThemePreset] = {
     "supabase": SUPABASE_THEME,
     "raycast": RAYCAST_THEME,
     "adaptive": ADAPTIVE_THEME,
-}
+})
 
 
+@lru_cache(maxsize=64)
 def get_preset(name: str) -> ThemePreset:
-    """Get a theme preset by name, with fallback to default."""
+    """Get a theme preset by name, with fallback to default.
+
+    Memoized; the cache is cleared whenever THEME_PRESETS is modified.
+    Preset keys are interned, so names that are literals (or were passed
+    through ``sys.intern``) match on identity without comparing characters.
+    """
     return THEME_PRESETS.get(name, DEFAULT_THEME)
 
 
-def list_presets() -> list[dict]:
-    """Return list of available presets with metadata."""
-    return [
+@lru_cache(maxsize=None)
+def _preset_metadata() -> tuple[dict, ...]:
+    return tuple(
         {
             "name": preset.name,
             "display_name": preset.display_name,
             "description": preset.description,
         }
         for preset in THEME_PRESETS.values()
-    ]
+    )
+
+
+def list_presets() -> list[dict]:
+    """Return list of available presets with metadata.
+
+    The metadata is built once; each call returns fresh dicts so callers
+    may modify the result.
+    """
+    return [dict(entry) for entry in _preset_metadata()]
+
+
+# cache_clear callables of memos in other modules that are derived from
+# THEME_PRESETS (e.g. high_contrast); cleared alongside the ones above.
+_DEPENDENT_CACHE_CLEARS: list = []
+
+
+def _clear_lookup_caches() -> None:
+    """Invalidate get_preset()/list_presets() memos after THEME_PRESETS changes."""
+    get_preset.cache_clear()
+    _preset_metadata.cache_clear()
+    for cache_clear in _DEPENDENT_CACHE_CLEARS:
+        cache_clear()
@@ -7,19 +7,30 @@ Third-party apps register custom presets/themes in their own ready().
 """
 
 import importlib
+import itertools
 import logging
+import sys
 import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Registry generations come from one counter shared by every registry
+# instance, so a generation number identifies a single registry state even
+# across _reset() (see ThemeRegistry.generation).
+_GENERATIONS = itertools.count(1)
+
 
 class ThemeRegistry:
     """Singleton registry for theme presets and design systems.
 
     Thread-safe. Populated during AppConfig.ready() via discover().
     Third-party apps call register_preset()/register_theme() in their own ready().
+
+    ``generation`` changes on every registration and after discovery, so
+    derived data can be cached per generation.
     """
 
     _instance: Optional["ThemeRegistry"] = None
@@ -35,6 +46,11 @@ class ThemeRegistry:
                     inst._packs = {}   # theme packs
                     inst._manifests = {}  # ThemeManifest objects
                     inst._discovered = False
+                    inst.generation = next(_GENERATIONS)
+                    # Read-only live views, created once (see presets/themes/packs)
+                    inst._presets_view = MappingProxyType(inst._presets)
+                    inst._themes_view = MappingProxyType(inst._themes)
+                    inst._packs_view = MappingProxyType(inst._packs)
                     cls._instance = inst
         return cls._instance
 
@@ -42,25 +58,32 @@ class ThemeRegistry:
     # Registration API
     # ------------------------------------------------------------------
 
+    # Names are interned so per-request lookups with the same (usually
+    # literal or cookie-derived) name hit dict's identity fast path.
+
     def register_preset(self, name: str, preset) -> None:
         """Register a color preset. Overwrites if name exists."""
         with self._lock:
-            self._presets[name] = preset
+            self._presets[sys.intern(name)] = preset
+            self.generation = next(_GENERATIONS)
 
     def register_theme(self, name: str, theme) -> None:
         """Register a design system. Overwrites if name exists."""
         with self._lock:
-            self._themes[name] = theme
+            self._themes[sys.intern(name)] = theme
+            self.generation = next(_GENERATIONS)
 
     def register_pack(self, name: str, pack) -> None:
         """Register a theme pack. Overwrites if name exists."""
         with self._lock:
-            self._packs[name] = pack
+            self._packs[sys.intern(name)] = pack
+            self.generation = next(_GENERATIONS)
 
     def register_manifest(self, name: str, manifest) -> None:
         """Register a parsed ThemeManifest."""
         with self._lock:
             self._manifests[name] = manifest
+            self.generation = next(_GENERATIONS)
 
     # ------------------------------------------------------------------
     # Lookup API
@@ -107,6 +130,25 @@ class ThemeRegistry:
         """Return a shallow copy of all registered manifests."""
         return dict(self._manifests)
 
+    @property
+    def presets(self) -> MappingProxyType:
+        """Read-only live view of registered presets (no copy).
+
+        Prefer this over list_presets() on hot read paths; use list_presets()
+        when you need a snapshot you can modify.
+        """
+        return self._presets_view
+
+    @property
+    def themes(self) -> MappingProxyType:
+        """Read-only live view of registered design systems (no copy)."""
+        return self._themes_view
+
+    @property
+    def packs(self) -> MappingProxyType:
+        """Read-only live view of registered theme packs (no copy)."""
+        return self._packs_view
+
     # ------------------------------------------------------------------
     # Discovery
     # ------------------------------------------------------------------
@@ -120,6 +162,7 @@ class ThemeRegistry:
                 return
             self._do_discover()
             self._discovered = True
+            self.generation = next(_GENERATIONS)
 
     def _do_discover(self):
         """Internal: load from built-in dicts, DJUST_THEMES setting, themes_dir."""
@@ -7,10 +7,46 @@ Provides utilities to:
 - Parse themes from themes.shadcn.com
 """
 
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any, Optional
 import json
 import re
-from .presets import ThemePreset, ThemeTokens, ColorScale, THEME_PRESETS
+from .presets import ThemePreset, ThemeTokens, ColorScale, THEME_PRESETS, COLOR_TOKEN_FIELDS
+
+# orjson (the "fast-json" extra) is an optional speedup for theme file import
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# shadcn cssVars exported per mode (ThemeTokens field names, in output order).
+_SHADCN_EXPORT_FIELDS = (
+    "background",
+    "foreground",
+    "card",
+    "card_foreground",
+    "popover",
+    "popover_foreground",
+    "primary",
+    "primary_foreground",
+    "secondary",
+    "secondary_foreground",
+    "muted",
+    "muted_foreground",
+    "accent",
+    "accent_foreground",
+    "destructive",
+    "destructive_foreground",
+    "border",
+    "input",
+    "ring",
+)
+_SHADCN_EXPORT_KEYS = tuple(field.replace("_", "-") for field in _SHADCN_EXPORT_FIELDS)
+# Picks those fields' values out of ThemeTokens.hsl_values in one C call.
+_get_shadcn_export_hsl = itemgetter(
+    *(COLOR_TOKEN_FIELDS.index(field) for field in _SHADCN_EXPORT_FIELDS)
+)
 
 
 def parse_shadcn_theme(theme_json: Dict[str, Any]) -> ThemePreset:
@@ -62,7 +98,7 @@ def parse_shadcn_theme(theme_json: Dict[str, Any]) -> ThemePreset:
 
     # Extract radius from light vars (same for both modes)
     radius_str = light_vars.get("radius", "0.5rem")
-    radius = float(re.sub(r'[^\d.]', '', radius_str)) if radius_str else 0.5
+    radius = _parse_radius(radius_str) if radius_str else 0.5
 
     return ThemePreset(
         name=name,
@@ -73,86 +109,137 @@ def parse_shadcn_theme(theme_json: Dict[str, Any]) -> ThemePreset:
     )
 
 
-def _parse_shadcn_vars(vars_dict: Dict[str, str]) -> ThemeTokens:
-    """Parse shadcn CSS variables into ThemeTokens."""
+def _parse_radius(radius_str: str) -> float:
+    """Parse a radius such as '0.5rem' or '8px' to its number."""
+    number = radius_str.removesuffix("rem").removesuffix("px")
+    if number.strip("0123456789."):
+        # Anything unusual: keep only digits and dots, as before
+        number = re.sub(r'[^\d.]', '', radius_str)
+    return float(number)
 
-    def parse_hsl(hsl_str: str) -> ColorScale:
-        """Parse 'H S% L%' string to ColorScale."""
-        # Handle both "H S% L%" and "H S L" formats
-        hsl_str = hsl_str.strip()
-        parts = hsl_str.split()
 
-        if len(parts) != 3:
-            # Fallback to neutral gray
-            return ColorScale(0, 0, 50)
+# "H S% L%" or "H S L"; components may be fractional, e.g. "221.2 83.2% 53.3%".
+_HSL_RE = re.compile(r"\s*([-+]?[\d.]+)\s+([-+]?[\d.]+)%*\s+([-+]?[\d.]+)%*\s*")
 
-        try:
-            h = float(parts[0])
-            s = float(parts[1].rstrip('%'))
-            l = float(parts[2].rstrip('%'))
-            return ColorScale(int(h), int(s), int(l))
-        except (ValueError, IndexError):
-            return ColorScale(0, 0, 50)
+
+@lru_cache(maxsize=256)
+def _parse_hsl(hsl_str: str) -> ColorScale:
+    """Parse 'H S% L%' string to ColorScale.
+
+    Cached: shadcn theme files repeat the same few values (white, near-black,
+    the primary) across many tokens and across light/dark.
+    """
+    match = _HSL_RE.fullmatch(hsl_str)
+    if match is None:
+        # Fallback to neutral gray
+        return ColorScale.of(0, 0, 50)
+    try:
+        h, s, l = map(float, match.groups())
+    except ValueError:
+        return ColorScale.of(0, 0, 50)
+    return ColorScale.of(int(h), int(s), int(l))
+
+
+# Defaults for shadcn variables that do not fall back to another variable;
+# parsed once at import so missing keys cost a dict lookup.
+_DEFAULT_HSL = {
+    "secondary": "210 40% 96.1%",
+    "secondary-foreground": "222.2 47.4% 11.2%",
+    "muted": "210 40% 96.1%",
+    "muted-foreground": "215.4 16.3% 46.9%",
+    "accent": "210 40% 96.1%",
+    "accent-foreground": "222.2 47.4% 11.2%",
+    "destructive": "0 84.2% 60.2%",
+    "destructive-foreground": "210 40% 98%",
+    "success": "142 76% 36%",
+    "success-foreground": "0 0% 100%",
+    "warning": "38 92% 50%",
+    "warning-foreground": "0 0% 100%",
+    "info": "199 89% 48%",
+    "info-foreground": "0 0% 98%",
+    "code": "240 5% 94%",
+    "code-foreground": "240 10% 20%",
+    "selection": "240 100% 80%",
+    "selection-foreground": "240 10% 4%",
+    "border": "214.3 31.8% 91.4%",
+    "input": "214.3 31.8% 91.4%",
+    "ring": "221.2 83.2% 53.3%",
+}
+_DEFAULT_COLORS = {key: _parse_hsl(value) for key, value in _DEFAULT_HSL.items()}
+
+
+def _color(vars_dict: Dict[str, str], key: str) -> ColorScale:
+    """Parse ``vars_dict[key]``, or return its default if the key is missing."""
+    value = vars_dict.get(key)
+    if value is None:
+        return _DEFAULT_COLORS[key]
+    return _parse_hsl(value)
+
+
+def _parse_shadcn_vars(vars_dict: Dict[str, str]) -> ThemeTokens:
+    """Parse shadcn CSS variables into ThemeTokens."""
+
+    # Values other tokens fall back to, resolved once
+    background_str = vars_dict.get("background", "0 0% 100%")
+    foreground_str = vars_dict.get("foreground", "222.2 47.4% 11.2%")
+    primary_str = vars_dict.get("primary", "221.2 83.2% 53.3%")
+    primary_foreground_str = vars_dict.get("primary-foreground", "210 40% 98%")
 
     # Extract all required tokens (with fallbacks)
-    background = parse_hsl(vars_dict.get("background", "0 0% 100%"))
-    foreground = parse_hsl(vars_dict.get("foreground", "222.2 47.4% 11.2%"))
+    background = _parse_hsl(background_str)
+    foreground = _parse_hsl(foreground_str)
 
-    card = parse_hsl(vars_dict.get("card", vars_dict.get("background", "0 0% 100%")))
-    card_foreground = parse_hsl(
-        vars_dict.get("card-foreground", vars_dict.get("foreground", "222.2 47.4% 11.2%"))
-    )
+    card = _parse_hsl(vars_dict.get("card", background_str))
+    card_foreground = _parse_hsl(vars_dict.get("card-foreground", foreground_str))
 
-    popover = parse_hsl(vars_dict.get("popover", vars_dict.get("background", "0 0% 100%")))
-    popover_foreground = parse_hsl(
-        vars_dict.get("popover-foreground", vars_dict.get("foreground", "222.2 47.4% 11.2%"))
-    )
+    popover = _parse_hsl(vars_dict.get("popover", background_str))
+    popover_foreground = _parse_hsl(vars_dict.get("popover-foreground", foreground_str))
 
-    primary = parse_hsl(vars_dict.get("primary", "221.2 83.2% 53.3%"))
-    primary_foreground = parse_hsl(vars_dict.get("primary-foreground", "210 40% 98%"))
+    primary = _parse_hsl(primary_str)
+    primary_foreground = _parse_hsl(primary_foreground_str)
 
-    secondary = parse_hsl(vars_dict.get("secondary", "210 40% 96.1%"))
-    secondary_foreground = parse_hsl(vars_dict.get("secondary-foreground", "222.2 47.4% 11.2%"))
+    secondary = _color(vars_dict, "secondary")
+    secondary_foreground = _color(vars_dict, "secondary-foreground")
 
-    muted = parse_hsl(vars_dict.get("muted", "210 40% 96.1%"))
-    muted_foreground = parse_hsl(vars_dict.get("muted-foreground", "215.4 16.3% 46.9%"))
+    muted = _color(vars_dict, "muted")
+    muted_foreground = _color(vars_dict, "muted-foreground")
 
-    accent = parse_hsl(vars_dict.get("accent", "210 40% 96.1%"))
-    accent_foreground = parse_hsl(vars_dict.get("accent-foreground", "222.2 47.4% 11.2%"))
+    accent = _color(vars_dict, "accent")
+    accent_foreground = _color(vars_dict, "accent-foreground")
 
-    destructive = parse_hsl(vars_dict.get("destructive", "0 84.2% 60.2%"))
-    destructive_foreground = parse_hsl(vars_dict.get("destructive-foreground", "210 40% 98%"))
+    destructive = _color(vars_dict, "destructive")
+    destructive_foreground = _color(vars_dict, "destructive-foreground")
 
     # Extensions - not in standard shadcn
-    success = parse_hsl(vars_dict.get("success", "142 76% 36%"))
-    success_foreground = parse_hsl(vars_dict.get("success-foreground", "0 0% 100%"))
+    success = _color(vars_dict, "success")
+    success_foreground = _color(vars_dict, "success-foreground")
 
-    warning = parse_hsl(vars_dict.get("warning", "38 92% 50%"))
-    warning_foreground = parse_hsl(vars_dict.get("warning-foreground", "0 0% 100%"))
+    warning = _color(vars_dict, "warning")
+    warning_foreground = _color(vars_dict, "warning-foreground")
 
-    info = parse_hsl(vars_dict.get("info", "199 89% 48%"))
-    info_foreground = parse_hsl(vars_dict.get("info-foreground", "0 0% 98%"))
+    info = _color(vars_dict, "info")
+    info_foreground = _color(vars_dict, "info-foreground")
 
-    link = parse_hsl(vars_dict.get("link", vars_dict.get("primary", "221.2 83.2% 53.3%")))
-    link_hover = parse_hsl(vars_dict.get("link-hover", vars_dict.get("primary", "221.2 83.2% 45%")))
+    link = _parse_hsl(vars_dict.get("link", primary_str))
+    link_hover = _parse_hsl(vars_dict.get("link-hover", vars_dict.get("primary", "221.2 83.2% 45%")))
 
-    code = parse_hsl(vars_dict.get("code", "240 5% 94%"))
-    code_foreground = parse_hsl(vars_dict.get("code-foreground", "240 10% 20%"))
+    code = _color(vars_dict, "code")
+    code_foreground = _color(vars_dict, "code-foreground")
 
-    selection = parse_hsl(vars_dict.get("selection", "240 100% 80%"))
-    selection_foreground = parse_hsl(vars_dict.get("selection-foreground", "240 10% 4%"))
+    selection = _color(vars_dict, "selection")
+    selection_foreground = _color(vars_dict, "selection-foreground")
 
-    brand = parse_hsl(vars_dict.get("brand", vars_dict.get("primary", "221.2 83.2% 53.3%")))
-    brand_foreground = parse_hsl(vars_dict.get("brand-foreground", vars_dict.get("primary-foreground", "210 40% 98%")))
+    brand = _parse_hsl(vars_dict.get("brand", primary_str))
+    brand_foreground = _parse_hsl(vars_dict.get("brand-foreground", primary_foreground_str))
 
-    border = parse_hsl(vars_dict.get("border", "214.3 31.8% 91.4%"))
-    input_color = parse_hsl(vars_dict.get("input", "214.3 31.8% 91.4%"))
-    ring = parse_hsl(vars_dict.get("ring", "221.2 83.2% 53.3%"))
+    border = _color(vars_dict, "border")
+    input_color = _color(vars_dict, "input")
+    ring = _color(vars_dict, "ring")
 
     # Surface tokens - fall back to background variants
-    surface_1 = parse_hsl(vars_dict.get("surface-1", vars_dict.get("background", "0 0% 99%")))
-    surface_2 = parse_hsl(vars_dict.get("surface-2", vars_dict.get("background", "0 0% 97%")))
-    surface_3 = parse_hsl(vars_dict.get("surface-3", vars_dict.get("background", "0 0% 95%")))
+    surface_1 = _parse_hsl(vars_dict.get("surface-1", vars_dict.get("background", "0 0% 99%")))
+    surface_2 = _parse_hsl(vars_dict.get("surface-2", vars_dict.get("background", "0 0% 97%")))
+    surface_3 = _parse_hsl(vars_dict.get("surface-3", vars_dict.get("background", "0 0% 95%")))
 
     return ThemeTokens(
         background=background,
@@ -194,6 +281,13 @@ def _parse_shadcn_vars(vars_dict: Dict[str, str]) -> ThemeTokens:
     )
 
 
+def _shadcn_css_vars(tokens: ThemeTokens, radius: str) -> Dict[str, str]:
+    """Build one mode's shadcn ``cssVars`` dict from its tokens."""
+    css_vars = dict(zip(_SHADCN_EXPORT_KEYS, _get_shadcn_export_hsl(tokens.hsl_values)))
+    css_vars["radius"] = radius
+    return css_vars
+
+
 def export_to_shadcn_format(preset_name: str = "default") -> Dict[str, Any]:
     """
     Export a djust-theming preset to shadcn/ui theme JSON format.
@@ -217,6 +311,7 @@ def export_to_shadcn_format(preset_name: str = "default") -> Dict[str, Any]:
 
     light = preset.light
     dark = preset.dark
+    radius = f"{preset.radius}rem"
 
     return {
         "name": preset.name,
@@ -226,50 +321,8 @@ def export_to_shadcn_format(preset_name: str = "default") -> Dict[str, Any]:
             "dark": dark.primary.to_hsl(),
         },
         "cssVars": {
-            "light": {
-                "background": light.background.to_hsl(),
-                "foreground": light.foreground.to_hsl(),
-                "card": light.card.to_hsl(),
-                "card-foreground": light.card_foreground.to_hsl(),
-                "popover": light.popover.to_hsl(),
-                "popover-foreground": light.popover_foreground.to_hsl(),
-                "primary": light.primary.to_hsl(),
-                "primary-foreground": light.primary_foreground.to_hsl(),
-                "secondary": light.secondary.to_hsl(),
-                "secondary-foreground": light.secondary_foreground.to_hsl(),
-                "muted": light.muted.to_hsl(),
-                "muted-foreground": light.muted_foreground.to_hsl(),
-                "accent": light.accent.to_hsl(),
-                "accent-foreground": light.accent_foreground.to_hsl(),
-                "destructive": light.destructive.to_hsl(),
-                "destructive-foreground": light.destructive_foreground.to_hsl(),
-                "border": light.border.to_hsl(),
-                "input": light.input.to_hsl(),
-                "ring": light.ring.to_hsl(),
-                "radius": f"{preset.radius}rem",
-            },
-            "dark": {
-                "background": dark.background.to_hsl(),
-                "foreground": dark.foreground.to_hsl(),
-                "card": dark.card.to_hsl(),
-                "card-foreground": dark.card_foreground.to_hsl(),
-                "popover": dark.popover.to_hsl(),
-                "popover-foreground": dark.popover_foreground.to_hsl(),
-                "primary": dark.primary.to_hsl(),
-                "primary-foreground": dark.primary_foreground.to_hsl(),
-                "secondary": dark.secondary.to_hsl(),
-                "secondary-foreground": dark.secondary_foreground.to_hsl(),
-                "muted": dark.muted.to_hsl(),
-                "muted-foreground": dark.muted_foreground.to_hsl(),
-                "accent": dark.accent.to_hsl(),
-                "accent-foreground": dark.accent_foreground.to_hsl(),
-                "destructive": dark.destructive.to_hsl(),
-                "destructive-foreground": dark.destructive_foreground.to_hsl(),
-                "border": dark.border.to_hsl(),
-                "input": dark.input.to_hsl(),
-                "ring": dark.ring.to_hsl(),
-                "radius": f"{preset.radius}rem",
-            },
+            "light": _shadcn_css_vars(light, radius),
+            "dark": _shadcn_css_vars(dark, radius),
         },
     }
 
@@ -290,8 +343,17 @@ def import_shadcn_theme_from_file(file_path: str) -> ThemePreset:
         >>> from djust_theming.presets import THEME_PRESETS
         >>> THEME_PRESETS[preset.name] = preset
     """
-    with open(file_path, 'r') as f:
-        theme_json = json.load(f)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    theme_json = None
+    if orjson is not None:
+        try:
+            theme_json = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN); accept the same files.
+            pass
+    if theme_json is None:
+        theme_json = json.loads(data)
 
     return parse_shadcn_theme(theme_json)
 
@@ -310,5 +372,7 @@ def export_shadcn_theme_to_file(preset_name: str, file_path: str):
     """
     theme = export_to_shadcn_format(preset_name)
 
+    # Always written with json so the file is byte-identical whether or not
+    # orjson is installed.
     with open(file_path, 'w') as f:
         json.dump(theme, f, indent=2)
@@ -11,9 +11,46 @@ Provides utilities to:
 from typing import Dict, Any, Optional
 from functools import lru_cache
 
-from .presets import THEME_PRESETS, ThemePreset, ThemeTokens, get_preset
+from .presets import (
+    _DEPENDENT_CACHE_CLEARS,
+    COLOR_TOKEN_FIELDS,
+    THEME_PRESETS,
+    ThemePreset,
+    ThemeTokens,
+    get_preset,
+)
+
+
+# Fixed parts of tailwind.config.js around the generated colors block.
+_TAILWIND_CONFIG_HEAD = """/** @type {import('tailwindcss').Config} */
+module.exports = {
+  content: [
+    './templates/**/*.html',
+    './static/**/*.js',
+    './**/*.py',  // For class names in Python code
+  ],
+  theme: {
+    {
+      colors: {
+"""
+_TAILWIND_CONFIG_HEAD_EXTEND = _TAILWIND_CONFIG_HEAD.replace(
+    "  theme: {\n    {\n", "  theme: {\n    extend: {\n"
+)
+_TAILWIND_CONFIG_TAIL = """
+      },
+      borderRadius: {
+        lg: 'var(--radius)',
+        md: 'calc(var(--radius) - 2px)',
+        sm: 'calc(var(--radius) - 4px)',
+      },
+    },
+  },
+  plugins: [],
+}
+"""
 
 
+@lru_cache(maxsize=32)
 def generate_tailwind_config(
     preset_name: str = "default",
     extend_colors: bool = True,
@@ -30,6 +67,8 @@ def generate_tailwind_config(
     Returns:
         Complete tailwind.config.js file content as a string
 
+    Results are cached per argument combination until THEME_PRESETS changes.
+
     Example:
         >>> from djust_theming.tailwind import generate_tailwind_config
         >>> config = generate_tailwind_config('blue')
@@ -45,82 +84,66 @@ def generate_tailwind_config(
 
     # Optionally include all presets
     if include_all_presets:
-        all_presets_config = _generate_all_presets_config()
-        colors_config.update(all_presets_config)
+        colors_config = {**colors_config, **_generate_all_presets_config()}
 
     # Generate the full config
-    config_content = f"""/** @type {{import('tailwindcss').Config}} */
-module.exports = {{
-  content: [
-    './templates/**/*.html',
-    './static/**/*.js',
-    './**/*.py',  // For class names in Python code
-  ],
-  theme: {{
-    {'extend: {' if extend_colors else '{'}
-      colors: {{
-{_format_colors_config(colors_config, indent=8)}
-      }},
-      borderRadius: {{
-        lg: 'var(--radius)',
-        md: 'calc(var(--radius) - 2px)',
-        sm: 'calc(var(--radius) - 4px)',
-      }},
-    }},
-  }},
-  plugins: [],
-}}
-"""
-    return config_content
+    head = _TAILWIND_CONFIG_HEAD_EXTEND if extend_colors else _TAILWIND_CONFIG_HEAD
+    return head + _format_colors_config(colors_config, indent=8) + _TAILWIND_CONFIG_TAIL
+
+
+# Tailwind color names -> theme CSS variables. Identical for every preset
+# (values are var() references), so it is built once; treat as read-only.
+_BASE_TAILWIND_COLORS: Dict[str, Any] = {
+    "border": "hsl(var(--border))",
+    "input": "hsl(var(--input))",
+    "ring": "hsl(var(--ring))",
+    "background": "hsl(var(--background))",
+    "foreground": "hsl(var(--foreground))",
+    "primary": {
+        "DEFAULT": "hsl(var(--primary))",
+        "foreground": "hsl(var(--primary-foreground))",
+    },
+    "secondary": {
+        "DEFAULT": "hsl(var(--secondary))",
+        "foreground": "hsl(var(--secondary-foreground))",
+    },
+    "destructive": {
+        "DEFAULT": "hsl(var(--destructive))",
+        "foreground": "hsl(var(--destructive-foreground))",
+    },
+    "muted": {
+        "DEFAULT": "hsl(var(--muted))",
+        "foreground": "hsl(var(--muted-foreground))",
+    },
+    "accent": {
+        "DEFAULT": "hsl(var(--accent))",
+        "foreground": "hsl(var(--accent-foreground))",
+    },
+    "popover": {
+        "DEFAULT": "hsl(var(--popover))",
+        "foreground": "hsl(var(--popover-foreground))",
+    },
+    "card": {
+        "DEFAULT": "hsl(var(--card))",
+        "foreground": "hsl(var(--card-foreground))",
+    },
+    "success": {
+        "DEFAULT": "hsl(var(--success))",
+        "foreground": "hsl(var(--success-foreground))",
+    },
+    "warning": {
+        "DEFAULT": "hsl(var(--warning))",
+        "foreground": "hsl(var(--warning-foreground))",
+    },
+}
 
 
 def _generate_color_config(preset: ThemePreset, extend: bool = True) -> Dict[str, Any]:
-    """Generate Tailwind color config from a preset."""
-    colors = {
-        "border": "hsl(var(--border))",
-        "input": "hsl(var(--input))",
-        "ring": "hsl(var(--ring))",
-        "background": "hsl(var(--background))",
-        "foreground": "hsl(var(--foreground))",
-        "primary": {
-            "DEFAULT": "hsl(var(--primary))",
-            "foreground": "hsl(var(--primary-foreground))",
-        },
-        "secondary": {
-            "DEFAULT": "hsl(var(--secondary))",
-            "foreground": "hsl(var(--secondary-foreground))",
-        },
-        "destructive": {
-            "DEFAULT": "hsl(var(--destructive))",
-            "foreground": "hsl(var(--destructive-foreground))",
-        },
-        "muted": {
-            "DEFAULT": "hsl(var(--muted))",
-            "foreground": "hsl(var(--muted-foreground))",
-        },
-        "accent": {
-            "DEFAULT": "hsl(var(--accent))",
-            "foreground": "hsl(var(--accent-foreground))",
-        },
-        "popover": {
-            "DEFAULT": "hsl(var(--popover))",
-            "foreground": "hsl(var(--popover-foreground))",
-        },
-        "card": {
-            "DEFAULT": "hsl(var(--card))",
-            "foreground": "hsl(var(--card-foreground))",
-        },
-        "success": {
-            "DEFAULT": "hsl(var(--success))",
-            "foreground": "hsl(var(--success-foreground))",
-        },
-        "warning": {
-            "DEFAULT": "hsl(var(--warning))",
-            "foreground": "hsl(var(--warning-foreground))",
-        },
-    }
+    """Generate Tailwind color config from a preset.
 
-    return colors
+    Returns the shared _BASE_TAILWIND_COLORS mapping; copy before modifying.
+    """
+    return _BASE_TAILWIND_COLORS
 
 
 def _generate_all_presets_config() -> Dict[str, Any]:
@@ -142,23 +165,22 @@ def _generate_all_presets_config() -> Dict[str, Any]:
 
 def _format_colors_config(colors: Dict[str, Any], indent: int = 8) -> str:
     """Format the colors config dict as JavaScript object notation."""
-    lines = []
-    indent_str = " " * indent
+    return "\n".join(_iter_colors_config(colors, " " * indent))
+
 
+def _iter_colors_config(colors: Dict[str, Any], indent_str: str):
+    """Yield the lines of :func:`_format_colors_config`."""
     for key, value in colors.items():
         if isinstance(value, dict):
-            lines.append(f"{indent_str}{key}: {{")
-            for sub_key, sub_value in value.items():
-                # Handle DEFAULT specially (no quotes needed)
-                if sub_key == "DEFAULT":
-                    lines.append(f"{indent_str}  DEFAULT: '{sub_value}',")
-                else:
-                    lines.append(f"{indent_str}  {sub_key}: '{sub_value}',")
-            lines.append(f"{indent_str}}},")
+            yield f"{indent_str}{key}: {{"
+            # DEFAULT is a bare identifier, so it is emitted like any other key
+            yield from (
+                f"{indent_str}  {sub_key}: '{sub_value}',"
+                for sub_key, sub_value in value.items()
+            )
+            yield f"{indent_str}}},"
         else:
-            lines.append(f"{indent_str}{key}: '{value}',")
-
-    return "\n".join(lines)
+            yield f"{indent_str}{key}: '{value}',"
 
 
 def export_preset_as_tailwind_colors(preset_name: str = "default") -> Dict[str, str]:
@@ -180,6 +202,11 @@ def export_preset_as_tailwind_colors(preset_name: str = "default") -> Dict[str,
         >>> colors['primary']
         'hsl(221, 83%, 53%)'
     """
+    return dict(_export_preset_as_tailwind_colors(preset_name))
+
+
+@lru_cache(maxsize=32)
+def _export_preset_as_tailwind_colors(preset_name: str) -> Dict[str, str]:
     preset = THEME_PRESETS.get(preset_name)
     if not preset:
         raise ValueError(f"Unknown preset: {preset_name}")
@@ -211,18 +238,8 @@ def export_preset_as_tailwind_colors(preset_name: str = "default") -> Dict[str,
     }
 
 
-def generate_tailwind_apply_examples() -> str:
-    """
-    Generate example CSS showing how to use @apply with theme colors.
-
-    Returns:
-        CSS code with @apply examples
-
-    Example:
-        >>> from djust_theming.tailwind import generate_tailwind_apply_examples
-        >>> print(generate_tailwind_apply_examples())
-    """
-    return """/* Using @apply with djust-theming colors */
+# Static @apply examples returned by generate_tailwind_apply_examples().
+_TAILWIND_APPLY_EXAMPLES = """/* Using @apply with djust-theming colors */
 
 /* Button styles */
 .btn-primary {
@@ -276,62 +293,43 @@ def generate_tailwind_apply_examples() -> str:
 """
 
 
+def generate_tailwind_apply_examples() -> str:
+    """
+    Generate example CSS showing how to use @apply with theme colors.
+
+    Returns:
+        CSS code with @apply examples
+
+    Example:
+        >>> from djust_theming.tailwind import generate_tailwind_apply_examples
+        >>> print(generate_tailwind_apply_examples())
+    """
+    return _TAILWIND_APPLY_EXAMPLES
+
+
 # =============================================================================
 # Tailwind v4 CSS-First Theme Generation
 # =============================================================================
 
 
+# @theme color names as (theme-var-name, index into ThemeTokens.hsl_values).
+# Brand colors are not exported; surface levels keep their underscore names.
+_THEME_COLOR_VARS = tuple(
+    (field if field.startswith("surface_") else field.replace("_", "-"), index)
+    for index, field in enumerate(COLOR_TOKEN_FIELDS)
+    if not field.startswith("brand")
+)
+
+
 def _tokens_to_theme_vars(tokens: ThemeTokens, prefix: str = "") -> list[tuple[str, str]]:
     """Convert ThemeTokens fields to (name, css_value) pairs for @theme.
 
     Returns (css-variable-name, css-value) tuples ready to be written as:
         --color-primary: hsl(28 80% 53%);
     """
-    lines = []
-
-    # Color mappings: field_name -> (theme-var-name, css-value)
-    color_mappings = [
-        ("background", f"hsl({tokens.background.to_hsl()})"),
-        ("foreground", f"hsl({tokens.foreground.to_hsl()})"),
-        ("card", f"hsl({tokens.card.to_hsl()})"),
-        ("card-foreground", f"hsl({tokens.card_foreground.to_hsl()})"),
-        ("popover", f"hsl({tokens.popover.to_hsl()})"),
-        ("popover-foreground", f"hsl({tokens.popover_foreground.to_hsl()})"),
-        ("primary", f"hsl({tokens.primary.to_hsl()})"),
-        ("primary-foreground", f"hsl({tokens.primary_foreground.to_hsl()})"),
-        ("secondary", f"hsl({tokens.secondary.to_hsl()})"),
-        ("secondary-foreground", f"hsl({tokens.secondary_foreground.to_hsl()})"),
-        ("muted", f"hsl({tokens.muted.to_hsl()})"),
-        ("muted-foreground", f"hsl({tokens.muted_foreground.to_hsl()})"),
-        ("accent", f"hsl({tokens.accent.to_hsl()})"),
-        ("accent-foreground", f"hsl({tokens.accent_foreground.to_hsl()})"),
-        ("destructive", f"hsl({tokens.destructive.to_hsl()})"),
-        ("destructive-foreground", f"hsl({tokens.destructive_foreground.to_hsl()})"),
-        ("success", f"hsl({tokens.success.to_hsl()})"),
-        ("success-foreground", f"hsl({tokens.success_foreground.to_hsl()})"),
-        ("warning", f"hsl({tokens.warning.to_hsl()})"),
-        ("warning-foreground", f"hsl({tokens.warning_foreground.to_hsl()})"),
-        ("info", f"hsl({tokens.info.to_hsl()})"),
-        ("info-foreground", f"hsl({tokens.info_foreground.to_hsl()})"),
-        ("link", f"hsl({tokens.link.to_hsl()})"),
-        ("link-hover", f"hsl({tokens.link_hover.to_hsl()})"),
-        ("code", f"hsl({tokens.code.to_hsl()})"),
-        ("code-foreground", f"hsl({tokens.code_foreground.to_hsl()})"),
-        ("selection", f"hsl({tokens.selection.to_hsl()})"),
-        ("selection-foreground", f"hsl({tokens.selection_foreground.to_hsl()})"),
-        ("border", f"hsl({tokens.border.to_hsl()})"),
-        ("input", f"hsl({tokens.input.to_hsl()})"),
-        ("ring", f"hsl({tokens.ring.to_hsl()})"),
-        ("surface_1", f"hsl({tokens.surface_1.to_hsl()})"),
-        ("surface_2", f"hsl({tokens.surface_2.to_hsl()})"),
-        ("surface_3", f"hsl({tokens.surface_3.to_hsl()})"),
-    ]
-
-    for name, value in color_mappings:
-        var_name = f"--color{'-' + prefix if prefix else '-'}{name}"
-        lines.append((var_name, value))
-
-    return lines
+    hsl = tokens.hsl_values
+    head = f"--color{'-' + prefix if prefix else '-'}"
+    return [(f"{head}{name}", f"hsl({hsl[index]})") for name, index in _THEME_COLOR_VARS]
 
 
 def _extra_vars_to_theme_vars(extra_vars: dict | None) -> list[tuple[str, str]]:
@@ -481,3 +479,11 @@ def generate_tailwindv4_theme_block(preset_name: str = "default") -> str:
 def generate_tailwindv4_theme_block_cached(preset_name: str = "default") -> str:
     """Cached version of generate_tailwindv4_theme_block."""
     return generate_tailwindv4_theme_block(preset_name)
+
+
+# Everything above is derived from THEME_PRESETS; drop it when presets change.
+_DEPENDENT_CACHE_CLEARS.extend((
+    generate_tailwind_config.cache_clear,
+    _export_preset_as_tailwind_colors.cache_clear,
+    generate_tailwindv4_theme_block_cached.cache_clear,
+))
@@ -9,6 +9,10 @@ Provides helpers that build a fallback chain of template candidates:
 The first template found by ``django.template.loader.select_template``
 wins. If no theme-specific override exists, the default ships with the
 package and is always available.
+
+Resolved templates are memoized on the request's ``ThemeManager``, so a
+page rendering many components of the same kind runs the fallback lookup
+once per component.
 """
 
 from django.template.loader import select_template
@@ -16,6 +20,20 @@ from django.template.loader import select_template
 from .manager import get_theme_manager
 
 
+def _select_template(manager, candidates: list[str]):
+    """
+    ``select_template()`` memoized on the (per-request) theme manager.
+
+    Keyed by the theme-specific candidate, which encodes both the theme
+    and the template name.
+    """
+    cache = manager._templates
+    template = cache.get(candidates[0])
+    if template is None:
+        template = cache[candidates[0]] = select_template(candidates)
+    return template
+
+
 def _get_component_candidates(theme_name: str, component_name: str) -> list[str]:
     """
     Build the ordered list of template candidates for a component.
@@ -64,7 +82,7 @@ def resolve_component_template(request, component_name: str):
     manager = get_theme_manager(request)
     state = manager.get_state()
     candidates = _get_component_candidates(state.theme, component_name)
-    return select_template(candidates)
+    return _select_template(manager, candidates)
 
 
 def _get_layout_candidates(theme_name: str, layout_name: str) -> list[str]:
@@ -98,7 +116,7 @@ def resolve_layout_template(request, layout_name: str):
     manager = get_theme_manager(request)
     state = manager.get_state()
     candidates = _get_layout_candidates(state.theme, layout_name)
-    return select_template(candidates)
+    return _select_template(manager, candidates)
 
 
 def _get_page_candidates(theme_name: str, page_name: str) -> list[str]:
@@ -132,7 +150,7 @@ def resolve_page_template(request, page_name: str):
     manager = get_theme_manager(request)
     state = manager.get_state()
     candidates = _get_page_candidates(state.theme, page_name)
-    return select_template(candidates)
+    return _select_template(manager, candidates)
 
 
 def resolve_theme_template(request, template_name: str):
@@ -149,4 +167,4 @@ def resolve_theme_template(request, template_name: str):
     manager = get_theme_manager(request)
     state = manager.get_state()
     candidates = _get_theme_template_candidates(state.theme, template_name)
-    return select_template(candidates)
+    return _select_template(manager, candidates)
@@ -12,6 +12,7 @@ Falling back to:
 """
 
 import uuid
+from functools import lru_cache
 
 from django import template
 from django.utils.safestring import mark_safe
@@ -33,7 +34,12 @@ def _extract_slots(attrs: dict) -> tuple[dict, dict]:
 
     Returns:
         (slots_dict, remaining_attrs_dict)
+
+    ``attrs`` is the tag's own ``**attrs`` dict, so when it holds no slots
+    it is returned as-is rather than copied.
     """
+    if not any(k.startswith("slot_") for k in attrs):
+        return {}, attrs
     slots = {}
     remaining = {}
     for k, v in attrs.items():
@@ -655,6 +661,26 @@ def theme_tooltip(context, text: str, position: str = 'top', **attrs):
     return mark_safe(tmpl.render(ctx))
 
 
+# Placeholder SVG icons; ``{s}`` is the size.
+_ICONS = {
+    'check': '<svg width="{s}" height="{s}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="20 6 9 17 4 12"></polyline></svg>',
+    'x': '<svg width="{s}" height="{s}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="18" y1="6" x2="6" y2="18"></line><line x1="6" y1="6" x2="18" y2="18"></line></svg>',
+    'alert': '<svg width="{s}" height="{s}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><line x1="12" y1="8" x2="12" y2="12"></line><line x1="12" y1="16" x2="12.01" y2="16"></line></svg>',
+    'info': '<svg width="{s}" height="{s}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><line x1="12" y1="16" x2="12" y2="12"></line><line x1="12" y1="8" x2="12.01" y2="8"></line></svg>',
+}
+
+
+# Icons at the default size, rendered once at import.
+_DEFAULT_ICONS = {name: mark_safe(svg.format(s=20)) for name, svg in _ICONS.items()}
+_NO_ICON = mark_safe('')
+
+
+@lru_cache(maxsize=256)
+def _render_icon(name: str, size) -> str:
+    """Render a known icon at ``size`` (cached; pages reuse few sizes)."""
+    return mark_safe(_ICONS[name].format(s=size))
+
+
 @register.simple_tag
 def theme_icon(name: str, size: int = 20):
     """
@@ -667,14 +693,11 @@ def theme_icon(name: str, size: int = 20):
     Usage:
         {% theme_icon "check" size=16 %}
     """
-    # Placeholder SVG icons
-    icons = {
-        'check': f'<svg width="{size}" height="{size}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="20 6 9 17 4 12"></polyline></svg>',
-        'x': f'<svg width="{size}" height="{size}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="18" y1="6" x2="6" y2="18"></line><line x1="6" y1="6" x2="18" y2="18"></line></svg>',
-        'alert': f'<svg width="{size}" height="{size}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><line x1="12" y1="8" x2="12" y2="12"></line><line x1="12" y1="16" x2="12.01" y2="16"></line></svg>',
-        'info': f'<svg width="{size}" height="{size}" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"></circle><line x1="12" y1="16" x2="12" y2="12"></line><line x1="12" y1="8" x2="12.01" y2="8"></line></svg>',
-    }
-    return mark_safe(icons.get(name, ''))
+    if size == 20:
+        return _DEFAULT_ICONS.get(name, _NO_ICON)
+    if name not in _ICONS:
+        return _NO_ICON
+    return _render_icon(name, size)
 
 
 @register.simple_tag(takes_context=True)
@@ -30,6 +30,7 @@ from ..manager import (
     generate_critical_css_for_state,
     generate_css_for_state,
     get_css_prefix,
+    get_css_version,
     get_direction,
     get_theme_config,
     get_theme_manager,
@@ -52,7 +53,8 @@ def theme_head(context, include_js: bool = True, link_css: bool = False):
     Renders via the shared ``djust_theming/theme_head.html`` template:
 
     - Anti-flash script (runs before page render to set correct theme)
-    - Theme CSS (either inline <style> or <link> tag)
+    - Theme CSS (either inline <style> or, with ``link_css=True``, a <link>
+      to a content-versioned URL that browsers and CDNs cache for a year)
     - Component CSS (``components.css`` via <link> tag)
     - Optionally, the theme.js script tag
 
@@ -98,13 +100,18 @@ def theme_head(context, include_js: bool = True, link_css: bool = False):
             deferred_css_block = ""
     elif link_css:
         try:
-            url = reverse("djust_theming:theme_css")
-            # Add cache buster based on state
-            query_params = {"t": state.theme, "p": state.preset, "m": state.mode}
+            # Content-versioned URL: the browser/CDN caches it for a year and
+            # a theme or config change yields a new URL.
+            css = generate_css_for_state(state, css_prefix=css_prefix)
+            url = reverse("djust_theming:versioned_theme_css", kwargs={
+                "theme": state.theme,
+                "preset": state.preset,
+                "version": get_css_version(css),
+            })
             if state.pack:
-                query_params["pk"] = state.pack
+                url = f"{url}?{urlencode({'pk': state.pack})}"
 
-            css_block = f'<link rel="stylesheet" href="{url}?{urlencode(query_params)}" data-djust-theme>'
+            css_block = f'<link rel="stylesheet" href="{url}" data-djust-theme>'
         except NoReverseMatch:
             # Fallback to inline if URL not configured
             pass
@@ -263,24 +270,16 @@ def theme_panel(
         {% theme_panel show_packs=False %}
         {% theme_panel show_design=False %}
     """
-    from ..theme_packs import get_all_design_systems, get_all_theme_packs
+    from ..theme_packs import design_system_choices, theme_pack_choices
 
     request = context.get("request")
     manager = get_theme_manager(request)
     state = manager.get_state()
     presets = manager.get_available_presets()
 
-    # Build design system list with display names
-    designs = [
-        {"name": name, "display_name": name.replace("_", " ").title()}
-        for name in sorted(get_all_design_systems().keys())
-    ]
-
-    # Build theme pack list
-    packs = [
-        {"name": name, "display_name": pack.display_name, "description": pack.description}
-        for name, pack in sorted(get_all_theme_packs().items())
-    ]
+    # Design system and theme pack lists (cached per registry generation)
+    designs = design_system_choices()
+    packs = theme_pack_choices()
 
     # Build layout list
     layouts = [
@@ -310,6 +309,27 @@ def theme_panel(
     }))
 
 
+def _theme_state(context):
+    """Resolved ThemeState for the template's request (memoized per request)."""
+    return get_theme_manager(context.get("request")).get_state()
+
+
+@register.simple_tag(takes_context=True)
+def theme_state(context):
+    """
+    Get the current ThemeState for use in the template.
+
+    Use this instead of several of the single-value tags below when a
+    template needs more than one field.
+
+    Usage:
+        {% theme_state as ts %}
+        <body class="theme-{{ ts.preset }}" data-theme-setting="{{ ts.mode }}"
+              data-theme="{{ ts.resolved_mode }}">
+    """
+    return _theme_state(context)
+
+
 @register.simple_tag(takes_context=True)
 def theme_preset(context):
     """
@@ -318,9 +338,7 @@ def theme_preset(context):
     Usage:
         <body class="theme-{% theme_preset %}">
     """
-    request = context.get("request")
-    manager = get_theme_manager(request)
-    return manager.get_state().preset
+    return _theme_state(context).preset
 
 
 @register.simple_tag(takes_context=True)
@@ -333,9 +351,7 @@ def theme_mode(context):
     Usage:
         <body data-theme-setting="{% theme_mode %}">
     """
-    request = context.get("request")
-    manager = get_theme_manager(request)
-    return manager.get_state().mode
+    return _theme_state(context).mode
 
 
 @register.simple_tag(takes_context=True)
@@ -346,6 +362,4 @@ def theme_resolved_mode(context):
     Usage:
         <body class="{% theme_resolved_mode %}">
     """
-    request = context.get("request")
-    manager = get_theme_manager(request)
-    return manager.get_state().resolved_mode
+    return _theme_state(context).resolved_mode
@@ -12,6 +12,7 @@ Generates CSS custom properties for all aspects of a theme:
 Sources design data from DesignSystem objects in theme_packs.py.
 """
 
+import re
 from functools import lru_cache
 
 from .manager import get_theme_config
@@ -19,6 +20,30 @@ from .theme_packs import DesignSystem, get_design_system
 from .css_generator import ThemeCSSGenerator as ColorCSSGenerator
 
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from generated CSS.
+
+    Deliberately conservative: whitespace runs collapse to one space and
+    is only removed next to ``{``, ``}`` and ``;``, so selectors such as
+    ``.a :hover`` keep their meaning.
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_RE.sub(r"\1", css).strip()
+
+
+def _finish_css(css: str) -> str:
+    """Apply the ``minify_css`` config option to cached generator output."""
+    if get_theme_config().get("minify_css", False):
+        return minify_css(css)
+    return css
+
+
 def _parse_size_to_px(size: str) -> float:
     """Parse a CSS size string to pixels. Assumes 1rem = 16px."""
     size = size.strip()
@@ -108,29 +133,36 @@ def _compute_spacing_scale(space_unit: str) -> dict:
     return result
 
 
+# Shared easing profiles for simple keyword easings.
+_EASING_KEYWORD_VARIANTS = {
+    "linear": {
+        "ease_in": "linear",
+        "ease_out": "linear",
+        "ease_in_out": "linear",
+    },
+    "ease": {
+        "ease_in": "cubic-bezier(0.4, 0, 1, 1)",
+        "ease_out": "cubic-bezier(0, 0, 0.2, 1)",
+        "ease_in_out": "cubic-bezier(0.4, 0, 0.2, 1)",
+    },
+    "ease-out": {
+        "ease_in": "cubic-bezier(0.4, 0, 1, 1)",
+        "ease_out": "ease-out",
+        "ease_in_out": "cubic-bezier(0.4, 0, 0.2, 1)",
+    },
+}
+
+
+@lru_cache(maxsize=None)
 def _derive_easing_variants(easing: str) -> dict:
-    """Derive ease-in, ease-out, ease-in-out from a single easing value."""
-    # If it's a simple keyword, map to standard curves
-    keyword_map = {
-        "linear": {
-            "ease_in": "linear",
-            "ease_out": "linear",
-            "ease_in_out": "linear",
-        },
-        "ease": {
-            "ease_in": "cubic-bezier(0.4, 0, 1, 1)",
-            "ease_out": "cubic-bezier(0, 0, 0.2, 1)",
-            "ease_in_out": "cubic-bezier(0.4, 0, 0.2, 1)",
-        },
-        "ease-out": {
-            "ease_in": "cubic-bezier(0.4, 0, 1, 1)",
-            "ease_out": "ease-out",
-            "ease_in_out": "cubic-bezier(0.4, 0, 0.2, 1)",
-        },
-    }
+    """Derive ease-in, ease-out, ease-in-out from a single easing value.
 
-    if easing in keyword_map:
-        return keyword_map[easing]
+    Design systems share a handful of easing curves, so each distinct value
+    maps to one cached profile. The returned dict is shared; do not mutate it.
+    """
+    # If it's a simple keyword, map to standard curves
+    if easing in _EASING_KEYWORD_VARIANTS:
+        return _EASING_KEYWORD_VARIANTS[easing]
 
     # For cubic-bezier values, use the provided value as ease-in-out
     # and derive reasonable in/out variants
@@ -177,6 +209,178 @@ def _infer_component_styles(ds: DesignSystem) -> dict:
     }
 
 
+# Fixed-shape sections of _generate_theme_vars, filled with format_map() from
+# the _compute_type_scale() / _compute_spacing_scale() dicts.
+_FONT_SIZES_TEMPLATE = "\n".join([
+    "",
+    "  /* Font Sizes */",
+    "  --text-xs: {text_xs};",
+    "  --text-sm: {text_sm};",
+    "  --text-base: {text_base};",
+    "  --text-lg: {text_lg};",
+    "  --text-xl: {text_xl};",
+    "  --text-2xl: {text_2xl};",
+    "  --text-3xl: {text_3xl};",
+    "  --text-4xl: {text_4xl};",
+    "  --text-5xl: {text_5xl};",
+])
+_SPACING_TEMPLATE = "\n".join([
+    "",
+    "  /* Spacing */",
+    "  --space-base: {base}rem;",
+    "  --space-0: 0;",
+    *(f"  --space-{n}: {{space_{n}}}rem;" for n in (1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 24)),
+])
+# The spacing scale uses a fixed base step regardless of space_unit (see
+# _compute_spacing_scale), so the whole section is computed once at import.
+_SPACING_CSS = _SPACING_TEMPLATE.format_map(_compute_spacing_scale("0.25rem"))
+
+# AnimationStyle effect name -> keyframe animation name.
+_ENTRANCE_ANIMATIONS = {
+    "fade": "dj-fade-in",
+    "slide": "dj-slide-in",
+    "scale": "dj-scale-in",
+    "bounce": "dj-bounce-in",
+    "none": "none",
+}
+_CLICK_ANIMATIONS = {
+    "pulse": "dj-click-pulse",
+    "bounce": "dj-click-bounce",
+    "scale": "dj-click-pulse",   # scale uses pulse (similar feel)
+    "ripple": "dj-click-pulse",  # ripple falls back to pulse (pure CSS)
+    "none": "none",
+}
+
+
+# Static typography utility classes (see _generate_typography_classes).
+_TYPOGRAPHY_CLASSES_CSS = """/* Typography Utilities */
+/* Note: body font-family/size/line-height is set in critical CSS base styles
+   to prevent layout shift when deferred CSS loads. */
+
+.font-sans { font-family: var(--font-sans); }
+.font-mono { font-family: var(--font-mono); }
+.font-display { font-family: var(--font-display, var(--font-sans)); }
+
+.text-xs { font-size: var(--text-xs); }
+.text-sm { font-size: var(--text-sm); }
+.text-base { font-size: var(--text-base); }
+.text-lg { font-size: var(--text-lg); }
+.text-xl { font-size: var(--text-xl); }
+.text-2xl { font-size: var(--text-2xl); }
+.text-3xl { font-size: var(--text-3xl); }
+.text-4xl { font-size: var(--text-4xl); }
+.text-5xl { font-size: var(--text-5xl); }
+
+.font-normal { font-weight: var(--font-normal); }
+.font-medium { font-weight: var(--font-medium); }
+.font-semibold { font-weight: var(--font-semibold); }
+.font-bold { font-weight: var(--font-bold); }
+
+.leading-tight { line-height: var(--leading-tight); }
+.leading-normal { line-height: var(--leading-normal); }
+.leading-relaxed { line-height: var(--leading-relaxed); }"""
+
+# Button CSS per button_style; formatted with the class prefix as ``p``.
+_BUTTON_STYLES = {
+    "solid": """
+.{p}btn {{
+  border-radius: var(--radius-md);
+  box-shadow: var(--shadow-sm);
+  transition: all var(--duration-normal) var(--ease-out);
+}}
+.{p}btn:hover {{
+  box-shadow: var(--shadow);
+  transform: translateY(-1px);
+}}""",
+    "outlined": """
+.{p}btn {{
+  border-radius: var(--radius);
+  border: 2px solid currentColor;
+  background: transparent;
+  transition: all var(--duration-fast) var(--ease-out);
+}}
+.{p}btn:hover {{
+  background: currentColor;
+  color: var(--background);
+}}""",
+    "ghost": """
+.{p}btn {{
+  border-radius: var(--radius);
+  background: transparent;
+  transition: background var(--duration-fast) var(--ease-out);
+}}
+.{p}btn:hover {{
+  background: hsl(var(--accent) / 0.1);
+}}""",
+}
+
+# Card CSS per card_style; formatted with the class prefix as ``p``.
+_CARD_STYLES = {
+    "elevated": """
+.{p}card {{
+  border-radius: var(--radius-lg);
+  box-shadow: var(--shadow);
+  transition: box-shadow var(--duration-normal) var(--ease-out);
+}}
+.{p}card:hover {{
+  box-shadow: var(--shadow-lg);
+}}""",
+    "outlined": """
+.{p}card {{
+  border-radius: var(--radius-md);
+  border: 1px solid hsl(var(--border));
+  box-shadow: none;
+}}""",
+    "flat": """
+.{p}card {{
+  border-radius: var(--radius-sm);
+  background: hsl(var(--muted) / 0.3);
+  box-shadow: none;
+}}""",
+}
+
+# Input CSS per input_style; formatted with the class prefix as ``p``.
+_INPUT_STYLES = {
+    "outlined": """
+.{p}form-input {{
+  border-radius: var(--radius);
+  border: 2px solid hsl(var(--input));
+  background: transparent;
+  transition: border-color var(--duration-fast) var(--ease-out);
+}}
+.{p}form-input:focus {{
+  border-color: hsl(var(--ring));
+  outline: none;
+}}""",
+    "filled": """
+.{p}form-input {{
+  border-radius: var(--radius) var(--radius) 0 0;
+  border: none;
+  border-bottom: 2px solid hsl(var(--input));
+  background: hsl(var(--muted) / 0.5);
+  transition: all var(--duration-fast) var(--ease-out);
+}}
+.{p}form-input:focus {{
+  border-bottom-color: hsl(var(--ring));
+  background: hsl(var(--muted) / 0.7);
+  outline: none;
+}}""",
+    "underlined": """
+.{p}form-input {{
+  border-radius: 0;
+  border: none;
+  border-bottom: 1px solid hsl(var(--input));
+  background: transparent;
+  transition: border-color var(--duration-fast) var(--ease-out);
+}}
+.{p}form-input:focus {{
+  border-bottom-width: 2px;
+  border-bottom-color: hsl(var(--ring));
+  outline: none;
+}}""",
+}
+
+
 class CompleteThemeCSSGenerator:
     """Generate complete theme CSS including colors, typography, spacing, etc."""
 
@@ -199,6 +403,15 @@ class CompleteThemeCSSGenerator:
         # Initialize color generator
         self.color_generator = ColorCSSGenerator(preset_name=self.color_preset)
 
+    def _color_tokens_css(self) -> str:
+        """Light, dark and system-preference color token blocks."""
+        gen = self.color_generator
+        return (
+            f"{gen._generate_light_mode()}\n\n"
+            f"{gen._generate_dark_mode()}\n\n"
+            f"{gen._generate_system_preference()}"
+        )
+
     def generate_css(self) -> str:
         """Generate complete CSS for the theme.
 
@@ -209,20 +422,11 @@ class CompleteThemeCSSGenerator:
         use_layers = config.get("use_css_layers", True)
         layer_order = config.get("css_layer_order", "base, tokens, components, theme")
 
-        # Build raw color token parts (unwrapped — we'll wrap once)
-        color_parts = [
-            self.color_generator._generate_light_mode(),
-            "",
-            self.color_generator._generate_dark_mode(),
-            "",
-            self.color_generator._generate_system_preference(),
-        ]
-
+        # Build raw color token CSS (unwrapped — we'll wrap once)
+        color_tokens_css = self._color_tokens_css()
         if self.color_generator.include_design_tokens:
             from .design_tokens import generate_design_tokens_css
-            color_parts.extend(["", "", generate_design_tokens_css()])
-
-        color_tokens_css = "\n".join(color_parts)
+            color_tokens_css = f"{color_tokens_css}\n\n\n{generate_design_tokens_css()}"
 
         theme_vars = self._generate_theme_vars()
         typography_css = self._generate_typography_classes()
@@ -251,14 +455,12 @@ class CompleteThemeCSSGenerator:
                 parts.extend(["", f"@layer components {{\n{utilities_css}\n}}"])
             if surface_css:
                 parts.extend(["", f"@layer components {{\n{surface_css}\n}}"])
-            parts.extend([
-                "",
-                f"@layer components {{\n{typography_css}\n}}",
-                "",
-                f"@layer components {{\n{component_css}\n}}",
-            ])
+            parts.append(
+                f"\n@layer components {{\n{typography_css}\n}}"
+                f"\n\n@layer components {{\n{component_css}\n}}"
+            )
         else:
-            all_tokens = color_tokens_css + "\n\n" + theme_vars
+            all_tokens = f"{color_tokens_css}\n\n{theme_vars}"
             parts.append(all_tokens)
             if base_css:
                 parts.extend(["", base_css])
@@ -266,12 +468,7 @@ class CompleteThemeCSSGenerator:
                 parts.extend(["", utilities_css])
             if surface_css:
                 parts.extend(["", surface_css])
-            parts.extend([
-                "",
-                typography_css,
-                "",
-                component_css,
-            ])
+            parts.append(f"\n{typography_css}\n\n{component_css}")
 
         return "\n".join(parts)
 
@@ -293,17 +490,10 @@ class CompleteThemeCSSGenerator:
         layer_order = config.get("css_layer_order", "base, tokens, components, theme")
 
         # Build raw color token CSS (light/dark/system + design token root vars)
-        color_parts = [
-            self.color_generator._generate_light_mode(),
-            "",
-            self.color_generator._generate_dark_mode(),
-            "",
-            self.color_generator._generate_system_preference(),
-        ]
-
+        color_tokens_css = self._color_tokens_css()
         if self.color_generator.include_design_tokens:
             from .design_tokens import generate_design_tokens_root_css
-            color_parts.extend(["", "", generate_design_tokens_root_css()])
+            color_tokens_css = f"{color_tokens_css}\n\n\n{generate_design_tokens_root_css()}"
 
         # Theme vars (:root with typography, spacing, shadows, etc.)
         theme_vars = self._generate_theme_vars()
@@ -313,7 +503,7 @@ class CompleteThemeCSSGenerator:
         base_css = self.color_generator._generate_base_styles() if self.color_generator.include_base_styles else ""
 
         # Combine all token CSS
-        all_tokens = "\n".join(color_parts) + "\n\n" + theme_vars
+        all_tokens = f"{color_tokens_css}\n\n{theme_vars}"
 
         parts = [
             "/* djust-theming - Critical CSS (inline) */",
@@ -362,395 +552,253 @@ class CompleteThemeCSSGenerator:
                 parts.extend(["", f"@layer components {{\n{utilities_css}\n}}"])
             if design_classes:
                 parts.extend(["", f"@layer components {{\n{design_classes}\n}}"])
-            parts.extend([
-                "",
-                f"@layer components {{\n{typography_css}\n}}",
-                "",
-                f"@layer components {{\n{component_css}\n}}",
-            ])
+            parts.append(
+                f"\n@layer components {{\n{typography_css}\n}}"
+                f"\n\n@layer components {{\n{component_css}\n}}"
+            )
         else:
             if utilities_css:
                 parts.extend(["", utilities_css])
             if design_classes:
                 parts.extend(["", design_classes])
-            parts.extend([
-                "",
-                typography_css,
-                "",
-                component_css,
-            ])
+            parts.append(f"\n{typography_css}\n\n{component_css}")
 
         return "\n".join(parts)
 
     def _generate_theme_vars(self) -> str:
         """Generate theme-specific CSS custom properties from DesignSystem."""
-        ds = self.ds
-        typo = ds.typography
-        layout = ds.layout
-        surface = ds.surface
-        anim = ds.animation
-
-        parts = [
-            ":root {",
-            "  /* ========================================",
-            f"     Design System: {ds.display_name}",
-            f"     {ds.description}",
-            "     ======================================== */",
-            "",
-        ]
-
-        # Typography
-        parts.extend([
-            "  /* Typography */",
-            f"  --font-sans: {typo.body_font};",
-            f"  --font-mono: ui-monospace, SFMono-Regular, monospace;",
-        ])
-        if typo.heading_font and typo.heading_font != typo.body_font:
-            parts.append(f"  --font-display: {typo.heading_font};")
-
-        # Font sizes — derived from base_size and heading_scale
-        scale = _compute_type_scale(typo.base_size, typo.heading_scale)
-        parts.extend([
-            "",
-            "  /* Font Sizes */",
-            f"  --text-xs: {scale['text_xs']};",
-            f"  --text-sm: {scale['text_sm']};",
-            f"  --text-base: {scale['text_base']};",
-            f"  --text-lg: {scale['text_lg']};",
-            f"  --text-xl: {scale['text_xl']};",
-            f"  --text-2xl: {scale['text_2xl']};",
-            f"  --text-3xl: {scale['text_3xl']};",
-            f"  --text-4xl: {scale['text_4xl']};",
-            f"  --text-5xl: {scale['text_5xl']};",
-        ])
-
-        # Font weights — derived from body_weight and heading_weight
-        body_w = int(typo.body_weight)
-        heading_w = int(typo.heading_weight)
-        section_w = int(getattr(typo, 'section_heading_weight', heading_w))
-        parts.extend([
-            "",
-            "  /* Font Weights */",
-            f"  --font-normal: {body_w};",
-            f"  --font-medium: {min(body_w + 100, 900)};",
-            f"  --font-semibold: {section_w};",
-            f"  --font-bold: {heading_w};",
-        ])
-
-        # Line heights
-        line_h = float(typo.line_height)
-        body_line_h = float(getattr(typo, 'body_line_height', line_h + 0.1))
-        parts.extend([
-            "",
-            "  /* Line Heights */",
-            f"  --leading-tight: {max(line_h - 0.15, 1.0)};",
-            f"  --leading-normal: {line_h};",
-            f"  --leading-relaxed: {body_line_h};",
-            f"  --leading-loose: {body_line_h + 0.2};",
-        ])
-
-        # Spacing — derived from space_unit
-        sp = _compute_spacing_scale(layout.space_unit)
-        parts.extend([
-            "",
-            "  /* Spacing */",
-            f"  --space-base: {sp['base']}rem;",
-            f"  --space-0: 0;",
-            f"  --space-1: {sp['space_1']}rem;",
-            f"  --space-2: {sp['space_2']}rem;",
-            f"  --space-3: {sp['space_3']}rem;",
-            f"  --space-4: {sp['space_4']}rem;",
-            f"  --space-5: {sp['space_5']}rem;",
-            f"  --space-6: {sp['space_6']}rem;",
-            f"  --space-8: {sp['space_8']}rem;",
-            f"  --space-10: {sp['space_10']}rem;",
-            f"  --space-12: {sp['space_12']}rem;",
-            f"  --space-16: {sp['space_16']}rem;",
-            f"  --space-20: {sp['space_20']}rem;",
-            f"  --space-24: {sp['space_24']}rem;",
-        ])
-
-        # Border Radius — from layout border_radius_sm/md/lg, derive the rest
-        r_sm = layout.border_radius_sm
-        r_md = layout.border_radius_md
-        r_lg = layout.border_radius_lg
-        # Derive intermediate/larger sizes
-        r_sm_px = _parse_size_to_px(r_sm)
-        r_md_px = _parse_size_to_px(r_md)
-        r_lg_px = _parse_size_to_px(r_lg)
-
-        def fmt_radius(px):
-            if px == 0:
-                return "0px"
-            rem = px / 16
-            if rem == int(rem):
-                return f"{int(rem)}rem"
-            return f"{rem:.3f}rem"
-
-        parts.extend([
-            "",
-            "  /* Border Radius */",
-            f"  --radius-sm: {r_sm};",
-            f"  --radius: {r_sm};",
-            f"  --radius-md: {r_md};",
-            f"  --radius-lg: {r_lg};",
-            f"  --radius-xl: {fmt_radius(r_lg_px * 1.5)};",
-            f"  --radius-2xl: {fmt_radius(r_lg_px * 2)};",
-            f"  --radius-3xl: {fmt_radius(r_lg_px * 3)};",
-            f"  --radius-full: 9999px;",
-        ])
-
-        # Shadows — from surface shadow_sm/md/lg, derive the rest
-        parts.extend([
-            "",
-            "  /* Shadows */",
-            f"  --shadow-xs: {surface.shadow_sm};",
-            f"  --shadow-sm: {surface.shadow_sm};",
-            f"  --shadow: {surface.shadow_md};",
-            f"  --shadow-md: {surface.shadow_md};",
-            f"  --shadow-lg: {surface.shadow_lg};",
-            f"  --shadow-xl: {surface.shadow_lg};",
-            f"  --shadow-2xl: {surface.shadow_lg};",
-            f"  --shadow-inner: inset 0 2px 4px 0 rgb(0 0 0 / 0.05);",
-        ])
-
-        # Animations — from animation style
-        easing_variants = _derive_easing_variants(anim.easing)
-        parts.extend([
-            "",
-            "  /* Animations */",
-            f"  --duration-fast: {anim.duration_fast};",
-            f"  --duration-normal: {anim.duration_normal};",
-            f"  --duration-slow: {anim.duration_slow};",
-            f"  --ease-in: {easing_variants['ease_in']};",
-            f"  --ease-out: {easing_variants['ease_out']};",
-            f"  --ease-in-out: {easing_variants['ease_in_out']};",
-        ])
-
-        if anim.transition_style == "bouncy":
-            parts.append("  --ease-bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);")
-
-        # Animation behavior
-        entrance_map = {
-            "fade": "dj-fade-in",
-            "slide": "dj-slide-in",
-            "scale": "dj-scale-in",
-            "bounce": "dj-bounce-in",
-            "none": "none",
-        }
-        click_map = {
-            "pulse": "dj-click-pulse",
-            "bounce": "dj-click-bounce",
-            "scale": "dj-click-pulse",   # scale uses pulse (similar feel)
-            "ripple": "dj-click-pulse",  # ripple falls back to pulse (pure CSS)
-            "none": "none",
-        }
-        entrance_anim = entrance_map.get(anim.entrance_effect, "none")
-        click_anim = click_map.get(anim.click_effect, "none")
-
-        # Glow hover — emits a colored shadow for neon/glass themes
-        hover_glow = "0 0 0 transparent"
-        if anim.hover_effect == "glow":
-            hover_glow = "0 0 20px hsl(var(--brand, var(--primary)) / 0.3)"
-
-        parts.extend([
-            "",
-            "  /* Animation Behavior */",
-            f"  --hover-scale: {anim.hover_scale};",
-            f"  --hover-translate-y: {anim.hover_translate_y};",
-            f"  --hover-glow: {hover_glow};",
-            f"  --entrance-animation: {entrance_anim};",
-            f"  --click-animation: {click_anim};",
-        ])
-
-        # Layout
-        parts.extend([
-            "",
-            "  /* Layout */",
-            f"  --container-width: {layout.container_width};",
-            f"  --grid-gap: {layout.grid_gap};",
-            f"  --section-spacing: {layout.section_spacing};",
-            f"  --hero-padding-top: {layout.hero_padding_top};",
-            f"  --hero-padding-bottom: {layout.hero_padding_bottom};",
-            f"  --hero-line-height: {layout.hero_line_height};",
-            f"  --hero-max-width: {layout.hero_max_width};",
-        ])
-
-        # Typography extras
-        parts.extend([
-            "",
-            "  /* Typography Extras */",
-            f"  --letter-spacing: {typo.letter_spacing};",
-            f"  --prose-max-width: {typo.prose_max_width};",
-            f"  --badge-radius: {getattr(typo, 'badge_radius', '9999px')};",
-            f"  --leading-body: {body_line_h};",
-        ])
-
-        # Surface treatment
-        parts.extend([
-            "",
-            "  /* Surface Treatment */",
-            f"  --border-width: {surface.border_width};",
-            f"  --surface-treatment: {surface.surface_treatment};",
-        ])
-        # Glass — frosted blur effect for overlays, navbars, cards
-        if surface.backdrop_blur and surface.backdrop_blur != "0px":
-            parts.append(f"  --glass-blur: {surface.backdrop_blur};")
-            parts.append(f"  --glass-bg: hsl(var(--card) / 0.7);")
-            parts.append(f"  --glass-border: hsl(var(--border) / 0.3);")
-            parts.append(f"  --navbar-opacity: 0.85;")
-        # Gradient — derived from theme brand/primary colors
-        if surface.surface_treatment == "gradient":
-            parts.append(f"  --gradient-from: hsl(var(--brand, var(--primary)) / 0.08);")
-            parts.append(f"  --gradient-to: transparent;")
-        # Noise — grain/dither overlay on body::after
-        if surface.noise_opacity and surface.noise_opacity > 0:
-            parts.append(f"  --noise-opacity: {surface.noise_opacity};")
-
-        parts.append("}")
-
-        return "\n".join(parts)
+        return _theme_vars_css(self.ds)
 
     def _generate_typography_classes(self) -> str:
         """Generate utility classes for typography."""
-        return """/* Typography Utilities */
-/* Note: body font-family/size/line-height is set in critical CSS base styles
-   to prevent layout shift when deferred CSS loads. */
-
-.font-sans { font-family: var(--font-sans); }
-.font-mono { font-family: var(--font-mono); }
-.font-display { font-family: var(--font-display, var(--font-sans)); }
-
-.text-xs { font-size: var(--text-xs); }
-.text-sm { font-size: var(--text-sm); }
-.text-base { font-size: var(--text-base); }
-.text-lg { font-size: var(--text-lg); }
-.text-xl { font-size: var(--text-xl); }
-.text-2xl { font-size: var(--text-2xl); }
-.text-3xl { font-size: var(--text-3xl); }
-.text-4xl { font-size: var(--text-4xl); }
-.text-5xl { font-size: var(--text-5xl); }
-
-.font-normal { font-weight: var(--font-normal); }
-.font-medium { font-weight: var(--font-medium); }
-.font-semibold { font-weight: var(--font-semibold); }
-.font-bold { font-weight: var(--font-bold); }
-
-.leading-tight { line-height: var(--leading-tight); }
-.leading-normal { line-height: var(--leading-normal); }
-.leading-relaxed { line-height: var(--leading-relaxed); }"""
+        return _TYPOGRAPHY_CLASSES_CSS
 
     def _generate_component_styles(self) -> str:
         """Generate component styles based on design system."""
         styles = _infer_component_styles(self.ds)
-        p = self.css_prefix  # shorthand for prefix
+        return _component_styles_css(
+            styles["button_style"], styles["card_style"], styles["input_style"],
+            self.css_prefix,
+        )
 
-        parts = ["/* Component Styles */"]
 
-        # Button styles
-        if styles["button_style"] == "solid":
-            parts.append(f"""
-.{p}btn {{
-  border-radius: var(--radius-md);
-  box-shadow: var(--shadow-sm);
-  transition: all var(--duration-normal) var(--ease-out);
-}}
-.{p}btn:hover {{
-  box-shadow: var(--shadow);
-  transform: translateY(-1px);
-}}""")
-        elif styles["button_style"] == "outlined":
-            parts.append(f"""
-.{p}btn {{
-  border-radius: var(--radius);
-  border: 2px solid currentColor;
-  background: transparent;
-  transition: all var(--duration-fast) var(--ease-out);
-}}
-.{p}btn:hover {{
-  background: currentColor;
-  color: var(--background);
-}}""")
-        elif styles["button_style"] == "ghost":
-            parts.append(f"""
-.{p}btn {{
-  border-radius: var(--radius);
-  background: transparent;
-  transition: background var(--duration-fast) var(--ease-out);
-}}
-.{p}btn:hover {{
-  background: hsl(var(--accent) / 0.1);
-}}""")
+@lru_cache(maxsize=64)
+def _theme_vars_css(ds: DesignSystem) -> str:
+    """Render the ``:root`` custom-property block for a design system.
 
-        # Card styles
-        if styles["card_style"] == "elevated":
-            parts.append(f"""
-.{p}card {{
-  border-radius: var(--radius-lg);
-  box-shadow: var(--shadow);
-  transition: box-shadow var(--duration-normal) var(--ease-out);
-}}
-.{p}card:hover {{
-  box-shadow: var(--shadow-lg);
-}}""")
-        elif styles["card_style"] == "outlined":
-            parts.append(f"""
-.{p}card {{
-  border-radius: var(--radius-md);
-  border: 1px solid hsl(var(--border));
-  box-shadow: none;
-}}""")
-        elif styles["card_style"] == "flat":
-            parts.append(f"""
-.{p}card {{
-  border-radius: var(--radius-sm);
-  background: hsl(var(--muted) / 0.3);
-  box-shadow: none;
-}}""")
+    The block depends only on the (frozen) design system, not on the color
+    preset or prefix, so it is rendered once per design system and shared by
+    every preset's full and critical CSS.
+    """
+    typo = ds.typography
+    layout = ds.layout
+    surface = ds.surface
+    anim = ds.animation
+
+    parts = [
+        ":root {",
+        "  /* ========================================",
+        f"     Design System: {ds.display_name}",
+        f"     {ds.description}",
+        "     ======================================== */",
+        "",
+    ]
+
+    # Typography
+    parts.extend([
+        "  /* Typography */",
+        f"  --font-sans: {typo.body_font};",
+        f"  --font-mono: ui-monospace, SFMono-Regular, monospace;",
+    ])
+    if typo.heading_font and typo.heading_font != typo.body_font:
+        parts.append(f"  --font-display: {typo.heading_font};")
+
+    # Font sizes — derived from base_size and heading_scale
+    scale = _compute_type_scale(typo.base_size, typo.heading_scale)
+    parts.append(_FONT_SIZES_TEMPLATE.format_map(scale))
+
+    # Font weights — derived from body_weight and heading_weight
+    body_w = int(typo.body_weight)
+    heading_w = int(typo.heading_weight)
+    section_w = int(typo.section_heading_weight)
+    parts.extend([
+        "",
+        "  /* Font Weights */",
+        f"  --font-normal: {body_w};",
+        f"  --font-medium: {min(body_w + 100, 900)};",
+        f"  --font-semibold: {section_w};",
+        f"  --font-bold: {heading_w};",
+    ])
+
+    # Line heights
+    line_h = float(typo.line_height)
+    body_line_h = float(typo.body_line_height)
+    parts.extend([
+        "",
+        "  /* Line Heights */",
+        f"  --leading-tight: {max(line_h - 0.15, 1.0)};",
+        f"  --leading-normal: {line_h};",
+        f"  --leading-relaxed: {body_line_h};",
+        f"  --leading-loose: {body_line_h + 0.2};",
+    ])
+
+    # Spacing — fixed 4px step scale, precomputed
+    parts.append(_SPACING_CSS)
+
+    # Border Radius — from layout border_radius_sm/md/lg, derive the rest
+    r_sm = layout.border_radius_sm
+    r_md = layout.border_radius_md
+    r_lg = layout.border_radius_lg
+    # Derive intermediate/larger sizes
+    r_sm_px = _parse_size_to_px(r_sm)
+    r_md_px = _parse_size_to_px(r_md)
+    r_lg_px = _parse_size_to_px(r_lg)
+
+    def fmt_radius(px):
+        if px == 0:
+            return "0px"
+        rem = px / 16
+        if rem == int(rem):
+            return f"{int(rem)}rem"
+        return f"{rem:.3f}rem"
 
-        # Input styles
-        if styles["input_style"] == "outlined":
-            parts.append(f"""
-.{p}form-input {{
-  border-radius: var(--radius);
-  border: 2px solid hsl(var(--input));
-  background: transparent;
-  transition: border-color var(--duration-fast) var(--ease-out);
-}}
-.{p}form-input:focus {{
-  border-color: hsl(var(--ring));
-  outline: none;
-}}""")
-        elif styles["input_style"] == "filled":
-            parts.append(f"""
-.{p}form-input {{
-  border-radius: var(--radius) var(--radius) 0 0;
-  border: none;
-  border-bottom: 2px solid hsl(var(--input));
-  background: hsl(var(--muted) / 0.5);
-  transition: all var(--duration-fast) var(--ease-out);
-}}
-.{p}form-input:focus {{
-  border-bottom-color: hsl(var(--ring));
-  background: hsl(var(--muted) / 0.7);
-  outline: none;
-}}""")
-        elif styles["input_style"] == "underlined":
-            parts.append(f"""
-.{p}form-input {{
-  border-radius: 0;
-  border: none;
-  border-bottom: 1px solid hsl(var(--input));
-  background: transparent;
-  transition: border-color var(--duration-fast) var(--ease-out);
-}}
-.{p}form-input:focus {{
-  border-bottom-width: 2px;
-  border-bottom-color: hsl(var(--ring));
-  outline: none;
-}}""")
+    parts.extend([
+        "",
+        "  /* Border Radius */",
+        f"  --radius-sm: {r_sm};",
+        f"  --radius: {r_sm};",
+        f"  --radius-md: {r_md};",
+        f"  --radius-lg: {r_lg};",
+        f"  --radius-xl: {fmt_radius(r_lg_px * 1.5)};",
+        f"  --radius-2xl: {fmt_radius(r_lg_px * 2)};",
+        f"  --radius-3xl: {fmt_radius(r_lg_px * 3)};",
+        f"  --radius-full: 9999px;",
+    ])
+
+    # Shadows — from surface shadow_sm/md/lg, derive the rest
+    parts.extend([
+        "",
+        "  /* Shadows */",
+        f"  --shadow-xs: {surface.shadow_sm};",
+        f"  --shadow-sm: {surface.shadow_sm};",
+        f"  --shadow: {surface.shadow_md};",
+        f"  --shadow-md: {surface.shadow_md};",
+        f"  --shadow-lg: {surface.shadow_lg};",
+        f"  --shadow-xl: {surface.shadow_lg};",
+        f"  --shadow-2xl: {surface.shadow_lg};",
+        f"  --shadow-inner: inset 0 2px 4px 0 rgb(0 0 0 / 0.05);",
+    ])
+
+    # Animations — from animation style
+    easing_variants = _derive_easing_variants(anim.easing)
+    parts.extend([
+        "",
+        "  /* Animations */",
+        f"  --duration-fast: {anim.duration_fast};",
+        f"  --duration-normal: {anim.duration_normal};",
+        f"  --duration-slow: {anim.duration_slow};",
+        f"  --ease-in: {easing_variants['ease_in']};",
+        f"  --ease-out: {easing_variants['ease_out']};",
+        f"  --ease-in-out: {easing_variants['ease_in_out']};",
+    ])
+
+    if anim.transition_style == "bouncy":
+        parts.append("  --ease-bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);")
+
+    # Animation behavior
+    entrance_anim = _ENTRANCE_ANIMATIONS.get(anim.entrance_effect, "none")
+    click_anim = _CLICK_ANIMATIONS.get(anim.click_effect, "none")
+
+    # Glow hover — emits a colored shadow for neon/glass themes
+    hover_glow = "0 0 0 transparent"
+    if anim.hover_effect == "glow":
+        hover_glow = "0 0 20px hsl(var(--brand, var(--primary)) / 0.3)"
+
+    parts.extend([
+        "",
+        "  /* Animation Behavior */",
+        f"  --hover-scale: {anim.hover_scale};",
+        f"  --hover-translate-y: {anim.hover_translate_y};",
+        f"  --hover-glow: {hover_glow};",
+        f"  --entrance-animation: {entrance_anim};",
+        f"  --click-animation: {click_anim};",
+    ])
+
+    # Layout
+    parts.extend([
+        "",
+        "  /* Layout */",
+        f"  --container-width: {layout.container_width};",
+        f"  --grid-gap: {layout.grid_gap};",
+        f"  --section-spacing: {layout.section_spacing};",
+        f"  --hero-padding-top: {layout.hero_padding_top};",
+        f"  --hero-padding-bottom: {layout.hero_padding_bottom};",
+        f"  --hero-line-height: {layout.hero_line_height};",
+        f"  --hero-max-width: {layout.hero_max_width};",
+    ])
+
+    # Typography extras
+    parts.extend([
+        "",
+        "  /* Typography Extras */",
+        f"  --letter-spacing: {typo.letter_spacing};",
+        f"  --prose-max-width: {typo.prose_max_width};",
+        f"  --badge-radius: {typo.badge_radius};",
+        f"  --leading-body: {body_line_h};",
+    ])
+
+    # Surface treatment
+    parts.extend([
+        "",
+        "  /* Surface Treatment */",
+        f"  --border-width: {surface.border_width};",
+        f"  --surface-treatment: {surface.surface_treatment};",
+    ])
+    # Glass — frosted blur effect for overlays, navbars, cards
+    if surface.backdrop_blur and surface.backdrop_blur != "0px":
+        parts.append(f"  --glass-blur: {surface.backdrop_blur};")
+        parts.append(f"  --glass-bg: hsl(var(--card) / 0.7);")
+        parts.append(f"  --glass-border: hsl(var(--border) / 0.3);")
+        parts.append(f"  --navbar-opacity: 0.85;")
+    # Gradient — derived from theme brand/primary colors
+    if surface.surface_treatment == "gradient":
+        parts.append(f"  --gradient-from: hsl(var(--brand, var(--primary)) / 0.08);")
+        parts.append(f"  --gradient-to: transparent;")
+    # Noise — grain/dither overlay on body::after
+    if surface.noise_opacity and surface.noise_opacity > 0:
+        parts.append(f"  --noise-opacity: {surface.noise_opacity};")
+
+    parts.append("}")
+
+    return "\n".join(parts)
+
+
+def get_design_css(name: str) -> str:
+    """Return the cached ``:root`` variable block for a design system.
+
+    Raises:
+        ValueError: If the design system is not found.
+    """
+    ds = get_design_system(name)
+    if not ds:
+        raise ValueError(f"Design system '{name}' not found")
+    return _theme_vars_css(ds)
 
-        return "\n".join(parts)
+
+@lru_cache(maxsize=64)
+def _component_styles_css(button_style: str, card_style: str, input_style: str, p: str) -> str:
+    """Format the component style blocks (shared by every preset of a design system)."""
+    parts = ["/* Component Styles */"]
+    for blocks, style in (
+        (_BUTTON_STYLES, button_style),
+        (_CARD_STYLES, card_style),
+        (_INPUT_STYLES, input_style),
+    ):
+        block = blocks.get(style)
+        if block is not None:
+            parts.append(block.format(p=p))
+
+    return "\n".join(parts)
 
 
 @lru_cache(maxsize=256)
@@ -759,7 +807,8 @@ def generate_theme_css(theme_name: str, color_preset: str = None, css_prefix: st
     Generate complete CSS for a theme (cached).
 
     Results are cached by (theme_name, color_preset, css_prefix). Use
-    ``clear_css_cache()`` to invalidate during development.
+    ``clear_css_cache()`` to invalidate during development. When the
+    ``minify_css`` config option is set, the cached string is minified.
 
     Args:
         theme_name: Name of the design system (material, ios, bauhaus, etc.)
@@ -773,4 +822,38 @@ def generate_theme_css(theme_name: str, color_preset: str = None, css_prefix: st
         color_preset = "default"
 
     generator = CompleteThemeCSSGenerator(theme_name, color_preset, css_prefix=css_prefix)
-    return generator.generate_css()
+    return _finish_css(generator.generate_css())
+
+
+@lru_cache(maxsize=256)
+def generate_theme_critical_css(
+    theme_name: str, color_preset: str = None, css_prefix: str = ""
+) -> str:
+    """
+    Generate critical (first-paint) CSS for a theme (cached).
+
+    Cached like :func:`generate_theme_css`; see
+    :meth:`CompleteThemeCSSGenerator.generate_critical_css`.
+    """
+    if color_preset is None:
+        color_preset = "default"
+
+    generator = CompleteThemeCSSGenerator(theme_name, color_preset, css_prefix=css_prefix)
+    return _finish_css(generator.generate_critical_css())
+
+
+@lru_cache(maxsize=256)
+def generate_theme_deferred_css(
+    theme_name: str, color_preset: str = None, css_prefix: str = ""
+) -> str:
+    """
+    Generate deferred (async-loaded) CSS for a theme (cached).
+
+    Cached like :func:`generate_theme_css`; see
+    :meth:`CompleteThemeCSSGenerator.generate_deferred_css`.
+    """
+    if color_preset is None:
+        color_preset = "default"
+
+    generator = CompleteThemeCSSGenerator(theme_name, color_preset, css_prefix=css_prefix)
+    return _finish_css(generator.generate_deferred_css())
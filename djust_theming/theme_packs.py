@@ -9,11 +9,31 @@ A DesignSystem defines the non-color aspects of UI:
 - Interaction feedback
 """
 
+import sys
+from collections import ChainMap
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
+from .registry import get_registry
 
-@dataclass
+
+def _intern_fields(obj) -> None:
+    """Intern the string fields of a frozen, slotted style dataclass.
+
+    Theme modules repeat the same CSS values ("1.5rem", "0.15s", easing
+    curves, font stacks) in every file; interning collapses them into one
+    shared object per value and lets equality checks short-circuit on
+    identity.
+    """
+    for name in obj.__slots__:
+        value = getattr(obj, name)
+        if type(value) is str:
+            object.__setattr__(obj, name, sys.intern(value))
+
+
+@dataclass(frozen=True, slots=True)
 class TypographyStyle:
     """Typography configuration."""
     name: str
@@ -38,8 +58,11 @@ class TypographyStyle:
     prose_max_width: str = "42rem"    # Max width for readable text blocks
     badge_radius: str = "9999px"      # Badge border-radius (pill by default)
 
+    def __post_init__(self):
+        _intern_fields(self)
+
 
-@dataclass 
+@dataclass(frozen=True, slots=True)
 class LayoutStyle:
     """Layout and spacing configuration."""
     name: str
@@ -69,8 +92,11 @@ class LayoutStyle:
     hero_line_height: str = "1.1"
     hero_max_width: str = "64rem"      # Content width within hero
 
+    def __post_init__(self):
+        _intern_fields(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SurfaceStyle:
     """Surface treatments and visual depth."""
     name: str
@@ -89,8 +115,11 @@ class SurfaceStyle:
     backdrop_blur: str = "0px"
     noise_opacity: float = 0.0
 
+    def __post_init__(self):
+        _intern_fields(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IconStyle:
     """Icon styling configuration."""
     name: str
@@ -102,8 +131,11 @@ class IconStyle:
     stroke_width: str = "2"
     corner_rounding: str = "0"  # For rounded style
 
+    def __post_init__(self):
+        _intern_fields(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AnimationStyle:
     """Animation and motion configuration."""
     name: str
@@ -130,10 +162,13 @@ class AnimationStyle:
     duration_slow: str = "0.5s"
     easing: str = "cubic-bezier(0.4, 0, 0.2, 1)"
 
+    def __post_init__(self):
+        _intern_fields(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InteractionStyle:
-    """User interaction feedback.""" 
+    """User interaction feedback."""
     name: str
 
     # Hover effects
@@ -141,12 +176,22 @@ class InteractionStyle:
     link_hover: str = "underline"  # "underline", "color", "background", "none"
     card_hover: str = "lift"  # "lift", "scale", "border", "shadow", "none"
 
+    # Click effects
+    button_click: str = "scale"  # "scale", "ripple", "pulse", "none"
+
     # Focus effects
     focus_style: str = "ring"  # "ring", "outline", "glow", "underline"
     focus_ring_width: str = "2px"
+    focus_ring_offset: str = "2px"
+
+    # Cursor
+    cursor_style: str = "pointer"  # "pointer", "default", "custom"
 
+    def __post_init__(self):
+        _intern_fields(self)
 
-@dataclass 
+
+@dataclass(frozen=True, slots=True)
 class DesignSystem:
     """
     Complete design system - all visual aspects EXCEPT colors.
@@ -1310,7 +1355,6 @@ DESIGN_SYSTEMS: Dict[str, DesignSystem] = {
 def get_design_system(name: str) -> Optional[DesignSystem]:
     """Get a design system by name (includes user-registered systems)."""
     _ensure_theme_imports()
-    from .registry import get_registry
     reg = get_registry()
     return reg.get_theme(name) or DESIGN_SYSTEMS.get(name)
 
@@ -1318,19 +1362,28 @@ def get_design_system(name: str) -> Optional[DesignSystem]:
 def get_all_design_systems() -> Dict[str, DesignSystem]:
     """Get all available design systems (built-in + user-registered)."""
     _ensure_theme_imports()
-    from .registry import get_registry
     reg = get_registry()
     result = DESIGN_SYSTEMS.copy()
     result.update(reg.list_themes())
     return result
 
 
+def design_systems_view() -> Mapping[str, DesignSystem]:
+    """Read-only view of all design systems (built-in + user-registered).
+
+    Same contents as :func:`get_all_design_systems` without copying either
+    dict; use it for read-only lookups on hot paths such as template tags.
+    """
+    _ensure_theme_imports()
+    return MappingProxyType(ChainMap(get_registry().themes, DESIGN_SYSTEMS))
+
+
 # =============================================================================
 # Legacy Theme Packs (for backward compatibility)
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatternStyle:
     """Background patterns and textures."""
     name: str
@@ -1349,30 +1402,11 @@ class PatternStyle:
     # Noise for texture
     noise_intensity: float = 0.0
 
-
-@dataclass
-class InteractionStyle:
-    """User interaction feedback."""
-    name: str
-
-    # Hover effects
-    button_hover: str = "lift"  # "lift", "scale", "glow", "darken", "none"
-    link_hover: str = "underline"  # "underline", "color", "background", "none"
-    card_hover: str = "lift"  # "lift", "scale", "border", "shadow", "none"
-
-    # Click effects
-    button_click: str = "scale"  # "scale", "ripple", "pulse", "none"
-
-    # Focus effects
-    focus_style: str = "ring"  # "ring", "outline", "glow", "underline"
-    focus_ring_width: str = "2px"
-    focus_ring_offset: str = "2px"
-
-    # Cursor
-    cursor_style: str = "pointer"  # "pointer", "default", "custom"
+    def __post_init__(self):
+        _intern_fields(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IllustrationStyle:
     """Illustration and imagery treatment."""
     name: str
@@ -1387,8 +1421,11 @@ class IllustrationStyle:
     # Aspect ratios preference
     preferred_aspect: str = "16:9"  # "1:1", "16:9", "4:3", "3:4"
 
+    def __post_init__(self):
+        _intern_fields(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ThemePack:
     """
     Complete design system combining all styling dimensions.
@@ -2066,7 +2103,6 @@ def _ensure_theme_imports() -> None:
 def get_theme_pack(name: str) -> Optional[ThemePack]:
     """Get a theme pack by name (includes user-registered packs)."""
     _ensure_theme_imports()
-    from .registry import get_registry
     reg = get_registry()
     return reg.get_pack(name) or THEME_PACKS.get(name)
 
@@ -2074,8 +2110,53 @@ def get_theme_pack(name: str) -> Optional[ThemePack]:
 def get_all_theme_packs() -> Dict[str, ThemePack]:
     """Get all available theme packs (built-in + user-registered)."""
     _ensure_theme_imports()
-    from .registry import get_registry
     reg = get_registry()
     result = THEME_PACKS.copy()
     result.update(reg.list_packs())
     return result
+
+
+def theme_packs_view() -> Mapping[str, ThemePack]:
+    """Read-only view of all theme packs (built-in + user-registered).
+
+    Same contents as :func:`get_all_theme_packs` without copying either
+    dict; use it for read-only lookups on hot paths such as template tags.
+    """
+    _ensure_theme_imports()
+    return MappingProxyType(ChainMap(get_registry().packs, THEME_PACKS))
+
+
+def design_system_choices() -> tuple:
+    """``{"name", "display_name"}`` rows for every design system, sorted by name.
+
+    Only the columns selectors need, projected once per registry
+    generation instead of on every render.
+    """
+    _ensure_theme_imports()
+    return _design_system_choices(get_registry().generation)
+
+
+@lru_cache(maxsize=1)
+def _design_system_choices(generation: int) -> tuple:
+    return tuple(
+        {"name": name, "display_name": name.replace("_", " ").title()}
+        for name in sorted(design_systems_view())
+    )
+
+
+def theme_pack_choices() -> tuple:
+    """``{"name", "display_name", "description"}`` rows for every theme pack.
+
+    Sorted by name and cached per registry generation, like
+    :func:`design_system_choices`.
+    """
+    _ensure_theme_imports()
+    return _theme_pack_choices(get_registry().generation)
+
+
+@lru_cache(maxsize=1)
+def _theme_pack_choices(generation: int) -> tuple:
+    return tuple(
+        {"name": name, "display_name": pack.display_name, "description": pack.description}
+        for name, pack in sorted(theme_packs_view().items())
+    )
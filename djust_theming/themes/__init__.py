@@ -5,6 +5,9 @@ Each theme file (e.g., bauhaus.py, dracula.py) contains all pieces for
 that theme: color preset (PRESET), design system (DESIGN_SYSTEM), and
 theme pack (PACK).
 
+Theme modules are imported by the preset and theme pack registries (and
+on attribute access here), not by this package's __init__.
+
 This package also re-exports the deprecated Theme/THEMES API from
 _legacy.py for backward compatibility.
 """
@@ -25,68 +28,16 @@ from ._legacy import (  # noqa: F401
     list_themes,
 )
 
-# Import all per-theme modules for convenient access
-from . import (  # noqa: F401
-    default,
-    shadcn,
-    blue,
-    green,
-    purple,
-    orange,
-    rose,
-    natural20,
-    catppuccin,
-    rose_pine,
-    tokyo_night,
-    nord,
-    synthwave,
-    cyberpunk,
-    outrun,
-    forest,
-    amber,
-    slate,
-    nebula,
-    djust,
-    dracula,
-    gruvbox,
-    solarized,
-    high_contrast,
-    mono,
-    ember,
-    aurora,
-    ink,
-    solarpunk,
-    bauhaus,
-    cyberdeck,
-    paper,
-    neon_noir,
-    ocean_deep,
-    stripe,
-    linear,
-    notion,
-    vercel,
-    github,
-    art_deco,
-    handcraft,
-    terminal,
-    magazine,
-    swiss,
-    candy,
-    retro_computing,
-    medical,
-    legal,
-    midnight,
-    sunrise,
-    forest_floor,
-    dashboard,
-    one_dark,
-    monokai,
-    ayu,
-    kanagawa,
-    everforest,
-    poimandres,
-    tailwind,
-    supabase,
-    raycast,
-    adaptive,
-)
+
+def __getattr__(name: str):
+    """Import per-theme modules (e.g. ``themes.dracula``) on first access."""
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as exc:
+        if exc.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -16,81 +16,81 @@ from ._base import (
 # forward-thinking energy.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(210, 20, 98),            # Cool clean white
-    foreground=ColorScale(215, 28, 17),            # Dark navy text — not pure black
-    card=ColorScale(0, 0, 100),                    # White cards
-    card_foreground=ColorScale(215, 28, 17),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(215, 28, 17),
-    primary=ColorScale(228, 61, 41),               # Royal blue — trust, authority
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 15, 95),             # Cool light panel
-    secondary_foreground=ColorScale(215, 28, 17),
-    muted=ColorScale(210, 12, 92),
-    muted_foreground=ColorScale(215, 15, 45),
-    accent=ColorScale(210, 12, 96),                # Subtle cool hover
-    accent_foreground=ColorScale(215, 28, 17),
-    destructive=ColorScale(0, 70, 50),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(155, 60, 40),               # Teal green — adaptive growth
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 85, 50),                # Warm amber
-    warning_foreground=ColorScale(215, 28, 17),
-    info=ColorScale(228, 61, 50),                  # Lighter royal blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(228, 61, 41),                  # Blue links — trustworthy
-    link_hover=ColorScale(12, 66, 48),             # Vermillion on hover — energy shift
-    code=ColorScale(215, 28, 17),                  # Dark navy code bg
-    code_foreground=ColorScale(12, 66, 65),        # Vermillion code text
-    selection=ColorScale(228, 61, 85),             # Pale blue selection
-    selection_foreground=ColorScale(215, 28, 17),
-    brand=ColorScale(12, 66, 50),                  # Warm vermillion — the energy accent
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(210, 15, 88),                # Cool subtle border
-    input=ColorScale(210, 12, 95),
-    ring=ColorScale(228, 61, 41),                  # Blue focus ring
-    surface_1=ColorScale(210, 20, 98),             # Base
-    surface_2=ColorScale(210, 15, 96),             # Navbar
-    surface_3=ColorScale(210, 12, 93),             # Elevated
+    background=ColorScale.of(210, 20, 98),            # Cool clean white
+    foreground=ColorScale.of(215, 28, 17),            # Dark navy text — not pure black
+    card=ColorScale.of(0, 0, 100),                    # White cards
+    card_foreground=ColorScale.of(215, 28, 17),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(215, 28, 17),
+    primary=ColorScale.of(228, 61, 41),               # Royal blue — trust, authority
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 15, 95),             # Cool light panel
+    secondary_foreground=ColorScale.of(215, 28, 17),
+    muted=ColorScale.of(210, 12, 92),
+    muted_foreground=ColorScale.of(215, 15, 45),
+    accent=ColorScale.of(210, 12, 96),                # Subtle cool hover
+    accent_foreground=ColorScale.of(215, 28, 17),
+    destructive=ColorScale.of(0, 70, 50),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(155, 60, 40),               # Teal green — adaptive growth
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 85, 50),                # Warm amber
+    warning_foreground=ColorScale.of(215, 28, 17),
+    info=ColorScale.of(228, 61, 50),                  # Lighter royal blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(228, 61, 41),                  # Blue links — trustworthy
+    link_hover=ColorScale.of(12, 66, 48),             # Vermillion on hover — energy shift
+    code=ColorScale.of(215, 28, 17),                  # Dark navy code bg
+    code_foreground=ColorScale.of(12, 66, 65),        # Vermillion code text
+    selection=ColorScale.of(228, 61, 85),             # Pale blue selection
+    selection_foreground=ColorScale.of(215, 28, 17),
+    brand=ColorScale.of(12, 66, 50),                  # Warm vermillion — the energy accent
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(210, 15, 88),                # Cool subtle border
+    input=ColorScale.of(210, 12, 95),
+    ring=ColorScale.of(228, 61, 41),                  # Blue focus ring
+    surface_1=ColorScale.of(210, 20, 98),             # Base
+    surface_2=ColorScale.of(210, 15, 96),             # Navbar
+    surface_3=ColorScale.of(210, 12, 93),             # Elevated
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(215, 28, 17),            # Dark navy
-    foreground=ColorScale(210, 15, 92),            # Cool light text
-    card=ColorScale(215, 25, 20),
-    card_foreground=ColorScale(210, 15, 92),
-    popover=ColorScale(215, 25, 20),
-    popover_foreground=ColorScale(210, 15, 92),
-    primary=ColorScale(228, 61, 55),               # Royal blue — brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(215, 20, 22),
-    secondary_foreground=ColorScale(210, 15, 92),
-    muted=ColorScale(215, 18, 24),
-    muted_foreground=ColorScale(210, 10, 55),
-    accent=ColorScale(215, 18, 22),
-    accent_foreground=ColorScale(210, 15, 92),
-    destructive=ColorScale(0, 70, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(155, 60, 48),
-    success_foreground=ColorScale(215, 28, 17),
-    warning=ColorScale(38, 85, 55),
-    warning_foreground=ColorScale(215, 28, 17),
-    info=ColorScale(228, 61, 60),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(228, 61, 60),
-    link_hover=ColorScale(12, 66, 58),             # Vermillion hover
-    code=ColorScale(215, 30, 12),
-    code_foreground=ColorScale(12, 66, 65),
-    selection=ColorScale(228, 50, 28),
-    selection_foreground=ColorScale(210, 15, 92),
-    brand=ColorScale(12, 66, 58),                  # Warm vermillion — brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(215, 18, 26),
-    input=ColorScale(215, 18, 22),
-    ring=ColorScale(228, 61, 55),
-    surface_1=ColorScale(215, 30, 12),
-    surface_2=ColorScale(215, 28, 15),
-    surface_3=ColorScale(215, 25, 20),
+    background=ColorScale.of(215, 28, 17),            # Dark navy
+    foreground=ColorScale.of(210, 15, 92),            # Cool light text
+    card=ColorScale.of(215, 25, 20),
+    card_foreground=ColorScale.of(210, 15, 92),
+    popover=ColorScale.of(215, 25, 20),
+    popover_foreground=ColorScale.of(210, 15, 92),
+    primary=ColorScale.of(228, 61, 55),               # Royal blue — brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(215, 20, 22),
+    secondary_foreground=ColorScale.of(210, 15, 92),
+    muted=ColorScale.of(215, 18, 24),
+    muted_foreground=ColorScale.of(210, 10, 55),
+    accent=ColorScale.of(215, 18, 22),
+    accent_foreground=ColorScale.of(210, 15, 92),
+    destructive=ColorScale.of(0, 70, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(155, 60, 48),
+    success_foreground=ColorScale.of(215, 28, 17),
+    warning=ColorScale.of(38, 85, 55),
+    warning_foreground=ColorScale.of(215, 28, 17),
+    info=ColorScale.of(228, 61, 60),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(228, 61, 60),
+    link_hover=ColorScale.of(12, 66, 58),             # Vermillion hover
+    code=ColorScale.of(215, 30, 12),
+    code_foreground=ColorScale.of(12, 66, 65),
+    selection=ColorScale.of(228, 50, 28),
+    selection_foreground=ColorScale.of(210, 15, 92),
+    brand=ColorScale.of(12, 66, 58),                  # Warm vermillion — brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(215, 18, 26),
+    input=ColorScale.of(215, 18, 22),
+    ring=ColorScale.of(228, 61, 55),
+    surface_1=ColorScale.of(215, 30, 12),
+    surface_2=ColorScale.of(215, 28, 15),
+    surface_3=ColorScale.of(215, 25, 20),
 )
 
 PRESET = ThemePreset(
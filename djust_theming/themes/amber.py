@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(38, 40, 98),
-    foreground=ColorScale(34, 100, 15),
-    card=ColorScale(38, 35, 94),
-    card_foreground=ColorScale(34, 100, 15),
-    popover=ColorScale(38, 35, 94),
-    popover_foreground=ColorScale(34, 100, 15),
-    primary=ColorScale(38, 92, 50),
-    primary_foreground=ColorScale(0, 0, 10),
-    secondary=ColorScale(38, 30, 88),
-    secondary_foreground=ColorScale(34, 100, 20),
-    muted=ColorScale(38, 30, 90),
-    muted_foreground=ColorScale(34, 50, 40),
-    accent=ColorScale(38, 30, 88),
-    accent_foreground=ColorScale(34, 100, 20),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 100, 60),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(38, 92, 50),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(38, 92, 45),
-    link_hover=ColorScale(38, 92, 35),
-    code=ColorScale(38, 35, 92),
-    code_foreground=ColorScale(34, 100, 15),
-    selection=ColorScale(38, 92, 50),
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(38, 92, 50),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(38, 30, 82),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(38, 92, 50),
-    surface_1=ColorScale(38, 40, 98),
-    surface_2=ColorScale(38, 35, 96),
-    surface_3=ColorScale(38, 30, 93),
+    background=ColorScale.of(38, 40, 98),
+    foreground=ColorScale.of(34, 100, 15),
+    card=ColorScale.of(38, 35, 94),
+    card_foreground=ColorScale.of(34, 100, 15),
+    popover=ColorScale.of(38, 35, 94),
+    popover_foreground=ColorScale.of(34, 100, 15),
+    primary=ColorScale.of(38, 92, 50),
+    primary_foreground=ColorScale.of(0, 0, 10),
+    secondary=ColorScale.of(38, 30, 88),
+    secondary_foreground=ColorScale.of(34, 100, 20),
+    muted=ColorScale.of(38, 30, 90),
+    muted_foreground=ColorScale.of(34, 50, 40),
+    accent=ColorScale.of(38, 30, 88),
+    accent_foreground=ColorScale.of(34, 100, 20),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 100, 60),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(38, 92, 50),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(38, 92, 45),
+    link_hover=ColorScale.of(38, 92, 35),
+    code=ColorScale.of(38, 35, 92),
+    code_foreground=ColorScale.of(34, 100, 15),
+    selection=ColorScale.of(38, 92, 50),
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(38, 92, 50),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(38, 30, 82),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(38, 92, 50),
+    surface_1=ColorScale.of(38, 40, 98),
+    surface_2=ColorScale.of(38, 35, 96),
+    surface_3=ColorScale.of(38, 30, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(34, 100, 5),
-    foreground=ColorScale(45, 100, 95),
-    card=ColorScale(36, 100, 8),
-    card_foreground=ColorScale(45, 100, 95),
-    popover=ColorScale(36, 100, 8),
-    popover_foreground=ColorScale(45, 100, 95),
-    primary=ColorScale(38, 92, 50),
-    primary_foreground=ColorScale(0, 0, 10),
-    secondary=ColorScale(34, 100, 10),
-    secondary_foreground=ColorScale(45, 100, 95),
-    muted=ColorScale(34, 100, 10),
-    muted_foreground=ColorScale(45, 80, 65),
-    accent=ColorScale(34, 100, 10),
-    accent_foreground=ColorScale(45, 100, 75),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 100, 60),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(38, 92, 50),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(38, 92, 50),
-    link_hover=ColorScale(38, 92, 60),
-    code=ColorScale(34, 100, 6),
-    code_foreground=ColorScale(45, 100, 95),
-    selection=ColorScale(38, 92, 50),
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(38, 92, 50),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(34, 100, 10),
-    input=ColorScale(36, 100, 8),
-    ring=ColorScale(38, 92, 50),
-    surface_1=ColorScale(34, 30, 4),
-    surface_2=ColorScale(34, 25, 7),
-    surface_3=ColorScale(34, 20, 11),
+    background=ColorScale.of(34, 100, 5),
+    foreground=ColorScale.of(45, 100, 95),
+    card=ColorScale.of(36, 100, 8),
+    card_foreground=ColorScale.of(45, 100, 95),
+    popover=ColorScale.of(36, 100, 8),
+    popover_foreground=ColorScale.of(45, 100, 95),
+    primary=ColorScale.of(38, 92, 50),
+    primary_foreground=ColorScale.of(0, 0, 10),
+    secondary=ColorScale.of(34, 100, 10),
+    secondary_foreground=ColorScale.of(45, 100, 95),
+    muted=ColorScale.of(34, 100, 10),
+    muted_foreground=ColorScale.of(45, 80, 65),
+    accent=ColorScale.of(34, 100, 10),
+    accent_foreground=ColorScale.of(45, 100, 75),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 100, 60),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(38, 92, 50),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(38, 92, 50),
+    link_hover=ColorScale.of(38, 92, 60),
+    code=ColorScale.of(34, 100, 6),
+    code_foreground=ColorScale.of(45, 100, 95),
+    selection=ColorScale.of(38, 92, 50),
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(38, 92, 50),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(34, 100, 10),
+    input=ColorScale.of(36, 100, 8),
+    ring=ColorScale.of(38, 92, 50),
+    surface_1=ColorScale.of(34, 30, 4),
+    surface_2=ColorScale.of(34, 25, 7),
+    surface_3=ColorScale.of(34, 20, 11),
 )
 
 PRESET = ThemePreset(
@@ -17,81 +17,81 @@ from ._base import (
 # dark backgrounds with metallic highlights.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(44, 58, 96),             # #FBF8F0 — cream
-    foreground=ColorScale(219, 55, 10),            # #0C1629 — midnight navy text
-    card=ColorScale(0, 0, 100),                    # White cards
-    card_foreground=ColorScale(219, 55, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(219, 55, 10),
-    primary=ColorScale(41, 49, 59),                # #C9A962 — gold
-    primary_foreground=ColorScale(219, 55, 10),    # Dark on gold
-    secondary=ColorScale(42, 60, 90),              # Champagne panel
-    secondary_foreground=ColorScale(219, 55, 10),
-    muted=ColorScale(42, 40, 88),                  # Warm muted
-    muted_foreground=ColorScale(219, 30, 35),
-    accent=ColorScale(42, 40, 93),                 # Warm hover surface
-    accent_foreground=ColorScale(219, 55, 10),
-    destructive=ColorScale(333, 61, 34),           # #8B2252 — burgundy
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 64, 29),               # #1B7A5A — emerald
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(41, 49, 59),                # Gold doubles as warning
-    warning_foreground=ColorScale(219, 55, 10),
-    info=ColorScale(226, 49, 40),                  # Deep blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(41, 55, 50),                   # Deeper gold links
-    link_hover=ColorScale(29, 57, 46),             # Copper on hover
-    code=ColorScale(219, 55, 10),                  # Midnight code bg
-    code_foreground=ColorScale(42, 52, 65),        # Bright gold code text
-    selection=ColorScale(41, 49, 80),              # Pale gold selection
-    selection_foreground=ColorScale(219, 55, 10),
-    brand=ColorScale(41, 49, 59),                  # Gold IS the brand
-    brand_foreground=ColorScale(219, 55, 10),
-    border=ColorScale(41, 30, 78),                 # Gold-tinted border
-    input=ColorScale(42, 30, 90),                  # Light gold input
-    ring=ColorScale(41, 49, 59),                   # Gold focus ring
-    surface_1=ColorScale(44, 58, 96),              # Cream base
-    surface_2=ColorScale(42, 60, 93),              # Champagne
-    surface_3=ColorScale(42, 50, 90),              # Deeper champagne
+    background=ColorScale.of(44, 58, 96),             # #FBF8F0 — cream
+    foreground=ColorScale.of(219, 55, 10),            # #0C1629 — midnight navy text
+    card=ColorScale.of(0, 0, 100),                    # White cards
+    card_foreground=ColorScale.of(219, 55, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(219, 55, 10),
+    primary=ColorScale.of(41, 49, 59),                # #C9A962 — gold
+    primary_foreground=ColorScale.of(219, 55, 10),    # Dark on gold
+    secondary=ColorScale.of(42, 60, 90),              # Champagne panel
+    secondary_foreground=ColorScale.of(219, 55, 10),
+    muted=ColorScale.of(42, 40, 88),                  # Warm muted
+    muted_foreground=ColorScale.of(219, 30, 35),
+    accent=ColorScale.of(42, 40, 93),                 # Warm hover surface
+    accent_foreground=ColorScale.of(219, 55, 10),
+    destructive=ColorScale.of(333, 61, 34),           # #8B2252 — burgundy
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 64, 29),               # #1B7A5A — emerald
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(41, 49, 59),                # Gold doubles as warning
+    warning_foreground=ColorScale.of(219, 55, 10),
+    info=ColorScale.of(226, 49, 40),                  # Deep blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(41, 55, 50),                   # Deeper gold links
+    link_hover=ColorScale.of(29, 57, 46),             # Copper on hover
+    code=ColorScale.of(219, 55, 10),                  # Midnight code bg
+    code_foreground=ColorScale.of(42, 52, 65),        # Bright gold code text
+    selection=ColorScale.of(41, 49, 80),              # Pale gold selection
+    selection_foreground=ColorScale.of(219, 55, 10),
+    brand=ColorScale.of(41, 49, 59),                  # Gold IS the brand
+    brand_foreground=ColorScale.of(219, 55, 10),
+    border=ColorScale.of(41, 30, 78),                 # Gold-tinted border
+    input=ColorScale.of(42, 30, 90),                  # Light gold input
+    ring=ColorScale.of(41, 49, 59),                   # Gold focus ring
+    surface_1=ColorScale.of(44, 58, 96),              # Cream base
+    surface_2=ColorScale.of(42, 60, 93),              # Champagne
+    surface_3=ColorScale.of(42, 50, 90),              # Deeper champagne
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(219, 55, 10),            # #0C1629 — midnight navy
-    foreground=ColorScale(40, 44, 89),             # #F0E8D8 — ivory text
-    card=ColorScale(226, 49, 17),                  # #162040 — deep navy card
-    card_foreground=ColorScale(40, 44, 89),
-    popover=ColorScale(222, 45, 20),               # #1C2A4A — navy panel
-    popover_foreground=ColorScale(40, 44, 89),
-    primary=ColorScale(41, 49, 59),                # #C9A962 — gold (unchanged — metallic stays constant)
-    primary_foreground=ColorScale(219, 55, 10),    # Dark on gold
-    secondary=ColorScale(222, 45, 20),             # Navy panel
-    secondary_foreground=ColorScale(40, 44, 89),
-    muted=ColorScale(222, 40, 22),                 # Dark muted
-    muted_foreground=ColorScale(0, 0, 55),         # Silver-gray muted text
-    accent=ColorScale(222, 40, 22),                # Dark hover surface
-    accent_foreground=ColorScale(40, 44, 89),
-    destructive=ColorScale(333, 61, 45),           # Burgundy — brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 64, 40),               # Emerald — brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 52, 65),                # Bright gold
-    warning_foreground=ColorScale(219, 55, 10),
-    info=ColorScale(226, 49, 55),                  # Blue — brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(42, 52, 65),                   # Bright gold links on dark
-    link_hover=ColorScale(43, 60, 77),             # Pale gold hover
-    code=ColorScale(219, 60, 7),                   # Deepest midnight
-    code_foreground=ColorScale(41, 49, 59),        # Gold code text
-    selection=ColorScale(41, 40, 25),              # Dark gold selection
-    selection_foreground=ColorScale(40, 44, 89),
-    brand=ColorScale(42, 52, 65),                  # Bright gold on dark
-    brand_foreground=ColorScale(219, 55, 10),
-    border=ColorScale(41, 30, 30),                 # Dark gold-tinted border
-    input=ColorScale(222, 40, 22),                 # Dark input bg
-    ring=ColorScale(41, 49, 59),                   # Gold focus ring
-    surface_1=ColorScale(219, 60, 7),              # Deepest midnight
-    surface_2=ColorScale(219, 55, 10),             # Midnight navy
-    surface_3=ColorScale(226, 49, 17),             # Deep navy
+    background=ColorScale.of(219, 55, 10),            # #0C1629 — midnight navy
+    foreground=ColorScale.of(40, 44, 89),             # #F0E8D8 — ivory text
+    card=ColorScale.of(226, 49, 17),                  # #162040 — deep navy card
+    card_foreground=ColorScale.of(40, 44, 89),
+    popover=ColorScale.of(222, 45, 20),               # #1C2A4A — navy panel
+    popover_foreground=ColorScale.of(40, 44, 89),
+    primary=ColorScale.of(41, 49, 59),                # #C9A962 — gold (unchanged — metallic stays constant)
+    primary_foreground=ColorScale.of(219, 55, 10),    # Dark on gold
+    secondary=ColorScale.of(222, 45, 20),             # Navy panel
+    secondary_foreground=ColorScale.of(40, 44, 89),
+    muted=ColorScale.of(222, 40, 22),                 # Dark muted
+    muted_foreground=ColorScale.of(0, 0, 55),         # Silver-gray muted text
+    accent=ColorScale.of(222, 40, 22),                # Dark hover surface
+    accent_foreground=ColorScale.of(40, 44, 89),
+    destructive=ColorScale.of(333, 61, 45),           # Burgundy — brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 64, 40),               # Emerald — brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 52, 65),                # Bright gold
+    warning_foreground=ColorScale.of(219, 55, 10),
+    info=ColorScale.of(226, 49, 55),                  # Blue — brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(42, 52, 65),                   # Bright gold links on dark
+    link_hover=ColorScale.of(43, 60, 77),             # Pale gold hover
+    code=ColorScale.of(219, 60, 7),                   # Deepest midnight
+    code_foreground=ColorScale.of(41, 49, 59),        # Gold code text
+    selection=ColorScale.of(41, 40, 25),              # Dark gold selection
+    selection_foreground=ColorScale.of(40, 44, 89),
+    brand=ColorScale.of(42, 52, 65),                  # Bright gold on dark
+    brand_foreground=ColorScale.of(219, 55, 10),
+    border=ColorScale.of(41, 30, 30),                 # Dark gold-tinted border
+    input=ColorScale.of(222, 40, 22),                 # Dark input bg
+    ring=ColorScale.of(41, 49, 59),                   # Gold focus ring
+    surface_1=ColorScale.of(219, 60, 7),              # Deepest midnight
+    surface_2=ColorScale.of(219, 55, 10),             # Midnight navy
+    surface_3=ColorScale.of(226, 49, 17),             # Deep navy
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(210, 20, 98),
-    foreground=ColorScale(220, 25, 15),
-    card=ColorScale(210, 18, 95),
-    card_foreground=ColorScale(220, 25, 15),
-    popover=ColorScale(210, 18, 95),
-    popover_foreground=ColorScale(220, 25, 15),
-    primary=ColorScale(160, 84, 39),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 15, 90),
-    secondary_foreground=ColorScale(220, 25, 15),
-    muted=ColorScale(210, 15, 90),
-    muted_foreground=ColorScale(220, 15, 45),
-    accent=ColorScale(270, 60, 60),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 72, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 90, 55),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(200, 80, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(160, 84, 39),
-    link_hover=ColorScale(270, 60, 55),
-    code=ColorScale(210, 15, 92),
-    code_foreground=ColorScale(160, 84, 35),
-    selection=ColorScale(160, 80, 85),
-    selection_foreground=ColorScale(160, 10, 15),
-    brand=ColorScale(270, 60, 65),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(210, 15, 82),
-    input=ColorScale(210, 15, 82),
-    ring=ColorScale(160, 84, 39),
-    surface_1=ColorScale(160, 5, 96),
-    surface_2=ColorScale(160, 5, 93),
-    surface_3=ColorScale(160, 5, 90),
+    background=ColorScale.of(210, 20, 98),
+    foreground=ColorScale.of(220, 25, 15),
+    card=ColorScale.of(210, 18, 95),
+    card_foreground=ColorScale.of(220, 25, 15),
+    popover=ColorScale.of(210, 18, 95),
+    popover_foreground=ColorScale.of(220, 25, 15),
+    primary=ColorScale.of(160, 84, 39),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 15, 90),
+    secondary_foreground=ColorScale.of(220, 25, 15),
+    muted=ColorScale.of(210, 15, 90),
+    muted_foreground=ColorScale.of(220, 15, 45),
+    accent=ColorScale.of(270, 60, 60),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 72, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 90, 55),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(200, 80, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(160, 84, 39),
+    link_hover=ColorScale.of(270, 60, 55),
+    code=ColorScale.of(210, 15, 92),
+    code_foreground=ColorScale.of(160, 84, 35),
+    selection=ColorScale.of(160, 80, 85),
+    selection_foreground=ColorScale.of(160, 10, 15),
+    brand=ColorScale.of(270, 60, 65),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(210, 15, 82),
+    input=ColorScale.of(210, 15, 82),
+    ring=ColorScale.of(160, 84, 39),
+    surface_1=ColorScale.of(160, 5, 96),
+    surface_2=ColorScale.of(160, 5, 93),
+    surface_3=ColorScale.of(160, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(230, 25, 10),
-    foreground=ColorScale(180, 20, 90),
-    card=ColorScale(230, 22, 14),
-    card_foreground=ColorScale(180, 20, 90),
-    popover=ColorScale(230, 22, 14),
-    popover_foreground=ColorScale(180, 20, 90),
-    primary=ColorScale(160, 84, 52),
-    primary_foreground=ColorScale(230, 25, 10),
-    secondary=ColorScale(230, 22, 18),
-    secondary_foreground=ColorScale(180, 20, 90),
-    muted=ColorScale(230, 22, 18),
-    muted_foreground=ColorScale(200, 15, 55),
-    accent=ColorScale(270, 60, 65),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 72, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 52),
-    success_foreground=ColorScale(230, 25, 10),
-    warning=ColorScale(45, 90, 60),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(200, 80, 60),
-    info_foreground=ColorScale(230, 25, 10),
-    link=ColorScale(160, 84, 52),
-    link_hover=ColorScale(270, 60, 70),
-    code=ColorScale(230, 22, 16),
-    code_foreground=ColorScale(160, 84, 60),
-    selection=ColorScale(160, 80, 25),
-    selection_foreground=ColorScale(160, 10, 90),
-    brand=ColorScale(270, 60, 65),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(230, 22, 22),
-    input=ColorScale(230, 22, 22),
-    ring=ColorScale(160, 84, 52),
-    surface_1=ColorScale(160, 5, 6),
-    surface_2=ColorScale(160, 5, 10),
-    surface_3=ColorScale(160, 5, 14),
+    background=ColorScale.of(230, 25, 10),
+    foreground=ColorScale.of(180, 20, 90),
+    card=ColorScale.of(230, 22, 14),
+    card_foreground=ColorScale.of(180, 20, 90),
+    popover=ColorScale.of(230, 22, 14),
+    popover_foreground=ColorScale.of(180, 20, 90),
+    primary=ColorScale.of(160, 84, 52),
+    primary_foreground=ColorScale.of(230, 25, 10),
+    secondary=ColorScale.of(230, 22, 18),
+    secondary_foreground=ColorScale.of(180, 20, 90),
+    muted=ColorScale.of(230, 22, 18),
+    muted_foreground=ColorScale.of(200, 15, 55),
+    accent=ColorScale.of(270, 60, 65),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 72, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 52),
+    success_foreground=ColorScale.of(230, 25, 10),
+    warning=ColorScale.of(45, 90, 60),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(200, 80, 60),
+    info_foreground=ColorScale.of(230, 25, 10),
+    link=ColorScale.of(160, 84, 52),
+    link_hover=ColorScale.of(270, 60, 70),
+    code=ColorScale.of(230, 22, 16),
+    code_foreground=ColorScale.of(160, 84, 60),
+    selection=ColorScale.of(160, 80, 25),
+    selection_foreground=ColorScale.of(160, 10, 90),
+    brand=ColorScale.of(270, 60, 65),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(230, 22, 22),
+    input=ColorScale.of(230, 22, 22),
+    ring=ColorScale.of(160, 84, 52),
+    surface_1=ColorScale.of(160, 5, 6),
+    surface_2=ColorScale.of(160, 5, 10),
+    surface_3=ColorScale.of(160, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # - Blue #73d0ff, Red #ff3333
 
 LIGHT = ThemeTokens(
-    background=ColorScale(40, 10, 99),                 # Very warm light
-    foreground=ColorScale(220, 15, 20),                # Warm dark fg
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(220, 15, 20),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(220, 15, 20),
-    primary=ColorScale(25, 100, 63),                   # Orange accent
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(40, 10, 96),
-    secondary_foreground=ColorScale(220, 15, 20),
-    muted=ColorScale(40, 8, 90),
-    muted_foreground=ColorScale(220, 10, 50),
-    accent=ColorScale(40, 10, 96),                     # Subtle warm hover
-    accent_foreground=ColorScale(220, 15, 20),
-    destructive=ColorScale(0, 100, 60),                # Red #ff3333
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(80, 65, 57),                    # Green #bae67e
-    success_foreground=ColorScale(220, 15, 20),
-    warning=ColorScale(40, 100, 70),                   # Gold #ffcc66
-    warning_foreground=ColorScale(220, 15, 20),
-    info=ColorScale(205, 78, 56),                      # Blue #73d0ff
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(205, 78, 56),                      # Blue
-    link_hover=ColorScale(205, 78, 45),
-    code=ColorScale(222, 22, 15),                      # Dark code bg
-    code_foreground=ColorScale(40, 100, 70),           # Gold code text
-    selection=ColorScale(25, 80, 92),                  # Pale orange selection
-    selection_foreground=ColorScale(220, 15, 20),
-    brand=ColorScale(40, 100, 70),                     # Gold #ffcc66
-    brand_foreground=ColorScale(220, 15, 20),
-    border=ColorScale(40, 8, 88),
-    input=ColorScale(40, 8, 93),
-    ring=ColorScale(25, 100, 63),
-    surface_1=ColorScale(40, 10, 99),
-    surface_2=ColorScale(40, 10, 96),
-    surface_3=ColorScale(40, 8, 93),
+    background=ColorScale.of(40, 10, 99),                 # Very warm light
+    foreground=ColorScale.of(220, 15, 20),                # Warm dark fg
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(220, 15, 20),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(220, 15, 20),
+    primary=ColorScale.of(25, 100, 63),                   # Orange accent
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(40, 10, 96),
+    secondary_foreground=ColorScale.of(220, 15, 20),
+    muted=ColorScale.of(40, 8, 90),
+    muted_foreground=ColorScale.of(220, 10, 50),
+    accent=ColorScale.of(40, 10, 96),                     # Subtle warm hover
+    accent_foreground=ColorScale.of(220, 15, 20),
+    destructive=ColorScale.of(0, 100, 60),                # Red #ff3333
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(80, 65, 57),                    # Green #bae67e
+    success_foreground=ColorScale.of(220, 15, 20),
+    warning=ColorScale.of(40, 100, 70),                   # Gold #ffcc66
+    warning_foreground=ColorScale.of(220, 15, 20),
+    info=ColorScale.of(205, 78, 56),                      # Blue #73d0ff
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(205, 78, 56),                      # Blue
+    link_hover=ColorScale.of(205, 78, 45),
+    code=ColorScale.of(222, 22, 15),                      # Dark code bg
+    code_foreground=ColorScale.of(40, 100, 70),           # Gold code text
+    selection=ColorScale.of(25, 80, 92),                  # Pale orange selection
+    selection_foreground=ColorScale.of(220, 15, 20),
+    brand=ColorScale.of(40, 100, 70),                     # Gold #ffcc66
+    brand_foreground=ColorScale.of(220, 15, 20),
+    border=ColorScale.of(40, 8, 88),
+    input=ColorScale.of(40, 8, 93),
+    ring=ColorScale.of(25, 100, 63),
+    surface_1=ColorScale.of(40, 10, 99),
+    surface_2=ColorScale.of(40, 10, 96),
+    surface_3=ColorScale.of(40, 8, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(222, 22, 15),                # #1f2430
-    foreground=ColorScale(70, 6, 79),                  # #cbccc6
-    card=ColorScale(222, 20, 19),
-    card_foreground=ColorScale(70, 6, 79),
-    popover=ColorScale(222, 20, 19),
-    popover_foreground=ColorScale(70, 6, 79),
-    primary=ColorScale(25, 100, 63),                   # Orange accent
-    primary_foreground=ColorScale(222, 22, 15),
-    secondary=ColorScale(222, 18, 22),
-    secondary_foreground=ColorScale(70, 6, 79),
-    muted=ColorScale(222, 15, 25),
-    muted_foreground=ColorScale(220, 10, 50),
-    accent=ColorScale(222, 18, 22),                    # Subtle dark hover
-    accent_foreground=ColorScale(70, 6, 79),
-    destructive=ColorScale(0, 100, 60),                # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(80, 65, 57),                    # Green
-    success_foreground=ColorScale(222, 22, 15),
-    warning=ColorScale(40, 100, 70),                   # Gold
-    warning_foreground=ColorScale(222, 22, 15),
-    info=ColorScale(205, 78, 56),                      # Blue
-    info_foreground=ColorScale(222, 22, 15),
-    link=ColorScale(205, 78, 66),                      # Blue brightened
-    link_hover=ColorScale(205, 78, 75),
-    code=ColorScale(222, 22, 10),                      # Very dark code bg
-    code_foreground=ColorScale(40, 100, 70),           # Gold code text
-    selection=ColorScale(25, 60, 22),                  # Dark orange selection
-    selection_foreground=ColorScale(70, 6, 85),
-    brand=ColorScale(40, 100, 70),                     # Gold #ffcc66
-    brand_foreground=ColorScale(222, 22, 15),
-    border=ColorScale(222, 15, 26),
-    input=ColorScale(222, 15, 26),
-    ring=ColorScale(25, 100, 63),
-    surface_1=ColorScale(222, 22, 11),
-    surface_2=ColorScale(222, 22, 15),
-    surface_3=ColorScale(222, 20, 19),
+    background=ColorScale.of(222, 22, 15),                # #1f2430
+    foreground=ColorScale.of(70, 6, 79),                  # #cbccc6
+    card=ColorScale.of(222, 20, 19),
+    card_foreground=ColorScale.of(70, 6, 79),
+    popover=ColorScale.of(222, 20, 19),
+    popover_foreground=ColorScale.of(70, 6, 79),
+    primary=ColorScale.of(25, 100, 63),                   # Orange accent
+    primary_foreground=ColorScale.of(222, 22, 15),
+    secondary=ColorScale.of(222, 18, 22),
+    secondary_foreground=ColorScale.of(70, 6, 79),
+    muted=ColorScale.of(222, 15, 25),
+    muted_foreground=ColorScale.of(220, 10, 50),
+    accent=ColorScale.of(222, 18, 22),                    # Subtle dark hover
+    accent_foreground=ColorScale.of(70, 6, 79),
+    destructive=ColorScale.of(0, 100, 60),                # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(80, 65, 57),                    # Green
+    success_foreground=ColorScale.of(222, 22, 15),
+    warning=ColorScale.of(40, 100, 70),                   # Gold
+    warning_foreground=ColorScale.of(222, 22, 15),
+    info=ColorScale.of(205, 78, 56),                      # Blue
+    info_foreground=ColorScale.of(222, 22, 15),
+    link=ColorScale.of(205, 78, 66),                      # Blue brightened
+    link_hover=ColorScale.of(205, 78, 75),
+    code=ColorScale.of(222, 22, 10),                      # Very dark code bg
+    code_foreground=ColorScale.of(40, 100, 70),           # Gold code text
+    selection=ColorScale.of(25, 60, 22),                  # Dark orange selection
+    selection_foreground=ColorScale.of(70, 6, 85),
+    brand=ColorScale.of(40, 100, 70),                     # Gold #ffcc66
+    brand_foreground=ColorScale.of(222, 22, 15),
+    border=ColorScale.of(222, 15, 26),
+    input=ColorScale.of(222, 15, 26),
+    ring=ColorScale.of(25, 100, 63),
+    surface_1=ColorScale.of(222, 22, 11),
+    surface_2=ColorScale.of(222, 22, 15),
+    surface_3=ColorScale.of(222, 20, 19),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(37, 39, 94),
-    foreground=ColorScale(0, 0, 8),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(0, 0, 8),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 8),
-    primary=ColorScale(2, 65, 47),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(40, 20, 90),
-    secondary_foreground=ColorScale(0, 0, 8),
-    muted=ColorScale(40, 15, 88),
-    muted_foreground=ColorScale(0, 0, 35),
-    accent=ColorScale(40, 20, 90),
-    accent_foreground=ColorScale(0, 0, 8),
-    destructive=ColorScale(2, 65, 47),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 45, 35),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(48, 82, 50),
-    warning_foreground=ColorScale(0, 0, 8),
-    info=ColorScale(223, 60, 29),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(223, 60, 40),
-    link_hover=ColorScale(2, 65, 47),
-    code=ColorScale(0, 0, 12),
-    code_foreground=ColorScale(48, 82, 60),
-    selection=ColorScale(48, 82, 80),
-    selection_foreground=ColorScale(0, 0, 8),
-    brand=ColorScale(223, 60, 29),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 8),
-    input=ColorScale(40, 15, 93),
-    ring=ColorScale(2, 65, 47),
-    surface_1=ColorScale(37, 39, 94),
-    surface_2=ColorScale(40, 20, 90),
-    surface_3=ColorScale(40, 15, 86),
+    background=ColorScale.of(37, 39, 94),
+    foreground=ColorScale.of(0, 0, 8),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(0, 0, 8),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 8),
+    primary=ColorScale.of(2, 65, 47),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(40, 20, 90),
+    secondary_foreground=ColorScale.of(0, 0, 8),
+    muted=ColorScale.of(40, 15, 88),
+    muted_foreground=ColorScale.of(0, 0, 35),
+    accent=ColorScale.of(40, 20, 90),
+    accent_foreground=ColorScale.of(0, 0, 8),
+    destructive=ColorScale.of(2, 65, 47),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 45, 35),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(48, 82, 50),
+    warning_foreground=ColorScale.of(0, 0, 8),
+    info=ColorScale.of(223, 60, 29),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(223, 60, 40),
+    link_hover=ColorScale.of(2, 65, 47),
+    code=ColorScale.of(0, 0, 12),
+    code_foreground=ColorScale.of(48, 82, 60),
+    selection=ColorScale.of(48, 82, 80),
+    selection_foreground=ColorScale.of(0, 0, 8),
+    brand=ColorScale.of(223, 60, 29),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 8),
+    input=ColorScale.of(40, 15, 93),
+    ring=ColorScale.of(2, 65, 47),
+    surface_1=ColorScale.of(37, 39, 94),
+    surface_2=ColorScale.of(40, 20, 90),
+    surface_3=ColorScale.of(40, 15, 86),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 5),
-    foreground=ColorScale(37, 39, 94),
-    card=ColorScale(0, 0, 10),
-    card_foreground=ColorScale(37, 39, 94),
-    popover=ColorScale(0, 0, 10),
-    popover_foreground=ColorScale(37, 39, 94),
-    primary=ColorScale(2, 65, 47),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 15),
-    secondary_foreground=ColorScale(37, 39, 94),
-    muted=ColorScale(0, 0, 15),
-    muted_foreground=ColorScale(0, 0, 55),
-    accent=ColorScale(0, 0, 18),
-    accent_foreground=ColorScale(37, 39, 94),
-    destructive=ColorScale(2, 65, 52),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 45, 45),
-    success_foreground=ColorScale(0, 0, 5),
-    warning=ColorScale(48, 82, 50),
-    warning_foreground=ColorScale(0, 0, 5),
-    info=ColorScale(223, 60, 50),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(223, 60, 62),
-    link_hover=ColorScale(2, 65, 60),
-    code=ColorScale(0, 0, 8),
-    code_foreground=ColorScale(48, 82, 60),
-    selection=ColorScale(223, 60, 25),
-    selection_foreground=ColorScale(37, 39, 94),
-    brand=ColorScale(223, 60, 50),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(37, 39, 94),
-    input=ColorScale(0, 0, 50),
-    ring=ColorScale(2, 65, 47),
-    surface_1=ColorScale(0, 0, 3),
-    surface_2=ColorScale(0, 0, 7),
-    surface_3=ColorScale(0, 0, 12),
+    background=ColorScale.of(0, 0, 5),
+    foreground=ColorScale.of(37, 39, 94),
+    card=ColorScale.of(0, 0, 10),
+    card_foreground=ColorScale.of(37, 39, 94),
+    popover=ColorScale.of(0, 0, 10),
+    popover_foreground=ColorScale.of(37, 39, 94),
+    primary=ColorScale.of(2, 65, 47),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 15),
+    secondary_foreground=ColorScale.of(37, 39, 94),
+    muted=ColorScale.of(0, 0, 15),
+    muted_foreground=ColorScale.of(0, 0, 55),
+    accent=ColorScale.of(0, 0, 18),
+    accent_foreground=ColorScale.of(37, 39, 94),
+    destructive=ColorScale.of(2, 65, 52),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 45, 45),
+    success_foreground=ColorScale.of(0, 0, 5),
+    warning=ColorScale.of(48, 82, 50),
+    warning_foreground=ColorScale.of(0, 0, 5),
+    info=ColorScale.of(223, 60, 50),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(223, 60, 62),
+    link_hover=ColorScale.of(2, 65, 60),
+    code=ColorScale.of(0, 0, 8),
+    code_foreground=ColorScale.of(48, 82, 60),
+    selection=ColorScale.of(223, 60, 25),
+    selection_foreground=ColorScale.of(37, 39, 94),
+    brand=ColorScale.of(223, 60, 50),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(37, 39, 94),
+    input=ColorScale.of(0, 0, 50),
+    ring=ColorScale.of(2, 65, 47),
+    surface_1=ColorScale.of(0, 0, 3),
+    surface_2=ColorScale.of(0, 0, 7),
+    surface_3=ColorScale.of(0, 0, 12),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(222, 47, 11),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(222, 47, 11),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(222, 47, 11),
-    primary=ColorScale(221, 83, 53),
-    primary_foreground=ColorScale(210, 40, 98),
-    secondary=ColorScale(210, 40, 96),
-    secondary_foreground=ColorScale(222, 47, 11),
-    muted=ColorScale(210, 40, 96),
-    muted_foreground=ColorScale(215, 16, 38),
-    accent=ColorScale(210, 40, 96),
-    accent_foreground=ColorScale(222, 47, 11),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(221, 83, 53),
-    link_hover=ColorScale(221, 83, 45),
-    code=ColorScale(221, 95, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(221, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(221, 83, 53),
-    brand_foreground=ColorScale(210, 40, 98),
-    border=ColorScale(214, 32, 91),
-    input=ColorScale(214, 32, 91),
-    ring=ColorScale(221, 83, 53),
-    surface_1=ColorScale(220, 20, 98),
-    surface_2=ColorScale(220, 15, 96),
-    surface_3=ColorScale(220, 12, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(222, 47, 11),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(222, 47, 11),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(222, 47, 11),
+    primary=ColorScale.of(221, 83, 53),
+    primary_foreground=ColorScale.of(210, 40, 98),
+    secondary=ColorScale.of(210, 40, 96),
+    secondary_foreground=ColorScale.of(222, 47, 11),
+    muted=ColorScale.of(210, 40, 96),
+    muted_foreground=ColorScale.of(215, 16, 38),
+    accent=ColorScale.of(210, 40, 96),
+    accent_foreground=ColorScale.of(222, 47, 11),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(221, 83, 53),
+    link_hover=ColorScale.of(221, 83, 45),
+    code=ColorScale.of(221, 95, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(221, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(221, 83, 53),
+    brand_foreground=ColorScale.of(210, 40, 98),
+    border=ColorScale.of(214, 32, 91),
+    input=ColorScale.of(214, 32, 91),
+    ring=ColorScale.of(221, 83, 53),
+    surface_1=ColorScale.of(220, 20, 98),
+    surface_2=ColorScale.of(220, 15, 96),
+    surface_3=ColorScale.of(220, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(222, 47, 11),
-    foreground=ColorScale(210, 40, 98),
-    card=ColorScale(222, 47, 11),
-    card_foreground=ColorScale(210, 40, 98),
-    popover=ColorScale(222, 47, 11),
-    popover_foreground=ColorScale(210, 40, 98),
-    primary=ColorScale(217, 91, 60),
-    primary_foreground=ColorScale(222, 47, 11),
-    secondary=ColorScale(217, 33, 17),
-    secondary_foreground=ColorScale(210, 40, 98),
-    muted=ColorScale(217, 33, 17),
-    muted_foreground=ColorScale(215, 15, 85),
-    accent=ColorScale(217, 33, 17),
-    accent_foreground=ColorScale(210, 40, 98),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(221, 83, 65),
-    link_hover=ColorScale(221, 83, 75),
-    code=ColorScale(221, 30, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(221, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(217, 91, 60),
-    brand_foreground=ColorScale(222, 47, 11),
-    border=ColorScale(217, 33, 17),
-    input=ColorScale(217, 33, 17),
-    ring=ColorScale(224, 76, 48),
-    surface_1=ColorScale(222, 25, 4),
-    surface_2=ColorScale(222, 20, 7),
-    surface_3=ColorScale(222, 15, 11),
+    background=ColorScale.of(222, 47, 11),
+    foreground=ColorScale.of(210, 40, 98),
+    card=ColorScale.of(222, 47, 11),
+    card_foreground=ColorScale.of(210, 40, 98),
+    popover=ColorScale.of(222, 47, 11),
+    popover_foreground=ColorScale.of(210, 40, 98),
+    primary=ColorScale.of(217, 91, 60),
+    primary_foreground=ColorScale.of(222, 47, 11),
+    secondary=ColorScale.of(217, 33, 17),
+    secondary_foreground=ColorScale.of(210, 40, 98),
+    muted=ColorScale.of(217, 33, 17),
+    muted_foreground=ColorScale.of(215, 15, 85),
+    accent=ColorScale.of(217, 33, 17),
+    accent_foreground=ColorScale.of(210, 40, 98),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(221, 83, 65),
+    link_hover=ColorScale.of(221, 83, 75),
+    code=ColorScale.of(221, 30, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(221, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(217, 91, 60),
+    brand_foreground=ColorScale.of(222, 47, 11),
+    border=ColorScale.of(217, 33, 17),
+    input=ColorScale.of(217, 33, 17),
+    ring=ColorScale.of(224, 76, 48),
+    surface_1=ColorScale.of(222, 25, 4),
+    surface_2=ColorScale.of(222, 20, 7),
+    surface_3=ColorScale.of(222, 15, 11),
 )
 
 PRESET = ThemePreset(
@@ -16,81 +16,81 @@ from ._base import (
 # Think: bubblegum, frosting, candy wrappers.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(330, 50, 97),               # Pale pink
-    foreground=ColorScale(280, 40, 20),                # Deep purple
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(280, 40, 20),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(280, 40, 20),
-    primary=ColorScale(330, 80, 60),                   # Hot pink
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(270, 40, 95),                 # Pale lavender
-    secondary_foreground=ColorScale(280, 40, 20),
-    muted=ColorScale(160, 50, 95),                     # Pale mint accent
-    muted_foreground=ColorScale(280, 30, 40),          # Purple-gray text
-    accent=ColorScale(270, 30, 95),                    # Lavender hover
-    accent_foreground=ColorScale(280, 40, 20),
-    destructive=ColorScale(0, 70, 55),                 # Candy red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 50),                   # Mint
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(30, 90, 65),                    # Peach
-    warning_foreground=ColorScale(280, 40, 20),
-    info=ColorScale(200, 80, 60),                      # Sky blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(270, 60, 55),                      # Lavender-purple links
-    link_hover=ColorScale(270, 70, 45),                # Deeper purple hover
-    code=ColorScale(280, 40, 15),                      # Deep purple code bg
-    code_foreground=ColorScale(330, 80, 75),           # Pink code text
-    selection=ColorScale(330, 60, 90),                 # Pale pink selection
-    selection_foreground=ColorScale(280, 40, 20),
-    brand=ColorScale(270, 60, 70),                     # Lavender
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(330, 40, 82),                    # Pink-tinted border
-    input=ColorScale(330, 30, 92),                     # Pale pink input
-    ring=ColorScale(330, 80, 60),                      # Hot pink focus ring
-    surface_1=ColorScale(330, 50, 97),                 # Pale pink
-    surface_2=ColorScale(330, 40, 95),                 # Slightly deeper
-    surface_3=ColorScale(270, 35, 93),                 # Lavender tint
+    background=ColorScale.of(330, 50, 97),               # Pale pink
+    foreground=ColorScale.of(280, 40, 20),                # Deep purple
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(280, 40, 20),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(280, 40, 20),
+    primary=ColorScale.of(330, 80, 60),                   # Hot pink
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(270, 40, 95),                 # Pale lavender
+    secondary_foreground=ColorScale.of(280, 40, 20),
+    muted=ColorScale.of(160, 50, 95),                     # Pale mint accent
+    muted_foreground=ColorScale.of(280, 30, 40),          # Purple-gray text
+    accent=ColorScale.of(270, 30, 95),                    # Lavender hover
+    accent_foreground=ColorScale.of(280, 40, 20),
+    destructive=ColorScale.of(0, 70, 55),                 # Candy red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 50),                   # Mint
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(30, 90, 65),                    # Peach
+    warning_foreground=ColorScale.of(280, 40, 20),
+    info=ColorScale.of(200, 80, 60),                      # Sky blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(270, 60, 55),                      # Lavender-purple links
+    link_hover=ColorScale.of(270, 70, 45),                # Deeper purple hover
+    code=ColorScale.of(280, 40, 15),                      # Deep purple code bg
+    code_foreground=ColorScale.of(330, 80, 75),           # Pink code text
+    selection=ColorScale.of(330, 60, 90),                 # Pale pink selection
+    selection_foreground=ColorScale.of(280, 40, 20),
+    brand=ColorScale.of(270, 60, 70),                     # Lavender
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(330, 40, 82),                    # Pink-tinted border
+    input=ColorScale.of(330, 30, 92),                     # Pale pink input
+    ring=ColorScale.of(330, 80, 60),                      # Hot pink focus ring
+    surface_1=ColorScale.of(330, 50, 97),                 # Pale pink
+    surface_2=ColorScale.of(330, 40, 95),                 # Slightly deeper
+    surface_3=ColorScale.of(270, 35, 93),                 # Lavender tint
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(280, 40, 12),                # Deep purple
-    foreground=ColorScale(330, 30, 92),                # Pale pink
-    card=ColorScale(280, 35, 16),                      # Purple card
-    card_foreground=ColorScale(330, 30, 92),
-    popover=ColorScale(280, 35, 16),
-    popover_foreground=ColorScale(330, 30, 92),
-    primary=ColorScale(330, 80, 65),                   # Hot pink brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(280, 30, 18),                 # Dark purple panel
-    secondary_foreground=ColorScale(330, 30, 92),
-    muted=ColorScale(280, 25, 22),                     # Dark muted purple
-    muted_foreground=ColorScale(330, 20, 60),          # Muted pink text
-    accent=ColorScale(280, 30, 18),                    # Dark purple hover
-    accent_foreground=ColorScale(330, 30, 92),
-    destructive=ColorScale(0, 70, 60),                 # Candy red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 55),                   # Mint brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(30, 90, 70),                    # Peach brightened
-    warning_foreground=ColorScale(280, 40, 15),
-    info=ColorScale(200, 80, 65),                      # Sky blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(270, 60, 72),                      # Lavender brightened
-    link_hover=ColorScale(270, 70, 80),                # Lighter lavender
-    code=ColorScale(280, 40, 8),                       # Deepest purple code bg
-    code_foreground=ColorScale(330, 80, 75),           # Pink code text
-    selection=ColorScale(330, 60, 25),                 # Deep pink selection
-    selection_foreground=ColorScale(330, 30, 92),
-    brand=ColorScale(270, 60, 75),                     # Lavender brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(280, 30, 25),                    # Dark purple border
-    input=ColorScale(280, 25, 20),                     # Dark purple input
-    ring=ColorScale(330, 80, 65),                      # Hot pink focus ring
-    surface_1=ColorScale(280, 40, 10),                 # Deepest purple
-    surface_2=ColorScale(280, 38, 14),                 # Mid purple
-    surface_3=ColorScale(280, 35, 18),                 # Elevated purple
+    background=ColorScale.of(280, 40, 12),                # Deep purple
+    foreground=ColorScale.of(330, 30, 92),                # Pale pink
+    card=ColorScale.of(280, 35, 16),                      # Purple card
+    card_foreground=ColorScale.of(330, 30, 92),
+    popover=ColorScale.of(280, 35, 16),
+    popover_foreground=ColorScale.of(330, 30, 92),
+    primary=ColorScale.of(330, 80, 65),                   # Hot pink brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(280, 30, 18),                 # Dark purple panel
+    secondary_foreground=ColorScale.of(330, 30, 92),
+    muted=ColorScale.of(280, 25, 22),                     # Dark muted purple
+    muted_foreground=ColorScale.of(330, 20, 60),          # Muted pink text
+    accent=ColorScale.of(280, 30, 18),                    # Dark purple hover
+    accent_foreground=ColorScale.of(330, 30, 92),
+    destructive=ColorScale.of(0, 70, 60),                 # Candy red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 55),                   # Mint brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(30, 90, 70),                    # Peach brightened
+    warning_foreground=ColorScale.of(280, 40, 15),
+    info=ColorScale.of(200, 80, 65),                      # Sky blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(270, 60, 72),                      # Lavender brightened
+    link_hover=ColorScale.of(270, 70, 80),                # Lighter lavender
+    code=ColorScale.of(280, 40, 8),                       # Deepest purple code bg
+    code_foreground=ColorScale.of(330, 80, 75),           # Pink code text
+    selection=ColorScale.of(330, 60, 25),                 # Deep pink selection
+    selection_foreground=ColorScale.of(330, 30, 92),
+    brand=ColorScale.of(270, 60, 75),                     # Lavender brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(280, 30, 25),                    # Dark purple border
+    input=ColorScale.of(280, 25, 20),                     # Dark purple input
+    ring=ColorScale.of(330, 80, 65),                      # Hot pink focus ring
+    surface_1=ColorScale.of(280, 40, 10),                 # Deepest purple
+    surface_2=ColorScale.of(280, 38, 14),                 # Mid purple
+    surface_3=ColorScale.of(280, 35, 18),                 # Elevated purple
 )
 
 PRESET = ThemePreset(
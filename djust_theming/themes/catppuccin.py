@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(240, 23, 15),
-    card=ColorScale(220, 23, 97),
-    card_foreground=ColorScale(240, 23, 15),
-    popover=ColorScale(220, 23, 97),
-    popover_foreground=ColorScale(240, 23, 15),
-    primary=ColorScale(217, 92, 76),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 17, 93),
-    secondary_foreground=ColorScale(240, 23, 15),
-    muted=ColorScale(220, 17, 93),
-    muted_foreground=ColorScale(233, 16, 49),
-    accent=ColorScale(220, 17, 93),
-    accent_foreground=ColorScale(217, 92, 76),
-    destructive=ColorScale(343, 81, 75),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(115, 54, 76),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(35, 77, 49),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 100, 74),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 84, 81),
-    link_hover=ColorScale(267, 84, 71),
-    code=ColorScale(220, 23, 97),
-    code_foreground=ColorScale(240, 23, 15),
-    selection=ColorScale(217, 92, 86),
-    selection_foreground=ColorScale(240, 23, 15),
-    brand=ColorScale(10, 56, 91),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(220, 17, 93),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(217, 92, 76),
-    surface_1=ColorScale(232, 18, 98),
-    surface_2=ColorScale(232, 14, 96),
-    surface_3=ColorScale(232, 10, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(240, 23, 15),
+    card=ColorScale.of(220, 23, 97),
+    card_foreground=ColorScale.of(240, 23, 15),
+    popover=ColorScale.of(220, 23, 97),
+    popover_foreground=ColorScale.of(240, 23, 15),
+    primary=ColorScale.of(217, 92, 76),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 17, 93),
+    secondary_foreground=ColorScale.of(240, 23, 15),
+    muted=ColorScale.of(220, 17, 93),
+    muted_foreground=ColorScale.of(233, 16, 49),
+    accent=ColorScale.of(220, 17, 93),
+    accent_foreground=ColorScale.of(217, 92, 76),
+    destructive=ColorScale.of(343, 81, 75),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(115, 54, 76),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(35, 77, 49),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 100, 74),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 84, 81),
+    link_hover=ColorScale.of(267, 84, 71),
+    code=ColorScale.of(220, 23, 97),
+    code_foreground=ColorScale.of(240, 23, 15),
+    selection=ColorScale.of(217, 92, 86),
+    selection_foreground=ColorScale.of(240, 23, 15),
+    brand=ColorScale.of(10, 56, 91),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(220, 17, 93),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(217, 92, 76),
+    surface_1=ColorScale.of(232, 18, 98),
+    surface_2=ColorScale.of(232, 14, 96),
+    surface_3=ColorScale.of(232, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 21, 15),
-    foreground=ColorScale(226, 64, 88),
-    card=ColorScale(240, 21, 19),
-    card_foreground=ColorScale(226, 64, 88),
-    popover=ColorScale(240, 21, 19),
-    popover_foreground=ColorScale(226, 64, 88),
-    primary=ColorScale(217, 92, 76),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 21, 26),
-    secondary_foreground=ColorScale(226, 64, 88),
-    muted=ColorScale(240, 21, 26),
-    muted_foreground=ColorScale(227, 27, 72),
-    accent=ColorScale(240, 21, 26),
-    accent_foreground=ColorScale(267, 84, 81),
-    destructive=ColorScale(343, 81, 75),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(115, 54, 76),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(23, 92, 75),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 100, 74),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 84, 81),
-    link_hover=ColorScale(267, 84, 71),
-    code=ColorScale(240, 21, 12),
-    code_foreground=ColorScale(226, 64, 88),
-    selection=ColorScale(267, 84, 81),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(10, 56, 91),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(240, 21, 26),
-    input=ColorScale(240, 21, 19),
-    ring=ColorScale(217, 92, 76),
-    surface_1=ColorScale(240, 20, 7),
-    surface_2=ColorScale(240, 16, 11),
-    surface_3=ColorScale(240, 12, 15),
+    background=ColorScale.of(240, 21, 15),
+    foreground=ColorScale.of(226, 64, 88),
+    card=ColorScale.of(240, 21, 19),
+    card_foreground=ColorScale.of(226, 64, 88),
+    popover=ColorScale.of(240, 21, 19),
+    popover_foreground=ColorScale.of(226, 64, 88),
+    primary=ColorScale.of(217, 92, 76),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 21, 26),
+    secondary_foreground=ColorScale.of(226, 64, 88),
+    muted=ColorScale.of(240, 21, 26),
+    muted_foreground=ColorScale.of(227, 27, 72),
+    accent=ColorScale.of(240, 21, 26),
+    accent_foreground=ColorScale.of(267, 84, 81),
+    destructive=ColorScale.of(343, 81, 75),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(115, 54, 76),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(23, 92, 75),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 100, 74),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 84, 81),
+    link_hover=ColorScale.of(267, 84, 71),
+    code=ColorScale.of(240, 21, 12),
+    code_foreground=ColorScale.of(226, 64, 88),
+    selection=ColorScale.of(267, 84, 81),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(10, 56, 91),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(240, 21, 26),
+    input=ColorScale.of(240, 21, 19),
+    ring=ColorScale.of(217, 92, 76),
+    surface_1=ColorScale.of(240, 20, 7),
+    surface_2=ColorScale.of(240, 16, 11),
+    surface_3=ColorScale.of(240, 12, 15),
 )
 
 PRESET = ThemePreset(
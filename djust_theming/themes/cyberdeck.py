@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 97),
-    foreground=ColorScale(120, 10, 15),
-    card=ColorScale(120, 5, 94),
-    card_foreground=ColorScale(120, 10, 15),
-    popover=ColorScale(120, 5, 94),
-    popover_foreground=ColorScale(120, 10, 15),
-    primary=ColorScale(120, 100, 35),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(120, 5, 90),
-    secondary_foreground=ColorScale(120, 10, 15),
-    muted=ColorScale(120, 5, 90),
-    muted_foreground=ColorScale(120, 5, 45),
-    accent=ColorScale(120, 100, 90),
-    accent_foreground=ColorScale(120, 10, 15),
-    destructive=ColorScale(0, 80, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 100, 35),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(60, 80, 45),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(180, 80, 40),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(120, 100, 30),
-    link_hover=ColorScale(120, 100, 22),
-    code=ColorScale(120, 5, 92),
-    code_foreground=ColorScale(120, 100, 30),
-    selection=ColorScale(120, 80, 85),
-    selection_foreground=ColorScale(120, 10, 15),
-    brand=ColorScale(120, 100, 35),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(120, 10, 80),
-    input=ColorScale(120, 10, 80),
-    ring=ColorScale(120, 100, 35),
-    surface_1=ColorScale(120, 5, 96),
-    surface_2=ColorScale(120, 5, 93),
-    surface_3=ColorScale(120, 5, 90),
+    background=ColorScale.of(0, 0, 97),
+    foreground=ColorScale.of(120, 10, 15),
+    card=ColorScale.of(120, 5, 94),
+    card_foreground=ColorScale.of(120, 10, 15),
+    popover=ColorScale.of(120, 5, 94),
+    popover_foreground=ColorScale.of(120, 10, 15),
+    primary=ColorScale.of(120, 100, 35),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(120, 5, 90),
+    secondary_foreground=ColorScale.of(120, 10, 15),
+    muted=ColorScale.of(120, 5, 90),
+    muted_foreground=ColorScale.of(120, 5, 45),
+    accent=ColorScale.of(120, 100, 90),
+    accent_foreground=ColorScale.of(120, 10, 15),
+    destructive=ColorScale.of(0, 80, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 100, 35),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(60, 80, 45),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(180, 80, 40),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(120, 100, 30),
+    link_hover=ColorScale.of(120, 100, 22),
+    code=ColorScale.of(120, 5, 92),
+    code_foreground=ColorScale.of(120, 100, 30),
+    selection=ColorScale.of(120, 80, 85),
+    selection_foreground=ColorScale.of(120, 10, 15),
+    brand=ColorScale.of(120, 100, 35),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(120, 10, 80),
+    input=ColorScale.of(120, 10, 80),
+    ring=ColorScale.of(120, 100, 35),
+    surface_1=ColorScale.of(120, 5, 96),
+    surface_2=ColorScale.of(120, 5, 93),
+    surface_3=ColorScale.of(120, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 2),
-    foreground=ColorScale(120, 100, 50),
-    card=ColorScale(120, 10, 5),
-    card_foreground=ColorScale(120, 100, 50),
-    popover=ColorScale(120, 10, 5),
-    popover_foreground=ColorScale(120, 100, 50),
-    primary=ColorScale(120, 100, 50),
-    primary_foreground=ColorScale(0, 0, 2),
-    secondary=ColorScale(120, 10, 8),
-    secondary_foreground=ColorScale(120, 100, 50),
-    muted=ColorScale(120, 10, 8),
-    muted_foreground=ColorScale(120, 50, 35),
-    accent=ColorScale(120, 100, 12),
-    accent_foreground=ColorScale(120, 100, 50),
-    destructive=ColorScale(0, 100, 50),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 100, 50),
-    success_foreground=ColorScale(0, 0, 2),
-    warning=ColorScale(60, 100, 50),
-    warning_foreground=ColorScale(0, 0, 2),
-    info=ColorScale(180, 100, 45),
-    info_foreground=ColorScale(0, 0, 2),
-    link=ColorScale(120, 100, 50),
-    link_hover=ColorScale(120, 100, 65),
-    code=ColorScale(120, 10, 7),
-    code_foreground=ColorScale(120, 100, 55),
-    selection=ColorScale(120, 80, 25),
-    selection_foreground=ColorScale(120, 10, 90),
-    brand=ColorScale(120, 100, 50),
-    brand_foreground=ColorScale(0, 0, 2),
-    border=ColorScale(120, 100, 18),
-    input=ColorScale(120, 100, 18),
-    ring=ColorScale(120, 100, 50),
-    surface_1=ColorScale(120, 5, 6),
-    surface_2=ColorScale(120, 5, 10),
-    surface_3=ColorScale(120, 5, 14),
+    background=ColorScale.of(0, 0, 2),
+    foreground=ColorScale.of(120, 100, 50),
+    card=ColorScale.of(120, 10, 5),
+    card_foreground=ColorScale.of(120, 100, 50),
+    popover=ColorScale.of(120, 10, 5),
+    popover_foreground=ColorScale.of(120, 100, 50),
+    primary=ColorScale.of(120, 100, 50),
+    primary_foreground=ColorScale.of(0, 0, 2),
+    secondary=ColorScale.of(120, 10, 8),
+    secondary_foreground=ColorScale.of(120, 100, 50),
+    muted=ColorScale.of(120, 10, 8),
+    muted_foreground=ColorScale.of(120, 50, 35),
+    accent=ColorScale.of(120, 100, 12),
+    accent_foreground=ColorScale.of(120, 100, 50),
+    destructive=ColorScale.of(0, 100, 50),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 100, 50),
+    success_foreground=ColorScale.of(0, 0, 2),
+    warning=ColorScale.of(60, 100, 50),
+    warning_foreground=ColorScale.of(0, 0, 2),
+    info=ColorScale.of(180, 100, 45),
+    info_foreground=ColorScale.of(0, 0, 2),
+    link=ColorScale.of(120, 100, 50),
+    link_hover=ColorScale.of(120, 100, 65),
+    code=ColorScale.of(120, 10, 7),
+    code_foreground=ColorScale.of(120, 100, 55),
+    selection=ColorScale.of(120, 80, 25),
+    selection_foreground=ColorScale.of(120, 10, 90),
+    brand=ColorScale.of(120, 100, 50),
+    brand_foreground=ColorScale.of(0, 0, 2),
+    border=ColorScale.of(120, 100, 18),
+    input=ColorScale.of(120, 100, 18),
+    ring=ColorScale.of(120, 100, 50),
+    surface_1=ColorScale.of(120, 5, 6),
+    surface_2=ColorScale.of(120, 5, 10),
+    surface_3=ColorScale.of(120, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 98),
-    foreground=ColorScale(219, 100, 15),
-    card=ColorScale(219, 50, 95),
-    card_foreground=ColorScale(219, 100, 15),
-    popover=ColorScale(219, 50, 95),
-    popover_foreground=ColorScale(219, 100, 15),
-    primary=ColorScale(54, 70, 68),
-    primary_foreground=ColorScale(0, 0, 10),
-    secondary=ColorScale(219, 50, 88),
-    secondary_foreground=ColorScale(219, 100, 15),
-    muted=ColorScale(219, 50, 88),
-    muted_foreground=ColorScale(219, 50, 45),
-    accent=ColorScale(330, 100, 50),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(135, 94, 65),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(54, 70, 68),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(180, 100, 50),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(330, 100, 50),
-    link_hover=ColorScale(330, 100, 40),
-    code=ColorScale(219, 50, 95),
-    code_foreground=ColorScale(219, 100, 15),
-    selection=ColorScale(54, 70, 78),
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(300, 100, 50),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(219, 50, 88),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(54, 70, 68),
-    surface_1=ColorScale(219, 20, 98),
-    surface_2=ColorScale(219, 15, 96),
-    surface_3=ColorScale(219, 12, 93),
+    background=ColorScale.of(0, 0, 98),
+    foreground=ColorScale.of(219, 100, 15),
+    card=ColorScale.of(219, 50, 95),
+    card_foreground=ColorScale.of(219, 100, 15),
+    popover=ColorScale.of(219, 50, 95),
+    popover_foreground=ColorScale.of(219, 100, 15),
+    primary=ColorScale.of(54, 70, 68),
+    primary_foreground=ColorScale.of(0, 0, 10),
+    secondary=ColorScale.of(219, 50, 88),
+    secondary_foreground=ColorScale.of(219, 100, 15),
+    muted=ColorScale.of(219, 50, 88),
+    muted_foreground=ColorScale.of(219, 50, 45),
+    accent=ColorScale.of(330, 100, 50),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(135, 94, 65),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(54, 70, 68),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(180, 100, 50),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(330, 100, 50),
+    link_hover=ColorScale.of(330, 100, 40),
+    code=ColorScale.of(219, 50, 95),
+    code_foreground=ColorScale.of(219, 100, 15),
+    selection=ColorScale.of(54, 70, 78),
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(300, 100, 50),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(219, 50, 88),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(54, 70, 68),
+    surface_1=ColorScale.of(219, 20, 98),
+    surface_2=ColorScale.of(219, 15, 96),
+    surface_3=ColorScale.of(219, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(219, 100, 6),
-    foreground=ColorScale(54, 70, 95),
-    card=ColorScale(219, 100, 10),
-    card_foreground=ColorScale(54, 70, 95),
-    popover=ColorScale(219, 100, 10),
-    popover_foreground=ColorScale(54, 70, 95),
-    primary=ColorScale(54, 70, 68),
-    primary_foreground=ColorScale(0, 0, 10),
-    secondary=ColorScale(219, 100, 15),
-    secondary_foreground=ColorScale(54, 70, 95),
-    muted=ColorScale(219, 100, 15),
-    muted_foreground=ColorScale(180, 100, 70),
-    accent=ColorScale(330, 100, 50),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(135, 94, 65),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(54, 70, 68),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(180, 100, 50),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(330, 100, 50),
-    link_hover=ColorScale(330, 100, 60),
-    code=ColorScale(219, 100, 8),
-    code_foreground=ColorScale(54, 70, 95),
-    selection=ColorScale(330, 100, 50),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(300, 100, 50),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(219, 100, 15),
-    input=ColorScale(219, 100, 10),
-    ring=ColorScale(54, 70, 68),
-    surface_1=ColorScale(219, 25, 3),
-    surface_2=ColorScale(219, 20, 5),
-    surface_3=ColorScale(219, 15, 8),
+    background=ColorScale.of(219, 100, 6),
+    foreground=ColorScale.of(54, 70, 95),
+    card=ColorScale.of(219, 100, 10),
+    card_foreground=ColorScale.of(54, 70, 95),
+    popover=ColorScale.of(219, 100, 10),
+    popover_foreground=ColorScale.of(54, 70, 95),
+    primary=ColorScale.of(54, 70, 68),
+    primary_foreground=ColorScale.of(0, 0, 10),
+    secondary=ColorScale.of(219, 100, 15),
+    secondary_foreground=ColorScale.of(54, 70, 95),
+    muted=ColorScale.of(219, 100, 15),
+    muted_foreground=ColorScale.of(180, 100, 70),
+    accent=ColorScale.of(330, 100, 50),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(135, 94, 65),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(54, 70, 68),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(180, 100, 50),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(330, 100, 50),
+    link_hover=ColorScale.of(330, 100, 60),
+    code=ColorScale.of(219, 100, 8),
+    code_foreground=ColorScale.of(54, 70, 95),
+    selection=ColorScale.of(330, 100, 50),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(300, 100, 50),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(219, 100, 15),
+    input=ColorScale.of(219, 100, 10),
+    ring=ColorScale.of(54, 70, 68),
+    surface_1=ColorScale.of(219, 25, 3),
+    surface_2=ColorScale.of(219, 20, 5),
+    surface_3=ColorScale.of(219, 15, 8),
 )
 
 PRESET = ThemePreset(
@@ -16,81 +16,81 @@ from ._base import (
 # Designed for data-dense admin panels, analytics, monitoring.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(220, 10, 98),                # Cool gray
-    foreground=ColorScale(220, 10, 12),                # Dark gray
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(220, 10, 12),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(220, 10, 12),
-    primary=ColorScale(215, 80, 50),                   # Dashboard blue
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 8, 95),                  # Very pale gray
-    secondary_foreground=ColorScale(220, 10, 12),
-    muted=ColorScale(220, 8, 92),                      # Cool muted
-    muted_foreground=ColorScale(220, 6, 45),           # Mid gray text
-    accent=ColorScale(220, 8, 95),                     # Subtle hover surface
-    accent_foreground=ColorScale(220, 10, 12),
-    destructive=ColorScale(0, 65, 50),                 # Alert red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 60, 40),                   # Data green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 85, 52),                    # Amber
-    warning_foreground=ColorScale(220, 10, 12),
-    info=ColorScale(215, 80, 50),                      # Same blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(215, 80, 45),                      # Blue links
-    link_hover=ColorScale(215, 80, 38),                # Darker blue
-    code=ColorScale(220, 10, 10),                      # Dark code bg
-    code_foreground=ColorScale(215, 60, 70),           # Light blue code text
-    selection=ColorScale(215, 60, 90),                 # Pale blue selection
-    selection_foreground=ColorScale(220, 10, 12),
-    brand=ColorScale(215, 80, 50),                     # Dashboard blue
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 8, 87),                     # Subtle border
-    input=ColorScale(220, 6, 90),                      # Light input
-    ring=ColorScale(215, 80, 50),                      # Blue focus ring
-    surface_1=ColorScale(220, 10, 98),                 # Lightest
-    surface_2=ColorScale(220, 8, 96),                  # Mid
-    surface_3=ColorScale(220, 6, 93),                  # Deeper
+    background=ColorScale.of(220, 10, 98),                # Cool gray
+    foreground=ColorScale.of(220, 10, 12),                # Dark gray
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(220, 10, 12),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(220, 10, 12),
+    primary=ColorScale.of(215, 80, 50),                   # Dashboard blue
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 8, 95),                  # Very pale gray
+    secondary_foreground=ColorScale.of(220, 10, 12),
+    muted=ColorScale.of(220, 8, 92),                      # Cool muted
+    muted_foreground=ColorScale.of(220, 6, 45),           # Mid gray text
+    accent=ColorScale.of(220, 8, 95),                     # Subtle hover surface
+    accent_foreground=ColorScale.of(220, 10, 12),
+    destructive=ColorScale.of(0, 65, 50),                 # Alert red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 60, 40),                   # Data green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 85, 52),                    # Amber
+    warning_foreground=ColorScale.of(220, 10, 12),
+    info=ColorScale.of(215, 80, 50),                      # Same blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(215, 80, 45),                      # Blue links
+    link_hover=ColorScale.of(215, 80, 38),                # Darker blue
+    code=ColorScale.of(220, 10, 10),                      # Dark code bg
+    code_foreground=ColorScale.of(215, 60, 70),           # Light blue code text
+    selection=ColorScale.of(215, 60, 90),                 # Pale blue selection
+    selection_foreground=ColorScale.of(220, 10, 12),
+    brand=ColorScale.of(215, 80, 50),                     # Dashboard blue
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 8, 87),                     # Subtle border
+    input=ColorScale.of(220, 6, 90),                      # Light input
+    ring=ColorScale.of(215, 80, 50),                      # Blue focus ring
+    surface_1=ColorScale.of(220, 10, 98),                 # Lightest
+    surface_2=ColorScale.of(220, 8, 96),                  # Mid
+    surface_3=ColorScale.of(220, 6, 93),                  # Deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(220, 15, 8),                 # Very dark gray
-    foreground=ColorScale(220, 5, 85),                 # Light gray
-    card=ColorScale(220, 12, 11),                      # Dark card
-    card_foreground=ColorScale(220, 5, 85),
-    popover=ColorScale(220, 12, 11),
-    popover_foreground=ColorScale(220, 5, 85),
-    primary=ColorScale(215, 80, 55),                   # Blue brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 10, 13),                 # Dark panel
-    secondary_foreground=ColorScale(220, 5, 85),
-    muted=ColorScale(220, 8, 18),                      # Dark muted
-    muted_foreground=ColorScale(220, 5, 52),           # Muted text
-    accent=ColorScale(220, 10, 13),                    # Dark hover
-    accent_foreground=ColorScale(220, 5, 85),
-    destructive=ColorScale(0, 65, 55),                 # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 60, 48),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 85, 58),                    # Amber brightened
-    warning_foreground=ColorScale(220, 15, 8),
-    info=ColorScale(215, 80, 55),                      # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(215, 80, 60),                      # Blue brightened
-    link_hover=ColorScale(215, 80, 70),                # Lighter blue
-    code=ColorScale(220, 15, 5),                       # Deepest dark code
-    code_foreground=ColorScale(215, 60, 65),           # Blue code text
-    selection=ColorScale(215, 60, 20),                 # Deep blue selection
-    selection_foreground=ColorScale(220, 5, 85),
-    brand=ColorScale(215, 80, 55),                     # Blue brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 8, 18),                     # Dark border
-    input=ColorScale(220, 8, 15),                      # Dark input
-    ring=ColorScale(215, 80, 55),                      # Blue focus ring
-    surface_1=ColorScale(220, 15, 6),                  # Deepest
-    surface_2=ColorScale(220, 12, 9),                  # Mid dark
-    surface_3=ColorScale(220, 10, 12),                 # Elevated
+    background=ColorScale.of(220, 15, 8),                 # Very dark gray
+    foreground=ColorScale.of(220, 5, 85),                 # Light gray
+    card=ColorScale.of(220, 12, 11),                      # Dark card
+    card_foreground=ColorScale.of(220, 5, 85),
+    popover=ColorScale.of(220, 12, 11),
+    popover_foreground=ColorScale.of(220, 5, 85),
+    primary=ColorScale.of(215, 80, 55),                   # Blue brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 10, 13),                 # Dark panel
+    secondary_foreground=ColorScale.of(220, 5, 85),
+    muted=ColorScale.of(220, 8, 18),                      # Dark muted
+    muted_foreground=ColorScale.of(220, 5, 52),           # Muted text
+    accent=ColorScale.of(220, 10, 13),                    # Dark hover
+    accent_foreground=ColorScale.of(220, 5, 85),
+    destructive=ColorScale.of(0, 65, 55),                 # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 60, 48),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 85, 58),                    # Amber brightened
+    warning_foreground=ColorScale.of(220, 15, 8),
+    info=ColorScale.of(215, 80, 55),                      # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(215, 80, 60),                      # Blue brightened
+    link_hover=ColorScale.of(215, 80, 70),                # Lighter blue
+    code=ColorScale.of(220, 15, 5),                       # Deepest dark code
+    code_foreground=ColorScale.of(215, 60, 65),           # Blue code text
+    selection=ColorScale.of(215, 60, 20),                 # Deep blue selection
+    selection_foreground=ColorScale.of(220, 5, 85),
+    brand=ColorScale.of(215, 80, 55),                     # Blue brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 8, 18),                     # Dark border
+    input=ColorScale.of(220, 8, 15),                      # Dark input
+    ring=ColorScale.of(215, 80, 55),                      # Blue focus ring
+    surface_1=ColorScale.of(220, 15, 6),                  # Deepest
+    surface_2=ColorScale.of(220, 12, 9),                  # Mid dark
+    surface_3=ColorScale.of(220, 10, 12),                 # Elevated
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(240, 10, 4),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(240, 10, 4),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(240, 10, 4),
-    primary=ColorScale(240, 6, 10),
-    primary_foreground=ColorScale(0, 0, 98),
-    secondary=ColorScale(240, 5, 96),
-    secondary_foreground=ColorScale(240, 6, 10),
-    muted=ColorScale(240, 5, 96),
-    muted_foreground=ColorScale(240, 5, 40),
-    accent=ColorScale(240, 5, 96),
-    accent_foreground=ColorScale(240, 6, 10),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(221, 83, 53),
-    link_hover=ColorScale(221, 83, 45),
-    code=ColorScale(240, 5, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(240, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(240, 6, 10),
-    brand_foreground=ColorScale(0, 0, 98),
-    border=ColorScale(240, 6, 90),
-    input=ColorScale(240, 6, 90),
-    ring=ColorScale(240, 6, 10),
-    surface_1=ColorScale(240, 10, 98),
-    surface_2=ColorScale(240, 8, 96),
-    surface_3=ColorScale(240, 6, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(240, 10, 4),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(240, 10, 4),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(240, 10, 4),
+    primary=ColorScale.of(240, 6, 10),
+    primary_foreground=ColorScale.of(0, 0, 98),
+    secondary=ColorScale.of(240, 5, 96),
+    secondary_foreground=ColorScale.of(240, 6, 10),
+    muted=ColorScale.of(240, 5, 96),
+    muted_foreground=ColorScale.of(240, 5, 40),
+    accent=ColorScale.of(240, 5, 96),
+    accent_foreground=ColorScale.of(240, 6, 10),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(221, 83, 53),
+    link_hover=ColorScale.of(221, 83, 45),
+    code=ColorScale.of(240, 5, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(240, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(240, 6, 10),
+    brand_foreground=ColorScale.of(0, 0, 98),
+    border=ColorScale.of(240, 6, 90),
+    input=ColorScale.of(240, 6, 90),
+    ring=ColorScale.of(240, 6, 10),
+    surface_1=ColorScale.of(240, 10, 98),
+    surface_2=ColorScale.of(240, 8, 96),
+    surface_3=ColorScale.of(240, 6, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 10, 4),
-    foreground=ColorScale(0, 0, 98),
-    card=ColorScale(240, 10, 4),
-    card_foreground=ColorScale(0, 0, 98),
-    popover=ColorScale(240, 10, 4),
-    popover_foreground=ColorScale(0, 0, 98),
-    primary=ColorScale(0, 0, 98),
-    primary_foreground=ColorScale(240, 6, 10),
-    secondary=ColorScale(240, 4, 16),
-    secondary_foreground=ColorScale(0, 0, 98),
-    muted=ColorScale(240, 4, 16),
-    muted_foreground=ColorScale(240, 5, 75),
-    accent=ColorScale(240, 4, 16),
-    accent_foreground=ColorScale(0, 0, 98),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(221, 83, 65),
-    link_hover=ColorScale(221, 83, 75),
-    code=ColorScale(240, 4, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(240, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(0, 0, 98),
-    brand_foreground=ColorScale(240, 6, 10),
-    border=ColorScale(240, 4, 16),
-    input=ColorScale(240, 4, 16),
-    ring=ColorScale(240, 5, 84),
-    surface_1=ColorScale(240, 12, 4),
-    surface_2=ColorScale(240, 10, 6),
-    surface_3=ColorScale(240, 8, 10),
+    background=ColorScale.of(240, 10, 4),
+    foreground=ColorScale.of(0, 0, 98),
+    card=ColorScale.of(240, 10, 4),
+    card_foreground=ColorScale.of(0, 0, 98),
+    popover=ColorScale.of(240, 10, 4),
+    popover_foreground=ColorScale.of(0, 0, 98),
+    primary=ColorScale.of(0, 0, 98),
+    primary_foreground=ColorScale.of(240, 6, 10),
+    secondary=ColorScale.of(240, 4, 16),
+    secondary_foreground=ColorScale.of(0, 0, 98),
+    muted=ColorScale.of(240, 4, 16),
+    muted_foreground=ColorScale.of(240, 5, 75),
+    accent=ColorScale.of(240, 4, 16),
+    accent_foreground=ColorScale.of(0, 0, 98),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(221, 83, 65),
+    link_hover=ColorScale.of(221, 83, 75),
+    code=ColorScale.of(240, 4, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(240, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(0, 0, 98),
+    brand_foreground=ColorScale.of(240, 6, 10),
+    border=ColorScale.of(240, 4, 16),
+    input=ColorScale.of(240, 4, 16),
+    ring=ColorScale.of(240, 5, 84),
+    surface_1=ColorScale.of(240, 12, 4),
+    surface_2=ColorScale.of(240, 10, 6),
+    surface_3=ColorScale.of(240, 8, 10),
 )
 
 PRESET = ThemePreset(
@@ -23,81 +23,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(220, 10, 98),
-    foreground=ColorScale(220, 10, 4),
-    card=ColorScale(220, 10, 100),
-    card_foreground=ColorScale(220, 10, 4),
-    popover=ColorScale(220, 10, 100),
-    popover_foreground=ColorScale(220, 10, 4),
-    primary=ColorScale(28, 80, 53),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(154, 48, 39),
-    secondary_foreground=ColorScale(0, 0, 100),
-    muted=ColorScale(215, 14, 93),
-    muted_foreground=ColorScale(215, 10, 45),
-    accent=ColorScale(157, 46, 39),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(350, 89, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 100),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(28, 80, 53),
-    link_hover=ColorScale(28, 80, 45),
-    code=ColorScale(215, 14, 93),
-    code_foreground=ColorScale(215, 10, 20),
-    selection=ColorScale(28, 80, 53),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(28, 80, 53),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(215, 14, 88),
-    input=ColorScale(215, 14, 88),
-    ring=ColorScale(28, 80, 53),
-    surface_1=ColorScale(220, 10, 98),
-    surface_2=ColorScale(220, 10, 95),
-    surface_3=ColorScale(220, 10, 92),
+    background=ColorScale.of(220, 10, 98),
+    foreground=ColorScale.of(220, 10, 4),
+    card=ColorScale.of(220, 10, 100),
+    card_foreground=ColorScale.of(220, 10, 4),
+    popover=ColorScale.of(220, 10, 100),
+    popover_foreground=ColorScale.of(220, 10, 4),
+    primary=ColorScale.of(28, 80, 53),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(154, 48, 39),
+    secondary_foreground=ColorScale.of(0, 0, 100),
+    muted=ColorScale.of(215, 14, 93),
+    muted_foreground=ColorScale.of(215, 10, 45),
+    accent=ColorScale.of(157, 46, 39),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(350, 89, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 100),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(28, 80, 53),
+    link_hover=ColorScale.of(28, 80, 45),
+    code=ColorScale.of(215, 14, 93),
+    code_foreground=ColorScale.of(215, 10, 20),
+    selection=ColorScale.of(28, 80, 53),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(28, 80, 53),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(215, 14, 88),
+    input=ColorScale.of(215, 14, 88),
+    ring=ColorScale.of(28, 80, 53),
+    surface_1=ColorScale.of(220, 10, 98),
+    surface_2=ColorScale.of(220, 10, 95),
+    surface_3=ColorScale.of(220, 10, 92),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(223, 39, 7),
-    foreground=ColorScale(214, 32, 91),
-    card=ColorScale(224, 34, 13),
-    card_foreground=ColorScale(214, 32, 91),
-    popover=ColorScale(224, 34, 13),
-    popover_foreground=ColorScale(214, 32, 91),
-    primary=ColorScale(28, 80, 55),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(154, 48, 53),
-    secondary_foreground=ColorScale(0, 0, 100),
-    muted=ColorScale(224, 30, 16),
-    muted_foreground=ColorScale(215, 20, 65),
-    accent=ColorScale(157, 46, 49),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(350, 89, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 100),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(28, 80, 55),
-    link_hover=ColorScale(28, 80, 65),
-    code=ColorScale(224, 34, 13),
-    code_foreground=ColorScale(214, 32, 91),
-    selection=ColorScale(28, 80, 55),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(28, 80, 55),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(215, 25, 18),
-    input=ColorScale(215, 25, 18),
-    ring=ColorScale(28, 80, 55),
-    surface_1=ColorScale(223, 39, 7),
-    surface_2=ColorScale(224, 34, 13),
-    surface_3=ColorScale(215, 25, 18),
+    background=ColorScale.of(223, 39, 7),
+    foreground=ColorScale.of(214, 32, 91),
+    card=ColorScale.of(224, 34, 13),
+    card_foreground=ColorScale.of(214, 32, 91),
+    popover=ColorScale.of(224, 34, 13),
+    popover_foreground=ColorScale.of(214, 32, 91),
+    primary=ColorScale.of(28, 80, 55),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(154, 48, 53),
+    secondary_foreground=ColorScale.of(0, 0, 100),
+    muted=ColorScale.of(224, 30, 16),
+    muted_foreground=ColorScale.of(215, 20, 65),
+    accent=ColorScale.of(157, 46, 49),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(350, 89, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 100),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(28, 80, 55),
+    link_hover=ColorScale.of(28, 80, 65),
+    code=ColorScale.of(224, 34, 13),
+    code_foreground=ColorScale.of(214, 32, 91),
+    selection=ColorScale.of(28, 80, 55),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(28, 80, 55),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(215, 25, 18),
+    input=ColorScale.of(215, 25, 18),
+    ring=ColorScale.of(28, 80, 55),
+    surface_1=ColorScale.of(223, 39, 7),
+    surface_2=ColorScale.of(224, 34, 13),
+    surface_3=ColorScale.of(215, 25, 18),
 )
 
 PRESET = ThemePreset(
@@ -20,81 +20,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(45, 100, 96),
-    foreground=ColorScale(0, 0, 12),
-    card=ColorScale(45, 60, 93),
-    card_foreground=ColorScale(0, 0, 12),
-    popover=ColorScale(45, 80, 95),
-    popover_foreground=ColorScale(0, 0, 12),
-    primary=ColorScale(265, 89, 55),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(45, 30, 90),
-    secondary_foreground=ColorScale(0, 0, 12),
-    muted=ColorScale(45, 30, 88),
-    muted_foreground=ColorScale(0, 0, 40),
-    accent=ColorScale(326, 100, 45),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 100, 50),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(135, 80, 35),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(31, 100, 50),
-    warning_foreground=ColorScale(0, 0, 100),
-    info=ColorScale(191, 97, 40),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(326, 100, 40),
-    link_hover=ColorScale(265, 89, 45),
-    code=ColorScale(45, 40, 90),
-    code_foreground=ColorScale(265, 89, 40),
-    selection=ColorScale(240, 20, 84),
-    selection_foreground=ColorScale(0, 0, 12),
-    brand=ColorScale(326, 100, 74),
-    brand_foreground=ColorScale(231, 15, 18),
-    border=ColorScale(240, 15, 82),
-    input=ColorScale(240, 15, 85),
-    ring=ColorScale(265, 89, 55),
-    surface_1=ColorScale(45, 60, 97),
-    surface_2=ColorScale(45, 40, 94),
-    surface_3=ColorScale(45, 30, 91),
+    background=ColorScale.of(45, 100, 96),
+    foreground=ColorScale.of(0, 0, 12),
+    card=ColorScale.of(45, 60, 93),
+    card_foreground=ColorScale.of(0, 0, 12),
+    popover=ColorScale.of(45, 80, 95),
+    popover_foreground=ColorScale.of(0, 0, 12),
+    primary=ColorScale.of(265, 89, 55),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(45, 30, 90),
+    secondary_foreground=ColorScale.of(0, 0, 12),
+    muted=ColorScale.of(45, 30, 88),
+    muted_foreground=ColorScale.of(0, 0, 40),
+    accent=ColorScale.of(326, 100, 45),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 100, 50),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(135, 80, 35),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(31, 100, 50),
+    warning_foreground=ColorScale.of(0, 0, 100),
+    info=ColorScale.of(191, 97, 40),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(326, 100, 40),
+    link_hover=ColorScale.of(265, 89, 45),
+    code=ColorScale.of(45, 40, 90),
+    code_foreground=ColorScale.of(265, 89, 40),
+    selection=ColorScale.of(240, 20, 84),
+    selection_foreground=ColorScale.of(0, 0, 12),
+    brand=ColorScale.of(326, 100, 74),
+    brand_foreground=ColorScale.of(231, 15, 18),
+    border=ColorScale.of(240, 15, 82),
+    input=ColorScale.of(240, 15, 85),
+    ring=ColorScale.of(265, 89, 55),
+    surface_1=ColorScale.of(45, 60, 97),
+    surface_2=ColorScale.of(45, 40, 94),
+    surface_3=ColorScale.of(45, 30, 91),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(231, 15, 18),
-    foreground=ColorScale(60, 30, 96),
-    card=ColorScale(232, 15, 15),
-    card_foreground=ColorScale(60, 30, 96),
-    popover=ColorScale(231, 15, 24),
-    popover_foreground=ColorScale(60, 30, 96),
-    primary=ColorScale(265, 89, 78),
-    primary_foreground=ColorScale(231, 15, 18),
-    secondary=ColorScale(231, 8, 29),
-    secondary_foreground=ColorScale(60, 30, 96),
-    muted=ColorScale(232, 14, 31),
-    muted_foreground=ColorScale(225, 27, 51),
-    accent=ColorScale(326, 100, 74),
-    accent_foreground=ColorScale(231, 15, 18),
-    destructive=ColorScale(0, 100, 67),
-    destructive_foreground=ColorScale(60, 30, 96),
-    success=ColorScale(135, 94, 65),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(31, 100, 71),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(191, 97, 77),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(326, 100, 74),
-    link_hover=ColorScale(265, 89, 78),
-    code=ColorScale(230, 15, 11),
-    code_foreground=ColorScale(191, 97, 77),
-    selection=ColorScale(232, 14, 31),
-    selection_foreground=ColorScale(60, 30, 96),
-    brand=ColorScale(326, 100, 74),
-    brand_foreground=ColorScale(231, 15, 18),
-    border=ColorScale(225, 27, 51),
-    input=ColorScale(232, 14, 31),
-    ring=ColorScale(265, 89, 78),
-    surface_1=ColorScale(230, 15, 11),
-    surface_2=ColorScale(232, 15, 15),
-    surface_3=ColorScale(231, 15, 24),
+    background=ColorScale.of(231, 15, 18),
+    foreground=ColorScale.of(60, 30, 96),
+    card=ColorScale.of(232, 15, 15),
+    card_foreground=ColorScale.of(60, 30, 96),
+    popover=ColorScale.of(231, 15, 24),
+    popover_foreground=ColorScale.of(60, 30, 96),
+    primary=ColorScale.of(265, 89, 78),
+    primary_foreground=ColorScale.of(231, 15, 18),
+    secondary=ColorScale.of(231, 8, 29),
+    secondary_foreground=ColorScale.of(60, 30, 96),
+    muted=ColorScale.of(232, 14, 31),
+    muted_foreground=ColorScale.of(225, 27, 51),
+    accent=ColorScale.of(326, 100, 74),
+    accent_foreground=ColorScale.of(231, 15, 18),
+    destructive=ColorScale.of(0, 100, 67),
+    destructive_foreground=ColorScale.of(60, 30, 96),
+    success=ColorScale.of(135, 94, 65),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(31, 100, 71),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(191, 97, 77),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(326, 100, 74),
+    link_hover=ColorScale.of(265, 89, 78),
+    code=ColorScale.of(230, 15, 11),
+    code_foreground=ColorScale.of(191, 97, 77),
+    selection=ColorScale.of(232, 14, 31),
+    selection_foreground=ColorScale.of(60, 30, 96),
+    brand=ColorScale.of(326, 100, 74),
+    brand_foreground=ColorScale.of(231, 15, 18),
+    border=ColorScale.of(225, 27, 51),
+    input=ColorScale.of(232, 14, 31),
+    ring=ColorScale.of(265, 89, 78),
+    surface_1=ColorScale.of(230, 15, 11),
+    surface_2=ColorScale.of(232, 15, 15),
+    surface_3=ColorScale.of(231, 15, 24),
 )
 
 PRESET = ThemePreset(
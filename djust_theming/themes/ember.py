@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(30, 20, 97),
-    foreground=ColorScale(15, 20, 15),
-    card=ColorScale(30, 18, 94),
-    card_foreground=ColorScale(15, 20, 15),
-    popover=ColorScale(30, 18, 94),
-    popover_foreground=ColorScale(15, 20, 15),
-    primary=ColorScale(35, 95, 55),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(30, 15, 88),
-    secondary_foreground=ColorScale(15, 20, 15),
-    muted=ColorScale(30, 15, 88),
-    muted_foreground=ColorScale(15, 10, 45),
-    accent=ColorScale(15, 80, 55),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 72, 51),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(85, 45, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(35, 95, 55),
-    warning_foreground=ColorScale(15, 20, 15),
-    info=ColorScale(200, 40, 50),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(15, 80, 50),
-    link_hover=ColorScale(15, 80, 40),
-    code=ColorScale(30, 15, 90),
-    code_foreground=ColorScale(15, 80, 45),
-    selection=ColorScale(35, 80, 85),
-    selection_foreground=ColorScale(35, 10, 15),
-    brand=ColorScale(25, 95, 55),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(30, 12, 80),
-    input=ColorScale(30, 12, 80),
-    ring=ColorScale(35, 95, 55),
-    surface_1=ColorScale(30, 20, 96),
-    surface_2=ColorScale(30, 15, 93),
-    surface_3=ColorScale(30, 12, 90),
+    background=ColorScale.of(30, 20, 97),
+    foreground=ColorScale.of(15, 20, 15),
+    card=ColorScale.of(30, 18, 94),
+    card_foreground=ColorScale.of(15, 20, 15),
+    popover=ColorScale.of(30, 18, 94),
+    popover_foreground=ColorScale.of(15, 20, 15),
+    primary=ColorScale.of(35, 95, 55),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(30, 15, 88),
+    secondary_foreground=ColorScale.of(15, 20, 15),
+    muted=ColorScale.of(30, 15, 88),
+    muted_foreground=ColorScale.of(15, 10, 45),
+    accent=ColorScale.of(15, 80, 55),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 72, 51),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(85, 45, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(35, 95, 55),
+    warning_foreground=ColorScale.of(15, 20, 15),
+    info=ColorScale.of(200, 40, 50),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(15, 80, 50),
+    link_hover=ColorScale.of(15, 80, 40),
+    code=ColorScale.of(30, 15, 90),
+    code_foreground=ColorScale.of(15, 80, 45),
+    selection=ColorScale.of(35, 80, 85),
+    selection_foreground=ColorScale.of(35, 10, 15),
+    brand=ColorScale.of(25, 95, 55),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(30, 12, 80),
+    input=ColorScale.of(30, 12, 80),
+    ring=ColorScale.of(35, 95, 55),
+    surface_1=ColorScale.of(30, 20, 96),
+    surface_2=ColorScale.of(30, 15, 93),
+    surface_3=ColorScale.of(30, 12, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(15, 15, 10),
-    foreground=ColorScale(35, 30, 88),
-    card=ColorScale(15, 12, 14),
-    card_foreground=ColorScale(35, 30, 88),
-    popover=ColorScale(15, 12, 14),
-    popover_foreground=ColorScale(35, 30, 88),
-    primary=ColorScale(35, 95, 55),
-    primary_foreground=ColorScale(15, 15, 10),
-    secondary=ColorScale(15, 12, 18),
-    secondary_foreground=ColorScale(35, 30, 88),
-    muted=ColorScale(15, 12, 18),
-    muted_foreground=ColorScale(25, 15, 55),
-    accent=ColorScale(15, 80, 55),
-    accent_foreground=ColorScale(15, 15, 10),
-    destructive=ColorScale(0, 72, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(85, 45, 55),
-    success_foreground=ColorScale(15, 15, 10),
-    warning=ColorScale(35, 95, 55),
-    warning_foreground=ColorScale(15, 15, 10),
-    info=ColorScale(200, 40, 60),
-    info_foreground=ColorScale(15, 15, 10),
-    link=ColorScale(35, 95, 55),
-    link_hover=ColorScale(35, 95, 70),
-    code=ColorScale(15, 12, 16),
-    code_foreground=ColorScale(35, 95, 65),
-    selection=ColorScale(35, 80, 25),
-    selection_foreground=ColorScale(35, 10, 90),
-    brand=ColorScale(25, 95, 55),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(15, 12, 22),
-    input=ColorScale(15, 12, 22),
-    ring=ColorScale(35, 95, 55),
-    surface_1=ColorScale(15, 20, 6),
-    surface_2=ColorScale(15, 15, 10),
-    surface_3=ColorScale(15, 12, 14),
+    background=ColorScale.of(15, 15, 10),
+    foreground=ColorScale.of(35, 30, 88),
+    card=ColorScale.of(15, 12, 14),
+    card_foreground=ColorScale.of(35, 30, 88),
+    popover=ColorScale.of(15, 12, 14),
+    popover_foreground=ColorScale.of(35, 30, 88),
+    primary=ColorScale.of(35, 95, 55),
+    primary_foreground=ColorScale.of(15, 15, 10),
+    secondary=ColorScale.of(15, 12, 18),
+    secondary_foreground=ColorScale.of(35, 30, 88),
+    muted=ColorScale.of(15, 12, 18),
+    muted_foreground=ColorScale.of(25, 15, 55),
+    accent=ColorScale.of(15, 80, 55),
+    accent_foreground=ColorScale.of(15, 15, 10),
+    destructive=ColorScale.of(0, 72, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(85, 45, 55),
+    success_foreground=ColorScale.of(15, 15, 10),
+    warning=ColorScale.of(35, 95, 55),
+    warning_foreground=ColorScale.of(15, 15, 10),
+    info=ColorScale.of(200, 40, 60),
+    info_foreground=ColorScale.of(15, 15, 10),
+    link=ColorScale.of(35, 95, 55),
+    link_hover=ColorScale.of(35, 95, 70),
+    code=ColorScale.of(15, 12, 16),
+    code_foreground=ColorScale.of(35, 95, 65),
+    selection=ColorScale.of(35, 80, 25),
+    selection_foreground=ColorScale.of(35, 10, 90),
+    brand=ColorScale.of(25, 95, 55),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(15, 12, 22),
+    input=ColorScale.of(15, 12, 22),
+    ring=ColorScale.of(35, 95, 55),
+    surface_1=ColorScale.of(15, 20, 6),
+    surface_2=ColorScale.of(15, 15, 10),
+    surface_3=ColorScale.of(15, 12, 14),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # Blue #7fbbb3, aqua #83c092
 
 LIGHT = ThemeTokens(
-    background=ColorScale(44, 87, 94),                 # #fdf6e3 — warm cream
-    foreground=ColorScale(202, 11, 40),                # #5c6a72
-    card=ColorScale(44, 60, 97),
-    card_foreground=ColorScale(202, 11, 40),
-    popover=ColorScale(44, 60, 97),
-    popover_foreground=ColorScale(202, 11, 40),
-    primary=ColorScale(83, 34, 63),                    # Green #a7c080
-    primary_foreground=ColorScale(202, 11, 20),
-    secondary=ColorScale(44, 50, 91),
-    secondary_foreground=ColorScale(202, 11, 40),
-    muted=ColorScale(44, 35, 86),
-    muted_foreground=ColorScale(202, 11, 55),
-    accent=ColorScale(44, 50, 91),                     # Subtle warm hover
-    accent_foreground=ColorScale(202, 11, 40),
-    destructive=ColorScale(359, 68, 70),               # Red #e67e80
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(83, 34, 63),                    # Green #a7c080
-    success_foreground=ColorScale(202, 11, 20),
-    warning=ColorScale(40, 56, 68),                    # Yellow #dbbc7f
-    warning_foreground=ColorScale(202, 11, 20),
-    info=ColorScale(172, 31, 62),                      # Blue #7fbbb3
-    info_foreground=ColorScale(202, 11, 20),
-    link=ColorScale(172, 31, 52),                      # Blue darker for light bg
-    link_hover=ColorScale(172, 31, 42),
-    code=ColorScale(206, 13, 20),                      # Dark code bg
-    code_foreground=ColorScale(83, 34, 70),            # Green code text
-    selection=ColorScale(83, 34, 88),                  # Pale green selection
-    selection_foreground=ColorScale(202, 11, 20),
-    brand=ColorScale(83, 34, 63),                      # Green
-    brand_foreground=ColorScale(202, 11, 20),
-    border=ColorScale(44, 25, 82),
-    input=ColorScale(44, 35, 90),
-    ring=ColorScale(83, 34, 63),
-    surface_1=ColorScale(44, 87, 94),
-    surface_2=ColorScale(44, 50, 91),
-    surface_3=ColorScale(44, 35, 88),
+    background=ColorScale.of(44, 87, 94),                 # #fdf6e3 — warm cream
+    foreground=ColorScale.of(202, 11, 40),                # #5c6a72
+    card=ColorScale.of(44, 60, 97),
+    card_foreground=ColorScale.of(202, 11, 40),
+    popover=ColorScale.of(44, 60, 97),
+    popover_foreground=ColorScale.of(202, 11, 40),
+    primary=ColorScale.of(83, 34, 63),                    # Green #a7c080
+    primary_foreground=ColorScale.of(202, 11, 20),
+    secondary=ColorScale.of(44, 50, 91),
+    secondary_foreground=ColorScale.of(202, 11, 40),
+    muted=ColorScale.of(44, 35, 86),
+    muted_foreground=ColorScale.of(202, 11, 55),
+    accent=ColorScale.of(44, 50, 91),                     # Subtle warm hover
+    accent_foreground=ColorScale.of(202, 11, 40),
+    destructive=ColorScale.of(359, 68, 70),               # Red #e67e80
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(83, 34, 63),                    # Green #a7c080
+    success_foreground=ColorScale.of(202, 11, 20),
+    warning=ColorScale.of(40, 56, 68),                    # Yellow #dbbc7f
+    warning_foreground=ColorScale.of(202, 11, 20),
+    info=ColorScale.of(172, 31, 62),                      # Blue #7fbbb3
+    info_foreground=ColorScale.of(202, 11, 20),
+    link=ColorScale.of(172, 31, 52),                      # Blue darker for light bg
+    link_hover=ColorScale.of(172, 31, 42),
+    code=ColorScale.of(206, 13, 20),                      # Dark code bg
+    code_foreground=ColorScale.of(83, 34, 70),            # Green code text
+    selection=ColorScale.of(83, 34, 88),                  # Pale green selection
+    selection_foreground=ColorScale.of(202, 11, 20),
+    brand=ColorScale.of(83, 34, 63),                      # Green
+    brand_foreground=ColorScale.of(202, 11, 20),
+    border=ColorScale.of(44, 25, 82),
+    input=ColorScale.of(44, 35, 90),
+    ring=ColorScale.of(83, 34, 63),
+    surface_1=ColorScale.of(44, 87, 94),
+    surface_2=ColorScale.of(44, 50, 91),
+    surface_3=ColorScale.of(44, 35, 88),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(206, 13, 20),                # #2d353b
-    foreground=ColorScale(41, 32, 75),                 # #d3c6aa
-    card=ColorScale(206, 12, 24),
-    card_foreground=ColorScale(41, 32, 75),
-    popover=ColorScale(206, 12, 24),
-    popover_foreground=ColorScale(41, 32, 75),
-    primary=ColorScale(83, 34, 63),                    # Green #a7c080
-    primary_foreground=ColorScale(206, 13, 15),
-    secondary=ColorScale(206, 11, 27),
-    secondary_foreground=ColorScale(41, 32, 75),
-    muted=ColorScale(206, 10, 30),
-    muted_foreground=ColorScale(41, 15, 50),
-    accent=ColorScale(206, 11, 27),                    # Subtle dark hover
-    accent_foreground=ColorScale(41, 32, 75),
-    destructive=ColorScale(359, 68, 70),               # Red #e67e80
-    destructive_foreground=ColorScale(206, 13, 15),
-    success=ColorScale(83, 34, 63),                    # Green
-    success_foreground=ColorScale(206, 13, 15),
-    warning=ColorScale(40, 56, 68),                    # Yellow
-    warning_foreground=ColorScale(206, 13, 15),
-    info=ColorScale(172, 31, 62),                      # Blue
-    info_foreground=ColorScale(206, 13, 15),
-    link=ColorScale(172, 31, 62),                      # Blue
-    link_hover=ColorScale(172, 31, 72),
-    code=ColorScale(206, 13, 15),                      # Very dark code bg
-    code_foreground=ColorScale(83, 34, 70),            # Green code text
-    selection=ColorScale(83, 25, 24),                  # Dark green selection
-    selection_foreground=ColorScale(41, 32, 82),
-    brand=ColorScale(83, 34, 63),                      # Green
-    brand_foreground=ColorScale(206, 13, 15),
-    border=ColorScale(206, 10, 30),
-    input=ColorScale(206, 10, 30),
-    ring=ColorScale(83, 34, 63),
-    surface_1=ColorScale(206, 13, 16),
-    surface_2=ColorScale(206, 13, 20),
-    surface_3=ColorScale(206, 12, 24),
+    background=ColorScale.of(206, 13, 20),                # #2d353b
+    foreground=ColorScale.of(41, 32, 75),                 # #d3c6aa
+    card=ColorScale.of(206, 12, 24),
+    card_foreground=ColorScale.of(41, 32, 75),
+    popover=ColorScale.of(206, 12, 24),
+    popover_foreground=ColorScale.of(41, 32, 75),
+    primary=ColorScale.of(83, 34, 63),                    # Green #a7c080
+    primary_foreground=ColorScale.of(206, 13, 15),
+    secondary=ColorScale.of(206, 11, 27),
+    secondary_foreground=ColorScale.of(41, 32, 75),
+    muted=ColorScale.of(206, 10, 30),
+    muted_foreground=ColorScale.of(41, 15, 50),
+    accent=ColorScale.of(206, 11, 27),                    # Subtle dark hover
+    accent_foreground=ColorScale.of(41, 32, 75),
+    destructive=ColorScale.of(359, 68, 70),               # Red #e67e80
+    destructive_foreground=ColorScale.of(206, 13, 15),
+    success=ColorScale.of(83, 34, 63),                    # Green
+    success_foreground=ColorScale.of(206, 13, 15),
+    warning=ColorScale.of(40, 56, 68),                    # Yellow
+    warning_foreground=ColorScale.of(206, 13, 15),
+    info=ColorScale.of(172, 31, 62),                      # Blue
+    info_foreground=ColorScale.of(206, 13, 15),
+    link=ColorScale.of(172, 31, 62),                      # Blue
+    link_hover=ColorScale.of(172, 31, 72),
+    code=ColorScale.of(206, 13, 15),                      # Very dark code bg
+    code_foreground=ColorScale.of(83, 34, 70),            # Green code text
+    selection=ColorScale.of(83, 25, 24),                  # Dark green selection
+    selection_foreground=ColorScale.of(41, 32, 82),
+    brand=ColorScale.of(83, 34, 63),                      # Green
+    brand_foreground=ColorScale.of(206, 13, 15),
+    border=ColorScale.of(206, 10, 30),
+    input=ColorScale.of(206, 10, 30),
+    ring=ColorScale.of(83, 34, 63),
+    surface_1=ColorScale.of(206, 13, 16),
+    surface_2=ColorScale.of(206, 13, 20),
+    surface_3=ColorScale.of(206, 12, 24),
 )
 
 PRESET = ThemePreset(
@@ -20,81 +20,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(150, 30, 98),
-    foreground=ColorScale(150, 80, 15),
-    card=ColorScale(150, 25, 95),
-    card_foreground=ColorScale(150, 80, 15),
-    popover=ColorScale(150, 25, 95),
-    popover_foreground=ColorScale(150, 80, 15),
-    primary=ColorScale(142, 71, 45),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(150, 20, 90),
-    secondary_foreground=ColorScale(150, 80, 20),
-    muted=ColorScale(150, 20, 92),
-    muted_foreground=ColorScale(150, 30, 40),
-    accent=ColorScale(150, 25, 90),
-    accent_foreground=ColorScale(150, 80, 20),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(158, 64, 52),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(142, 71, 40),
-    link_hover=ColorScale(142, 71, 30),
-    code=ColorScale(150, 30, 94),
-    code_foreground=ColorScale(150, 80, 15),
-    selection=ColorScale(142, 71, 45),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(142, 71, 45),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(150, 20, 85),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(142, 71, 45),
-    surface_1=ColorScale(150, 20, 98),
-    surface_2=ColorScale(150, 15, 96),
-    surface_3=ColorScale(150, 12, 93),
+    background=ColorScale.of(150, 30, 98),
+    foreground=ColorScale.of(150, 80, 15),
+    card=ColorScale.of(150, 25, 95),
+    card_foreground=ColorScale.of(150, 80, 15),
+    popover=ColorScale.of(150, 25, 95),
+    popover_foreground=ColorScale.of(150, 80, 15),
+    primary=ColorScale.of(142, 71, 45),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(150, 20, 90),
+    secondary_foreground=ColorScale.of(150, 80, 20),
+    muted=ColorScale.of(150, 20, 92),
+    muted_foreground=ColorScale.of(150, 30, 40),
+    accent=ColorScale.of(150, 25, 90),
+    accent_foreground=ColorScale.of(150, 80, 20),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(158, 64, 52),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(142, 71, 40),
+    link_hover=ColorScale.of(142, 71, 30),
+    code=ColorScale.of(150, 30, 94),
+    code_foreground=ColorScale.of(150, 80, 15),
+    selection=ColorScale.of(142, 71, 45),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(142, 71, 45),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(150, 20, 85),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(142, 71, 45),
+    surface_1=ColorScale.of(150, 20, 98),
+    surface_2=ColorScale.of(150, 15, 96),
+    surface_3=ColorScale.of(150, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(150, 51, 8),
-    foreground=ColorScale(150, 50, 95),
-    card=ColorScale(150, 48, 12),
-    card_foreground=ColorScale(150, 50, 95),
-    popover=ColorScale(150, 48, 12),
-    popover_foreground=ColorScale(150, 50, 95),
-    primary=ColorScale(142, 71, 45),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(150, 45, 18),
-    secondary_foreground=ColorScale(150, 50, 95),
-    muted=ColorScale(150, 45, 18),
-    muted_foreground=ColorScale(150, 40, 65),
-    accent=ColorScale(150, 45, 18),
-    accent_foreground=ColorScale(142, 65, 75),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(158, 64, 52),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(142, 71, 50),
-    link_hover=ColorScale(142, 71, 60),
-    code=ColorScale(150, 48, 10),
-    code_foreground=ColorScale(150, 50, 95),
-    selection=ColorScale(142, 71, 45),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(142, 71, 45),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(150, 45, 18),
-    input=ColorScale(150, 48, 12),
-    ring=ColorScale(142, 71, 45),
-    surface_1=ColorScale(150, 20, 4),
-    surface_2=ColorScale(150, 15, 7),
-    surface_3=ColorScale(150, 12, 11),
+    background=ColorScale.of(150, 51, 8),
+    foreground=ColorScale.of(150, 50, 95),
+    card=ColorScale.of(150, 48, 12),
+    card_foreground=ColorScale.of(150, 50, 95),
+    popover=ColorScale.of(150, 48, 12),
+    popover_foreground=ColorScale.of(150, 50, 95),
+    primary=ColorScale.of(142, 71, 45),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(150, 45, 18),
+    secondary_foreground=ColorScale.of(150, 50, 95),
+    muted=ColorScale.of(150, 45, 18),
+    muted_foreground=ColorScale.of(150, 40, 65),
+    accent=ColorScale.of(150, 45, 18),
+    accent_foreground=ColorScale.of(142, 65, 75),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(158, 64, 52),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(142, 71, 50),
+    link_hover=ColorScale.of(142, 71, 60),
+    code=ColorScale.of(150, 48, 10),
+    code_foreground=ColorScale.of(150, 50, 95),
+    selection=ColorScale.of(142, 71, 45),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(142, 71, 45),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(150, 45, 18),
+    input=ColorScale.of(150, 48, 12),
+    ring=ColorScale.of(142, 71, 45),
+    surface_1=ColorScale.of(150, 20, 4),
+    surface_2=ColorScale.of(150, 15, 7),
+    surface_3=ColorScale.of(150, 12, 11),
 )
 
 PRESET = ThemePreset(
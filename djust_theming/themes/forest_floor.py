@@ -16,81 +16,81 @@ from ._base import (
 # Think: walking through old-growth forest, dappled light.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(120, 15, 96),                # Pale sage
-    foreground=ColorScale(30, 25, 12),                 # Deep bark
-    card=ColorScale(100, 10, 99),                      # Almost white with green tint
-    card_foreground=ColorScale(30, 25, 12),
-    popover=ColorScale(100, 10, 99),
-    popover_foreground=ColorScale(30, 25, 12),
-    primary=ColorScale(140, 45, 35),                   # Moss green
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(120, 12, 93),                 # Pale sage panel
-    secondary_foreground=ColorScale(30, 25, 12),
-    muted=ColorScale(120, 10, 90),                     # Sage muted
-    muted_foreground=ColorScale(100, 10, 42),          # Green-gray text
-    accent=ColorScale(120, 12, 93),                    # Sage hover surface
-    accent_foreground=ColorScale(30, 25, 12),
-    destructive=ColorScale(350, 50, 45),               # Berry red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 50, 38),                   # Deep forest green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 60, 50),                    # Amber mushroom
-    warning_foreground=ColorScale(30, 25, 12),
-    info=ColorScale(200, 40, 48),                      # Stream blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(120, 40, 38),                      # Fern green links
-    link_hover=ColorScale(140, 45, 30),                # Deeper moss on hover
-    code=ColorScale(140, 30, 10),                      # Dark forest code bg
-    code_foreground=ColorScale(100, 35, 70),           # Lichen green code text
-    selection=ColorScale(140, 30, 88),                 # Pale moss selection
-    selection_foreground=ColorScale(30, 25, 12),
-    brand=ColorScale(120, 40, 45),                     # Fern green
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(100, 12, 83),                    # Sage border
-    input=ColorScale(120, 10, 90),                     # Sage input
-    ring=ColorScale(140, 45, 35),                      # Moss focus ring
-    surface_1=ColorScale(120, 15, 96),                 # Pale sage
-    surface_2=ColorScale(120, 12, 94),                 # Slightly deeper
-    surface_3=ColorScale(120, 10, 91),                 # Deeper still
+    background=ColorScale.of(120, 15, 96),                # Pale sage
+    foreground=ColorScale.of(30, 25, 12),                 # Deep bark
+    card=ColorScale.of(100, 10, 99),                      # Almost white with green tint
+    card_foreground=ColorScale.of(30, 25, 12),
+    popover=ColorScale.of(100, 10, 99),
+    popover_foreground=ColorScale.of(30, 25, 12),
+    primary=ColorScale.of(140, 45, 35),                   # Moss green
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(120, 12, 93),                 # Pale sage panel
+    secondary_foreground=ColorScale.of(30, 25, 12),
+    muted=ColorScale.of(120, 10, 90),                     # Sage muted
+    muted_foreground=ColorScale.of(100, 10, 42),          # Green-gray text
+    accent=ColorScale.of(120, 12, 93),                    # Sage hover surface
+    accent_foreground=ColorScale.of(30, 25, 12),
+    destructive=ColorScale.of(350, 50, 45),               # Berry red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 50, 38),                   # Deep forest green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 60, 50),                    # Amber mushroom
+    warning_foreground=ColorScale.of(30, 25, 12),
+    info=ColorScale.of(200, 40, 48),                      # Stream blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(120, 40, 38),                      # Fern green links
+    link_hover=ColorScale.of(140, 45, 30),                # Deeper moss on hover
+    code=ColorScale.of(140, 30, 10),                      # Dark forest code bg
+    code_foreground=ColorScale.of(100, 35, 70),           # Lichen green code text
+    selection=ColorScale.of(140, 30, 88),                 # Pale moss selection
+    selection_foreground=ColorScale.of(30, 25, 12),
+    brand=ColorScale.of(120, 40, 45),                     # Fern green
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(100, 12, 83),                    # Sage border
+    input=ColorScale.of(120, 10, 90),                     # Sage input
+    ring=ColorScale.of(140, 45, 35),                      # Moss focus ring
+    surface_1=ColorScale.of(120, 15, 96),                 # Pale sage
+    surface_2=ColorScale.of(120, 12, 94),                 # Slightly deeper
+    surface_3=ColorScale.of(120, 10, 91),                 # Deeper still
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(140, 30, 7),                 # Deep forest
-    foreground=ColorScale(100, 10, 80),                # Lichen gray
-    card=ColorScale(140, 25, 10),                      # Dark forest card
-    card_foreground=ColorScale(100, 10, 80),
-    popover=ColorScale(140, 25, 10),
-    popover_foreground=ColorScale(100, 10, 80),
-    primary=ColorScale(140, 45, 42),                   # Moss brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(140, 20, 12),                 # Dark forest panel
-    secondary_foreground=ColorScale(100, 10, 80),
-    muted=ColorScale(140, 15, 16),                     # Dark muted
-    muted_foreground=ColorScale(100, 8, 50),           # Muted lichen text
-    accent=ColorScale(140, 20, 12),                    # Dark forest hover
-    accent_foreground=ColorScale(100, 10, 80),
-    destructive=ColorScale(350, 50, 52),               # Berry red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 50, 45),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 60, 55),                    # Mushroom brightened
-    warning_foreground=ColorScale(30, 25, 10),
-    info=ColorScale(200, 40, 55),                      # Stream blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(120, 40, 52),                      # Fern brightened
-    link_hover=ColorScale(120, 45, 62),                # Lighter fern
-    code=ColorScale(140, 30, 5),                       # Deepest forest code
-    code_foreground=ColorScale(100, 35, 62),           # Lichen code text
-    selection=ColorScale(140, 30, 18),                 # Deep moss selection
-    selection_foreground=ColorScale(100, 10, 80),
-    brand=ColorScale(120, 40, 52),                     # Fern brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(140, 15, 18),                    # Dark forest border
-    input=ColorScale(140, 12, 15),                     # Dark input
-    ring=ColorScale(140, 45, 42),                      # Moss focus ring
-    surface_1=ColorScale(140, 30, 5),                  # Deepest
-    surface_2=ColorScale(140, 28, 8),                  # Mid dark
-    surface_3=ColorScale(140, 25, 11),                 # Elevated
+    background=ColorScale.of(140, 30, 7),                 # Deep forest
+    foreground=ColorScale.of(100, 10, 80),                # Lichen gray
+    card=ColorScale.of(140, 25, 10),                      # Dark forest card
+    card_foreground=ColorScale.of(100, 10, 80),
+    popover=ColorScale.of(140, 25, 10),
+    popover_foreground=ColorScale.of(100, 10, 80),
+    primary=ColorScale.of(140, 45, 42),                   # Moss brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(140, 20, 12),                 # Dark forest panel
+    secondary_foreground=ColorScale.of(100, 10, 80),
+    muted=ColorScale.of(140, 15, 16),                     # Dark muted
+    muted_foreground=ColorScale.of(100, 8, 50),           # Muted lichen text
+    accent=ColorScale.of(140, 20, 12),                    # Dark forest hover
+    accent_foreground=ColorScale.of(100, 10, 80),
+    destructive=ColorScale.of(350, 50, 52),               # Berry red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 50, 45),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 60, 55),                    # Mushroom brightened
+    warning_foreground=ColorScale.of(30, 25, 10),
+    info=ColorScale.of(200, 40, 55),                      # Stream blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(120, 40, 52),                      # Fern brightened
+    link_hover=ColorScale.of(120, 45, 62),                # Lighter fern
+    code=ColorScale.of(140, 30, 5),                       # Deepest forest code
+    code_foreground=ColorScale.of(100, 35, 62),           # Lichen code text
+    selection=ColorScale.of(140, 30, 18),                 # Deep moss selection
+    selection_foreground=ColorScale.of(100, 10, 80),
+    brand=ColorScale.of(120, 40, 52),                     # Fern brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(140, 15, 18),                    # Dark forest border
+    input=ColorScale.of(140, 12, 15),                     # Dark input
+    ring=ColorScale.of(140, 45, 42),                      # Moss focus ring
+    surface_1=ColorScale.of(140, 30, 5),                  # Deepest
+    surface_2=ColorScale.of(140, 28, 8),                  # Mid dark
+    surface_3=ColorScale.of(140, 25, 11),                 # Elevated
 )
 
 PRESET = ThemePreset(
@@ -20,81 +20,81 @@ from ._base import (
 # - #0D1117 — dark mode background
 
 LIGHT = ThemeTokens(
-    background=ColorScale(210, 29, 97),                # #F6F8FA — cool gray
-    foreground=ColorScale(213, 13, 14),                # #1F2328 — near-black
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(213, 13, 14),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(213, 13, 14),
-    primary=ColorScale(212, 92, 45),                   # #0969DA — Primer blue
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 18, 95),                 # Subtle cool bg
-    secondary_foreground=ColorScale(213, 13, 14),
-    muted=ColorScale(210, 18, 93),                     # Cool muted surface
-    muted_foreground=ColorScale(212, 8, 43),           # #656D76 — muted text
-    accent=ColorScale(210, 18, 96),                    # Cool hover surface
-    accent_foreground=ColorScale(213, 13, 14),
-    destructive=ColorScale(356, 72, 47),               # GitHub red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(137, 66, 30),                   # GitHub green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 100, 37),                   # GitHub amber
-    warning_foreground=ColorScale(213, 13, 14),
-    info=ColorScale(212, 92, 45),                      # Primary as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(212, 92, 42),                      # Primer link blue
-    link_hover=ColorScale(212, 92, 35),                # Darker on hover
-    code=ColorScale(210, 14, 93),                      # Subtle code bg
-    code_foreground=ColorScale(213, 13, 14),           # Dark code text
-    selection=ColorScale(212, 80, 88),                 # Pale blue selection
-    selection_foreground=ColorScale(213, 13, 14),
-    brand=ColorScale(261, 69, 59),                     # #8250DF — GitHub purple
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(210, 18, 84),                    # #D0D7DE — cool border
-    input=ColorScale(210, 18, 84),
-    ring=ColorScale(212, 92, 45),                      # Primer blue ring
-    surface_1=ColorScale(210, 29, 97),                 # Lightest cool
-    surface_2=ColorScale(210, 22, 95),                 # Mid cool
-    surface_3=ColorScale(210, 18, 93),                 # Slightly deeper
+    background=ColorScale.of(210, 29, 97),                # #F6F8FA — cool gray
+    foreground=ColorScale.of(213, 13, 14),                # #1F2328 — near-black
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(213, 13, 14),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(213, 13, 14),
+    primary=ColorScale.of(212, 92, 45),                   # #0969DA — Primer blue
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 18, 95),                 # Subtle cool bg
+    secondary_foreground=ColorScale.of(213, 13, 14),
+    muted=ColorScale.of(210, 18, 93),                     # Cool muted surface
+    muted_foreground=ColorScale.of(212, 8, 43),           # #656D76 — muted text
+    accent=ColorScale.of(210, 18, 96),                    # Cool hover surface
+    accent_foreground=ColorScale.of(213, 13, 14),
+    destructive=ColorScale.of(356, 72, 47),               # GitHub red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(137, 66, 30),                   # GitHub green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 100, 37),                   # GitHub amber
+    warning_foreground=ColorScale.of(213, 13, 14),
+    info=ColorScale.of(212, 92, 45),                      # Primary as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(212, 92, 42),                      # Primer link blue
+    link_hover=ColorScale.of(212, 92, 35),                # Darker on hover
+    code=ColorScale.of(210, 14, 93),                      # Subtle code bg
+    code_foreground=ColorScale.of(213, 13, 14),           # Dark code text
+    selection=ColorScale.of(212, 80, 88),                 # Pale blue selection
+    selection_foreground=ColorScale.of(213, 13, 14),
+    brand=ColorScale.of(261, 69, 59),                     # #8250DF — GitHub purple
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(210, 18, 84),                    # #D0D7DE — cool border
+    input=ColorScale.of(210, 18, 84),
+    ring=ColorScale.of(212, 92, 45),                      # Primer blue ring
+    surface_1=ColorScale.of(210, 29, 97),                 # Lightest cool
+    surface_2=ColorScale.of(210, 22, 95),                 # Mid cool
+    surface_3=ColorScale.of(210, 18, 93),                 # Slightly deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(215, 14, 11),                # #0D1117 — dark mode bg
-    foreground=ColorScale(210, 10, 85),                # Light text
-    card=ColorScale(215, 14, 14),                      # Slightly lighter card
-    card_foreground=ColorScale(210, 10, 85),
-    popover=ColorScale(215, 14, 14),
-    popover_foreground=ColorScale(210, 10, 85),
-    primary=ColorScale(212, 92, 55),                   # Primer blue — brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(215, 10, 16),                 # Dark panel
-    secondary_foreground=ColorScale(210, 10, 85),
-    muted=ColorScale(215, 10, 18),                     # Dark muted
-    muted_foreground=ColorScale(210, 10, 55),          # Muted text on dark
-    accent=ColorScale(215, 10, 16),                    # Dark hover surface
-    accent_foreground=ColorScale(210, 10, 85),
-    destructive=ColorScale(356, 72, 55),               # Red — brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(137, 66, 38),                   # Green — brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 100, 45),                   # Amber — brightened
-    warning_foreground=ColorScale(215, 14, 11),
-    info=ColorScale(212, 92, 55),                      # Primary
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(212, 92, 58),                      # Blue — brightened
-    link_hover=ColorScale(212, 92, 65),                # Lighter blue
-    code=ColorScale(215, 14, 11),                      # Dark code bg (same as bg)
-    code_foreground=ColorScale(210, 10, 85),           # Light code text
-    selection=ColorScale(212, 60, 25),                 # Deep blue selection
-    selection_foreground=ColorScale(210, 10, 85),
-    brand=ColorScale(261, 69, 65),                     # Purple — brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(215, 10, 22),                    # Dark border
-    input=ColorScale(215, 10, 22),
-    ring=ColorScale(212, 92, 55),                      # Blue focus ring
-    surface_1=ColorScale(215, 14, 8),                  # Deepest
-    surface_2=ColorScale(215, 14, 11),                 # Mid
-    surface_3=ColorScale(215, 14, 14),                 # Elevated
+    background=ColorScale.of(215, 14, 11),                # #0D1117 — dark mode bg
+    foreground=ColorScale.of(210, 10, 85),                # Light text
+    card=ColorScale.of(215, 14, 14),                      # Slightly lighter card
+    card_foreground=ColorScale.of(210, 10, 85),
+    popover=ColorScale.of(215, 14, 14),
+    popover_foreground=ColorScale.of(210, 10, 85),
+    primary=ColorScale.of(212, 92, 55),                   # Primer blue — brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(215, 10, 16),                 # Dark panel
+    secondary_foreground=ColorScale.of(210, 10, 85),
+    muted=ColorScale.of(215, 10, 18),                     # Dark muted
+    muted_foreground=ColorScale.of(210, 10, 55),          # Muted text on dark
+    accent=ColorScale.of(215, 10, 16),                    # Dark hover surface
+    accent_foreground=ColorScale.of(210, 10, 85),
+    destructive=ColorScale.of(356, 72, 55),               # Red — brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(137, 66, 38),                   # Green — brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 100, 45),                   # Amber — brightened
+    warning_foreground=ColorScale.of(215, 14, 11),
+    info=ColorScale.of(212, 92, 55),                      # Primary
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(212, 92, 58),                      # Blue — brightened
+    link_hover=ColorScale.of(212, 92, 65),                # Lighter blue
+    code=ColorScale.of(215, 14, 11),                      # Dark code bg (same as bg)
+    code_foreground=ColorScale.of(210, 10, 85),           # Light code text
+    selection=ColorScale.of(212, 60, 25),                 # Deep blue selection
+    selection_foreground=ColorScale.of(210, 10, 85),
+    brand=ColorScale.of(261, 69, 65),                     # Purple — brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(215, 10, 22),                    # Dark border
+    input=ColorScale.of(215, 10, 22),
+    ring=ColorScale.of(212, 92, 55),                      # Blue focus ring
+    surface_1=ColorScale.of(215, 14, 8),                  # Deepest
+    surface_2=ColorScale.of(215, 14, 11),                 # Mid
+    surface_3=ColorScale.of(215, 14, 14),                 # Elevated
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(140, 40, 10),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(140, 40, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(140, 40, 10),
-    primary=ColorScale(142, 76, 36),
-    primary_foreground=ColorScale(138, 76, 97),
-    secondary=ColorScale(138, 30, 95),
-    secondary_foreground=ColorScale(140, 40, 10),
-    muted=ColorScale(138, 30, 95),
-    muted_foreground=ColorScale(140, 15, 38),
-    accent=ColorScale(138, 30, 95),
-    accent_foreground=ColorScale(140, 40, 10),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(142, 76, 40),
-    link_hover=ColorScale(142, 76, 32),
-    code=ColorScale(142, 20, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(142, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(142, 76, 36),
-    brand_foreground=ColorScale(138, 76, 97),
-    border=ColorScale(140, 20, 88),
-    input=ColorScale(140, 20, 88),
-    ring=ColorScale(142, 76, 36),
-    surface_1=ColorScale(140, 20, 98),
-    surface_2=ColorScale(140, 15, 96),
-    surface_3=ColorScale(140, 12, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(140, 40, 10),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(140, 40, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(140, 40, 10),
+    primary=ColorScale.of(142, 76, 36),
+    primary_foreground=ColorScale.of(138, 76, 97),
+    secondary=ColorScale.of(138, 30, 95),
+    secondary_foreground=ColorScale.of(140, 40, 10),
+    muted=ColorScale.of(138, 30, 95),
+    muted_foreground=ColorScale.of(140, 15, 38),
+    accent=ColorScale.of(138, 30, 95),
+    accent_foreground=ColorScale.of(140, 40, 10),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(142, 76, 40),
+    link_hover=ColorScale.of(142, 76, 32),
+    code=ColorScale.of(142, 20, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(142, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(142, 76, 36),
+    brand_foreground=ColorScale.of(138, 76, 97),
+    border=ColorScale.of(140, 20, 88),
+    input=ColorScale.of(140, 20, 88),
+    ring=ColorScale.of(142, 76, 36),
+    surface_1=ColorScale.of(140, 20, 98),
+    surface_2=ColorScale.of(140, 15, 96),
+    surface_3=ColorScale.of(140, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(140, 40, 8),
-    foreground=ColorScale(138, 76, 97),
-    card=ColorScale(140, 40, 8),
-    card_foreground=ColorScale(138, 76, 97),
-    popover=ColorScale(140, 40, 8),
-    popover_foreground=ColorScale(138, 76, 97),
-    primary=ColorScale(142, 69, 45),
-    primary_foreground=ColorScale(140, 40, 8),
-    secondary=ColorScale(140, 30, 16),
-    secondary_foreground=ColorScale(138, 76, 97),
-    muted=ColorScale(140, 30, 16),
-    muted_foreground=ColorScale(140, 15, 85),
-    accent=ColorScale(140, 30, 16),
-    accent_foreground=ColorScale(138, 76, 97),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(142, 69, 45),
-    link_hover=ColorScale(142, 69, 55),
-    code=ColorScale(142, 30, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(142, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(142, 69, 45),
-    brand_foreground=ColorScale(140, 40, 8),
-    border=ColorScale(140, 30, 16),
-    input=ColorScale(140, 30, 16),
-    ring=ColorScale(142, 69, 45),
-    surface_1=ColorScale(140, 20, 4),
-    surface_2=ColorScale(140, 15, 7),
-    surface_3=ColorScale(140, 12, 11),
+    background=ColorScale.of(140, 40, 8),
+    foreground=ColorScale.of(138, 76, 97),
+    card=ColorScale.of(140, 40, 8),
+    card_foreground=ColorScale.of(138, 76, 97),
+    popover=ColorScale.of(140, 40, 8),
+    popover_foreground=ColorScale.of(138, 76, 97),
+    primary=ColorScale.of(142, 69, 45),
+    primary_foreground=ColorScale.of(140, 40, 8),
+    secondary=ColorScale.of(140, 30, 16),
+    secondary_foreground=ColorScale.of(138, 76, 97),
+    muted=ColorScale.of(140, 30, 16),
+    muted_foreground=ColorScale.of(140, 15, 85),
+    accent=ColorScale.of(140, 30, 16),
+    accent_foreground=ColorScale.of(138, 76, 97),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(142, 69, 45),
+    link_hover=ColorScale.of(142, 69, 55),
+    code=ColorScale.of(142, 30, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(142, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(142, 69, 45),
+    brand_foreground=ColorScale.of(140, 40, 8),
+    border=ColorScale.of(140, 30, 16),
+    input=ColorScale.of(140, 30, 16),
+    ring=ColorScale.of(142, 69, 45),
+    surface_1=ColorScale.of(140, 20, 4),
+    surface_2=ColorScale.of(140, 15, 7),
+    surface_3=ColorScale.of(140, 12, 11),
 )
 
 PRESET = ThemePreset(
@@ -20,81 +20,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(44, 87, 94),
-    foreground=ColorScale(0, 0, 16),
-    card=ColorScale(47, 80, 90),
-    card_foreground=ColorScale(0, 0, 16),
-    popover=ColorScale(47, 80, 90),
-    popover_foreground=ColorScale(0, 0, 16),
-    primary=ColorScale(27, 99, 55),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(44, 70, 85),
-    secondary_foreground=ColorScale(0, 0, 16),
-    muted=ColorScale(44, 70, 85),
-    muted_foreground=ColorScale(24, 12, 45),
-    accent=ColorScale(175, 42, 52),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(6, 96, 59),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(106, 33, 51),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 73, 49),
-    warning_foreground=ColorScale(0, 0, 100),
-    info=ColorScale(175, 42, 52),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(27, 99, 55),
-    link_hover=ColorScale(27, 99, 45),
-    code=ColorScale(44, 70, 85),
-    code_foreground=ColorScale(6, 96, 59),
-    selection=ColorScale(27, 80, 85),
-    selection_foreground=ColorScale(27, 10, 15),
-    brand=ColorScale(27, 99, 55),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(40, 30, 75),
-    input=ColorScale(40, 30, 75),
-    ring=ColorScale(27, 99, 55),
-    surface_1=ColorScale(27, 5, 96),
-    surface_2=ColorScale(27, 5, 93),
-    surface_3=ColorScale(27, 5, 90),
+    background=ColorScale.of(44, 87, 94),
+    foreground=ColorScale.of(0, 0, 16),
+    card=ColorScale.of(47, 80, 90),
+    card_foreground=ColorScale.of(0, 0, 16),
+    popover=ColorScale.of(47, 80, 90),
+    popover_foreground=ColorScale.of(0, 0, 16),
+    primary=ColorScale.of(27, 99, 55),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(44, 70, 85),
+    secondary_foreground=ColorScale.of(0, 0, 16),
+    muted=ColorScale.of(44, 70, 85),
+    muted_foreground=ColorScale.of(24, 12, 45),
+    accent=ColorScale.of(175, 42, 52),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(6, 96, 59),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(106, 33, 51),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 73, 49),
+    warning_foreground=ColorScale.of(0, 0, 100),
+    info=ColorScale.of(175, 42, 52),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(27, 99, 55),
+    link_hover=ColorScale.of(27, 99, 45),
+    code=ColorScale.of(44, 70, 85),
+    code_foreground=ColorScale.of(6, 96, 59),
+    selection=ColorScale.of(27, 80, 85),
+    selection_foreground=ColorScale.of(27, 10, 15),
+    brand=ColorScale.of(27, 99, 55),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(40, 30, 75),
+    input=ColorScale.of(40, 30, 75),
+    ring=ColorScale.of(27, 99, 55),
+    surface_1=ColorScale.of(27, 5, 96),
+    surface_2=ColorScale.of(27, 5, 93),
+    surface_3=ColorScale.of(27, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 16),
-    foreground=ColorScale(42, 46, 82),
-    card=ColorScale(20, 5, 20),
-    card_foreground=ColorScale(42, 46, 82),
-    popover=ColorScale(20, 5, 20),
-    popover_foreground=ColorScale(42, 46, 82),
-    primary=ColorScale(27, 99, 55),
-    primary_foreground=ColorScale(0, 0, 16),
-    secondary=ColorScale(20, 5, 24),
-    secondary_foreground=ColorScale(42, 46, 82),
-    muted=ColorScale(20, 5, 24),
-    muted_foreground=ColorScale(30, 12, 55),
-    accent=ColorScale(175, 42, 63),
-    accent_foreground=ColorScale(0, 0, 16),
-    destructive=ColorScale(6, 96, 59),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(106, 33, 62),
-    success_foreground=ColorScale(0, 0, 16),
-    warning=ColorScale(40, 73, 49),
-    warning_foreground=ColorScale(0, 0, 16),
-    info=ColorScale(175, 42, 63),
-    info_foreground=ColorScale(0, 0, 16),
-    link=ColorScale(27, 99, 55),
-    link_hover=ColorScale(40, 73, 60),
-    code=ColorScale(20, 5, 22),
-    code_foreground=ColorScale(106, 33, 62),
-    selection=ColorScale(27, 80, 25),
-    selection_foreground=ColorScale(27, 10, 90),
-    brand=ColorScale(27, 99, 55),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(20, 5, 28),
-    input=ColorScale(20, 5, 28),
-    ring=ColorScale(27, 99, 55),
-    surface_1=ColorScale(27, 5, 6),
-    surface_2=ColorScale(27, 5, 10),
-    surface_3=ColorScale(27, 5, 14),
+    background=ColorScale.of(0, 0, 16),
+    foreground=ColorScale.of(42, 46, 82),
+    card=ColorScale.of(20, 5, 20),
+    card_foreground=ColorScale.of(42, 46, 82),
+    popover=ColorScale.of(20, 5, 20),
+    popover_foreground=ColorScale.of(42, 46, 82),
+    primary=ColorScale.of(27, 99, 55),
+    primary_foreground=ColorScale.of(0, 0, 16),
+    secondary=ColorScale.of(20, 5, 24),
+    secondary_foreground=ColorScale.of(42, 46, 82),
+    muted=ColorScale.of(20, 5, 24),
+    muted_foreground=ColorScale.of(30, 12, 55),
+    accent=ColorScale.of(175, 42, 63),
+    accent_foreground=ColorScale.of(0, 0, 16),
+    destructive=ColorScale.of(6, 96, 59),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(106, 33, 62),
+    success_foreground=ColorScale.of(0, 0, 16),
+    warning=ColorScale.of(40, 73, 49),
+    warning_foreground=ColorScale.of(0, 0, 16),
+    info=ColorScale.of(175, 42, 63),
+    info_foreground=ColorScale.of(0, 0, 16),
+    link=ColorScale.of(27, 99, 55),
+    link_hover=ColorScale.of(40, 73, 60),
+    code=ColorScale.of(20, 5, 22),
+    code_foreground=ColorScale.of(106, 33, 62),
+    selection=ColorScale.of(27, 80, 25),
+    selection_foreground=ColorScale.of(27, 10, 90),
+    brand=ColorScale.of(27, 99, 55),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(20, 5, 28),
+    input=ColorScale.of(20, 5, 28),
+    ring=ColorScale.of(27, 99, 55),
+    surface_1=ColorScale.of(27, 5, 6),
+    surface_2=ColorScale.of(27, 5, 10),
+    surface_3=ColorScale.of(27, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -16,81 +16,81 @@ from ._base import (
 # mustard warning, slate blue info. Everything warm, nothing cold.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(33, 47, 96),             # #FAF6F1 — linen
-    foreground=ColorScale(27, 20, 20),             # #3D3229 — clay brown text
-    card=ColorScale(0, 0, 100),                    # White cards (clean canvas)
-    card_foreground=ColorScale(27, 20, 20),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(27, 20, 20),
-    primary=ColorScale(13, 51, 53),                # #C4654A — terracotta
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(36, 38, 92),              # #F3EDE4 — parchment
-    secondary_foreground=ColorScale(27, 20, 20),
-    muted=ColorScale(36, 30, 90),                  # Warm muted
-    muted_foreground=ColorScale(30, 9, 48),        # Warm gray text
-    accent=ColorScale(36, 30, 94),                 # Warm hover surface
-    accent_foreground=ColorScale(27, 20, 20),
-    destructive=ColorScale(0, 55, 50),             # Warm red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(127, 16, 55),               # #7A9E7E — sage green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 63, 55),                # #D4A843 — mustard
-    warning_foreground=ColorScale(27, 20, 20),
-    info=ColorScale(206, 24, 53),                  # #6B8BA4 — slate blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(13, 51, 48),                   # Darker terracotta links
-    link_hover=ColorScale(13, 51, 38),             # Deep terracotta hover
-    code=ColorScale(33, 27, 13),                   # Dark earth code bg
-    code_foreground=ColorScale(42, 63, 65),        # Mustard code text
-    selection=ColorScale(42, 63, 85),              # Pale mustard selection
-    selection_foreground=ColorScale(27, 20, 20),
-    brand=ColorScale(127, 16, 55),                 # Sage green — the craft/nature identity
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(33, 21, 81),                 # #D9D0C5 — earth border
-    input=ColorScale(36, 25, 92),                  # Light parchment input
-    ring=ColorScale(13, 51, 53),                   # Terracotta focus ring
-    surface_1=ColorScale(33, 47, 96),              # Linen
-    surface_2=ColorScale(36, 38, 93),              # Parchment
-    surface_3=ColorScale(36, 30, 90),              # Deeper parchment
+    background=ColorScale.of(33, 47, 96),             # #FAF6F1 — linen
+    foreground=ColorScale.of(27, 20, 20),             # #3D3229 — clay brown text
+    card=ColorScale.of(0, 0, 100),                    # White cards (clean canvas)
+    card_foreground=ColorScale.of(27, 20, 20),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(27, 20, 20),
+    primary=ColorScale.of(13, 51, 53),                # #C4654A — terracotta
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(36, 38, 92),              # #F3EDE4 — parchment
+    secondary_foreground=ColorScale.of(27, 20, 20),
+    muted=ColorScale.of(36, 30, 90),                  # Warm muted
+    muted_foreground=ColorScale.of(30, 9, 48),        # Warm gray text
+    accent=ColorScale.of(36, 30, 94),                 # Warm hover surface
+    accent_foreground=ColorScale.of(27, 20, 20),
+    destructive=ColorScale.of(0, 55, 50),             # Warm red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(127, 16, 55),               # #7A9E7E — sage green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 63, 55),                # #D4A843 — mustard
+    warning_foreground=ColorScale.of(27, 20, 20),
+    info=ColorScale.of(206, 24, 53),                  # #6B8BA4 — slate blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(13, 51, 48),                   # Darker terracotta links
+    link_hover=ColorScale.of(13, 51, 38),             # Deep terracotta hover
+    code=ColorScale.of(33, 27, 13),                   # Dark earth code bg
+    code_foreground=ColorScale.of(42, 63, 65),        # Mustard code text
+    selection=ColorScale.of(42, 63, 85),              # Pale mustard selection
+    selection_foreground=ColorScale.of(27, 20, 20),
+    brand=ColorScale.of(127, 16, 55),                 # Sage green — the craft/nature identity
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(33, 21, 81),                 # #D9D0C5 — earth border
+    input=ColorScale.of(36, 25, 92),                  # Light parchment input
+    ring=ColorScale.of(13, 51, 53),                   # Terracotta focus ring
+    surface_1=ColorScale.of(33, 47, 96),              # Linen
+    surface_2=ColorScale.of(36, 38, 93),              # Parchment
+    surface_3=ColorScale.of(36, 30, 90),              # Deeper parchment
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(33, 27, 13),             # #2A2218 — dark earth
-    foreground=ColorScale(36, 38, 92),             # #F3EDE4 — parchment text
-    card=ColorScale(33, 22, 17),                   # Slightly lighter earth
-    card_foreground=ColorScale(36, 38, 92),
-    popover=ColorScale(33, 22, 17),
-    popover_foreground=ColorScale(36, 38, 92),
-    primary=ColorScale(13, 51, 58),                # Terracotta — brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(33, 18, 20),              # Dark earth panel
-    secondary_foreground=ColorScale(36, 38, 92),
-    muted=ColorScale(33, 15, 22),
-    muted_foreground=ColorScale(30, 9, 58),        # Warm gray
-    accent=ColorScale(33, 15, 20),                 # Dark hover
-    accent_foreground=ColorScale(36, 38, 92),
-    destructive=ColorScale(0, 55, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(127, 16, 60),               # Sage — brightened
-    success_foreground=ColorScale(33, 27, 13),
-    warning=ColorScale(42, 63, 60),                # Mustard — brightened
-    warning_foreground=ColorScale(33, 27, 13),
-    info=ColorScale(206, 24, 60),                  # Slate blue — brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(13, 51, 63),                   # Terracotta — bright on dark
-    link_hover=ColorScale(13, 51, 73),
-    code=ColorScale(33, 30, 9),                    # Deepest earth
-    code_foreground=ColorScale(127, 16, 65),       # Sage code text
-    selection=ColorScale(42, 50, 25),              # Dark mustard selection
-    selection_foreground=ColorScale(36, 38, 92),
-    brand=ColorScale(127, 16, 60),                 # Sage — brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(33, 15, 25),                 # Dark border
-    input=ColorScale(33, 15, 22),
-    ring=ColorScale(13, 51, 58),
-    surface_1=ColorScale(33, 30, 9),               # Deepest
-    surface_2=ColorScale(33, 27, 13),              # Dark earth
-    surface_3=ColorScale(33, 22, 17),              # Panel
+    background=ColorScale.of(33, 27, 13),             # #2A2218 — dark earth
+    foreground=ColorScale.of(36, 38, 92),             # #F3EDE4 — parchment text
+    card=ColorScale.of(33, 22, 17),                   # Slightly lighter earth
+    card_foreground=ColorScale.of(36, 38, 92),
+    popover=ColorScale.of(33, 22, 17),
+    popover_foreground=ColorScale.of(36, 38, 92),
+    primary=ColorScale.of(13, 51, 58),                # Terracotta — brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(33, 18, 20),              # Dark earth panel
+    secondary_foreground=ColorScale.of(36, 38, 92),
+    muted=ColorScale.of(33, 15, 22),
+    muted_foreground=ColorScale.of(30, 9, 58),        # Warm gray
+    accent=ColorScale.of(33, 15, 20),                 # Dark hover
+    accent_foreground=ColorScale.of(36, 38, 92),
+    destructive=ColorScale.of(0, 55, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(127, 16, 60),               # Sage — brightened
+    success_foreground=ColorScale.of(33, 27, 13),
+    warning=ColorScale.of(42, 63, 60),                # Mustard — brightened
+    warning_foreground=ColorScale.of(33, 27, 13),
+    info=ColorScale.of(206, 24, 60),                  # Slate blue — brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(13, 51, 63),                   # Terracotta — bright on dark
+    link_hover=ColorScale.of(13, 51, 73),
+    code=ColorScale.of(33, 30, 9),                    # Deepest earth
+    code_foreground=ColorScale.of(127, 16, 65),       # Sage code text
+    selection=ColorScale.of(42, 50, 25),              # Dark mustard selection
+    selection_foreground=ColorScale.of(36, 38, 92),
+    brand=ColorScale.of(127, 16, 60),                 # Sage — brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(33, 15, 25),                 # Dark border
+    input=ColorScale.of(33, 15, 22),
+    ring=ColorScale.of(13, 51, 58),
+    surface_1=ColorScale.of(33, 30, 9),               # Deepest
+    surface_2=ColorScale.of(33, 27, 13),              # Dark earth
+    surface_3=ColorScale.of(33, 22, 17),              # Panel
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(0, 0, 0),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(0, 0, 0),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 0),
-    primary=ColorScale(220, 100, 40),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 95),
-    secondary_foreground=ColorScale(0, 0, 0),
-    muted=ColorScale(0, 0, 95),
-    muted_foreground=ColorScale(0, 0, 30),
-    accent=ColorScale(0, 0, 90),
-    accent_foreground=ColorScale(0, 0, 0),
-    destructive=ColorScale(0, 100, 40),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 100, 25),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 100, 40),
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(220, 100, 40),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(220, 100, 35),
-    link_hover=ColorScale(220, 100, 25),
-    code=ColorScale(0, 0, 93),
-    code_foreground=ColorScale(0, 100, 40),
-    selection=ColorScale(220, 80, 85),
-    selection_foreground=ColorScale(220, 10, 15),
-    brand=ColorScale(220, 100, 40),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 0),
-    input=ColorScale(0, 0, 0),
-    ring=ColorScale(220, 100, 40),
-    surface_1=ColorScale(220, 5, 96),
-    surface_2=ColorScale(220, 5, 93),
-    surface_3=ColorScale(220, 5, 90),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(0, 0, 0),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(0, 0, 0),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 0),
+    primary=ColorScale.of(220, 100, 40),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 95),
+    secondary_foreground=ColorScale.of(0, 0, 0),
+    muted=ColorScale.of(0, 0, 95),
+    muted_foreground=ColorScale.of(0, 0, 30),
+    accent=ColorScale.of(0, 0, 90),
+    accent_foreground=ColorScale.of(0, 0, 0),
+    destructive=ColorScale.of(0, 100, 40),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 100, 25),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 100, 40),
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(220, 100, 40),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(220, 100, 35),
+    link_hover=ColorScale.of(220, 100, 25),
+    code=ColorScale.of(0, 0, 93),
+    code_foreground=ColorScale.of(0, 100, 40),
+    selection=ColorScale.of(220, 80, 85),
+    selection_foreground=ColorScale.of(220, 10, 15),
+    brand=ColorScale.of(220, 100, 40),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 0),
+    input=ColorScale.of(0, 0, 0),
+    ring=ColorScale.of(220, 100, 40),
+    surface_1=ColorScale.of(220, 5, 96),
+    surface_2=ColorScale.of(220, 5, 93),
+    surface_3=ColorScale.of(220, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 0),
-    foreground=ColorScale(0, 0, 100),
-    card=ColorScale(0, 0, 5),
-    card_foreground=ColorScale(0, 0, 100),
-    popover=ColorScale(0, 0, 5),
-    popover_foreground=ColorScale(0, 0, 100),
-    primary=ColorScale(210, 100, 60),
-    primary_foreground=ColorScale(0, 0, 0),
-    secondary=ColorScale(0, 0, 12),
-    secondary_foreground=ColorScale(0, 0, 100),
-    muted=ColorScale(0, 0, 12),
-    muted_foreground=ColorScale(0, 0, 70),
-    accent=ColorScale(0, 0, 15),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 100, 55),
-    destructive_foreground=ColorScale(0, 0, 0),
-    success=ColorScale(120, 100, 45),
-    success_foreground=ColorScale(0, 0, 0),
-    warning=ColorScale(45, 100, 50),
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(210, 100, 60),
-    info_foreground=ColorScale(0, 0, 0),
-    link=ColorScale(210, 100, 65),
-    link_hover=ColorScale(210, 100, 80),
-    code=ColorScale(0, 0, 10),
-    code_foreground=ColorScale(120, 100, 50),
-    selection=ColorScale(210, 80, 25),
-    selection_foreground=ColorScale(210, 10, 90),
-    brand=ColorScale(210, 100, 60),
-    brand_foreground=ColorScale(0, 0, 0),
-    border=ColorScale(0, 0, 100),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(210, 100, 60),
-    surface_1=ColorScale(210, 5, 6),
-    surface_2=ColorScale(210, 5, 10),
-    surface_3=ColorScale(210, 5, 14),
+    background=ColorScale.of(0, 0, 0),
+    foreground=ColorScale.of(0, 0, 100),
+    card=ColorScale.of(0, 0, 5),
+    card_foreground=ColorScale.of(0, 0, 100),
+    popover=ColorScale.of(0, 0, 5),
+    popover_foreground=ColorScale.of(0, 0, 100),
+    primary=ColorScale.of(210, 100, 60),
+    primary_foreground=ColorScale.of(0, 0, 0),
+    secondary=ColorScale.of(0, 0, 12),
+    secondary_foreground=ColorScale.of(0, 0, 100),
+    muted=ColorScale.of(0, 0, 12),
+    muted_foreground=ColorScale.of(0, 0, 70),
+    accent=ColorScale.of(0, 0, 15),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 100, 55),
+    destructive_foreground=ColorScale.of(0, 0, 0),
+    success=ColorScale.of(120, 100, 45),
+    success_foreground=ColorScale.of(0, 0, 0),
+    warning=ColorScale.of(45, 100, 50),
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(210, 100, 60),
+    info_foreground=ColorScale.of(0, 0, 0),
+    link=ColorScale.of(210, 100, 65),
+    link_hover=ColorScale.of(210, 100, 80),
+    code=ColorScale.of(0, 0, 10),
+    code_foreground=ColorScale.of(120, 100, 50),
+    selection=ColorScale.of(210, 80, 25),
+    selection_foreground=ColorScale.of(210, 10, 90),
+    brand=ColorScale.of(210, 100, 60),
+    brand_foreground=ColorScale.of(0, 0, 0),
+    border=ColorScale.of(0, 0, 100),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(210, 100, 60),
+    surface_1=ColorScale.of(210, 5, 6),
+    surface_2=ColorScale.of(210, 5, 10),
+    surface_3=ColorScale.of(210, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -19,82 +19,82 @@ from ._base import (
 # - No decoration, no gradients, no glow — just ink on paper.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(220, 15, 97),            # Washi paper — cool off-white, NOT warm
-    foreground=ColorScale(220, 20, 12),            # Sumi ink — blue-black, deep
-    card=ColorScale(220, 10, 99),                  # Slightly brighter washi
-    card_foreground=ColorScale(220, 20, 12),
-    popover=ColorScale(220, 10, 99),
-    popover_foreground=ColorScale(220, 20, 12),
-    primary=ColorScale(8, 85, 48),                 # 朱 Vermillion — traditional seal red
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 8, 93),              # Pale washi
-    secondary_foreground=ColorScale(220, 20, 12),
-    muted=ColorScale(220, 8, 91),
-    muted_foreground=ColorScale(220, 10, 45),      # Diluted ink
-    accent=ColorScale(220, 8, 95),                 # Subtle hover — barely there
-    accent_foreground=ColorScale(220, 20, 12),
-    destructive=ColorScale(8, 85, 48),             # Vermillion doubles as destructive
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 25, 40),               # Muted pine green — subdued like nature
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 50, 50),                # Muted ochre — earthy, not bright
-    warning_foreground=ColorScale(220, 20, 12),
-    info=ColorScale(220, 20, 35),                  # Deep ink-blue — informational
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(8, 85, 43),                    # Darker vermillion — links are deliberate marks
-    link_hover=ColorScale(8, 85, 33),              # Deeper on hover — ink pressed harder
-    code=ColorScale(220, 20, 12),                  # Sumi ink code bg — full darkness
-    code_foreground=ColorScale(8, 85, 60),         # Vermillion code text
-    selection=ColorScale(8, 60, 88),               # Pale vermillion wash — like diluted ink
-    selection_foreground=ColorScale(220, 20, 12),
-    brand=ColorScale(8, 85, 48),                   # Vermillion IS the brand — the hanko seal
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 10, 82),                # Light ink wash border
-    input=ColorScale(220, 8, 95),                  # Near-paper input bg
-    ring=ColorScale(8, 85, 48),                    # Vermillion focus
-    surface_1=ColorScale(220, 15, 97),             # Washi base
-    surface_2=ColorScale(220, 10, 94),             # Slightly deeper
-    surface_3=ColorScale(220, 8, 91),              # Deepest washi
+    background=ColorScale.of(220, 15, 97),            # Washi paper — cool off-white, NOT warm
+    foreground=ColorScale.of(220, 20, 12),            # Sumi ink — blue-black, deep
+    card=ColorScale.of(220, 10, 99),                  # Slightly brighter washi
+    card_foreground=ColorScale.of(220, 20, 12),
+    popover=ColorScale.of(220, 10, 99),
+    popover_foreground=ColorScale.of(220, 20, 12),
+    primary=ColorScale.of(8, 85, 48),                 # 朱 Vermillion — traditional seal red
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 8, 93),              # Pale washi
+    secondary_foreground=ColorScale.of(220, 20, 12),
+    muted=ColorScale.of(220, 8, 91),
+    muted_foreground=ColorScale.of(220, 10, 45),      # Diluted ink
+    accent=ColorScale.of(220, 8, 95),                 # Subtle hover — barely there
+    accent_foreground=ColorScale.of(220, 20, 12),
+    destructive=ColorScale.of(8, 85, 48),             # Vermillion doubles as destructive
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 25, 40),               # Muted pine green — subdued like nature
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 50, 50),                # Muted ochre — earthy, not bright
+    warning_foreground=ColorScale.of(220, 20, 12),
+    info=ColorScale.of(220, 20, 35),                  # Deep ink-blue — informational
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(8, 85, 43),                    # Darker vermillion — links are deliberate marks
+    link_hover=ColorScale.of(8, 85, 33),              # Deeper on hover — ink pressed harder
+    code=ColorScale.of(220, 20, 12),                  # Sumi ink code bg — full darkness
+    code_foreground=ColorScale.of(8, 85, 60),         # Vermillion code text
+    selection=ColorScale.of(8, 60, 88),               # Pale vermillion wash — like diluted ink
+    selection_foreground=ColorScale.of(220, 20, 12),
+    brand=ColorScale.of(8, 85, 48),                   # Vermillion IS the brand — the hanko seal
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 10, 82),                # Light ink wash border
+    input=ColorScale.of(220, 8, 95),                  # Near-paper input bg
+    ring=ColorScale.of(8, 85, 48),                    # Vermillion focus
+    surface_1=ColorScale.of(220, 15, 97),             # Washi base
+    surface_2=ColorScale.of(220, 10, 94),             # Slightly deeper
+    surface_3=ColorScale.of(220, 8, 91),              # Deepest washi
 )
 
 DARK = ThemeTokens(
     # Dark mode: ink-soaked paper — deep blue-black with pale ink text
-    background=ColorScale(220, 25, 7),             # Deep sumi — nearly black with blue
-    foreground=ColorScale(220, 10, 80),            # Worn ink on dark paper
-    card=ColorScale(220, 20, 10),
-    card_foreground=ColorScale(220, 10, 80),
-    popover=ColorScale(220, 20, 10),
-    popover_foreground=ColorScale(220, 10, 80),
-    primary=ColorScale(8, 85, 55),                 # Vermillion — brightened for dark
-    primary_foreground=ColorScale(220, 25, 7),
-    secondary=ColorScale(220, 18, 12),
-    secondary_foreground=ColorScale(220, 10, 80),
-    muted=ColorScale(220, 15, 14),
-    muted_foreground=ColorScale(220, 8, 50),       # Faded ink
-    accent=ColorScale(220, 15, 12),                # Barely visible hover
-    accent_foreground=ColorScale(220, 10, 80),
-    destructive=ColorScale(8, 85, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 25, 50),
-    success_foreground=ColorScale(220, 25, 7),
-    warning=ColorScale(45, 50, 55),
-    warning_foreground=ColorScale(220, 25, 7),
-    info=ColorScale(220, 20, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(8, 85, 58),
-    link_hover=ColorScale(8, 85, 68),
-    code=ColorScale(220, 30, 5),                   # Deepest ink
-    code_foreground=ColorScale(8, 85, 60),         # Vermillion
-    selection=ColorScale(8, 60, 20),               # Dark vermillion wash
-    selection_foreground=ColorScale(220, 10, 85),
-    brand=ColorScale(8, 85, 55),
-    brand_foreground=ColorScale(220, 25, 7),
-    border=ColorScale(220, 15, 18),
-    input=ColorScale(220, 15, 12),
-    ring=ColorScale(8, 85, 55),
-    surface_1=ColorScale(220, 30, 4),              # Deepest
-    surface_2=ColorScale(220, 25, 7),              # Sumi black
-    surface_3=ColorScale(220, 20, 10),             # Raised
+    background=ColorScale.of(220, 25, 7),             # Deep sumi — nearly black with blue
+    foreground=ColorScale.of(220, 10, 80),            # Worn ink on dark paper
+    card=ColorScale.of(220, 20, 10),
+    card_foreground=ColorScale.of(220, 10, 80),
+    popover=ColorScale.of(220, 20, 10),
+    popover_foreground=ColorScale.of(220, 10, 80),
+    primary=ColorScale.of(8, 85, 55),                 # Vermillion — brightened for dark
+    primary_foreground=ColorScale.of(220, 25, 7),
+    secondary=ColorScale.of(220, 18, 12),
+    secondary_foreground=ColorScale.of(220, 10, 80),
+    muted=ColorScale.of(220, 15, 14),
+    muted_foreground=ColorScale.of(220, 8, 50),       # Faded ink
+    accent=ColorScale.of(220, 15, 12),                # Barely visible hover
+    accent_foreground=ColorScale.of(220, 10, 80),
+    destructive=ColorScale.of(8, 85, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 25, 50),
+    success_foreground=ColorScale.of(220, 25, 7),
+    warning=ColorScale.of(45, 50, 55),
+    warning_foreground=ColorScale.of(220, 25, 7),
+    info=ColorScale.of(220, 20, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(8, 85, 58),
+    link_hover=ColorScale.of(8, 85, 68),
+    code=ColorScale.of(220, 30, 5),                   # Deepest ink
+    code_foreground=ColorScale.of(8, 85, 60),         # Vermillion
+    selection=ColorScale.of(8, 60, 20),               # Dark vermillion wash
+    selection_foreground=ColorScale.of(220, 10, 85),
+    brand=ColorScale.of(8, 85, 55),
+    brand_foreground=ColorScale.of(220, 25, 7),
+    border=ColorScale.of(220, 15, 18),
+    input=ColorScale.of(220, 15, 12),
+    ring=ColorScale.of(8, 85, 55),
+    surface_1=ColorScale.of(220, 30, 4),              # Deepest
+    surface_2=ColorScale.of(220, 25, 7),              # Sumi black
+    surface_3=ColorScale.of(220, 20, 10),             # Raised
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # - peachRed #ff5d62, waveAqua #7aa89f
 
 LIGHT = ThemeTokens(
-    background=ColorScale(45, 30, 96),                 # Warm cream bg
-    foreground=ColorScale(240, 13, 14),                # Near-black fg
-    card=ColorScale(45, 25, 98),
-    card_foreground=ColorScale(240, 13, 14),
-    popover=ColorScale(45, 25, 98),
-    popover_foreground=ColorScale(240, 13, 14),
-    primary=ColorScale(220, 54, 67),                   # crystalBlue
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(45, 20, 93),
-    secondary_foreground=ColorScale(240, 13, 14),
-    muted=ColorScale(45, 15, 88),
-    muted_foreground=ColorScale(240, 10, 45),
-    accent=ColorScale(45, 20, 93),                     # Subtle warm hover
-    accent_foreground=ColorScale(240, 13, 14),
-    destructive=ColorScale(359, 52, 51),               # peachRed muted
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(103, 17, 50),                   # springGreen muted
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(39, 39, 59),                    # carpYellow muted
-    warning_foreground=ColorScale(240, 13, 14),
-    info=ColorScale(163, 17, 50),                      # waveAqua
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(220, 54, 67),                      # crystalBlue
-    link_hover=ColorScale(220, 54, 55),
-    code=ColorScale(240, 13, 14),                      # Dark code bg
-    code_foreground=ColorScale(51, 33, 80),            # fujiWhite
-    selection=ColorScale(220, 40, 88),                 # Pale blue selection
-    selection_foreground=ColorScale(240, 13, 14),
-    brand=ColorScale(263, 29, 61),                     # oniViolet
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(45, 15, 85),
-    input=ColorScale(45, 15, 91),
-    ring=ColorScale(220, 54, 67),
-    surface_1=ColorScale(45, 30, 96),
-    surface_2=ColorScale(45, 22, 93),
-    surface_3=ColorScale(45, 15, 90),
+    background=ColorScale.of(45, 30, 96),                 # Warm cream bg
+    foreground=ColorScale.of(240, 13, 14),                # Near-black fg
+    card=ColorScale.of(45, 25, 98),
+    card_foreground=ColorScale.of(240, 13, 14),
+    popover=ColorScale.of(45, 25, 98),
+    popover_foreground=ColorScale.of(240, 13, 14),
+    primary=ColorScale.of(220, 54, 67),                   # crystalBlue
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(45, 20, 93),
+    secondary_foreground=ColorScale.of(240, 13, 14),
+    muted=ColorScale.of(45, 15, 88),
+    muted_foreground=ColorScale.of(240, 10, 45),
+    accent=ColorScale.of(45, 20, 93),                     # Subtle warm hover
+    accent_foreground=ColorScale.of(240, 13, 14),
+    destructive=ColorScale.of(359, 52, 51),               # peachRed muted
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(103, 17, 50),                   # springGreen muted
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(39, 39, 59),                    # carpYellow muted
+    warning_foreground=ColorScale.of(240, 13, 14),
+    info=ColorScale.of(163, 17, 50),                      # waveAqua
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(220, 54, 67),                      # crystalBlue
+    link_hover=ColorScale.of(220, 54, 55),
+    code=ColorScale.of(240, 13, 14),                      # Dark code bg
+    code_foreground=ColorScale.of(51, 33, 80),            # fujiWhite
+    selection=ColorScale.of(220, 40, 88),                 # Pale blue selection
+    selection_foreground=ColorScale.of(240, 13, 14),
+    brand=ColorScale.of(263, 29, 61),                     # oniViolet
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(45, 15, 85),
+    input=ColorScale.of(45, 15, 91),
+    ring=ColorScale.of(220, 54, 67),
+    surface_1=ColorScale.of(45, 30, 96),
+    surface_2=ColorScale.of(45, 22, 93),
+    surface_3=ColorScale.of(45, 15, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 13, 14),                # #1f1f28 sumiInk1
-    foreground=ColorScale(51, 33, 80),                 # #dcd7ba fujiWhite
-    card=ColorScale(240, 12, 18),
-    card_foreground=ColorScale(51, 33, 80),
-    popover=ColorScale(240, 12, 18),
-    popover_foreground=ColorScale(51, 33, 80),
-    primary=ColorScale(220, 54, 67),                   # crystalBlue #7e9cd8
-    primary_foreground=ColorScale(240, 13, 14),
-    secondary=ColorScale(240, 12, 21),
-    secondary_foreground=ColorScale(51, 33, 80),
-    muted=ColorScale(240, 10, 24),
-    muted_foreground=ColorScale(240, 10, 45),
-    accent=ColorScale(240, 12, 21),                    # Subtle dark hover
-    accent_foreground=ColorScale(51, 33, 80),
-    destructive=ColorScale(359, 52, 51),               # peachRed
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(103, 17, 50),                   # springGreen
-    success_foreground=ColorScale(240, 13, 14),
-    warning=ColorScale(39, 39, 59),                    # carpYellow
-    warning_foreground=ColorScale(240, 13, 14),
-    info=ColorScale(163, 17, 50),                      # waveAqua
-    info_foreground=ColorScale(240, 13, 14),
-    link=ColorScale(220, 54, 67),                      # crystalBlue
-    link_hover=ColorScale(220, 54, 76),
-    code=ColorScale(215, 36, 21),                      # waveBlue1 #223249
-    code_foreground=ColorScale(51, 33, 80),            # fujiWhite
-    selection=ColorScale(220, 40, 24),                 # Deep blue selection
-    selection_foreground=ColorScale(51, 33, 85),
-    brand=ColorScale(263, 29, 61),                     # oniViolet
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(240, 10, 26),
-    input=ColorScale(240, 10, 26),
-    ring=ColorScale(220, 54, 67),
-    surface_1=ColorScale(240, 13, 10),                 # sumiInk0
-    surface_2=ColorScale(240, 13, 14),                 # sumiInk1
-    surface_3=ColorScale(240, 12, 18),                 # sumiInk2
+    background=ColorScale.of(240, 13, 14),                # #1f1f28 sumiInk1
+    foreground=ColorScale.of(51, 33, 80),                 # #dcd7ba fujiWhite
+    card=ColorScale.of(240, 12, 18),
+    card_foreground=ColorScale.of(51, 33, 80),
+    popover=ColorScale.of(240, 12, 18),
+    popover_foreground=ColorScale.of(51, 33, 80),
+    primary=ColorScale.of(220, 54, 67),                   # crystalBlue #7e9cd8
+    primary_foreground=ColorScale.of(240, 13, 14),
+    secondary=ColorScale.of(240, 12, 21),
+    secondary_foreground=ColorScale.of(51, 33, 80),
+    muted=ColorScale.of(240, 10, 24),
+    muted_foreground=ColorScale.of(240, 10, 45),
+    accent=ColorScale.of(240, 12, 21),                    # Subtle dark hover
+    accent_foreground=ColorScale.of(51, 33, 80),
+    destructive=ColorScale.of(359, 52, 51),               # peachRed
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(103, 17, 50),                   # springGreen
+    success_foreground=ColorScale.of(240, 13, 14),
+    warning=ColorScale.of(39, 39, 59),                    # carpYellow
+    warning_foreground=ColorScale.of(240, 13, 14),
+    info=ColorScale.of(163, 17, 50),                      # waveAqua
+    info_foreground=ColorScale.of(240, 13, 14),
+    link=ColorScale.of(220, 54, 67),                      # crystalBlue
+    link_hover=ColorScale.of(220, 54, 76),
+    code=ColorScale.of(215, 36, 21),                      # waveBlue1 #223249
+    code_foreground=ColorScale.of(51, 33, 80),            # fujiWhite
+    selection=ColorScale.of(220, 40, 24),                 # Deep blue selection
+    selection_foreground=ColorScale.of(51, 33, 85),
+    brand=ColorScale.of(263, 29, 61),                     # oniViolet
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(240, 10, 26),
+    input=ColorScale.of(240, 10, 26),
+    ring=ColorScale.of(220, 54, 67),
+    surface_1=ColorScale.of(240, 13, 10),                 # sumiInk0
+    surface_2=ColorScale.of(240, 13, 14),                 # sumiInk1
+    surface_3=ColorScale.of(240, 12, 18),                 # sumiInk2
 )
 
 PRESET = ThemePreset(
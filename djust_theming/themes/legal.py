@@ -16,81 +16,81 @@ from ._base import (
 # Designed for law firms, financial advisors, institutions.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(40, 15, 98),                 # Warm off-white
-    foreground=ColorScale(220, 30, 15),                # Dark navy
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(220, 30, 15),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(220, 30, 15),
-    primary=ColorScale(220, 50, 35),                   # Conservative navy
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(40, 10, 95),                  # Warm pale bg
-    secondary_foreground=ColorScale(220, 30, 15),
-    muted=ColorScale(40, 10, 91),                      # Warm gray muted
-    muted_foreground=ColorScale(220, 15, 45),          # Muted text
-    accent=ColorScale(40, 10, 95),                     # Warm hover surface
-    accent_foreground=ColorScale(220, 30, 15),
-    destructive=ColorScale(0, 55, 45),                 # Muted red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 40, 38),                   # Conservative green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 60, 48),                    # Muted amber
-    warning_foreground=ColorScale(220, 30, 15),
-    info=ColorScale(220, 50, 35),                      # Navy info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(345, 40, 35),                      # Burgundy links
-    link_hover=ColorScale(345, 40, 28),                # Darker burgundy
-    code=ColorScale(220, 30, 12),                      # Dark navy code bg
-    code_foreground=ColorScale(40, 15, 85),            # Warm light code text
-    selection=ColorScale(220, 30, 88),                 # Pale navy selection
-    selection_foreground=ColorScale(220, 30, 15),
-    brand=ColorScale(345, 40, 35),                     # Burgundy
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(40, 10, 85),                     # Warm gray border
-    input=ColorScale(40, 8, 90),                       # Warm input border
-    ring=ColorScale(220, 50, 35),                      # Navy focus ring
-    surface_1=ColorScale(40, 15, 98),                  # Warm off-white
-    surface_2=ColorScale(40, 12, 96),                  # Slightly deeper
-    surface_3=ColorScale(40, 10, 93),                  # Even deeper
+    background=ColorScale.of(40, 15, 98),                 # Warm off-white
+    foreground=ColorScale.of(220, 30, 15),                # Dark navy
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(220, 30, 15),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(220, 30, 15),
+    primary=ColorScale.of(220, 50, 35),                   # Conservative navy
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(40, 10, 95),                  # Warm pale bg
+    secondary_foreground=ColorScale.of(220, 30, 15),
+    muted=ColorScale.of(40, 10, 91),                      # Warm gray muted
+    muted_foreground=ColorScale.of(220, 15, 45),          # Muted text
+    accent=ColorScale.of(40, 10, 95),                     # Warm hover surface
+    accent_foreground=ColorScale.of(220, 30, 15),
+    destructive=ColorScale.of(0, 55, 45),                 # Muted red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 40, 38),                   # Conservative green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 60, 48),                    # Muted amber
+    warning_foreground=ColorScale.of(220, 30, 15),
+    info=ColorScale.of(220, 50, 35),                      # Navy info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(345, 40, 35),                      # Burgundy links
+    link_hover=ColorScale.of(345, 40, 28),                # Darker burgundy
+    code=ColorScale.of(220, 30, 12),                      # Dark navy code bg
+    code_foreground=ColorScale.of(40, 15, 85),            # Warm light code text
+    selection=ColorScale.of(220, 30, 88),                 # Pale navy selection
+    selection_foreground=ColorScale.of(220, 30, 15),
+    brand=ColorScale.of(345, 40, 35),                     # Burgundy
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(40, 10, 85),                     # Warm gray border
+    input=ColorScale.of(40, 8, 90),                       # Warm input border
+    ring=ColorScale.of(220, 50, 35),                      # Navy focus ring
+    surface_1=ColorScale.of(40, 15, 98),                  # Warm off-white
+    surface_2=ColorScale.of(40, 12, 96),                  # Slightly deeper
+    surface_3=ColorScale.of(40, 10, 93),                  # Even deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(220, 30, 12),                # Dark navy
-    foreground=ColorScale(40, 10, 90),                 # Warm off-white
-    card=ColorScale(220, 25, 15),                      # Dark card
-    card_foreground=ColorScale(40, 10, 90),
-    popover=ColorScale(220, 25, 15),
-    popover_foreground=ColorScale(40, 10, 90),
-    primary=ColorScale(220, 50, 50),                   # Navy brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 20, 18),                 # Dark panel
-    secondary_foreground=ColorScale(40, 10, 90),
-    muted=ColorScale(220, 15, 22),                     # Dark muted
-    muted_foreground=ColorScale(40, 8, 55),            # Muted text
-    accent=ColorScale(220, 20, 18),                    # Dark hover
-    accent_foreground=ColorScale(40, 10, 90),
-    destructive=ColorScale(0, 55, 52),                 # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 40, 45),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 60, 55),                    # Amber brightened
-    warning_foreground=ColorScale(220, 30, 12),
-    info=ColorScale(220, 50, 50),                      # Navy brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(345, 40, 50),                      # Burgundy brightened
-    link_hover=ColorScale(345, 40, 60),                # Lighter burgundy
-    code=ColorScale(220, 30, 8),                       # Deepest navy code
-    code_foreground=ColorScale(40, 20, 72),            # Warm code text
-    selection=ColorScale(220, 30, 22),                 # Deep navy selection
-    selection_foreground=ColorScale(40, 10, 90),
-    brand=ColorScale(345, 40, 48),                     # Burgundy brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 15, 22),                    # Dark border
-    input=ColorScale(220, 12, 18),                     # Dark input
-    ring=ColorScale(220, 50, 50),                      # Navy focus ring
-    surface_1=ColorScale(220, 30, 10),                 # Deepest
-    surface_2=ColorScale(220, 25, 13),                 # Mid dark
-    surface_3=ColorScale(220, 22, 16),                 # Elevated
+    background=ColorScale.of(220, 30, 12),                # Dark navy
+    foreground=ColorScale.of(40, 10, 90),                 # Warm off-white
+    card=ColorScale.of(220, 25, 15),                      # Dark card
+    card_foreground=ColorScale.of(40, 10, 90),
+    popover=ColorScale.of(220, 25, 15),
+    popover_foreground=ColorScale.of(40, 10, 90),
+    primary=ColorScale.of(220, 50, 50),                   # Navy brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 20, 18),                 # Dark panel
+    secondary_foreground=ColorScale.of(40, 10, 90),
+    muted=ColorScale.of(220, 15, 22),                     # Dark muted
+    muted_foreground=ColorScale.of(40, 8, 55),            # Muted text
+    accent=ColorScale.of(220, 20, 18),                    # Dark hover
+    accent_foreground=ColorScale.of(40, 10, 90),
+    destructive=ColorScale.of(0, 55, 52),                 # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 40, 45),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 60, 55),                    # Amber brightened
+    warning_foreground=ColorScale.of(220, 30, 12),
+    info=ColorScale.of(220, 50, 50),                      # Navy brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(345, 40, 50),                      # Burgundy brightened
+    link_hover=ColorScale.of(345, 40, 60),                # Lighter burgundy
+    code=ColorScale.of(220, 30, 8),                       # Deepest navy code
+    code_foreground=ColorScale.of(40, 20, 72),            # Warm code text
+    selection=ColorScale.of(220, 30, 22),                 # Deep navy selection
+    selection_foreground=ColorScale.of(40, 10, 90),
+    brand=ColorScale.of(345, 40, 48),                     # Burgundy brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 15, 22),                    # Dark border
+    input=ColorScale.of(220, 12, 18),                     # Dark input
+    ring=ColorScale.of(220, 50, 50),                      # Navy focus ring
+    surface_1=ColorScale.of(220, 30, 10),                 # Deepest
+    surface_2=ColorScale.of(220, 25, 13),                 # Mid dark
+    surface_3=ColorScale.of(220, 22, 16),                 # Elevated
 )
 
 PRESET = ThemePreset(
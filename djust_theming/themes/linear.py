@@ -18,81 +18,81 @@ from ._base import (
 # - Purple/violet accents throughout
 
 LIGHT = ThemeTokens(
-    background=ColorScale(240, 3, 98),               # Near-white with cool tint
-    foreground=ColorScale(240, 16, 13),               # Dark indigo text
-    card=ColorScale(0, 0, 100),                       # Pure white cards
-    card_foreground=ColorScale(240, 16, 13),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(240, 16, 13),
-    primary=ColorScale(234, 56, 60),                  # Purple primary
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 3, 95),                 # Subtle light bg
-    secondary_foreground=ColorScale(240, 16, 13),
-    muted=ColorScale(219, 6, 92),                     # Cool muted surface
-    muted_foreground=ColorScale(219, 6, 47),          # Muted text
-    accent=ColorScale(240, 5, 95),                    # Hover surface
-    accent_foreground=ColorScale(240, 16, 13),
-    destructive=ColorScale(0, 72, 55),                # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(123, 36, 46),                  # Green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 90, 50),                   # Amber
-    warning_foreground=ColorScale(240, 16, 13),
-    info=ColorScale(234, 56, 60),                     # Primary as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(243, 100, 69),                    # Linear violet
-    link_hover=ColorScale(234, 56, 50),               # Deeper purple on hover
-    code=ColorScale(240, 16, 10),                     # Dark code bg
-    code_foreground=ColorScale(243, 80, 78),          # Purple-tinted code text
-    selection=ColorScale(243, 60, 90),                # Pale purple selection
-    selection_foreground=ColorScale(240, 16, 13),
-    brand=ColorScale(243, 100, 69),                   # #5E6AD2 — Linear violet
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(240, 5, 88),                    # Subtle border
-    input=ColorScale(240, 5, 88),
-    ring=ColorScale(234, 56, 60),                     # Purple focus ring
-    surface_1=ColorScale(240, 3, 98),                 # Lightest
-    surface_2=ColorScale(240, 3, 96),                 # Mid
-    surface_3=ColorScale(240, 4, 94),                 # Slightly deeper
+    background=ColorScale.of(240, 3, 98),               # Near-white with cool tint
+    foreground=ColorScale.of(240, 16, 13),               # Dark indigo text
+    card=ColorScale.of(0, 0, 100),                       # Pure white cards
+    card_foreground=ColorScale.of(240, 16, 13),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(240, 16, 13),
+    primary=ColorScale.of(234, 56, 60),                  # Purple primary
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 3, 95),                 # Subtle light bg
+    secondary_foreground=ColorScale.of(240, 16, 13),
+    muted=ColorScale.of(219, 6, 92),                     # Cool muted surface
+    muted_foreground=ColorScale.of(219, 6, 47),          # Muted text
+    accent=ColorScale.of(240, 5, 95),                    # Hover surface
+    accent_foreground=ColorScale.of(240, 16, 13),
+    destructive=ColorScale.of(0, 72, 55),                # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(123, 36, 46),                  # Green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 90, 50),                   # Amber
+    warning_foreground=ColorScale.of(240, 16, 13),
+    info=ColorScale.of(234, 56, 60),                     # Primary as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(243, 100, 69),                    # Linear violet
+    link_hover=ColorScale.of(234, 56, 50),               # Deeper purple on hover
+    code=ColorScale.of(240, 16, 10),                     # Dark code bg
+    code_foreground=ColorScale.of(243, 80, 78),          # Purple-tinted code text
+    selection=ColorScale.of(243, 60, 90),                # Pale purple selection
+    selection_foreground=ColorScale.of(240, 16, 13),
+    brand=ColorScale.of(243, 100, 69),                   # #5E6AD2 — Linear violet
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(240, 5, 88),                    # Subtle border
+    input=ColorScale.of(240, 5, 88),
+    ring=ColorScale.of(234, 56, 60),                     # Purple focus ring
+    surface_1=ColorScale.of(240, 3, 98),                 # Lightest
+    surface_2=ColorScale.of(240, 3, 96),                 # Mid
+    surface_3=ColorScale.of(240, 4, 94),                 # Slightly deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 16, 13),               # Dark indigo
-    foreground=ColorScale(240, 3, 94),                # Light text
-    card=ColorScale(240, 13, 15),                     # Slightly lighter card
-    card_foreground=ColorScale(240, 3, 94),
-    popover=ColorScale(240, 13, 15),
-    popover_foreground=ColorScale(240, 3, 94),
-    primary=ColorScale(234, 56, 65),                  # Purple — brightened for dark
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 10, 18),                # Dark panel
-    secondary_foreground=ColorScale(240, 3, 94),
-    muted=ColorScale(240, 10, 20),                    # Dark muted
-    muted_foreground=ColorScale(219, 6, 57),          # Muted text on dark
-    accent=ColorScale(240, 10, 18),                   # Dark hover surface
-    accent_foreground=ColorScale(240, 3, 94),
-    destructive=ColorScale(0, 72, 60),                # Red — brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(123, 36, 52),                  # Green — brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 90, 55),                   # Amber — brightened
-    warning_foreground=ColorScale(240, 16, 13),
-    info=ColorScale(234, 56, 65),                     # Primary
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(243, 100, 75),                    # Violet — brightened
-    link_hover=ColorScale(234, 56, 70),               # Lighter purple
-    code=ColorScale(240, 16, 10),                     # Very dark code bg
-    code_foreground=ColorScale(243, 80, 78),          # Purple-tinted code text
-    selection=ColorScale(243, 80, 25),                # Deep purple selection
-    selection_foreground=ColorScale(240, 3, 94),
-    brand=ColorScale(243, 100, 75),                   # Violet — brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(240, 10, 22),                   # Dark border
-    input=ColorScale(240, 10, 22),
-    ring=ColorScale(234, 56, 65),                     # Purple focus ring
-    surface_1=ColorScale(240, 16, 10),                # Deepest
-    surface_2=ColorScale(240, 14, 12),                # Mid
-    surface_3=ColorScale(240, 13, 15),                # Elevated
+    background=ColorScale.of(240, 16, 13),               # Dark indigo
+    foreground=ColorScale.of(240, 3, 94),                # Light text
+    card=ColorScale.of(240, 13, 15),                     # Slightly lighter card
+    card_foreground=ColorScale.of(240, 3, 94),
+    popover=ColorScale.of(240, 13, 15),
+    popover_foreground=ColorScale.of(240, 3, 94),
+    primary=ColorScale.of(234, 56, 65),                  # Purple — brightened for dark
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 10, 18),                # Dark panel
+    secondary_foreground=ColorScale.of(240, 3, 94),
+    muted=ColorScale.of(240, 10, 20),                    # Dark muted
+    muted_foreground=ColorScale.of(219, 6, 57),          # Muted text on dark
+    accent=ColorScale.of(240, 10, 18),                   # Dark hover surface
+    accent_foreground=ColorScale.of(240, 3, 94),
+    destructive=ColorScale.of(0, 72, 60),                # Red — brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(123, 36, 52),                  # Green — brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 90, 55),                   # Amber — brightened
+    warning_foreground=ColorScale.of(240, 16, 13),
+    info=ColorScale.of(234, 56, 65),                     # Primary
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(243, 100, 75),                    # Violet — brightened
+    link_hover=ColorScale.of(234, 56, 70),               # Lighter purple
+    code=ColorScale.of(240, 16, 10),                     # Very dark code bg
+    code_foreground=ColorScale.of(243, 80, 78),          # Purple-tinted code text
+    selection=ColorScale.of(243, 80, 25),                # Deep purple selection
+    selection_foreground=ColorScale.of(240, 3, 94),
+    brand=ColorScale.of(243, 100, 75),                   # Violet — brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(240, 10, 22),                   # Dark border
+    input=ColorScale.of(240, 10, 22),
+    ring=ColorScale.of(234, 56, 65),                     # Purple focus ring
+    surface_1=ColorScale.of(240, 16, 10),                # Deepest
+    surface_2=ColorScale.of(240, 14, 12),                # Mid
+    surface_3=ColorScale.of(240, 13, 15),                # Elevated
 )
 
 PRESET = ThemePreset(
@@ -16,81 +16,81 @@ from ._base import (
 # Inspired by classic magazine layouts: Vogue, The New Yorker, Esquire.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),                # Pure white
-    foreground=ColorScale(0, 0, 8),                   # Near-black
-    card=ColorScale(0, 0, 100),                       # White cards
-    card_foreground=ColorScale(0, 0, 8),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 8),
-    primary=ColorScale(0, 85, 50),                    # Editorial red
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 96),                   # Very light gray
-    secondary_foreground=ColorScale(0, 0, 8),
-    muted=ColorScale(0, 0, 94),                       # Light gray muted
-    muted_foreground=ColorScale(0, 0, 42),            # Mid gray text
-    accent=ColorScale(0, 0, 96),                      # Subtle hover surface
-    accent_foreground=ColorScale(0, 0, 8),
-    destructive=ColorScale(0, 85, 50),                # Same red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 50, 38),                  # Muted green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 70, 50),                   # Warm amber
-    warning_foreground=ColorScale(0, 0, 8),
-    info=ColorScale(210, 50, 50),                     # Steel blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(0, 85, 45),                       # Red links (editorial)
-    link_hover=ColorScale(0, 85, 35),                 # Darker red on hover
-    code=ColorScale(0, 0, 8),                         # Near-black code bg
-    code_foreground=ColorScale(0, 0, 90),             # Light text on dark code
-    selection=ColorScale(0, 60, 92),                  # Pale red selection
-    selection_foreground=ColorScale(0, 0, 8),
-    brand=ColorScale(0, 85, 50),                      # Editorial red
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 85),                      # Hairline gray
-    input=ColorScale(0, 0, 90),                       # Light gray input border
-    ring=ColorScale(0, 85, 50),                       # Red focus ring
-    surface_1=ColorScale(0, 0, 100),                  # White
-    surface_2=ColorScale(0, 0, 97),                   # Off-white
-    surface_3=ColorScale(0, 0, 94),                   # Light gray
+    background=ColorScale.of(0, 0, 100),                # Pure white
+    foreground=ColorScale.of(0, 0, 8),                   # Near-black
+    card=ColorScale.of(0, 0, 100),                       # White cards
+    card_foreground=ColorScale.of(0, 0, 8),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 8),
+    primary=ColorScale.of(0, 85, 50),                    # Editorial red
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 96),                   # Very light gray
+    secondary_foreground=ColorScale.of(0, 0, 8),
+    muted=ColorScale.of(0, 0, 94),                       # Light gray muted
+    muted_foreground=ColorScale.of(0, 0, 42),            # Mid gray text
+    accent=ColorScale.of(0, 0, 96),                      # Subtle hover surface
+    accent_foreground=ColorScale.of(0, 0, 8),
+    destructive=ColorScale.of(0, 85, 50),                # Same red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 50, 38),                  # Muted green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 70, 50),                   # Warm amber
+    warning_foreground=ColorScale.of(0, 0, 8),
+    info=ColorScale.of(210, 50, 50),                     # Steel blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(0, 85, 45),                       # Red links (editorial)
+    link_hover=ColorScale.of(0, 85, 35),                 # Darker red on hover
+    code=ColorScale.of(0, 0, 8),                         # Near-black code bg
+    code_foreground=ColorScale.of(0, 0, 90),             # Light text on dark code
+    selection=ColorScale.of(0, 60, 92),                  # Pale red selection
+    selection_foreground=ColorScale.of(0, 0, 8),
+    brand=ColorScale.of(0, 85, 50),                      # Editorial red
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 85),                      # Hairline gray
+    input=ColorScale.of(0, 0, 90),                       # Light gray input border
+    ring=ColorScale.of(0, 85, 50),                       # Red focus ring
+    surface_1=ColorScale.of(0, 0, 100),                  # White
+    surface_2=ColorScale.of(0, 0, 97),                   # Off-white
+    surface_3=ColorScale.of(0, 0, 94),                   # Light gray
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 5),                   # Near-black
-    foreground=ColorScale(0, 0, 95),                  # Off-white
-    card=ColorScale(0, 0, 8),                         # Slightly lighter card
-    card_foreground=ColorScale(0, 0, 95),
-    popover=ColorScale(0, 0, 8),
-    popover_foreground=ColorScale(0, 0, 95),
-    primary=ColorScale(0, 85, 55),                    # Red brightened for dark
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 10),                   # Dark panel
-    secondary_foreground=ColorScale(0, 0, 95),
-    muted=ColorScale(0, 0, 15),                       # Dark muted
-    muted_foreground=ColorScale(0, 0, 55),            # Muted text on dark
-    accent=ColorScale(0, 0, 10),                      # Subtle dark hover
-    accent_foreground=ColorScale(0, 0, 95),
-    destructive=ColorScale(0, 85, 55),                # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 50, 48),                  # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 70, 55),                   # Amber brightened
-    warning_foreground=ColorScale(0, 0, 8),
-    info=ColorScale(210, 50, 58),                     # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(0, 85, 60),                       # Red brightened for dark
-    link_hover=ColorScale(0, 85, 70),                 # Lighter red on hover
-    code=ColorScale(0, 0, 3),                         # Very dark code bg
-    code_foreground=ColorScale(0, 60, 70),            # Muted red code text
-    selection=ColorScale(0, 60, 20),                  # Deep red selection
-    selection_foreground=ColorScale(0, 0, 95),
-    brand=ColorScale(0, 85, 55),                      # Red brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 18),                      # Dark border
-    input=ColorScale(0, 0, 15),                       # Dark input
-    ring=ColorScale(0, 85, 55),                       # Red focus ring
-    surface_1=ColorScale(0, 0, 5),                    # Deepest
-    surface_2=ColorScale(0, 0, 7),                    # Mid dark
-    surface_3=ColorScale(0, 0, 10),                   # Slightly elevated
+    background=ColorScale.of(0, 0, 5),                   # Near-black
+    foreground=ColorScale.of(0, 0, 95),                  # Off-white
+    card=ColorScale.of(0, 0, 8),                         # Slightly lighter card
+    card_foreground=ColorScale.of(0, 0, 95),
+    popover=ColorScale.of(0, 0, 8),
+    popover_foreground=ColorScale.of(0, 0, 95),
+    primary=ColorScale.of(0, 85, 55),                    # Red brightened for dark
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 10),                   # Dark panel
+    secondary_foreground=ColorScale.of(0, 0, 95),
+    muted=ColorScale.of(0, 0, 15),                       # Dark muted
+    muted_foreground=ColorScale.of(0, 0, 55),            # Muted text on dark
+    accent=ColorScale.of(0, 0, 10),                      # Subtle dark hover
+    accent_foreground=ColorScale.of(0, 0, 95),
+    destructive=ColorScale.of(0, 85, 55),                # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 50, 48),                  # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 70, 55),                   # Amber brightened
+    warning_foreground=ColorScale.of(0, 0, 8),
+    info=ColorScale.of(210, 50, 58),                     # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(0, 85, 60),                       # Red brightened for dark
+    link_hover=ColorScale.of(0, 85, 70),                 # Lighter red on hover
+    code=ColorScale.of(0, 0, 3),                         # Very dark code bg
+    code_foreground=ColorScale.of(0, 60, 70),            # Muted red code text
+    selection=ColorScale.of(0, 60, 20),                  # Deep red selection
+    selection_foreground=ColorScale.of(0, 0, 95),
+    brand=ColorScale.of(0, 85, 55),                      # Red brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 18),                      # Dark border
+    input=ColorScale.of(0, 0, 15),                       # Dark input
+    ring=ColorScale.of(0, 85, 55),                       # Red focus ring
+    surface_1=ColorScale.of(0, 0, 5),                    # Deepest
+    surface_2=ColorScale.of(0, 0, 7),                    # Mid dark
+    surface_3=ColorScale.of(0, 0, 10),                   # Slightly elevated
 )
 
 PRESET = ThemePreset(
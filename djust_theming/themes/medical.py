@@ -16,81 +16,81 @@ from ._base import (
 # Designed for medical forms, patient portals, healthcare dashboards.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(200, 20, 98),                # Cool white
-    foreground=ColorScale(210, 15, 15),                # Dark gray
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(210, 15, 15),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(210, 15, 15),
-    primary=ColorScale(200, 70, 50),                   # Calming blue
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(200, 15, 95),                 # Very pale cool bg
-    secondary_foreground=ColorScale(210, 15, 15),
-    muted=ColorScale(200, 12, 92),                     # Cool gray muted
-    muted_foreground=ColorScale(210, 10, 45),          # Mid gray text
-    accent=ColorScale(200, 15, 95),                    # Cool hover surface
-    accent_foreground=ColorScale(210, 15, 15),
-    destructive=ColorScale(0, 60, 50),                 # Muted red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 60, 40),                   # Medical green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 80, 50),                    # Soft amber
-    warning_foreground=ColorScale(210, 15, 15),
-    info=ColorScale(200, 70, 50),                      # Same calming blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(200, 70, 45),                      # Blue links
-    link_hover=ColorScale(200, 70, 35),                # Darker blue hover
-    code=ColorScale(210, 15, 12),                      # Dark code bg
-    code_foreground=ColorScale(200, 50, 75),           # Light blue code text
-    selection=ColorScale(200, 50, 90),                 # Pale blue selection
-    selection_foreground=ColorScale(210, 15, 15),
-    brand=ColorScale(175, 50, 45),                     # Teal
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(200, 15, 87),                    # Cool gray border
-    input=ColorScale(200, 12, 90),                     # Cool gray input
-    ring=ColorScale(200, 70, 50),                      # Blue focus ring
-    surface_1=ColorScale(200, 20, 98),                 # Cool white
-    surface_2=ColorScale(200, 15, 96),                 # Slightly deeper
-    surface_3=ColorScale(200, 12, 93),                 # Even deeper
+    background=ColorScale.of(200, 20, 98),                # Cool white
+    foreground=ColorScale.of(210, 15, 15),                # Dark gray
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(210, 15, 15),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(210, 15, 15),
+    primary=ColorScale.of(200, 70, 50),                   # Calming blue
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(200, 15, 95),                 # Very pale cool bg
+    secondary_foreground=ColorScale.of(210, 15, 15),
+    muted=ColorScale.of(200, 12, 92),                     # Cool gray muted
+    muted_foreground=ColorScale.of(210, 10, 45),          # Mid gray text
+    accent=ColorScale.of(200, 15, 95),                    # Cool hover surface
+    accent_foreground=ColorScale.of(210, 15, 15),
+    destructive=ColorScale.of(0, 60, 50),                 # Muted red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 60, 40),                   # Medical green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 80, 50),                    # Soft amber
+    warning_foreground=ColorScale.of(210, 15, 15),
+    info=ColorScale.of(200, 70, 50),                      # Same calming blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(200, 70, 45),                      # Blue links
+    link_hover=ColorScale.of(200, 70, 35),                # Darker blue hover
+    code=ColorScale.of(210, 15, 12),                      # Dark code bg
+    code_foreground=ColorScale.of(200, 50, 75),           # Light blue code text
+    selection=ColorScale.of(200, 50, 90),                 # Pale blue selection
+    selection_foreground=ColorScale.of(210, 15, 15),
+    brand=ColorScale.of(175, 50, 45),                     # Teal
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(200, 15, 87),                    # Cool gray border
+    input=ColorScale.of(200, 12, 90),                     # Cool gray input
+    ring=ColorScale.of(200, 70, 50),                      # Blue focus ring
+    surface_1=ColorScale.of(200, 20, 98),                 # Cool white
+    surface_2=ColorScale.of(200, 15, 96),                 # Slightly deeper
+    surface_3=ColorScale.of(200, 12, 93),                 # Even deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(210, 20, 12),                # Dark blue-gray
-    foreground=ColorScale(200, 10, 90),                # Cool white
-    card=ColorScale(210, 18, 15),                      # Dark card
-    card_foreground=ColorScale(200, 10, 90),
-    popover=ColorScale(210, 18, 15),
-    popover_foreground=ColorScale(200, 10, 90),
-    primary=ColorScale(200, 70, 58),                   # Blue brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 15, 18),                 # Dark panel
-    secondary_foreground=ColorScale(200, 10, 90),
-    muted=ColorScale(210, 12, 22),                     # Dark muted
-    muted_foreground=ColorScale(200, 8, 55),           # Muted text
-    accent=ColorScale(210, 15, 18),                    # Dark hover
-    accent_foreground=ColorScale(200, 10, 90),
-    destructive=ColorScale(0, 60, 55),                 # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 60, 48),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 80, 55),                    # Amber brightened
-    warning_foreground=ColorScale(210, 15, 12),
-    info=ColorScale(200, 70, 58),                      # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(200, 70, 62),                      # Blue brightened
-    link_hover=ColorScale(200, 70, 72),                # Lighter blue
-    code=ColorScale(210, 20, 8),                       # Deepest dark code
-    code_foreground=ColorScale(175, 50, 60),           # Teal code text
-    selection=ColorScale(200, 50, 22),                 # Deep blue selection
-    selection_foreground=ColorScale(200, 10, 90),
-    brand=ColorScale(175, 50, 52),                     # Teal brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(210, 15, 22),                    # Dark border
-    input=ColorScale(210, 12, 18),                     # Dark input
-    ring=ColorScale(200, 70, 58),                      # Blue focus ring
-    surface_1=ColorScale(210, 20, 10),                 # Deepest
-    surface_2=ColorScale(210, 18, 13),                 # Mid dark
-    surface_3=ColorScale(210, 16, 16),                 # Elevated
+    background=ColorScale.of(210, 20, 12),                # Dark blue-gray
+    foreground=ColorScale.of(200, 10, 90),                # Cool white
+    card=ColorScale.of(210, 18, 15),                      # Dark card
+    card_foreground=ColorScale.of(200, 10, 90),
+    popover=ColorScale.of(210, 18, 15),
+    popover_foreground=ColorScale.of(200, 10, 90),
+    primary=ColorScale.of(200, 70, 58),                   # Blue brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 15, 18),                 # Dark panel
+    secondary_foreground=ColorScale.of(200, 10, 90),
+    muted=ColorScale.of(210, 12, 22),                     # Dark muted
+    muted_foreground=ColorScale.of(200, 8, 55),           # Muted text
+    accent=ColorScale.of(210, 15, 18),                    # Dark hover
+    accent_foreground=ColorScale.of(200, 10, 90),
+    destructive=ColorScale.of(0, 60, 55),                 # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 60, 48),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 80, 55),                    # Amber brightened
+    warning_foreground=ColorScale.of(210, 15, 12),
+    info=ColorScale.of(200, 70, 58),                      # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(200, 70, 62),                      # Blue brightened
+    link_hover=ColorScale.of(200, 70, 72),                # Lighter blue
+    code=ColorScale.of(210, 20, 8),                       # Deepest dark code
+    code_foreground=ColorScale.of(175, 50, 60),           # Teal code text
+    selection=ColorScale.of(200, 50, 22),                 # Deep blue selection
+    selection_foreground=ColorScale.of(200, 10, 90),
+    brand=ColorScale.of(175, 50, 52),                     # Teal brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(210, 15, 22),                    # Dark border
+    input=ColorScale.of(210, 12, 18),                     # Dark input
+    ring=ColorScale.of(200, 70, 58),                      # Blue focus ring
+    surface_1=ColorScale.of(210, 20, 10),                 # Deepest
+    surface_2=ColorScale.of(210, 18, 13),                 # Mid dark
+    surface_3=ColorScale.of(210, 16, 16),                 # Elevated
 )
 
 PRESET = ThemePreset(
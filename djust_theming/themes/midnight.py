@@ -16,81 +16,81 @@ from ._base import (
 # Think: midnight sky, aurora borealis, neon on glass.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(260, 20, 98),                # Very pale purple
-    foreground=ColorScale(260, 30, 15),                # Deep purple
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(260, 30, 15),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(260, 30, 15),
-    primary=ColorScale(265, 80, 60),                   # Electric purple
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(260, 15, 95),                 # Pale purple bg
-    secondary_foreground=ColorScale(260, 30, 15),
-    muted=ColorScale(260, 12, 91),                     # Soft purple muted
-    muted_foreground=ColorScale(260, 15, 45),          # Muted text
-    accent=ColorScale(260, 15, 95),                    # Pale purple hover
-    accent_foreground=ColorScale(260, 30, 15),
-    destructive=ColorScale(350, 70, 50),               # Bright red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(155, 60, 42),                   # Teal green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 80, 52),                    # Amber
-    warning_foreground=ColorScale(260, 30, 15),
-    info=ColorScale(190, 80, 50),                      # Cyan info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(190, 80, 45),                      # Cyan links
-    link_hover=ColorScale(265, 80, 55),                # Purple on hover
-    code=ColorScale(260, 40, 10),                      # Deepest purple code bg
-    code_foreground=ColorScale(190, 80, 70),           # Cyan code text
-    selection=ColorScale(265, 60, 90),                 # Pale purple selection
-    selection_foreground=ColorScale(260, 30, 15),
-    brand=ColorScale(190, 80, 60),                     # Cyan brand
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(260, 15, 85),                    # Purple-tinted border
-    input=ColorScale(260, 12, 90),                     # Pale purple input
-    ring=ColorScale(265, 80, 60),                      # Purple focus ring
-    surface_1=ColorScale(260, 20, 98),                 # Palest
-    surface_2=ColorScale(260, 15, 96),                 # Mid
-    surface_3=ColorScale(260, 12, 93),                 # Deeper
+    background=ColorScale.of(260, 20, 98),                # Very pale purple
+    foreground=ColorScale.of(260, 30, 15),                # Deep purple
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(260, 30, 15),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(260, 30, 15),
+    primary=ColorScale.of(265, 80, 60),                   # Electric purple
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(260, 15, 95),                 # Pale purple bg
+    secondary_foreground=ColorScale.of(260, 30, 15),
+    muted=ColorScale.of(260, 12, 91),                     # Soft purple muted
+    muted_foreground=ColorScale.of(260, 15, 45),          # Muted text
+    accent=ColorScale.of(260, 15, 95),                    # Pale purple hover
+    accent_foreground=ColorScale.of(260, 30, 15),
+    destructive=ColorScale.of(350, 70, 50),               # Bright red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(155, 60, 42),                   # Teal green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 80, 52),                    # Amber
+    warning_foreground=ColorScale.of(260, 30, 15),
+    info=ColorScale.of(190, 80, 50),                      # Cyan info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(190, 80, 45),                      # Cyan links
+    link_hover=ColorScale.of(265, 80, 55),                # Purple on hover
+    code=ColorScale.of(260, 40, 10),                      # Deepest purple code bg
+    code_foreground=ColorScale.of(190, 80, 70),           # Cyan code text
+    selection=ColorScale.of(265, 60, 90),                 # Pale purple selection
+    selection_foreground=ColorScale.of(260, 30, 15),
+    brand=ColorScale.of(190, 80, 60),                     # Cyan brand
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(260, 15, 85),                    # Purple-tinted border
+    input=ColorScale.of(260, 12, 90),                     # Pale purple input
+    ring=ColorScale.of(265, 80, 60),                      # Purple focus ring
+    surface_1=ColorScale.of(260, 20, 98),                 # Palest
+    surface_2=ColorScale.of(260, 15, 96),                 # Mid
+    surface_3=ColorScale.of(260, 12, 93),                 # Deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(260, 40, 6),                 # Near-black purple
-    foreground=ColorScale(260, 15, 88),                # Pale lavender
-    card=ColorScale(260, 35, 10),                      # Dark purple card
-    card_foreground=ColorScale(260, 15, 88),
-    popover=ColorScale(260, 35, 10),
-    popover_foreground=ColorScale(260, 15, 88),
-    primary=ColorScale(265, 80, 65),                   # Electric purple brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(260, 30, 12),                 # Dark purple panel
-    secondary_foreground=ColorScale(260, 15, 88),
-    muted=ColorScale(260, 25, 16),                     # Dark muted
-    muted_foreground=ColorScale(260, 12, 55),          # Muted text
-    accent=ColorScale(260, 30, 10),                    # Dark purple hover
-    accent_foreground=ColorScale(260, 15, 88),
-    destructive=ColorScale(350, 70, 55),               # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(155, 60, 50),                   # Teal brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 80, 58),                    # Amber brightened
-    warning_foreground=ColorScale(260, 40, 8),
-    info=ColorScale(190, 80, 58),                      # Cyan brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(190, 80, 60),                      # Cyan brightened
-    link_hover=ColorScale(190, 80, 72),                # Lighter cyan
-    code=ColorScale(260, 40, 4),                       # Deepest purple code bg
-    code_foreground=ColorScale(190, 80, 65),           # Cyan code text
-    selection=ColorScale(265, 60, 20),                 # Deep purple selection
-    selection_foreground=ColorScale(260, 15, 88),
-    brand=ColorScale(190, 80, 65),                     # Cyan brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(260, 25, 18),                    # Dark purple border
-    input=ColorScale(260, 22, 15),                     # Dark purple input
-    ring=ColorScale(265, 80, 65),                      # Purple focus ring
-    surface_1=ColorScale(260, 40, 5),                  # Deepest
-    surface_2=ColorScale(260, 38, 8),                  # Mid dark
-    surface_3=ColorScale(260, 35, 11),                 # Elevated
+    background=ColorScale.of(260, 40, 6),                 # Near-black purple
+    foreground=ColorScale.of(260, 15, 88),                # Pale lavender
+    card=ColorScale.of(260, 35, 10),                      # Dark purple card
+    card_foreground=ColorScale.of(260, 15, 88),
+    popover=ColorScale.of(260, 35, 10),
+    popover_foreground=ColorScale.of(260, 15, 88),
+    primary=ColorScale.of(265, 80, 65),                   # Electric purple brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(260, 30, 12),                 # Dark purple panel
+    secondary_foreground=ColorScale.of(260, 15, 88),
+    muted=ColorScale.of(260, 25, 16),                     # Dark muted
+    muted_foreground=ColorScale.of(260, 12, 55),          # Muted text
+    accent=ColorScale.of(260, 30, 10),                    # Dark purple hover
+    accent_foreground=ColorScale.of(260, 15, 88),
+    destructive=ColorScale.of(350, 70, 55),               # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(155, 60, 50),                   # Teal brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 80, 58),                    # Amber brightened
+    warning_foreground=ColorScale.of(260, 40, 8),
+    info=ColorScale.of(190, 80, 58),                      # Cyan brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(190, 80, 60),                      # Cyan brightened
+    link_hover=ColorScale.of(190, 80, 72),                # Lighter cyan
+    code=ColorScale.of(260, 40, 4),                       # Deepest purple code bg
+    code_foreground=ColorScale.of(190, 80, 65),           # Cyan code text
+    selection=ColorScale.of(265, 60, 20),                 # Deep purple selection
+    selection_foreground=ColorScale.of(260, 15, 88),
+    brand=ColorScale.of(190, 80, 65),                     # Cyan brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(260, 25, 18),                    # Dark purple border
+    input=ColorScale.of(260, 22, 15),                     # Dark purple input
+    ring=ColorScale.of(265, 80, 65),                      # Purple focus ring
+    surface_1=ColorScale.of(260, 40, 5),                  # Deepest
+    surface_2=ColorScale.of(260, 38, 8),                  # Mid dark
+    surface_3=ColorScale.of(260, 35, 11),                 # Elevated
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # - Cyan #66d9ef, Purple #ae81ff, Orange #fd971f
 
 LIGHT = ThemeTokens(
-    background=ColorScale(60, 15, 98),                 # Warm off-white
-    foreground=ColorScale(70, 8, 15),                  # Warm near-black
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(70, 8, 15),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(70, 8, 15),
-    primary=ColorScale(338, 95, 56),                   # Pink #f92672
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(60, 12, 94),
-    secondary_foreground=ColorScale(70, 8, 15),
-    muted=ColorScale(55, 10, 89),
-    muted_foreground=ColorScale(50, 11, 41),
-    accent=ColorScale(60, 12, 94),                     # Subtle warm hover
-    accent_foreground=ColorScale(70, 8, 15),
-    destructive=ColorScale(338, 95, 56),               # Pink same as primary
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(80, 76, 53),                    # Green #a6e22e
-    success_foreground=ColorScale(70, 8, 15),
-    warning=ColorScale(54, 70, 68),                    # Yellow #e6db74
-    warning_foreground=ColorScale(70, 8, 15),
-    info=ColorScale(190, 81, 67),                      # Cyan #66d9ef
-    info_foreground=ColorScale(70, 8, 15),
-    link=ColorScale(261, 100, 75),                     # Purple #ae81ff
-    link_hover=ColorScale(261, 100, 65),
-    code=ColorScale(70, 8, 15),                        # Dark code bg
-    code_foreground=ColorScale(80, 76, 60),            # Green code text
-    selection=ColorScale(338, 80, 92),                 # Pale pink selection
-    selection_foreground=ColorScale(70, 8, 15),
-    brand=ColorScale(80, 76, 53),                      # Green #a6e22e
-    brand_foreground=ColorScale(70, 8, 15),
-    border=ColorScale(55, 10, 87),
-    input=ColorScale(55, 10, 92),
-    ring=ColorScale(338, 95, 56),
-    surface_1=ColorScale(60, 15, 98),
-    surface_2=ColorScale(60, 12, 95),
-    surface_3=ColorScale(55, 10, 92),
+    background=ColorScale.of(60, 15, 98),                 # Warm off-white
+    foreground=ColorScale.of(70, 8, 15),                  # Warm near-black
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(70, 8, 15),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(70, 8, 15),
+    primary=ColorScale.of(338, 95, 56),                   # Pink #f92672
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(60, 12, 94),
+    secondary_foreground=ColorScale.of(70, 8, 15),
+    muted=ColorScale.of(55, 10, 89),
+    muted_foreground=ColorScale.of(50, 11, 41),
+    accent=ColorScale.of(60, 12, 94),                     # Subtle warm hover
+    accent_foreground=ColorScale.of(70, 8, 15),
+    destructive=ColorScale.of(338, 95, 56),               # Pink same as primary
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(80, 76, 53),                    # Green #a6e22e
+    success_foreground=ColorScale.of(70, 8, 15),
+    warning=ColorScale.of(54, 70, 68),                    # Yellow #e6db74
+    warning_foreground=ColorScale.of(70, 8, 15),
+    info=ColorScale.of(190, 81, 67),                      # Cyan #66d9ef
+    info_foreground=ColorScale.of(70, 8, 15),
+    link=ColorScale.of(261, 100, 75),                     # Purple #ae81ff
+    link_hover=ColorScale.of(261, 100, 65),
+    code=ColorScale.of(70, 8, 15),                        # Dark code bg
+    code_foreground=ColorScale.of(80, 76, 60),            # Green code text
+    selection=ColorScale.of(338, 80, 92),                 # Pale pink selection
+    selection_foreground=ColorScale.of(70, 8, 15),
+    brand=ColorScale.of(80, 76, 53),                      # Green #a6e22e
+    brand_foreground=ColorScale.of(70, 8, 15),
+    border=ColorScale.of(55, 10, 87),
+    input=ColorScale.of(55, 10, 92),
+    ring=ColorScale.of(338, 95, 56),
+    surface_1=ColorScale.of(60, 15, 98),
+    surface_2=ColorScale.of(60, 12, 95),
+    surface_3=ColorScale.of(55, 10, 92),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(70, 8, 15),                  # #272822
-    foreground=ColorScale(60, 30, 96),                 # #f8f8f2
-    card=ColorScale(70, 8, 19),
-    card_foreground=ColorScale(60, 30, 96),
-    popover=ColorScale(70, 8, 19),
-    popover_foreground=ColorScale(60, 30, 96),
-    primary=ColorScale(338, 95, 56),                   # Pink #f92672
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(70, 8, 22),
-    secondary_foreground=ColorScale(60, 30, 96),
-    muted=ColorScale(70, 6, 25),
-    muted_foreground=ColorScale(50, 11, 41),
-    accent=ColorScale(70, 8, 22),                      # Subtle dark hover
-    accent_foreground=ColorScale(60, 30, 96),
-    destructive=ColorScale(338, 95, 56),               # Pink
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(80, 76, 53),                    # Green #a6e22e
-    success_foreground=ColorScale(70, 8, 15),
-    warning=ColorScale(54, 70, 68),                    # Yellow
-    warning_foreground=ColorScale(70, 8, 15),
-    info=ColorScale(190, 81, 67),                      # Cyan #66d9ef
-    info_foreground=ColorScale(70, 8, 15),
-    link=ColorScale(261, 100, 75),                     # Purple #ae81ff
-    link_hover=ColorScale(261, 100, 82),
-    code=ColorScale(70, 8, 10),                        # Very dark code bg
-    code_foreground=ColorScale(80, 76, 60),            # Green code text
-    selection=ColorScale(338, 60, 25),                 # Dark pink selection
-    selection_foreground=ColorScale(60, 30, 96),
-    brand=ColorScale(80, 76, 53),                      # Green #a6e22e
-    brand_foreground=ColorScale(70, 8, 15),
-    border=ColorScale(70, 6, 26),
-    input=ColorScale(70, 6, 26),
-    ring=ColorScale(338, 95, 56),
-    surface_1=ColorScale(70, 8, 11),
-    surface_2=ColorScale(70, 8, 15),
-    surface_3=ColorScale(70, 8, 20),
+    background=ColorScale.of(70, 8, 15),                  # #272822
+    foreground=ColorScale.of(60, 30, 96),                 # #f8f8f2
+    card=ColorScale.of(70, 8, 19),
+    card_foreground=ColorScale.of(60, 30, 96),
+    popover=ColorScale.of(70, 8, 19),
+    popover_foreground=ColorScale.of(60, 30, 96),
+    primary=ColorScale.of(338, 95, 56),                   # Pink #f92672
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(70, 8, 22),
+    secondary_foreground=ColorScale.of(60, 30, 96),
+    muted=ColorScale.of(70, 6, 25),
+    muted_foreground=ColorScale.of(50, 11, 41),
+    accent=ColorScale.of(70, 8, 22),                      # Subtle dark hover
+    accent_foreground=ColorScale.of(60, 30, 96),
+    destructive=ColorScale.of(338, 95, 56),               # Pink
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(80, 76, 53),                    # Green #a6e22e
+    success_foreground=ColorScale.of(70, 8, 15),
+    warning=ColorScale.of(54, 70, 68),                    # Yellow
+    warning_foreground=ColorScale.of(70, 8, 15),
+    info=ColorScale.of(190, 81, 67),                      # Cyan #66d9ef
+    info_foreground=ColorScale.of(70, 8, 15),
+    link=ColorScale.of(261, 100, 75),                     # Purple #ae81ff
+    link_hover=ColorScale.of(261, 100, 82),
+    code=ColorScale.of(70, 8, 10),                        # Very dark code bg
+    code_foreground=ColorScale.of(80, 76, 60),            # Green code text
+    selection=ColorScale.of(338, 60, 25),                 # Dark pink selection
+    selection_foreground=ColorScale.of(60, 30, 96),
+    brand=ColorScale.of(80, 76, 53),                      # Green #a6e22e
+    brand_foreground=ColorScale.of(70, 8, 15),
+    border=ColorScale.of(70, 6, 26),
+    input=ColorScale.of(70, 6, 26),
+    ring=ColorScale.of(338, 95, 56),
+    surface_1=ColorScale.of(70, 8, 11),
+    surface_2=ColorScale.of(70, 8, 15),
+    surface_3=ColorScale.of(70, 8, 20),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 98),
-    foreground=ColorScale(240, 10, 10),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(240, 10, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(240, 10, 10),
-    primary=ColorScale(211, 100, 65),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 5, 96),
-    secondary_foreground=ColorScale(240, 10, 10),
-    muted=ColorScale(240, 5, 96),
-    muted_foreground=ColorScale(0, 0, 53),
-    accent=ColorScale(211, 100, 96),
-    accent_foreground=ColorScale(211, 100, 30),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(211, 100, 65),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(211, 100, 55),
-    link_hover=ColorScale(211, 100, 45),
-    code=ColorScale(240, 5, 96),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(211, 100, 85),
-    selection_foreground=ColorScale(240, 10, 10),
-    brand=ColorScale(211, 100, 65),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(240, 5, 90),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(211, 100, 65),
-    surface_1=ColorScale(240, 15, 98),
-    surface_2=ColorScale(240, 12, 96),
-    surface_3=ColorScale(240, 10, 93),
+    background=ColorScale.of(0, 0, 98),
+    foreground=ColorScale.of(240, 10, 10),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(240, 10, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(240, 10, 10),
+    primary=ColorScale.of(211, 100, 65),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 5, 96),
+    secondary_foreground=ColorScale.of(240, 10, 10),
+    muted=ColorScale.of(240, 5, 96),
+    muted_foreground=ColorScale.of(0, 0, 53),
+    accent=ColorScale.of(211, 100, 96),
+    accent_foreground=ColorScale.of(211, 100, 30),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(211, 100, 65),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(211, 100, 55),
+    link_hover=ColorScale.of(211, 100, 45),
+    code=ColorScale.of(240, 5, 96),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(211, 100, 85),
+    selection_foreground=ColorScale.of(240, 10, 10),
+    brand=ColorScale.of(211, 100, 65),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(240, 5, 90),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(211, 100, 65),
+    surface_1=ColorScale.of(240, 15, 98),
+    surface_2=ColorScale.of(240, 12, 96),
+    surface_3=ColorScale.of(240, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 13, 3),
-    foreground=ColorScale(0, 0, 100),
-    card=ColorScale(240, 15, 6),
-    card_foreground=ColorScale(0, 0, 100),
-    popover=ColorScale(240, 15, 6),
-    popover_foreground=ColorScale(0, 0, 100),
-    primary=ColorScale(211, 100, 65),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 10, 10),
-    secondary_foreground=ColorScale(0, 0, 88),
-    muted=ColorScale(240, 9, 13),
-    muted_foreground=ColorScale(0, 0, 53),
-    accent=ColorScale(240, 9, 13),
-    accent_foreground=ColorScale(211, 100, 65),
-    destructive=ColorScale(0, 84, 53),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 100, 59),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(211, 100, 65),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(211, 100, 65),
-    link_hover=ColorScale(211, 100, 75),
-    code=ColorScale(240, 10, 8),
-    code_foreground=ColorScale(0, 0, 88),
-    selection=ColorScale(211, 100, 30),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(211, 100, 65),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(240, 9, 13),
-    input=ColorScale(240, 15, 6),
-    ring=ColorScale(211, 100, 65),
-    surface_1=ColorScale(240, 15, 4),
-    surface_2=ColorScale(240, 12, 7),
-    surface_3=ColorScale(240, 10, 11),
+    background=ColorScale.of(240, 13, 3),
+    foreground=ColorScale.of(0, 0, 100),
+    card=ColorScale.of(240, 15, 6),
+    card_foreground=ColorScale.of(0, 0, 100),
+    popover=ColorScale.of(240, 15, 6),
+    popover_foreground=ColorScale.of(0, 0, 100),
+    primary=ColorScale.of(211, 100, 65),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 10, 10),
+    secondary_foreground=ColorScale.of(0, 0, 88),
+    muted=ColorScale.of(240, 9, 13),
+    muted_foreground=ColorScale.of(0, 0, 53),
+    accent=ColorScale.of(240, 9, 13),
+    accent_foreground=ColorScale.of(211, 100, 65),
+    destructive=ColorScale.of(0, 84, 53),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 100, 59),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(211, 100, 65),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(211, 100, 65),
+    link_hover=ColorScale.of(211, 100, 75),
+    code=ColorScale.of(240, 10, 8),
+    code_foreground=ColorScale.of(0, 0, 88),
+    selection=ColorScale.of(211, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(211, 100, 65),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(240, 9, 13),
+    input=ColorScale.of(240, 15, 6),
+    ring=ColorScale.of(211, 100, 65),
+    surface_1=ColorScale.of(240, 15, 4),
+    surface_2=ColorScale.of(240, 12, 7),
+    surface_3=ColorScale.of(240, 10, 11),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(239, 50, 98),
-    foreground=ColorScale(218, 47, 15),
-    card=ColorScale(239, 45, 95),
-    card_foreground=ColorScale(218, 47, 15),
-    popover=ColorScale(239, 45, 95),
-    popover_foreground=ColorScale(218, 47, 15),
-    primary=ColorScale(239, 84, 67),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(239, 40, 90),
-    secondary_foreground=ColorScale(218, 47, 20),
-    muted=ColorScale(239, 40, 92),
-    muted_foreground=ColorScale(218, 30, 45),
-    accent=ColorScale(239, 40, 90),
-    accent_foreground=ColorScale(218, 47, 20),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(239, 84, 67),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(239, 84, 62),
-    link_hover=ColorScale(239, 84, 52),
-    code=ColorScale(239, 45, 93),
-    code_foreground=ColorScale(218, 47, 15),
-    selection=ColorScale(239, 84, 67),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(239, 84, 67),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(239, 40, 85),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(239, 84, 67),
-    surface_1=ColorScale(239, 20, 98),
-    surface_2=ColorScale(239, 15, 96),
-    surface_3=ColorScale(239, 12, 93),
+    background=ColorScale.of(239, 50, 98),
+    foreground=ColorScale.of(218, 47, 15),
+    card=ColorScale.of(239, 45, 95),
+    card_foreground=ColorScale.of(218, 47, 15),
+    popover=ColorScale.of(239, 45, 95),
+    popover_foreground=ColorScale.of(218, 47, 15),
+    primary=ColorScale.of(239, 84, 67),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(239, 40, 90),
+    secondary_foreground=ColorScale.of(218, 47, 20),
+    muted=ColorScale.of(239, 40, 92),
+    muted_foreground=ColorScale.of(218, 30, 45),
+    accent=ColorScale.of(239, 40, 90),
+    accent_foreground=ColorScale.of(218, 47, 20),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(239, 84, 67),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(239, 84, 62),
+    link_hover=ColorScale.of(239, 84, 52),
+    code=ColorScale.of(239, 45, 93),
+    code_foreground=ColorScale.of(218, 47, 15),
+    selection=ColorScale.of(239, 84, 67),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(239, 84, 67),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(239, 40, 85),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(239, 84, 67),
+    surface_1=ColorScale.of(239, 20, 98),
+    surface_2=ColorScale.of(239, 15, 96),
+    surface_3=ColorScale.of(239, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(218, 47, 11),
-    foreground=ColorScale(239, 50, 95),
-    card=ColorScale(220, 45, 15),
-    card_foreground=ColorScale(239, 50, 95),
-    popover=ColorScale(220, 45, 15),
-    popover_foreground=ColorScale(239, 50, 95),
-    primary=ColorScale(239, 84, 67),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(218, 45, 18),
-    secondary_foreground=ColorScale(239, 50, 95),
-    muted=ColorScale(218, 45, 18),
-    muted_foreground=ColorScale(239, 30, 70),
-    accent=ColorScale(218, 45, 18),
-    accent_foreground=ColorScale(239, 84, 80),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(239, 84, 67),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(239, 84, 67),
-    link_hover=ColorScale(239, 84, 77),
-    code=ColorScale(218, 45, 9),
-    code_foreground=ColorScale(239, 50, 95),
-    selection=ColorScale(239, 84, 67),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(239, 84, 67),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(218, 45, 18),
-    input=ColorScale(220, 45, 15),
-    ring=ColorScale(239, 84, 67),
-    surface_1=ColorScale(218, 25, 4),
-    surface_2=ColorScale(218, 20, 7),
-    surface_3=ColorScale(218, 15, 11),
+    background=ColorScale.of(218, 47, 11),
+    foreground=ColorScale.of(239, 50, 95),
+    card=ColorScale.of(220, 45, 15),
+    card_foreground=ColorScale.of(239, 50, 95),
+    popover=ColorScale.of(220, 45, 15),
+    popover_foreground=ColorScale.of(239, 50, 95),
+    primary=ColorScale.of(239, 84, 67),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(218, 45, 18),
+    secondary_foreground=ColorScale.of(239, 50, 95),
+    muted=ColorScale.of(218, 45, 18),
+    muted_foreground=ColorScale.of(239, 30, 70),
+    accent=ColorScale.of(218, 45, 18),
+    accent_foreground=ColorScale.of(239, 84, 80),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(239, 84, 67),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(239, 84, 67),
+    link_hover=ColorScale.of(239, 84, 77),
+    code=ColorScale.of(218, 45, 9),
+    code_foreground=ColorScale.of(239, 50, 95),
+    selection=ColorScale.of(239, 84, 67),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(239, 84, 67),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(218, 45, 18),
+    input=ColorScale.of(220, 45, 15),
+    ring=ColorScale.of(239, 84, 67),
+    surface_1=ColorScale.of(218, 25, 4),
+    surface_2=ColorScale.of(218, 20, 7),
+    surface_3=ColorScale.of(218, 15, 11),
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 98),
-    foreground=ColorScale(300, 10, 15),
-    card=ColorScale(300, 5, 95),
-    card_foreground=ColorScale(300, 10, 15),
-    popover=ColorScale(300, 5, 95),
-    popover_foreground=ColorScale(300, 10, 15),
-    primary=ColorScale(330, 100, 60),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(300, 5, 90),
-    secondary_foreground=ColorScale(300, 10, 15),
-    muted=ColorScale(300, 5, 90),
-    muted_foreground=ColorScale(300, 5, 45),
-    accent=ColorScale(300, 5, 88),
-    accent_foreground=ColorScale(300, 10, 15),
-    destructive=ColorScale(0, 85, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 85, 55),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(210, 70, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(330, 100, 55),
-    link_hover=ColorScale(330, 100, 45),
-    code=ColorScale(300, 5, 92),
-    code_foreground=ColorScale(330, 100, 50),
-    selection=ColorScale(330, 80, 85),
-    selection_foreground=ColorScale(330, 10, 15),
-    brand=ColorScale(330, 100, 60),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(300, 5, 82),
-    input=ColorScale(300, 5, 82),
-    ring=ColorScale(330, 100, 60),
-    surface_1=ColorScale(330, 5, 96),
-    surface_2=ColorScale(330, 5, 93),
-    surface_3=ColorScale(330, 5, 90),
+    background=ColorScale.of(0, 0, 98),
+    foreground=ColorScale.of(300, 10, 15),
+    card=ColorScale.of(300, 5, 95),
+    card_foreground=ColorScale.of(300, 10, 15),
+    popover=ColorScale.of(300, 5, 95),
+    popover_foreground=ColorScale.of(300, 10, 15),
+    primary=ColorScale.of(330, 100, 60),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(300, 5, 90),
+    secondary_foreground=ColorScale.of(300, 10, 15),
+    muted=ColorScale.of(300, 5, 90),
+    muted_foreground=ColorScale.of(300, 5, 45),
+    accent=ColorScale.of(300, 5, 88),
+    accent_foreground=ColorScale.of(300, 10, 15),
+    destructive=ColorScale.of(0, 85, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 85, 55),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(210, 70, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(330, 100, 55),
+    link_hover=ColorScale.of(330, 100, 45),
+    code=ColorScale.of(300, 5, 92),
+    code_foreground=ColorScale.of(330, 100, 50),
+    selection=ColorScale.of(330, 80, 85),
+    selection_foreground=ColorScale.of(330, 10, 15),
+    brand=ColorScale.of(330, 100, 60),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(300, 5, 82),
+    input=ColorScale.of(300, 5, 82),
+    ring=ColorScale.of(330, 100, 60),
+    surface_1=ColorScale.of(330, 5, 96),
+    surface_2=ColorScale.of(330, 5, 93),
+    surface_3=ColorScale.of(330, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 3),
-    foreground=ColorScale(0, 0, 85),
-    card=ColorScale(300, 5, 6),
-    card_foreground=ColorScale(0, 0, 85),
-    popover=ColorScale(300, 5, 6),
-    popover_foreground=ColorScale(0, 0, 85),
-    primary=ColorScale(330, 100, 60),
-    primary_foreground=ColorScale(0, 0, 3),
-    secondary=ColorScale(300, 5, 10),
-    secondary_foreground=ColorScale(0, 0, 85),
-    muted=ColorScale(300, 5, 10),
-    muted_foreground=ColorScale(0, 0, 45),
-    accent=ColorScale(300, 5, 12),
-    accent_foreground=ColorScale(0, 0, 85),
-    destructive=ColorScale(0, 85, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 50),
-    success_foreground=ColorScale(0, 0, 3),
-    warning=ColorScale(45, 85, 55),
-    warning_foreground=ColorScale(0, 0, 3),
-    info=ColorScale(210, 70, 60),
-    info_foreground=ColorScale(0, 0, 3),
-    link=ColorScale(330, 100, 60),
-    link_hover=ColorScale(330, 100, 75),
-    code=ColorScale(300, 5, 8),
-    code_foreground=ColorScale(330, 100, 65),
-    selection=ColorScale(330, 80, 25),
-    selection_foreground=ColorScale(330, 10, 90),
-    brand=ColorScale(330, 100, 60),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(300, 5, 12),
-    input=ColorScale(300, 5, 12),
-    ring=ColorScale(330, 100, 60),
-    surface_1=ColorScale(330, 5, 6),
-    surface_2=ColorScale(330, 5, 10),
-    surface_3=ColorScale(330, 5, 14),
+    background=ColorScale.of(0, 0, 3),
+    foreground=ColorScale.of(0, 0, 85),
+    card=ColorScale.of(300, 5, 6),
+    card_foreground=ColorScale.of(0, 0, 85),
+    popover=ColorScale.of(300, 5, 6),
+    popover_foreground=ColorScale.of(0, 0, 85),
+    primary=ColorScale.of(330, 100, 60),
+    primary_foreground=ColorScale.of(0, 0, 3),
+    secondary=ColorScale.of(300, 5, 10),
+    secondary_foreground=ColorScale.of(0, 0, 85),
+    muted=ColorScale.of(300, 5, 10),
+    muted_foreground=ColorScale.of(0, 0, 45),
+    accent=ColorScale.of(300, 5, 12),
+    accent_foreground=ColorScale.of(0, 0, 85),
+    destructive=ColorScale.of(0, 85, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 50),
+    success_foreground=ColorScale.of(0, 0, 3),
+    warning=ColorScale.of(45, 85, 55),
+    warning_foreground=ColorScale.of(0, 0, 3),
+    info=ColorScale.of(210, 70, 60),
+    info_foreground=ColorScale.of(0, 0, 3),
+    link=ColorScale.of(330, 100, 60),
+    link_hover=ColorScale.of(330, 100, 75),
+    code=ColorScale.of(300, 5, 8),
+    code_foreground=ColorScale.of(330, 100, 65),
+    selection=ColorScale.of(330, 80, 25),
+    selection_foreground=ColorScale.of(330, 10, 90),
+    brand=ColorScale.of(330, 100, 60),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(300, 5, 12),
+    input=ColorScale.of(300, 5, 12),
+    ring=ColorScale.of(330, 100, 60),
+    surface_1=ColorScale.of(330, 5, 6),
+    surface_2=ColorScale.of(330, 5, 10),
+    surface_3=ColorScale.of(330, 5, 14),
 )
 
 PRESET = ThemePreset(
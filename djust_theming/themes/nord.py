@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(220, 16, 22),
-    card=ColorScale(219, 28, 97),
-    card_foreground=ColorScale(220, 16, 22),
-    popover=ColorScale(219, 28, 97),
-    popover_foreground=ColorScale(220, 16, 22),
-    primary=ColorScale(193, 43, 67),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(219, 20, 92),
-    secondary_foreground=ColorScale(220, 16, 22),
-    muted=ColorScale(219, 20, 92),
-    muted_foreground=ColorScale(220, 16, 45),
-    accent=ColorScale(219, 20, 92),
-    accent_foreground=ColorScale(210, 34, 63),
-    destructive=ColorScale(354, 42, 56),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(92, 28, 65),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(40, 71, 73),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(210, 34, 63),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(213, 32, 52),
-    link_hover=ColorScale(213, 32, 42),
-    code=ColorScale(219, 28, 97),
-    code_foreground=ColorScale(220, 16, 22),
-    selection=ColorScale(193, 43, 77),
-    selection_foreground=ColorScale(220, 16, 22),
-    brand=ColorScale(193, 43, 67),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(219, 20, 92),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(193, 43, 67),
-    surface_1=ColorScale(220, 18, 98),
-    surface_2=ColorScale(220, 14, 96),
-    surface_3=ColorScale(220, 10, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(220, 16, 22),
+    card=ColorScale.of(219, 28, 97),
+    card_foreground=ColorScale.of(220, 16, 22),
+    popover=ColorScale.of(219, 28, 97),
+    popover_foreground=ColorScale.of(220, 16, 22),
+    primary=ColorScale.of(193, 43, 67),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(219, 20, 92),
+    secondary_foreground=ColorScale.of(220, 16, 22),
+    muted=ColorScale.of(219, 20, 92),
+    muted_foreground=ColorScale.of(220, 16, 45),
+    accent=ColorScale.of(219, 20, 92),
+    accent_foreground=ColorScale.of(210, 34, 63),
+    destructive=ColorScale.of(354, 42, 56),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(92, 28, 65),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(40, 71, 73),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(210, 34, 63),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(213, 32, 52),
+    link_hover=ColorScale.of(213, 32, 42),
+    code=ColorScale.of(219, 28, 97),
+    code_foreground=ColorScale.of(220, 16, 22),
+    selection=ColorScale.of(193, 43, 77),
+    selection_foreground=ColorScale.of(220, 16, 22),
+    brand=ColorScale.of(193, 43, 67),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(219, 20, 92),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(193, 43, 67),
+    surface_1=ColorScale.of(220, 18, 98),
+    surface_2=ColorScale.of(220, 14, 96),
+    surface_3=ColorScale.of(220, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(220, 16, 22),
-    foreground=ColorScale(219, 28, 88),
-    card=ColorScale(220, 16, 28),
-    card_foreground=ColorScale(219, 28, 88),
-    popover=ColorScale(220, 16, 28),
-    popover_foreground=ColorScale(219, 28, 88),
-    primary=ColorScale(193, 43, 67),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 16, 32),
-    secondary_foreground=ColorScale(219, 28, 88),
-    muted=ColorScale(220, 16, 32),
-    muted_foreground=ColorScale(219, 14, 62),
-    accent=ColorScale(220, 16, 32),
-    accent_foreground=ColorScale(210, 34, 63),
-    destructive=ColorScale(354, 42, 56),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(92, 28, 65),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(40, 71, 73),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(210, 34, 63),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(213, 32, 52),
-    link_hover=ColorScale(213, 32, 62),
-    code=ColorScale(220, 17, 18),
-    code_foreground=ColorScale(219, 28, 88),
-    selection=ColorScale(210, 34, 63),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(193, 43, 67),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(220, 16, 32),
-    input=ColorScale(220, 16, 28),
-    ring=ColorScale(193, 43, 67),
-    surface_1=ColorScale(220, 18, 10),
-    surface_2=ColorScale(220, 15, 14),
-    surface_3=ColorScale(220, 12, 18),
+    background=ColorScale.of(220, 16, 22),
+    foreground=ColorScale.of(219, 28, 88),
+    card=ColorScale.of(220, 16, 28),
+    card_foreground=ColorScale.of(219, 28, 88),
+    popover=ColorScale.of(220, 16, 28),
+    popover_foreground=ColorScale.of(219, 28, 88),
+    primary=ColorScale.of(193, 43, 67),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 16, 32),
+    secondary_foreground=ColorScale.of(219, 28, 88),
+    muted=ColorScale.of(220, 16, 32),
+    muted_foreground=ColorScale.of(219, 14, 62),
+    accent=ColorScale.of(220, 16, 32),
+    accent_foreground=ColorScale.of(210, 34, 63),
+    destructive=ColorScale.of(354, 42, 56),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(92, 28, 65),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(40, 71, 73),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(210, 34, 63),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(213, 32, 52),
+    link_hover=ColorScale.of(213, 32, 62),
+    code=ColorScale.of(220, 17, 18),
+    code_foreground=ColorScale.of(219, 28, 88),
+    selection=ColorScale.of(210, 34, 63),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(193, 43, 67),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(220, 16, 32),
+    input=ColorScale.of(220, 16, 28),
+    ring=ColorScale.of(193, 43, 67),
+    surface_1=ColorScale.of(220, 18, 10),
+    surface_2=ColorScale.of(220, 15, 14),
+    surface_3=ColorScale.of(220, 12, 18),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # - Serif headings, generous line-height, minimal decoration
 
 LIGHT = ThemeTokens(
-    background=ColorScale(60, 11, 98),                # #FBFBFA — warm off-white
-    foreground=ColorScale(45, 8, 20),                  # #37352F — warm near-black
-    card=ColorScale(0, 0, 100),                        # Pure white cards
-    card_foreground=ColorScale(45, 8, 20),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(45, 8, 20),
-    primary=ColorScale(210, 77, 51),                   # Blue primary
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(60, 5, 95),                   # Warm subtle bg
-    secondary_foreground=ColorScale(45, 8, 20),
-    muted=ColorScale(60, 4, 93),                       # Warm muted surface
-    muted_foreground=ColorScale(45, 2, 46),            # Muted text
-    accent=ColorScale(60, 5, 96),                      # Warm hover surface
-    accent_foreground=ColorScale(45, 8, 20),
-    destructive=ColorScale(0, 70, 50),                 # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 50, 40),                   # Green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(30, 89, 45),                    # Orange
-    warning_foreground=ColorScale(45, 8, 20),
-    info=ColorScale(210, 77, 51),                      # Primary as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(210, 77, 48),                      # Blue link
-    link_hover=ColorScale(210, 77, 40),                # Darker on hover
-    code=ColorScale(60, 5, 95),                        # Light warm code bg
-    code_foreground=ColorScale(45, 8, 20),             # Dark text in code
-    selection=ColorScale(201, 47, 88),                 # Pale blue selection
-    selection_foreground=ColorScale(45, 8, 20),
-    brand=ColorScale(19, 31, 47),                      # #9F6B53 — Notion brown
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(60, 4, 91),                      # #E9E9E7 — warm subtle border
-    input=ColorScale(60, 4, 91),
-    ring=ColorScale(210, 77, 51),                      # Blue focus ring
-    surface_1=ColorScale(60, 11, 98),                  # Lightest warm
-    surface_2=ColorScale(60, 7, 96),                   # Mid warm
-    surface_3=ColorScale(60, 5, 94),                   # Slightly deeper
+    background=ColorScale.of(60, 11, 98),                # #FBFBFA — warm off-white
+    foreground=ColorScale.of(45, 8, 20),                  # #37352F — warm near-black
+    card=ColorScale.of(0, 0, 100),                        # Pure white cards
+    card_foreground=ColorScale.of(45, 8, 20),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(45, 8, 20),
+    primary=ColorScale.of(210, 77, 51),                   # Blue primary
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(60, 5, 95),                   # Warm subtle bg
+    secondary_foreground=ColorScale.of(45, 8, 20),
+    muted=ColorScale.of(60, 4, 93),                       # Warm muted surface
+    muted_foreground=ColorScale.of(45, 2, 46),            # Muted text
+    accent=ColorScale.of(60, 5, 96),                      # Warm hover surface
+    accent_foreground=ColorScale.of(45, 8, 20),
+    destructive=ColorScale.of(0, 70, 50),                 # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 50, 40),                   # Green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(30, 89, 45),                    # Orange
+    warning_foreground=ColorScale.of(45, 8, 20),
+    info=ColorScale.of(210, 77, 51),                      # Primary as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(210, 77, 48),                      # Blue link
+    link_hover=ColorScale.of(210, 77, 40),                # Darker on hover
+    code=ColorScale.of(60, 5, 95),                        # Light warm code bg
+    code_foreground=ColorScale.of(45, 8, 20),             # Dark text in code
+    selection=ColorScale.of(201, 47, 88),                 # Pale blue selection
+    selection_foreground=ColorScale.of(45, 8, 20),
+    brand=ColorScale.of(19, 31, 47),                      # #9F6B53 — Notion brown
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(60, 4, 91),                      # #E9E9E7 — warm subtle border
+    input=ColorScale.of(60, 4, 91),
+    ring=ColorScale.of(210, 77, 51),                      # Blue focus ring
+    surface_1=ColorScale.of(60, 11, 98),                  # Lightest warm
+    surface_2=ColorScale.of(60, 7, 96),                   # Mid warm
+    surface_3=ColorScale.of(60, 5, 94),                   # Slightly deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 15),                   # Dark neutral
-    foreground=ColorScale(60, 5, 90),                  # Light warm text
-    card=ColorScale(0, 0, 18),                         # Slightly lighter card
-    card_foreground=ColorScale(60, 5, 90),
-    popover=ColorScale(0, 0, 18),
-    popover_foreground=ColorScale(60, 5, 90),
-    primary=ColorScale(210, 77, 58),                   # Blue — brightened for dark
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 20),                    # Dark panel
-    secondary_foreground=ColorScale(60, 5, 90),
-    muted=ColorScale(0, 0, 22),                        # Dark muted
-    muted_foreground=ColorScale(45, 3, 55),            # Muted text on dark
-    accent=ColorScale(0, 0, 20),                       # Dark hover surface
-    accent_foreground=ColorScale(60, 5, 90),
-    destructive=ColorScale(0, 70, 55),                 # Red — brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 50, 48),                   # Green — brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(30, 89, 52),                    # Orange — brightened
-    warning_foreground=ColorScale(0, 0, 15),
-    info=ColorScale(210, 77, 58),                      # Primary
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(210, 77, 62),                      # Blue — brightened
-    link_hover=ColorScale(210, 77, 55),                # Lighter blue
-    code=ColorScale(0, 0, 12),                         # Dark code bg
-    code_foreground=ColorScale(60, 5, 85),             # Light text in code
-    selection=ColorScale(210, 40, 25),                 # Dark blue selection
-    selection_foreground=ColorScale(60, 5, 90),
-    brand=ColorScale(19, 31, 55),                      # Brown — brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 25),                       # Dark border
-    input=ColorScale(0, 0, 25),
-    ring=ColorScale(210, 77, 58),                      # Blue focus ring
-    surface_1=ColorScale(0, 0, 12),                    # Deepest
-    surface_2=ColorScale(0, 0, 15),                    # Mid
-    surface_3=ColorScale(0, 0, 18),                    # Elevated
+    background=ColorScale.of(0, 0, 15),                   # Dark neutral
+    foreground=ColorScale.of(60, 5, 90),                  # Light warm text
+    card=ColorScale.of(0, 0, 18),                         # Slightly lighter card
+    card_foreground=ColorScale.of(60, 5, 90),
+    popover=ColorScale.of(0, 0, 18),
+    popover_foreground=ColorScale.of(60, 5, 90),
+    primary=ColorScale.of(210, 77, 58),                   # Blue — brightened for dark
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 20),                    # Dark panel
+    secondary_foreground=ColorScale.of(60, 5, 90),
+    muted=ColorScale.of(0, 0, 22),                        # Dark muted
+    muted_foreground=ColorScale.of(45, 3, 55),            # Muted text on dark
+    accent=ColorScale.of(0, 0, 20),                       # Dark hover surface
+    accent_foreground=ColorScale.of(60, 5, 90),
+    destructive=ColorScale.of(0, 70, 55),                 # Red — brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 50, 48),                   # Green — brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(30, 89, 52),                    # Orange — brightened
+    warning_foreground=ColorScale.of(0, 0, 15),
+    info=ColorScale.of(210, 77, 58),                      # Primary
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(210, 77, 62),                      # Blue — brightened
+    link_hover=ColorScale.of(210, 77, 55),                # Lighter blue
+    code=ColorScale.of(0, 0, 12),                         # Dark code bg
+    code_foreground=ColorScale.of(60, 5, 85),             # Light text in code
+    selection=ColorScale.of(210, 40, 25),                 # Dark blue selection
+    selection_foreground=ColorScale.of(60, 5, 90),
+    brand=ColorScale.of(19, 31, 55),                      # Brown — brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 25),                       # Dark border
+    input=ColorScale.of(0, 0, 25),
+    ring=ColorScale.of(210, 77, 58),                      # Blue focus ring
+    surface_1=ColorScale.of(0, 0, 12),                    # Deepest
+    surface_2=ColorScale.of(0, 0, 15),                    # Mid
+    surface_3=ColorScale.of(0, 0, 18),                    # Elevated
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(200, 25, 97),
-    foreground=ColorScale(210, 40, 15),
-    card=ColorScale(200, 22, 94),
-    card_foreground=ColorScale(210, 40, 15),
-    popover=ColorScale(200, 22, 94),
-    popover_foreground=ColorScale(210, 40, 15),
-    primary=ColorScale(200, 80, 45),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(200, 18, 88),
-    secondary_foreground=ColorScale(210, 40, 15),
-    muted=ColorScale(200, 18, 88),
-    muted_foreground=ColorScale(210, 20, 45),
-    accent=ColorScale(180, 50, 45),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 70, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 42),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 80, 55),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(200, 80, 45),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(200, 80, 40),
-    link_hover=ColorScale(200, 80, 32),
-    code=ColorScale(200, 18, 91),
-    code_foreground=ColorScale(200, 80, 35),
-    selection=ColorScale(200, 80, 85),
-    selection_foreground=ColorScale(200, 10, 15),
-    brand=ColorScale(200, 80, 45),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(200, 15, 80),
-    input=ColorScale(200, 15, 80),
-    ring=ColorScale(200, 80, 45),
-    surface_1=ColorScale(200, 5, 96),
-    surface_2=ColorScale(200, 5, 93),
-    surface_3=ColorScale(200, 5, 90),
+    background=ColorScale.of(200, 25, 97),
+    foreground=ColorScale.of(210, 40, 15),
+    card=ColorScale.of(200, 22, 94),
+    card_foreground=ColorScale.of(210, 40, 15),
+    popover=ColorScale.of(200, 22, 94),
+    popover_foreground=ColorScale.of(210, 40, 15),
+    primary=ColorScale.of(200, 80, 45),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(200, 18, 88),
+    secondary_foreground=ColorScale.of(210, 40, 15),
+    muted=ColorScale.of(200, 18, 88),
+    muted_foreground=ColorScale.of(210, 20, 45),
+    accent=ColorScale.of(180, 50, 45),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 70, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 42),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 80, 55),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(200, 80, 45),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(200, 80, 40),
+    link_hover=ColorScale.of(200, 80, 32),
+    code=ColorScale.of(200, 18, 91),
+    code_foreground=ColorScale.of(200, 80, 35),
+    selection=ColorScale.of(200, 80, 85),
+    selection_foreground=ColorScale.of(200, 10, 15),
+    brand=ColorScale.of(200, 80, 45),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(200, 15, 80),
+    input=ColorScale.of(200, 15, 80),
+    ring=ColorScale.of(200, 80, 45),
+    surface_1=ColorScale.of(200, 5, 96),
+    surface_2=ColorScale.of(200, 5, 93),
+    surface_3=ColorScale.of(200, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(210, 60, 8),
-    foreground=ColorScale(195, 30, 88),
-    card=ColorScale(210, 50, 12),
-    card_foreground=ColorScale(195, 30, 88),
-    popover=ColorScale(210, 50, 12),
-    popover_foreground=ColorScale(195, 30, 88),
-    primary=ColorScale(200, 80, 55),
-    primary_foreground=ColorScale(210, 60, 8),
-    secondary=ColorScale(210, 50, 16),
-    secondary_foreground=ColorScale(195, 30, 88),
-    muted=ColorScale(210, 50, 16),
-    muted_foreground=ColorScale(200, 20, 55),
-    accent=ColorScale(180, 50, 50),
-    accent_foreground=ColorScale(210, 60, 8),
-    destructive=ColorScale(0, 70, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 60, 50),
-    success_foreground=ColorScale(210, 60, 8),
-    warning=ColorScale(40, 80, 60),
-    warning_foreground=ColorScale(210, 60, 8),
-    info=ColorScale(200, 80, 55),
-    info_foreground=ColorScale(210, 60, 8),
-    link=ColorScale(200, 80, 55),
-    link_hover=ColorScale(180, 50, 65),
-    code=ColorScale(210, 50, 14),
-    code_foreground=ColorScale(180, 50, 60),
-    selection=ColorScale(200, 80, 25),
-    selection_foreground=ColorScale(200, 10, 90),
-    brand=ColorScale(200, 80, 55),
-    brand_foreground=ColorScale(210, 60, 8),
-    border=ColorScale(210, 50, 20),
-    input=ColorScale(210, 50, 20),
-    ring=ColorScale(200, 80, 55),
-    surface_1=ColorScale(200, 5, 6),
-    surface_2=ColorScale(200, 5, 10),
-    surface_3=ColorScale(200, 5, 14),
+    background=ColorScale.of(210, 60, 8),
+    foreground=ColorScale.of(195, 30, 88),
+    card=ColorScale.of(210, 50, 12),
+    card_foreground=ColorScale.of(195, 30, 88),
+    popover=ColorScale.of(210, 50, 12),
+    popover_foreground=ColorScale.of(195, 30, 88),
+    primary=ColorScale.of(200, 80, 55),
+    primary_foreground=ColorScale.of(210, 60, 8),
+    secondary=ColorScale.of(210, 50, 16),
+    secondary_foreground=ColorScale.of(195, 30, 88),
+    muted=ColorScale.of(210, 50, 16),
+    muted_foreground=ColorScale.of(200, 20, 55),
+    accent=ColorScale.of(180, 50, 50),
+    accent_foreground=ColorScale.of(210, 60, 8),
+    destructive=ColorScale.of(0, 70, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 60, 50),
+    success_foreground=ColorScale.of(210, 60, 8),
+    warning=ColorScale.of(40, 80, 60),
+    warning_foreground=ColorScale.of(210, 60, 8),
+    info=ColorScale.of(200, 80, 55),
+    info_foreground=ColorScale.of(210, 60, 8),
+    link=ColorScale.of(200, 80, 55),
+    link_hover=ColorScale.of(180, 50, 65),
+    code=ColorScale.of(210, 50, 14),
+    code_foreground=ColorScale.of(180, 50, 60),
+    selection=ColorScale.of(200, 80, 25),
+    selection_foreground=ColorScale.of(200, 10, 90),
+    brand=ColorScale.of(200, 80, 55),
+    brand_foreground=ColorScale.of(210, 60, 8),
+    border=ColorScale.of(210, 50, 20),
+    input=ColorScale.of(210, 50, 20),
+    ring=ColorScale.of(200, 80, 55),
+    surface_1=ColorScale.of(200, 5, 6),
+    surface_2=ColorScale.of(200, 5, 10),
+    surface_3=ColorScale.of(200, 5, 14),
 )
 
 PRESET = ThemePreset(
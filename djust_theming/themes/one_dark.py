@@ -19,81 +19,81 @@ from ._base import (
 # - Yellow #e5c07b, Red #e06c75, Cyan #56b6c2
 
 LIGHT = ThemeTokens(
-    background=ColorScale(220, 10, 98),               # Very light cool gray
-    foreground=ColorScale(220, 13, 18),                # Dark bg as fg
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(220, 13, 18),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(220, 13, 18),
-    primary=ColorScale(207, 82, 66),                   # Blue #61afef
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(220, 10, 95),
-    secondary_foreground=ColorScale(220, 13, 18),
-    muted=ColorScale(220, 10, 90),
-    muted_foreground=ColorScale(221, 14, 45),
-    accent=ColorScale(220, 10, 95),                    # Subtle hover surface
-    accent_foreground=ColorScale(220, 13, 18),
-    destructive=ColorScale(355, 65, 65),               # Red #e06c75
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(95, 38, 62),                    # Green #98c379
-    success_foreground=ColorScale(220, 13, 18),
-    warning=ColorScale(39, 67, 69),                    # Yellow #e5c07b
-    warning_foreground=ColorScale(220, 13, 18),
-    info=ColorScale(187, 47, 55),                      # Cyan #56b6c2
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(207, 82, 66),                      # Blue
-    link_hover=ColorScale(207, 82, 55),
-    code=ColorScale(220, 13, 18),                      # Dark code bg
-    code_foreground=ColorScale(95, 38, 62),            # Green code text
-    selection=ColorScale(207, 82, 90),                 # Pale blue selection
-    selection_foreground=ColorScale(220, 13, 18),
-    brand=ColorScale(286, 60, 67),                     # Magenta #c678dd
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 10, 88),
-    input=ColorScale(220, 10, 92),
-    ring=ColorScale(207, 82, 66),
-    surface_1=ColorScale(220, 10, 98),
-    surface_2=ColorScale(220, 10, 95),
-    surface_3=ColorScale(220, 10, 92),
+    background=ColorScale.of(220, 10, 98),               # Very light cool gray
+    foreground=ColorScale.of(220, 13, 18),                # Dark bg as fg
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(220, 13, 18),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(220, 13, 18),
+    primary=ColorScale.of(207, 82, 66),                   # Blue #61afef
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(220, 10, 95),
+    secondary_foreground=ColorScale.of(220, 13, 18),
+    muted=ColorScale.of(220, 10, 90),
+    muted_foreground=ColorScale.of(221, 14, 45),
+    accent=ColorScale.of(220, 10, 95),                    # Subtle hover surface
+    accent_foreground=ColorScale.of(220, 13, 18),
+    destructive=ColorScale.of(355, 65, 65),               # Red #e06c75
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(95, 38, 62),                    # Green #98c379
+    success_foreground=ColorScale.of(220, 13, 18),
+    warning=ColorScale.of(39, 67, 69),                    # Yellow #e5c07b
+    warning_foreground=ColorScale.of(220, 13, 18),
+    info=ColorScale.of(187, 47, 55),                      # Cyan #56b6c2
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(207, 82, 66),                      # Blue
+    link_hover=ColorScale.of(207, 82, 55),
+    code=ColorScale.of(220, 13, 18),                      # Dark code bg
+    code_foreground=ColorScale.of(95, 38, 62),            # Green code text
+    selection=ColorScale.of(207, 82, 90),                 # Pale blue selection
+    selection_foreground=ColorScale.of(220, 13, 18),
+    brand=ColorScale.of(286, 60, 67),                     # Magenta #c678dd
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 10, 88),
+    input=ColorScale.of(220, 10, 92),
+    ring=ColorScale.of(207, 82, 66),
+    surface_1=ColorScale.of(220, 10, 98),
+    surface_2=ColorScale.of(220, 10, 95),
+    surface_3=ColorScale.of(220, 10, 92),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(220, 13, 18),                # #282c34
-    foreground=ColorScale(219, 14, 71),                # #abb2bf
-    card=ColorScale(220, 13, 21),
-    card_foreground=ColorScale(219, 14, 71),
-    popover=ColorScale(220, 13, 21),
-    popover_foreground=ColorScale(219, 14, 71),
-    primary=ColorScale(207, 82, 66),                   # Blue #61afef
-    primary_foreground=ColorScale(220, 13, 18),
-    secondary=ColorScale(220, 13, 24),
-    secondary_foreground=ColorScale(219, 14, 71),
-    muted=ColorScale(220, 13, 26),
-    muted_foreground=ColorScale(221, 14, 45),
-    accent=ColorScale(220, 13, 24),                    # Subtle hover surface
-    accent_foreground=ColorScale(219, 14, 71),
-    destructive=ColorScale(355, 65, 65),               # Red #e06c75
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(95, 38, 62),                    # Green #98c379
-    success_foreground=ColorScale(220, 13, 18),
-    warning=ColorScale(39, 67, 69),                    # Yellow #e5c07b
-    warning_foreground=ColorScale(220, 13, 18),
-    info=ColorScale(187, 47, 55),                      # Cyan #56b6c2
-    info_foreground=ColorScale(220, 13, 18),
-    link=ColorScale(207, 82, 66),                      # Blue
-    link_hover=ColorScale(207, 82, 75),
-    code=ColorScale(220, 13, 12),                      # Very dark code bg
-    code_foreground=ColorScale(95, 38, 70),            # Green code text
-    selection=ColorScale(207, 60, 25),                 # Blue-tinted selection
-    selection_foreground=ColorScale(219, 14, 85),
-    brand=ColorScale(286, 60, 67),                     # Magenta #c678dd
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 13, 28),
-    input=ColorScale(220, 13, 28),
-    ring=ColorScale(207, 82, 66),
-    surface_1=ColorScale(220, 13, 14),
-    surface_2=ColorScale(220, 13, 18),
-    surface_3=ColorScale(220, 13, 22),
+    background=ColorScale.of(220, 13, 18),                # #282c34
+    foreground=ColorScale.of(219, 14, 71),                # #abb2bf
+    card=ColorScale.of(220, 13, 21),
+    card_foreground=ColorScale.of(219, 14, 71),
+    popover=ColorScale.of(220, 13, 21),
+    popover_foreground=ColorScale.of(219, 14, 71),
+    primary=ColorScale.of(207, 82, 66),                   # Blue #61afef
+    primary_foreground=ColorScale.of(220, 13, 18),
+    secondary=ColorScale.of(220, 13, 24),
+    secondary_foreground=ColorScale.of(219, 14, 71),
+    muted=ColorScale.of(220, 13, 26),
+    muted_foreground=ColorScale.of(221, 14, 45),
+    accent=ColorScale.of(220, 13, 24),                    # Subtle hover surface
+    accent_foreground=ColorScale.of(219, 14, 71),
+    destructive=ColorScale.of(355, 65, 65),               # Red #e06c75
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(95, 38, 62),                    # Green #98c379
+    success_foreground=ColorScale.of(220, 13, 18),
+    warning=ColorScale.of(39, 67, 69),                    # Yellow #e5c07b
+    warning_foreground=ColorScale.of(220, 13, 18),
+    info=ColorScale.of(187, 47, 55),                      # Cyan #56b6c2
+    info_foreground=ColorScale.of(220, 13, 18),
+    link=ColorScale.of(207, 82, 66),                      # Blue
+    link_hover=ColorScale.of(207, 82, 75),
+    code=ColorScale.of(220, 13, 12),                      # Very dark code bg
+    code_foreground=ColorScale.of(95, 38, 70),            # Green code text
+    selection=ColorScale.of(207, 60, 25),                 # Blue-tinted selection
+    selection_foreground=ColorScale.of(219, 14, 85),
+    brand=ColorScale.of(286, 60, 67),                     # Magenta #c678dd
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 13, 28),
+    input=ColorScale.of(220, 13, 28),
+    ring=ColorScale.of(207, 82, 66),
+    surface_1=ColorScale.of(220, 13, 14),
+    surface_2=ColorScale.of(220, 13, 18),
+    surface_3=ColorScale.of(220, 13, 22),
 )
 
 PRESET = ThemePreset(
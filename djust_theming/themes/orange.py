@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(20, 50, 10),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(20, 50, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(20, 50, 10),
-    primary=ColorScale(24, 95, 53),
-    primary_foreground=ColorScale(24, 100, 98),
-    secondary=ColorScale(24, 30, 95),
-    secondary_foreground=ColorScale(20, 50, 10),
-    muted=ColorScale(24, 30, 95),
-    muted_foreground=ColorScale(20, 15, 38),
-    accent=ColorScale(24, 30, 95),
-    accent_foreground=ColorScale(20, 50, 10),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(25, 95, 53),
-    link_hover=ColorScale(25, 95, 45),
-    code=ColorScale(25, 20, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(25, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(24, 95, 53),
-    brand_foreground=ColorScale(24, 100, 98),
-    border=ColorScale(24, 25, 88),
-    input=ColorScale(24, 25, 88),
-    ring=ColorScale(24, 95, 53),
-    surface_1=ColorScale(24, 20, 98),
-    surface_2=ColorScale(24, 15, 96),
-    surface_3=ColorScale(24, 12, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(20, 50, 10),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(20, 50, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(20, 50, 10),
+    primary=ColorScale.of(24, 95, 53),
+    primary_foreground=ColorScale.of(24, 100, 98),
+    secondary=ColorScale.of(24, 30, 95),
+    secondary_foreground=ColorScale.of(20, 50, 10),
+    muted=ColorScale.of(24, 30, 95),
+    muted_foreground=ColorScale.of(20, 15, 38),
+    accent=ColorScale.of(24, 30, 95),
+    accent_foreground=ColorScale.of(20, 50, 10),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(25, 95, 53),
+    link_hover=ColorScale.of(25, 95, 45),
+    code=ColorScale.of(25, 20, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(25, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(24, 95, 53),
+    brand_foreground=ColorScale.of(24, 100, 98),
+    border=ColorScale.of(24, 25, 88),
+    input=ColorScale.of(24, 25, 88),
+    ring=ColorScale.of(24, 95, 53),
+    surface_1=ColorScale.of(24, 20, 98),
+    surface_2=ColorScale.of(24, 15, 96),
+    surface_3=ColorScale.of(24, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(20, 50, 8),
-    foreground=ColorScale(24, 100, 98),
-    card=ColorScale(20, 50, 8),
-    card_foreground=ColorScale(24, 100, 98),
-    popover=ColorScale(20, 50, 8),
-    popover_foreground=ColorScale(24, 100, 98),
-    primary=ColorScale(24, 95, 55),
-    primary_foreground=ColorScale(20, 50, 8),
-    secondary=ColorScale(20, 30, 16),
-    secondary_foreground=ColorScale(24, 100, 98),
-    muted=ColorScale(20, 30, 16),
-    muted_foreground=ColorScale(20, 15, 85),
-    accent=ColorScale(20, 30, 16),
-    accent_foreground=ColorScale(24, 100, 98),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(25, 95, 55),
-    link_hover=ColorScale(25, 95, 65),
-    code=ColorScale(25, 30, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(25, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(24, 95, 55),
-    brand_foreground=ColorScale(20, 50, 8),
-    border=ColorScale(20, 30, 16),
-    input=ColorScale(20, 30, 16),
-    ring=ColorScale(24, 95, 55),
-    surface_1=ColorScale(20, 25, 4),
-    surface_2=ColorScale(20, 20, 7),
-    surface_3=ColorScale(20, 15, 11),
+    background=ColorScale.of(20, 50, 8),
+    foreground=ColorScale.of(24, 100, 98),
+    card=ColorScale.of(20, 50, 8),
+    card_foreground=ColorScale.of(24, 100, 98),
+    popover=ColorScale.of(20, 50, 8),
+    popover_foreground=ColorScale.of(24, 100, 98),
+    primary=ColorScale.of(24, 95, 55),
+    primary_foreground=ColorScale.of(20, 50, 8),
+    secondary=ColorScale.of(20, 30, 16),
+    secondary_foreground=ColorScale.of(24, 100, 98),
+    muted=ColorScale.of(20, 30, 16),
+    muted_foreground=ColorScale.of(20, 15, 85),
+    accent=ColorScale.of(20, 30, 16),
+    accent_foreground=ColorScale.of(24, 100, 98),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(25, 95, 55),
+    link_hover=ColorScale.of(25, 95, 65),
+    code=ColorScale.of(25, 30, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(25, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(24, 95, 55),
+    brand_foreground=ColorScale.of(20, 50, 8),
+    border=ColorScale.of(20, 30, 16),
+    input=ColorScale.of(20, 30, 16),
+    ring=ColorScale.of(24, 95, 55),
+    surface_1=ColorScale.of(20, 25, 4),
+    surface_2=ColorScale.of(20, 20, 7),
+    surface_3=ColorScale.of(20, 15, 11),
 )
 
 PRESET = ThemePreset(
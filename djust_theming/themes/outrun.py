@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 98),
-    foreground=ColorScale(240, 100, 15),
-    card=ColorScale(240, 50, 95),
-    card_foreground=ColorScale(240, 100, 15),
-    popover=ColorScale(240, 50, 95),
-    popover_foreground=ColorScale(240, 100, 15),
-    primary=ColorScale(329, 100, 71),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 50, 88),
-    secondary_foreground=ColorScale(240, 100, 15),
-    muted=ColorScale(240, 50, 88),
-    muted_foreground=ColorScale(240, 50, 45),
-    accent=ColorScale(285, 61, 66),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(187, 47, 55),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(48, 100, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(187, 47, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(329, 100, 71),
-    link_hover=ColorScale(329, 100, 61),
-    code=ColorScale(240, 50, 95),
-    code_foreground=ColorScale(240, 100, 15),
-    selection=ColorScale(329, 100, 81),
-    selection_foreground=ColorScale(240, 100, 15),
-    brand=ColorScale(180, 100, 50),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(240, 50, 88),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(329, 100, 71),
-    surface_1=ColorScale(280, 20, 98),
-    surface_2=ColorScale(280, 15, 96),
-    surface_3=ColorScale(280, 12, 93),
+    background=ColorScale.of(0, 0, 98),
+    foreground=ColorScale.of(240, 100, 15),
+    card=ColorScale.of(240, 50, 95),
+    card_foreground=ColorScale.of(240, 100, 15),
+    popover=ColorScale.of(240, 50, 95),
+    popover_foreground=ColorScale.of(240, 100, 15),
+    primary=ColorScale.of(329, 100, 71),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 50, 88),
+    secondary_foreground=ColorScale.of(240, 100, 15),
+    muted=ColorScale.of(240, 50, 88),
+    muted_foreground=ColorScale.of(240, 50, 45),
+    accent=ColorScale.of(285, 61, 66),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(187, 47, 55),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(48, 100, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(187, 47, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(329, 100, 71),
+    link_hover=ColorScale.of(329, 100, 61),
+    code=ColorScale.of(240, 50, 95),
+    code_foreground=ColorScale.of(240, 100, 15),
+    selection=ColorScale.of(329, 100, 81),
+    selection_foreground=ColorScale.of(240, 100, 15),
+    brand=ColorScale.of(180, 100, 50),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(240, 50, 88),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(329, 100, 71),
+    surface_1=ColorScale.of(280, 20, 98),
+    surface_2=ColorScale.of(280, 15, 96),
+    surface_3=ColorScale.of(280, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 100, 8),
-    foreground=ColorScale(329, 100, 95),
-    card=ColorScale(240, 100, 12),
-    card_foreground=ColorScale(329, 100, 95),
-    popover=ColorScale(240, 100, 12),
-    popover_foreground=ColorScale(329, 100, 95),
-    primary=ColorScale(329, 100, 71),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(240, 100, 18),
-    secondary_foreground=ColorScale(329, 100, 95),
-    muted=ColorScale(240, 100, 18),
-    muted_foreground=ColorScale(285, 61, 66),
-    accent=ColorScale(285, 61, 66),
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(187, 47, 55),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(48, 100, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(187, 47, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(329, 100, 71),
-    link_hover=ColorScale(329, 100, 81),
-    code=ColorScale(240, 100, 6),
-    code_foreground=ColorScale(329, 100, 95),
-    selection=ColorScale(329, 100, 71),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(180, 100, 50),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(240, 100, 18),
-    input=ColorScale(240, 100, 12),
-    ring=ColorScale(329, 100, 71),
-    surface_1=ColorScale(240, 25, 4),
-    surface_2=ColorScale(240, 20, 7),
-    surface_3=ColorScale(240, 15, 11),
+    background=ColorScale.of(240, 100, 8),
+    foreground=ColorScale.of(329, 100, 95),
+    card=ColorScale.of(240, 100, 12),
+    card_foreground=ColorScale.of(329, 100, 95),
+    popover=ColorScale.of(240, 100, 12),
+    popover_foreground=ColorScale.of(329, 100, 95),
+    primary=ColorScale.of(329, 100, 71),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(240, 100, 18),
+    secondary_foreground=ColorScale.of(329, 100, 95),
+    muted=ColorScale.of(240, 100, 18),
+    muted_foreground=ColorScale.of(285, 61, 66),
+    accent=ColorScale.of(285, 61, 66),
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(187, 47, 55),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(48, 100, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(187, 47, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(329, 100, 71),
+    link_hover=ColorScale.of(329, 100, 81),
+    code=ColorScale.of(240, 100, 6),
+    code_foreground=ColorScale.of(329, 100, 95),
+    selection=ColorScale.of(329, 100, 71),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(180, 100, 50),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(240, 100, 18),
+    input=ColorScale.of(240, 100, 12),
+    ring=ColorScale.of(329, 100, 71),
+    surface_1=ColorScale.of(240, 25, 4),
+    surface_2=ColorScale.of(240, 20, 7),
+    surface_3=ColorScale.of(240, 15, 11),
 )
 
 PRESET = ThemePreset(
@@ -21,82 +21,82 @@ from ._base import (
 # - Borders: like pencil lines on paper — light and warm
 
 LIGHT = ThemeTokens(
-    background=ColorScale(38, 45, 97),             # Cream paper — warm, sunlit
-    foreground=ColorScale(25, 25, 16),             # Warm near-black — like printed text
-    card=ColorScale(38, 35, 99),                   # Slightly brighter cream
-    card_foreground=ColorScale(25, 25, 16),
-    popover=ColorScale(38, 35, 99),
-    popover_foreground=ColorScale(25, 25, 16),
-    primary=ColorScale(25, 50, 38),                # Rich leather brown — bookbinding
-    primary_foreground=ColorScale(38, 45, 97),     # Cream on brown
-    secondary=ColorScale(38, 30, 93),              # Lighter cream panel
-    secondary_foreground=ColorScale(25, 25, 16),
-    muted=ColorScale(38, 25, 90),                  # Muted cream
-    muted_foreground=ColorScale(25, 12, 45),       # Faded print
-    accent=ColorScale(38, 25, 95),                 # Warm hover
-    accent_foreground=ColorScale(25, 25, 16),
-    destructive=ColorScale(5, 55, 48),             # Muted warm red — like a margin note
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 30, 38),               # Forest green — like a bookplate
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 65, 50),                # Warm amber — like aged paper edge
-    warning_foreground=ColorScale(25, 25, 16),
-    info=ColorScale(215, 45, 45),                  # Blue-ink — traditional
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(215, 50, 42),                  # Blue ink — the one cool color
-    link_hover=ColorScale(215, 50, 32),            # Darker blue on hover
-    code=ColorScale(25, 25, 16),                   # Dark as printed code
-    code_foreground=ColorScale(38, 45, 90),        # Light cream on dark code
-    selection=ColorScale(215, 50, 85),             # Pale blue-ink selection
-    selection_foreground=ColorScale(25, 25, 16),
-    brand=ColorScale(25, 50, 38),                  # Leather brown IS the brand
-    brand_foreground=ColorScale(38, 45, 97),
-    border=ColorScale(38, 18, 82),                 # Pencil line — light and warm
-    input=ColorScale(38, 20, 94),                  # Near-cream input
-    ring=ColorScale(215, 50, 42),                  # Blue-ink focus ring
-    surface_1=ColorScale(38, 45, 97),              # Paper base
-    surface_2=ColorScale(38, 35, 94),              # Slightly aged
-    surface_3=ColorScale(38, 25, 91),              # Deeper cream
+    background=ColorScale.of(38, 45, 97),             # Cream paper — warm, sunlit
+    foreground=ColorScale.of(25, 25, 16),             # Warm near-black — like printed text
+    card=ColorScale.of(38, 35, 99),                   # Slightly brighter cream
+    card_foreground=ColorScale.of(25, 25, 16),
+    popover=ColorScale.of(38, 35, 99),
+    popover_foreground=ColorScale.of(25, 25, 16),
+    primary=ColorScale.of(25, 50, 38),                # Rich leather brown — bookbinding
+    primary_foreground=ColorScale.of(38, 45, 97),     # Cream on brown
+    secondary=ColorScale.of(38, 30, 93),              # Lighter cream panel
+    secondary_foreground=ColorScale.of(25, 25, 16),
+    muted=ColorScale.of(38, 25, 90),                  # Muted cream
+    muted_foreground=ColorScale.of(25, 12, 45),       # Faded print
+    accent=ColorScale.of(38, 25, 95),                 # Warm hover
+    accent_foreground=ColorScale.of(25, 25, 16),
+    destructive=ColorScale.of(5, 55, 48),             # Muted warm red — like a margin note
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 30, 38),               # Forest green — like a bookplate
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 65, 50),                # Warm amber — like aged paper edge
+    warning_foreground=ColorScale.of(25, 25, 16),
+    info=ColorScale.of(215, 45, 45),                  # Blue-ink — traditional
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(215, 50, 42),                  # Blue ink — the one cool color
+    link_hover=ColorScale.of(215, 50, 32),            # Darker blue on hover
+    code=ColorScale.of(25, 25, 16),                   # Dark as printed code
+    code_foreground=ColorScale.of(38, 45, 90),        # Light cream on dark code
+    selection=ColorScale.of(215, 50, 85),             # Pale blue-ink selection
+    selection_foreground=ColorScale.of(25, 25, 16),
+    brand=ColorScale.of(25, 50, 38),                  # Leather brown IS the brand
+    brand_foreground=ColorScale.of(38, 45, 97),
+    border=ColorScale.of(38, 18, 82),                 # Pencil line — light and warm
+    input=ColorScale.of(38, 20, 94),                  # Near-cream input
+    ring=ColorScale.of(215, 50, 42),                  # Blue-ink focus ring
+    surface_1=ColorScale.of(38, 45, 97),              # Paper base
+    surface_2=ColorScale.of(38, 35, 94),              # Slightly aged
+    surface_3=ColorScale.of(38, 25, 91),              # Deeper cream
 )
 
 DARK = ThemeTokens(
     # Dark mode: reading by lamplight — warm dark, golden-tinted text
-    background=ColorScale(25, 20, 11),             # Dark leather — warm, not cold
-    foreground=ColorScale(38, 30, 85),             # Warm parchment text
-    card=ColorScale(25, 16, 15),                   # Slightly lighter
-    card_foreground=ColorScale(38, 30, 85),
-    popover=ColorScale(25, 16, 15),
-    popover_foreground=ColorScale(38, 30, 85),
-    primary=ColorScale(25, 50, 55),                # Leather — brightened
-    primary_foreground=ColorScale(25, 20, 11),
-    secondary=ColorScale(25, 14, 18),
-    secondary_foreground=ColorScale(38, 30, 85),
-    muted=ColorScale(25, 12, 20),
-    muted_foreground=ColorScale(38, 15, 55),       # Faded parchment
-    accent=ColorScale(25, 12, 17),                 # Warm dark hover
-    accent_foreground=ColorScale(38, 30, 85),
-    destructive=ColorScale(5, 55, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 30, 48),
-    success_foreground=ColorScale(25, 20, 11),
-    warning=ColorScale(38, 65, 55),
-    warning_foreground=ColorScale(25, 20, 11),
-    info=ColorScale(215, 45, 55),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(215, 50, 58),                  # Blue ink — brightened for dark
-    link_hover=ColorScale(215, 50, 68),
-    code=ColorScale(25, 25, 8),                    # Darkest leather
-    code_foreground=ColorScale(38, 30, 75),        # Warm parchment code text
-    selection=ColorScale(215, 40, 22),             # Dark blue-ink selection
-    selection_foreground=ColorScale(38, 30, 90),
-    brand=ColorScale(25, 50, 55),
-    brand_foreground=ColorScale(25, 20, 11),
-    border=ColorScale(25, 12, 22),
-    input=ColorScale(25, 12, 18),
-    ring=ColorScale(215, 50, 55),
-    surface_1=ColorScale(25, 25, 7),               # Deepest
-    surface_2=ColorScale(25, 20, 11),              # Dark leather
-    surface_3=ColorScale(25, 16, 15),              # Raised
+    background=ColorScale.of(25, 20, 11),             # Dark leather — warm, not cold
+    foreground=ColorScale.of(38, 30, 85),             # Warm parchment text
+    card=ColorScale.of(25, 16, 15),                   # Slightly lighter
+    card_foreground=ColorScale.of(38, 30, 85),
+    popover=ColorScale.of(25, 16, 15),
+    popover_foreground=ColorScale.of(38, 30, 85),
+    primary=ColorScale.of(25, 50, 55),                # Leather — brightened
+    primary_foreground=ColorScale.of(25, 20, 11),
+    secondary=ColorScale.of(25, 14, 18),
+    secondary_foreground=ColorScale.of(38, 30, 85),
+    muted=ColorScale.of(25, 12, 20),
+    muted_foreground=ColorScale.of(38, 15, 55),       # Faded parchment
+    accent=ColorScale.of(25, 12, 17),                 # Warm dark hover
+    accent_foreground=ColorScale.of(38, 30, 85),
+    destructive=ColorScale.of(5, 55, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 30, 48),
+    success_foreground=ColorScale.of(25, 20, 11),
+    warning=ColorScale.of(38, 65, 55),
+    warning_foreground=ColorScale.of(25, 20, 11),
+    info=ColorScale.of(215, 45, 55),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(215, 50, 58),                  # Blue ink — brightened for dark
+    link_hover=ColorScale.of(215, 50, 68),
+    code=ColorScale.of(25, 25, 8),                    # Darkest leather
+    code_foreground=ColorScale.of(38, 30, 75),        # Warm parchment code text
+    selection=ColorScale.of(215, 40, 22),             # Dark blue-ink selection
+    selection_foreground=ColorScale.of(38, 30, 90),
+    brand=ColorScale.of(25, 50, 55),
+    brand_foreground=ColorScale.of(25, 20, 11),
+    border=ColorScale.of(25, 12, 22),
+    input=ColorScale.of(25, 12, 18),
+    ring=ColorScale.of(215, 50, 55),
+    surface_1=ColorScale.of(25, 25, 7),               # Deepest
+    surface_2=ColorScale.of(25, 20, 11),              # Dark leather
+    surface_3=ColorScale.of(25, 16, 15),              # Raised
 )
 
 PRESET = ThemePreset(
@@ -20,81 +20,81 @@ from ._base import (
 # - Yellow #fffac2, Pink #fcc5e9
 
 LIGHT = ThemeTokens(
-    background=ColorScale(295, 20, 98),                # Pale pink-white
-    foreground=ColorScale(226, 25, 18),                # Dark purple fg
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(226, 25, 18),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(226, 25, 18),
-    primary=ColorScale(167, 71, 53),                   # Teal — slightly muted for light
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(295, 15, 95),
-    secondary_foreground=ColorScale(226, 25, 18),
-    muted=ColorScale(295, 12, 90),
-    muted_foreground=ColorScale(231, 15, 45),
-    accent=ColorScale(295, 15, 95),                    # Subtle pink hover
-    accent_foreground=ColorScale(226, 25, 18),
-    destructive=ColorScale(329, 53, 51),               # Lavender as destructive
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(167, 71, 53),                   # Teal
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(55, 100, 78),                   # Yellow muted for light
-    warning_foreground=ColorScale(226, 25, 18),
-    info=ColorScale(197, 100, 67),                     # Blue1
-    info_foreground=ColorScale(226, 25, 18),
-    link=ColorScale(209, 100, 74),                     # Blue2
-    link_hover=ColorScale(209, 100, 60),
-    code=ColorScale(226, 19, 13),                      # Dark code bg
-    code_foreground=ColorScale(167, 71, 63),           # Teal code text
-    selection=ColorScale(167, 50, 90),                 # Pale teal selection
-    selection_foreground=ColorScale(226, 25, 18),
-    brand=ColorScale(329, 53, 61),                     # Lavender
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(295, 12, 88),
-    input=ColorScale(295, 12, 93),
-    ring=ColorScale(167, 71, 53),
-    surface_1=ColorScale(295, 20, 98),
-    surface_2=ColorScale(295, 15, 95),
-    surface_3=ColorScale(295, 12, 92),
+    background=ColorScale.of(295, 20, 98),                # Pale pink-white
+    foreground=ColorScale.of(226, 25, 18),                # Dark purple fg
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(226, 25, 18),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(226, 25, 18),
+    primary=ColorScale.of(167, 71, 53),                   # Teal — slightly muted for light
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(295, 15, 95),
+    secondary_foreground=ColorScale.of(226, 25, 18),
+    muted=ColorScale.of(295, 12, 90),
+    muted_foreground=ColorScale.of(231, 15, 45),
+    accent=ColorScale.of(295, 15, 95),                    # Subtle pink hover
+    accent_foreground=ColorScale.of(226, 25, 18),
+    destructive=ColorScale.of(329, 53, 51),               # Lavender as destructive
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(167, 71, 53),                   # Teal
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(55, 100, 78),                   # Yellow muted for light
+    warning_foreground=ColorScale.of(226, 25, 18),
+    info=ColorScale.of(197, 100, 67),                     # Blue1
+    info_foreground=ColorScale.of(226, 25, 18),
+    link=ColorScale.of(209, 100, 74),                     # Blue2
+    link_hover=ColorScale.of(209, 100, 60),
+    code=ColorScale.of(226, 19, 13),                      # Dark code bg
+    code_foreground=ColorScale.of(167, 71, 63),           # Teal code text
+    selection=ColorScale.of(167, 50, 90),                 # Pale teal selection
+    selection_foreground=ColorScale.of(226, 25, 18),
+    brand=ColorScale.of(329, 53, 61),                     # Lavender
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(295, 12, 88),
+    input=ColorScale.of(295, 12, 93),
+    ring=ColorScale.of(167, 71, 53),
+    surface_1=ColorScale.of(295, 20, 98),
+    surface_2=ColorScale.of(295, 15, 95),
+    surface_3=ColorScale.of(295, 12, 92),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(226, 19, 13),                # #1b1e28
-    foreground=ColorScale(231, 28, 73),                # #a6accd
-    card=ColorScale(226, 18, 17),
-    card_foreground=ColorScale(231, 28, 73),
-    popover=ColorScale(226, 18, 17),
-    popover_foreground=ColorScale(231, 28, 73),
-    primary=ColorScale(167, 71, 63),                   # Teal #5de4c7
-    primary_foreground=ColorScale(226, 19, 13),
-    secondary=ColorScale(226, 16, 20),
-    secondary_foreground=ColorScale(231, 28, 73),
-    muted=ColorScale(226, 14, 23),
-    muted_foreground=ColorScale(231, 18, 48),
-    accent=ColorScale(226, 16, 20),                    # Subtle dark hover
-    accent_foreground=ColorScale(231, 28, 73),
-    destructive=ColorScale(329, 53, 61),               # Lavender
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(167, 71, 63),                   # Teal
-    success_foreground=ColorScale(226, 19, 13),
-    warning=ColorScale(55, 100, 88),                   # Yellow #fffac2
-    warning_foreground=ColorScale(226, 19, 13),
-    info=ColorScale(197, 100, 77),                     # Blue1 #89ddff
-    info_foreground=ColorScale(226, 19, 13),
-    link=ColorScale(209, 100, 84),                     # Blue2 #add7ff
-    link_hover=ColorScale(209, 100, 90),
-    code=ColorScale(226, 19, 9),                       # Very dark code bg
-    code_foreground=ColorScale(167, 71, 63),           # Teal code text
-    selection=ColorScale(226, 30, 22),                 # Purple-tinted selection
-    selection_foreground=ColorScale(231, 28, 85),
-    brand=ColorScale(329, 53, 61),                     # Lavender #d0679d
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(226, 14, 24),
-    input=ColorScale(226, 14, 24),
-    ring=ColorScale(167, 71, 63),
-    surface_1=ColorScale(226, 19, 9),
-    surface_2=ColorScale(226, 19, 13),
-    surface_3=ColorScale(226, 18, 17),
+    background=ColorScale.of(226, 19, 13),                # #1b1e28
+    foreground=ColorScale.of(231, 28, 73),                # #a6accd
+    card=ColorScale.of(226, 18, 17),
+    card_foreground=ColorScale.of(231, 28, 73),
+    popover=ColorScale.of(226, 18, 17),
+    popover_foreground=ColorScale.of(231, 28, 73),
+    primary=ColorScale.of(167, 71, 63),                   # Teal #5de4c7
+    primary_foreground=ColorScale.of(226, 19, 13),
+    secondary=ColorScale.of(226, 16, 20),
+    secondary_foreground=ColorScale.of(231, 28, 73),
+    muted=ColorScale.of(226, 14, 23),
+    muted_foreground=ColorScale.of(231, 18, 48),
+    accent=ColorScale.of(226, 16, 20),                    # Subtle dark hover
+    accent_foreground=ColorScale.of(231, 28, 73),
+    destructive=ColorScale.of(329, 53, 61),               # Lavender
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(167, 71, 63),                   # Teal
+    success_foreground=ColorScale.of(226, 19, 13),
+    warning=ColorScale.of(55, 100, 88),                   # Yellow #fffac2
+    warning_foreground=ColorScale.of(226, 19, 13),
+    info=ColorScale.of(197, 100, 77),                     # Blue1 #89ddff
+    info_foreground=ColorScale.of(226, 19, 13),
+    link=ColorScale.of(209, 100, 84),                     # Blue2 #add7ff
+    link_hover=ColorScale.of(209, 100, 90),
+    code=ColorScale.of(226, 19, 9),                       # Very dark code bg
+    code_foreground=ColorScale.of(167, 71, 63),           # Teal code text
+    selection=ColorScale.of(226, 30, 22),                 # Purple-tinted selection
+    selection_foreground=ColorScale.of(231, 28, 85),
+    brand=ColorScale.of(329, 53, 61),                     # Lavender #d0679d
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(226, 14, 24),
+    input=ColorScale.of(226, 14, 24),
+    ring=ColorScale.of(167, 71, 63),
+    surface_1=ColorScale.of(226, 19, 9),
+    surface_2=ColorScale.of(226, 19, 13),
+    surface_3=ColorScale.of(226, 18, 17),
 )
 
 PRESET = ThemePreset(
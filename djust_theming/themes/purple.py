@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(270, 50, 11),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(270, 50, 11),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(270, 50, 11),
-    primary=ColorScale(270, 50, 50),
-    primary_foreground=ColorScale(270, 80, 98),
-    secondary=ColorScale(270, 30, 96),
-    secondary_foreground=ColorScale(270, 50, 11),
-    muted=ColorScale(270, 30, 96),
-    muted_foreground=ColorScale(270, 15, 38),
-    accent=ColorScale(270, 30, 96),
-    accent_foreground=ColorScale(270, 50, 11),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(271, 81, 56),
-    link_hover=ColorScale(271, 81, 48),
-    code=ColorScale(271, 20, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(271, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(270, 50, 50),
-    brand_foreground=ColorScale(270, 80, 98),
-    border=ColorScale(270, 20, 90),
-    input=ColorScale(270, 20, 90),
-    ring=ColorScale(270, 50, 50),
-    surface_1=ColorScale(270, 20, 98),
-    surface_2=ColorScale(270, 15, 96),
-    surface_3=ColorScale(270, 12, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(270, 50, 11),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(270, 50, 11),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(270, 50, 11),
+    primary=ColorScale.of(270, 50, 50),
+    primary_foreground=ColorScale.of(270, 80, 98),
+    secondary=ColorScale.of(270, 30, 96),
+    secondary_foreground=ColorScale.of(270, 50, 11),
+    muted=ColorScale.of(270, 30, 96),
+    muted_foreground=ColorScale.of(270, 15, 38),
+    accent=ColorScale.of(270, 30, 96),
+    accent_foreground=ColorScale.of(270, 50, 11),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(271, 81, 56),
+    link_hover=ColorScale.of(271, 81, 48),
+    code=ColorScale.of(271, 20, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(271, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(270, 50, 50),
+    brand_foreground=ColorScale.of(270, 80, 98),
+    border=ColorScale.of(270, 20, 90),
+    input=ColorScale.of(270, 20, 90),
+    ring=ColorScale.of(270, 50, 50),
+    surface_1=ColorScale.of(270, 20, 98),
+    surface_2=ColorScale.of(270, 15, 96),
+    surface_3=ColorScale.of(270, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(270, 50, 8),
-    foreground=ColorScale(270, 80, 98),
-    card=ColorScale(270, 50, 8),
-    card_foreground=ColorScale(270, 80, 98),
-    popover=ColorScale(270, 50, 8),
-    popover_foreground=ColorScale(270, 80, 98),
-    primary=ColorScale(270, 60, 60),
-    primary_foreground=ColorScale(270, 50, 8),
-    secondary=ColorScale(270, 30, 16),
-    secondary_foreground=ColorScale(270, 80, 98),
-    muted=ColorScale(270, 30, 16),
-    muted_foreground=ColorScale(270, 15, 85),
-    accent=ColorScale(270, 30, 16),
-    accent_foreground=ColorScale(270, 80, 98),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(271, 91, 65),
-    link_hover=ColorScale(271, 91, 75),
-    code=ColorScale(271, 30, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(271, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(270, 60, 60),
-    brand_foreground=ColorScale(270, 50, 8),
-    border=ColorScale(270, 30, 16),
-    input=ColorScale(270, 30, 16),
-    ring=ColorScale(270, 60, 60),
-    surface_1=ColorScale(270, 20, 4),
-    surface_2=ColorScale(270, 15, 7),
-    surface_3=ColorScale(270, 12, 11),
+    background=ColorScale.of(270, 50, 8),
+    foreground=ColorScale.of(270, 80, 98),
+    card=ColorScale.of(270, 50, 8),
+    card_foreground=ColorScale.of(270, 80, 98),
+    popover=ColorScale.of(270, 50, 8),
+    popover_foreground=ColorScale.of(270, 80, 98),
+    primary=ColorScale.of(270, 60, 60),
+    primary_foreground=ColorScale.of(270, 50, 8),
+    secondary=ColorScale.of(270, 30, 16),
+    secondary_foreground=ColorScale.of(270, 80, 98),
+    muted=ColorScale.of(270, 30, 16),
+    muted_foreground=ColorScale.of(270, 15, 85),
+    accent=ColorScale.of(270, 30, 16),
+    accent_foreground=ColorScale.of(270, 80, 98),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(271, 91, 65),
+    link_hover=ColorScale.of(271, 91, 75),
+    code=ColorScale.of(271, 30, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(271, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(270, 60, 60),
+    brand_foreground=ColorScale.of(270, 50, 8),
+    border=ColorScale.of(270, 30, 16),
+    input=ColorScale.of(270, 30, 16),
+    ring=ColorScale.of(270, 60, 60),
+    surface_1=ColorScale.of(270, 20, 4),
+    surface_2=ColorScale.of(270, 15, 7),
+    surface_3=ColorScale.of(270, 12, 11),
 )
 
 PRESET = ThemePreset(
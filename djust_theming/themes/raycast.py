@@ -19,81 +19,81 @@ from ._base import (
 # - Cool grays, macOS-inspired
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),                  # Pure white
-    foreground=ColorScale(0, 0, 10),                   # Near-black
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(0, 0, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 10),
-    primary=ColorScale(262, 83, 58),                   # Raycast purple
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 96),
-    secondary_foreground=ColorScale(0, 0, 10),
-    muted=ColorScale(220, 5, 91),
-    muted_foreground=ColorScale(220, 5, 45),
-    accent=ColorScale(0, 0, 96),                       # Subtle hover
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 72, 51),                 # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 70, 45),                   # Green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),                    # Amber
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(262, 83, 58),                      # Purple doubles as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(262, 83, 58),                      # Purple
-    link_hover=ColorScale(262, 83, 48),
-    code=ColorScale(0, 0, 8),                          # Dark code bg
-    code_foreground=ColorScale(262, 60, 72),           # Purple code text
-    selection=ColorScale(262, 70, 92),                 # Pale purple selection
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(262, 83, 58),                     # Raycast purple
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 5, 90),
-    input=ColorScale(220, 5, 94),
-    ring=ColorScale(262, 83, 58),
-    surface_1=ColorScale(0, 0, 100),
-    surface_2=ColorScale(220, 5, 97),
-    surface_3=ColorScale(220, 5, 94),
+    background=ColorScale.of(0, 0, 100),                  # Pure white
+    foreground=ColorScale.of(0, 0, 10),                   # Near-black
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(0, 0, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 10),
+    primary=ColorScale.of(262, 83, 58),                   # Raycast purple
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 96),
+    secondary_foreground=ColorScale.of(0, 0, 10),
+    muted=ColorScale.of(220, 5, 91),
+    muted_foreground=ColorScale.of(220, 5, 45),
+    accent=ColorScale.of(0, 0, 96),                       # Subtle hover
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 72, 51),                 # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 70, 45),                   # Green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),                    # Amber
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(262, 83, 58),                      # Purple doubles as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(262, 83, 58),                      # Purple
+    link_hover=ColorScale.of(262, 83, 48),
+    code=ColorScale.of(0, 0, 8),                          # Dark code bg
+    code_foreground=ColorScale.of(262, 60, 72),           # Purple code text
+    selection=ColorScale.of(262, 70, 92),                 # Pale purple selection
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(262, 83, 58),                     # Raycast purple
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 5, 90),
+    input=ColorScale.of(220, 5, 94),
+    ring=ColorScale.of(262, 83, 58),
+    surface_1=ColorScale.of(0, 0, 100),
+    surface_2=ColorScale.of(220, 5, 97),
+    surface_3=ColorScale.of(220, 5, 94),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 8),                    # #141414
-    foreground=ColorScale(0, 0, 95),                   # #f2f2f2
-    card=ColorScale(0, 0, 12),
-    card_foreground=ColorScale(0, 0, 95),
-    popover=ColorScale(0, 0, 12),
-    popover_foreground=ColorScale(0, 0, 95),
-    primary=ColorScale(262, 83, 58),                   # Raycast purple
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 15),
-    secondary_foreground=ColorScale(0, 0, 95),
-    muted=ColorScale(220, 5, 18),
-    muted_foreground=ColorScale(220, 5, 55),
-    accent=ColorScale(0, 0, 15),                       # Subtle dark hover
-    accent_foreground=ColorScale(0, 0, 95),
-    destructive=ColorScale(0, 72, 56),                 # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 70, 50),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 55),                    # Amber brightened
-    warning_foreground=ColorScale(0, 0, 8),
-    info=ColorScale(262, 83, 65),                      # Purple brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(262, 83, 68),                      # Purple brightened
-    link_hover=ColorScale(262, 83, 76),
-    code=ColorScale(0, 0, 5),                          # Very dark code bg
-    code_foreground=ColorScale(262, 60, 72),           # Purple code text
-    selection=ColorScale(262, 50, 20),                 # Deep purple selection
-    selection_foreground=ColorScale(0, 0, 95),
-    brand=ColorScale(262, 83, 65),                     # Purple brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(220, 5, 18),
-    input=ColorScale(220, 5, 18),
-    ring=ColorScale(262, 83, 58),
-    surface_1=ColorScale(0, 0, 5),
-    surface_2=ColorScale(0, 0, 8),
-    surface_3=ColorScale(0, 0, 12),
+    background=ColorScale.of(0, 0, 8),                    # #141414
+    foreground=ColorScale.of(0, 0, 95),                   # #f2f2f2
+    card=ColorScale.of(0, 0, 12),
+    card_foreground=ColorScale.of(0, 0, 95),
+    popover=ColorScale.of(0, 0, 12),
+    popover_foreground=ColorScale.of(0, 0, 95),
+    primary=ColorScale.of(262, 83, 58),                   # Raycast purple
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 15),
+    secondary_foreground=ColorScale.of(0, 0, 95),
+    muted=ColorScale.of(220, 5, 18),
+    muted_foreground=ColorScale.of(220, 5, 55),
+    accent=ColorScale.of(0, 0, 15),                       # Subtle dark hover
+    accent_foreground=ColorScale.of(0, 0, 95),
+    destructive=ColorScale.of(0, 72, 56),                 # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 70, 50),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 55),                    # Amber brightened
+    warning_foreground=ColorScale.of(0, 0, 8),
+    info=ColorScale.of(262, 83, 65),                      # Purple brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(262, 83, 68),                      # Purple brightened
+    link_hover=ColorScale.of(262, 83, 76),
+    code=ColorScale.of(0, 0, 5),                          # Very dark code bg
+    code_foreground=ColorScale.of(262, 60, 72),           # Purple code text
+    selection=ColorScale.of(262, 50, 20),                 # Deep purple selection
+    selection_foreground=ColorScale.of(0, 0, 95),
+    brand=ColorScale.of(262, 83, 65),                     # Purple brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(220, 5, 18),
+    input=ColorScale.of(220, 5, 18),
+    ring=ColorScale.of(262, 83, 58),
+    surface_1=ColorScale.of(0, 0, 5),
+    surface_2=ColorScale.of(0, 0, 8),
+    surface_3=ColorScale.of(0, 0, 12),
 )
 
 PRESET = ThemePreset(
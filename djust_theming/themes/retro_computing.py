@@ -16,81 +16,81 @@ from ._base import (
 # Think: IBM 5151, Apple II, amber monochrome monitors.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(40, 40, 94),                 # Warm beige
-    foreground=ColorScale(30, 30, 12),                 # Dark brown
-    card=ColorScale(40, 35, 96),                       # Light warm card
-    card_foreground=ColorScale(30, 30, 12),
-    popover=ColorScale(40, 35, 96),
-    popover_foreground=ColorScale(30, 30, 12),
-    primary=ColorScale(38, 100, 50),                   # Amber
-    primary_foreground=ColorScale(30, 30, 8),
-    secondary=ColorScale(40, 30, 90),                  # Warm beige panel
-    secondary_foreground=ColorScale(30, 30, 12),
-    muted=ColorScale(40, 20, 88),                      # Warm muted
-    muted_foreground=ColorScale(30, 20, 40),           # Brown muted text
-    accent=ColorScale(40, 30, 90),                     # Warm hover surface
-    accent_foreground=ColorScale(30, 30, 12),
-    destructive=ColorScale(0, 70, 45),                 # CRT red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 60, 35),                   # Terminal green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 100, 50),                   # Amber (same as primary)
-    warning_foreground=ColorScale(30, 30, 8),
-    info=ColorScale(200, 50, 45),                      # Steel blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(38, 100, 42),                      # Darker amber links
-    link_hover=ColorScale(38, 100, 35),                # Even darker
-    code=ColorScale(30, 30, 6),                        # Very dark brown code bg
-    code_foreground=ColorScale(38, 100, 60),           # Amber code text
-    selection=ColorScale(38, 80, 85),                  # Pale amber selection
-    selection_foreground=ColorScale(30, 30, 12),
-    brand=ColorScale(38, 100, 50),                     # Amber
-    brand_foreground=ColorScale(30, 30, 8),
-    border=ColorScale(30, 25, 70),                     # Brown border
-    input=ColorScale(40, 25, 88),                      # Warm input
-    ring=ColorScale(38, 100, 50),                      # Amber focus ring
-    surface_1=ColorScale(40, 40, 94),                  # Warm beige
-    surface_2=ColorScale(40, 35, 91),                  # Slightly deeper
-    surface_3=ColorScale(40, 30, 88),                  # Deeper still
+    background=ColorScale.of(40, 40, 94),                 # Warm beige
+    foreground=ColorScale.of(30, 30, 12),                 # Dark brown
+    card=ColorScale.of(40, 35, 96),                       # Light warm card
+    card_foreground=ColorScale.of(30, 30, 12),
+    popover=ColorScale.of(40, 35, 96),
+    popover_foreground=ColorScale.of(30, 30, 12),
+    primary=ColorScale.of(38, 100, 50),                   # Amber
+    primary_foreground=ColorScale.of(30, 30, 8),
+    secondary=ColorScale.of(40, 30, 90),                  # Warm beige panel
+    secondary_foreground=ColorScale.of(30, 30, 12),
+    muted=ColorScale.of(40, 20, 88),                      # Warm muted
+    muted_foreground=ColorScale.of(30, 20, 40),           # Brown muted text
+    accent=ColorScale.of(40, 30, 90),                     # Warm hover surface
+    accent_foreground=ColorScale.of(30, 30, 12),
+    destructive=ColorScale.of(0, 70, 45),                 # CRT red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 60, 35),                   # Terminal green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 100, 50),                   # Amber (same as primary)
+    warning_foreground=ColorScale.of(30, 30, 8),
+    info=ColorScale.of(200, 50, 45),                      # Steel blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(38, 100, 42),                      # Darker amber links
+    link_hover=ColorScale.of(38, 100, 35),                # Even darker
+    code=ColorScale.of(30, 30, 6),                        # Very dark brown code bg
+    code_foreground=ColorScale.of(38, 100, 60),           # Amber code text
+    selection=ColorScale.of(38, 80, 85),                  # Pale amber selection
+    selection_foreground=ColorScale.of(30, 30, 12),
+    brand=ColorScale.of(38, 100, 50),                     # Amber
+    brand_foreground=ColorScale.of(30, 30, 8),
+    border=ColorScale.of(30, 25, 70),                     # Brown border
+    input=ColorScale.of(40, 25, 88),                      # Warm input
+    ring=ColorScale.of(38, 100, 50),                      # Amber focus ring
+    surface_1=ColorScale.of(40, 40, 94),                  # Warm beige
+    surface_2=ColorScale.of(40, 35, 91),                  # Slightly deeper
+    surface_3=ColorScale.of(40, 30, 88),                  # Deeper still
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(30, 30, 8),                  # Very dark brown
-    foreground=ColorScale(38, 100, 60),                # Amber text
-    card=ColorScale(30, 25, 11),                       # Dark brown card
-    card_foreground=ColorScale(38, 100, 60),
-    popover=ColorScale(30, 25, 11),
-    popover_foreground=ColorScale(38, 100, 60),
-    primary=ColorScale(38, 100, 50),                   # Amber
-    primary_foreground=ColorScale(30, 30, 5),
-    secondary=ColorScale(30, 25, 12),                  # Dark panel
-    secondary_foreground=ColorScale(38, 100, 60),
-    muted=ColorScale(30, 20, 16),                      # Dark muted
-    muted_foreground=ColorScale(38, 60, 40),           # Dim amber text
-    accent=ColorScale(30, 25, 12),                     # Dark hover
-    accent_foreground=ColorScale(38, 100, 60),
-    destructive=ColorScale(0, 70, 50),                 # CRT red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 60, 40),                   # Terminal green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 100, 55),                   # Amber brightened
-    warning_foreground=ColorScale(30, 30, 5),
-    info=ColorScale(200, 50, 55),                      # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(38, 100, 65),                      # Bright amber links
-    link_hover=ColorScale(38, 100, 75),                # Brighter amber
-    code=ColorScale(30, 30, 6),                        # Deepest brown code bg
-    code_foreground=ColorScale(38, 100, 60),           # Amber code text
-    selection=ColorScale(38, 80, 20),                  # Deep amber selection
-    selection_foreground=ColorScale(38, 100, 65),
-    brand=ColorScale(38, 100, 55),                     # Amber brightened
-    brand_foreground=ColorScale(30, 30, 5),
-    border=ColorScale(38, 40, 22),                     # Amber-tinted border
-    input=ColorScale(30, 20, 15),                      # Dark input
-    ring=ColorScale(38, 100, 50),                      # Amber focus ring
-    surface_1=ColorScale(30, 30, 6),                   # Deepest
-    surface_2=ColorScale(30, 28, 9),                   # Mid dark
-    surface_3=ColorScale(30, 25, 12),                  # Slightly elevated
+    background=ColorScale.of(30, 30, 8),                  # Very dark brown
+    foreground=ColorScale.of(38, 100, 60),                # Amber text
+    card=ColorScale.of(30, 25, 11),                       # Dark brown card
+    card_foreground=ColorScale.of(38, 100, 60),
+    popover=ColorScale.of(30, 25, 11),
+    popover_foreground=ColorScale.of(38, 100, 60),
+    primary=ColorScale.of(38, 100, 50),                   # Amber
+    primary_foreground=ColorScale.of(30, 30, 5),
+    secondary=ColorScale.of(30, 25, 12),                  # Dark panel
+    secondary_foreground=ColorScale.of(38, 100, 60),
+    muted=ColorScale.of(30, 20, 16),                      # Dark muted
+    muted_foreground=ColorScale.of(38, 60, 40),           # Dim amber text
+    accent=ColorScale.of(30, 25, 12),                     # Dark hover
+    accent_foreground=ColorScale.of(38, 100, 60),
+    destructive=ColorScale.of(0, 70, 50),                 # CRT red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 60, 40),                   # Terminal green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 100, 55),                   # Amber brightened
+    warning_foreground=ColorScale.of(30, 30, 5),
+    info=ColorScale.of(200, 50, 55),                      # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(38, 100, 65),                      # Bright amber links
+    link_hover=ColorScale.of(38, 100, 75),                # Brighter amber
+    code=ColorScale.of(30, 30, 6),                        # Deepest brown code bg
+    code_foreground=ColorScale.of(38, 100, 60),           # Amber code text
+    selection=ColorScale.of(38, 80, 20),                  # Deep amber selection
+    selection_foreground=ColorScale.of(38, 100, 65),
+    brand=ColorScale.of(38, 100, 55),                     # Amber brightened
+    brand_foreground=ColorScale.of(30, 30, 5),
+    border=ColorScale.of(38, 40, 22),                     # Amber-tinted border
+    input=ColorScale.of(30, 20, 15),                      # Dark input
+    ring=ColorScale.of(38, 100, 50),                      # Amber focus ring
+    surface_1=ColorScale.of(30, 30, 6),                   # Deepest
+    surface_2=ColorScale.of(30, 28, 9),                   # Mid dark
+    surface_3=ColorScale.of(30, 25, 12),                  # Slightly elevated
 )
 
 PRESET = ThemePreset(
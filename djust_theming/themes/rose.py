@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(346, 40, 11),
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(346, 40, 11),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(346, 40, 11),
-    primary=ColorScale(346, 77, 50),
-    primary_foreground=ColorScale(346, 100, 98),
-    secondary=ColorScale(346, 30, 96),
-    secondary_foreground=ColorScale(346, 40, 11),
-    muted=ColorScale(346, 30, 96),
-    muted_foreground=ColorScale(346, 15, 38),
-    accent=ColorScale(346, 30, 96),
-    accent_foreground=ColorScale(346, 40, 11),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 76, 36),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 48),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(347, 77, 50),
-    link_hover=ColorScale(347, 77, 42),
-    code=ColorScale(347, 20, 94),
-    code_foreground=ColorScale(240, 10, 20),
-    selection=ColorScale(347, 100, 80),
-    selection_foreground=ColorScale(240, 10, 4),
-    brand=ColorScale(346, 77, 50),
-    brand_foreground=ColorScale(346, 100, 98),
-    border=ColorScale(346, 20, 90),
-    input=ColorScale(346, 20, 90),
-    ring=ColorScale(346, 77, 50),
-    surface_1=ColorScale(346, 20, 98),
-    surface_2=ColorScale(346, 15, 96),
-    surface_3=ColorScale(346, 12, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(346, 40, 11),
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(346, 40, 11),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(346, 40, 11),
+    primary=ColorScale.of(346, 77, 50),
+    primary_foreground=ColorScale.of(346, 100, 98),
+    secondary=ColorScale.of(346, 30, 96),
+    secondary_foreground=ColorScale.of(346, 40, 11),
+    muted=ColorScale.of(346, 30, 96),
+    muted_foreground=ColorScale.of(346, 15, 38),
+    accent=ColorScale.of(346, 30, 96),
+    accent_foreground=ColorScale.of(346, 40, 11),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 76, 36),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 48),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(347, 77, 50),
+    link_hover=ColorScale.of(347, 77, 42),
+    code=ColorScale.of(347, 20, 94),
+    code_foreground=ColorScale.of(240, 10, 20),
+    selection=ColorScale.of(347, 100, 80),
+    selection_foreground=ColorScale.of(240, 10, 4),
+    brand=ColorScale.of(346, 77, 50),
+    brand_foreground=ColorScale.of(346, 100, 98),
+    border=ColorScale.of(346, 20, 90),
+    input=ColorScale.of(346, 20, 90),
+    ring=ColorScale.of(346, 77, 50),
+    surface_1=ColorScale.of(346, 20, 98),
+    surface_2=ColorScale.of(346, 15, 96),
+    surface_3=ColorScale.of(346, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(346, 40, 8),
-    foreground=ColorScale(346, 100, 98),
-    card=ColorScale(346, 40, 8),
-    card_foreground=ColorScale(346, 100, 98),
-    popover=ColorScale(346, 40, 8),
-    popover_foreground=ColorScale(346, 100, 98),
-    primary=ColorScale(346, 77, 55),
-    primary_foreground=ColorScale(346, 40, 8),
-    secondary=ColorScale(346, 30, 16),
-    secondary_foreground=ColorScale(346, 100, 98),
-    muted=ColorScale(346, 30, 16),
-    muted_foreground=ColorScale(346, 15, 85),
-    accent=ColorScale(346, 30, 16),
-    accent_foreground=ColorScale(346, 100, 98),
-    destructive=ColorScale(0, 62, 30),
-    destructive_foreground=ColorScale(0, 0, 98),
-    success=ColorScale(142, 69, 28),
-    success_foreground=ColorScale(0, 0, 98),
-    warning=ColorScale(38, 92, 40),
-    warning_foreground=ColorScale(0, 0, 98),
-    info=ColorScale(199, 89, 60),
-    info_foreground=ColorScale(0, 0, 98),
-    link=ColorScale(347, 77, 60),
-    link_hover=ColorScale(347, 77, 70),
-    code=ColorScale(347, 30, 12),
-    code_foreground=ColorScale(240, 5, 80),
-    selection=ColorScale(347, 100, 30),
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(346, 77, 55),
-    brand_foreground=ColorScale(346, 40, 8),
-    border=ColorScale(346, 30, 16),
-    input=ColorScale(346, 30, 16),
-    ring=ColorScale(346, 77, 55),
-    surface_1=ColorScale(346, 20, 4),
-    surface_2=ColorScale(346, 15, 7),
-    surface_3=ColorScale(346, 12, 11),
+    background=ColorScale.of(346, 40, 8),
+    foreground=ColorScale.of(346, 100, 98),
+    card=ColorScale.of(346, 40, 8),
+    card_foreground=ColorScale.of(346, 100, 98),
+    popover=ColorScale.of(346, 40, 8),
+    popover_foreground=ColorScale.of(346, 100, 98),
+    primary=ColorScale.of(346, 77, 55),
+    primary_foreground=ColorScale.of(346, 40, 8),
+    secondary=ColorScale.of(346, 30, 16),
+    secondary_foreground=ColorScale.of(346, 100, 98),
+    muted=ColorScale.of(346, 30, 16),
+    muted_foreground=ColorScale.of(346, 15, 85),
+    accent=ColorScale.of(346, 30, 16),
+    accent_foreground=ColorScale.of(346, 100, 98),
+    destructive=ColorScale.of(0, 62, 30),
+    destructive_foreground=ColorScale.of(0, 0, 98),
+    success=ColorScale.of(142, 69, 28),
+    success_foreground=ColorScale.of(0, 0, 98),
+    warning=ColorScale.of(38, 92, 40),
+    warning_foreground=ColorScale.of(0, 0, 98),
+    info=ColorScale.of(199, 89, 60),
+    info_foreground=ColorScale.of(0, 0, 98),
+    link=ColorScale.of(347, 77, 60),
+    link_hover=ColorScale.of(347, 77, 70),
+    code=ColorScale.of(347, 30, 12),
+    code_foreground=ColorScale.of(240, 5, 80),
+    selection=ColorScale.of(347, 100, 30),
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(346, 77, 55),
+    brand_foreground=ColorScale.of(346, 40, 8),
+    border=ColorScale.of(346, 30, 16),
+    input=ColorScale.of(346, 30, 16),
+    ring=ColorScale.of(346, 77, 55),
+    surface_1=ColorScale.of(346, 20, 4),
+    surface_2=ColorScale.of(346, 15, 7),
+    surface_3=ColorScale.of(346, 12, 11),
 )
 
 PRESET = ThemePreset(
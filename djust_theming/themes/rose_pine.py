@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(248, 25, 18),
-    card=ColorScale(245, 50, 97),
-    card_foreground=ColorScale(248, 25, 18),
-    popover=ColorScale(245, 50, 97),
-    popover_foreground=ColorScale(248, 25, 18),
-    primary=ColorScale(343, 76, 68),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(245, 22, 91),
-    secondary_foreground=ColorScale(248, 25, 18),
-    muted=ColorScale(245, 22, 91),
-    muted_foreground=ColorScale(257, 9, 48),
-    accent=ColorScale(245, 22, 91),
-    accent_foreground=ColorScale(267, 57, 78),
-    destructive=ColorScale(343, 76, 68),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(197, 49, 38),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(35, 88, 72),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 43, 73),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 57, 78),
-    link_hover=ColorScale(267, 57, 68),
-    code=ColorScale(245, 50, 97),
-    code_foreground=ColorScale(248, 25, 18),
-    selection=ColorScale(343, 76, 88),
-    selection_foreground=ColorScale(248, 25, 18),
-    brand=ColorScale(267, 57, 78),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(245, 22, 91),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(343, 76, 68),
-    surface_1=ColorScale(249, 18, 98),
-    surface_2=ColorScale(249, 14, 96),
-    surface_3=ColorScale(249, 10, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(248, 25, 18),
+    card=ColorScale.of(245, 50, 97),
+    card_foreground=ColorScale.of(248, 25, 18),
+    popover=ColorScale.of(245, 50, 97),
+    popover_foreground=ColorScale.of(248, 25, 18),
+    primary=ColorScale.of(343, 76, 68),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(245, 22, 91),
+    secondary_foreground=ColorScale.of(248, 25, 18),
+    muted=ColorScale.of(245, 22, 91),
+    muted_foreground=ColorScale.of(257, 9, 48),
+    accent=ColorScale.of(245, 22, 91),
+    accent_foreground=ColorScale.of(267, 57, 78),
+    destructive=ColorScale.of(343, 76, 68),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(197, 49, 38),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(35, 88, 72),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 43, 73),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 57, 78),
+    link_hover=ColorScale.of(267, 57, 68),
+    code=ColorScale.of(245, 50, 97),
+    code_foreground=ColorScale.of(248, 25, 18),
+    selection=ColorScale.of(343, 76, 88),
+    selection_foreground=ColorScale.of(248, 25, 18),
+    brand=ColorScale.of(267, 57, 78),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(245, 22, 91),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(343, 76, 68),
+    surface_1=ColorScale.of(249, 18, 98),
+    surface_2=ColorScale.of(249, 14, 96),
+    surface_3=ColorScale.of(249, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(249, 22, 12),
-    foreground=ColorScale(245, 50, 91),
-    card=ColorScale(250, 23, 17),
-    card_foreground=ColorScale(245, 50, 91),
-    popover=ColorScale(250, 23, 17),
-    popover_foreground=ColorScale(245, 50, 91),
-    primary=ColorScale(343, 76, 68),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(247, 23, 20),
-    secondary_foreground=ColorScale(245, 50, 91),
-    muted=ColorScale(247, 23, 20),
-    muted_foreground=ColorScale(249, 15, 56),
-    accent=ColorScale(247, 23, 20),
-    accent_foreground=ColorScale(267, 57, 78),
-    destructive=ColorScale(343, 76, 68),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(197, 49, 38),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(35, 88, 72),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 43, 73),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 57, 78),
-    link_hover=ColorScale(267, 57, 88),
-    code=ColorScale(248, 24, 10),
-    code_foreground=ColorScale(245, 50, 91),
-    selection=ColorScale(267, 57, 78),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(267, 57, 78),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(247, 23, 20),
-    input=ColorScale(250, 23, 17),
-    ring=ColorScale(343, 76, 68),
-    surface_1=ColorScale(249, 20, 5),
-    surface_2=ColorScale(249, 16, 8),
-    surface_3=ColorScale(249, 12, 12),
+    background=ColorScale.of(249, 22, 12),
+    foreground=ColorScale.of(245, 50, 91),
+    card=ColorScale.of(250, 23, 17),
+    card_foreground=ColorScale.of(245, 50, 91),
+    popover=ColorScale.of(250, 23, 17),
+    popover_foreground=ColorScale.of(245, 50, 91),
+    primary=ColorScale.of(343, 76, 68),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(247, 23, 20),
+    secondary_foreground=ColorScale.of(245, 50, 91),
+    muted=ColorScale.of(247, 23, 20),
+    muted_foreground=ColorScale.of(249, 15, 56),
+    accent=ColorScale.of(247, 23, 20),
+    accent_foreground=ColorScale.of(267, 57, 78),
+    destructive=ColorScale.of(343, 76, 68),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(197, 49, 38),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(35, 88, 72),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 43, 73),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 57, 78),
+    link_hover=ColorScale.of(267, 57, 88),
+    code=ColorScale.of(248, 24, 10),
+    code_foreground=ColorScale.of(245, 50, 91),
+    selection=ColorScale.of(267, 57, 78),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(267, 57, 78),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(247, 23, 20),
+    input=ColorScale.of(250, 23, 17),
+    ring=ColorScale.of(343, 76, 68),
+    surface_1=ColorScale.of(249, 20, 5),
+    surface_2=ColorScale.of(249, 16, 8),
+    surface_3=ColorScale.of(249, 12, 12),
 )
 
 PRESET = ThemePreset(
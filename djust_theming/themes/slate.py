@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(215, 25, 10),
-    card=ColorScale(0, 0, 98),
-    card_foreground=ColorScale(215, 25, 10),
-    popover=ColorScale(0, 0, 98),
-    popover_foreground=ColorScale(215, 25, 10),
-    primary=ColorScale(214, 16, 46),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 94),
-    secondary_foreground=ColorScale(215, 25, 15),
-    muted=ColorScale(0, 0, 94),
-    muted_foreground=ColorScale(215, 15, 45),
-    accent=ColorScale(0, 0, 94),
-    accent_foreground=ColorScale(215, 25, 15),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(214, 16, 46),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(214, 16, 40),
-    link_hover=ColorScale(214, 16, 30),
-    code=ColorScale(0, 0, 96),
-    code_foreground=ColorScale(215, 25, 10),
-    selection=ColorScale(214, 16, 46),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(214, 16, 46),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 88),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(214, 16, 46),
-    surface_1=ColorScale(215, 15, 98),
-    surface_2=ColorScale(215, 12, 96),
-    surface_3=ColorScale(215, 10, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(215, 25, 10),
+    card=ColorScale.of(0, 0, 98),
+    card_foreground=ColorScale.of(215, 25, 10),
+    popover=ColorScale.of(0, 0, 98),
+    popover_foreground=ColorScale.of(215, 25, 10),
+    primary=ColorScale.of(214, 16, 46),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 94),
+    secondary_foreground=ColorScale.of(215, 25, 15),
+    muted=ColorScale.of(0, 0, 94),
+    muted_foreground=ColorScale.of(215, 15, 45),
+    accent=ColorScale.of(0, 0, 94),
+    accent_foreground=ColorScale.of(215, 25, 15),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(214, 16, 46),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(214, 16, 40),
+    link_hover=ColorScale.of(214, 16, 30),
+    code=ColorScale.of(0, 0, 96),
+    code_foreground=ColorScale.of(215, 25, 10),
+    selection=ColorScale.of(214, 16, 46),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(214, 16, 46),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 88),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(214, 16, 46),
+    surface_1=ColorScale.of(215, 15, 98),
+    surface_2=ColorScale.of(215, 12, 96),
+    surface_3=ColorScale.of(215, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(240, 20, 5),
-    foreground=ColorScale(0, 0, 92),
-    card=ColorScale(240, 18, 8),
-    card_foreground=ColorScale(0, 0, 92),
-    popover=ColorScale(240, 18, 8),
-    popover_foreground=ColorScale(0, 0, 92),
-    primary=ColorScale(214, 16, 66),
-    primary_foreground=ColorScale(0, 0, 10),
-    secondary=ColorScale(240, 15, 12),
-    secondary_foreground=ColorScale(0, 0, 92),
-    muted=ColorScale(240, 15, 12),
-    muted_foreground=ColorScale(0, 0, 55),
-    accent=ColorScale(240, 15, 12),
-    accent_foreground=ColorScale(214, 16, 80),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(142, 71, 45),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(214, 16, 66),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(214, 16, 66),
-    link_hover=ColorScale(214, 16, 76),
-    code=ColorScale(240, 18, 6),
-    code_foreground=ColorScale(0, 0, 92),
-    selection=ColorScale(214, 16, 66),
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(214, 16, 66),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(240, 15, 12),
-    input=ColorScale(240, 18, 8),
-    ring=ColorScale(214, 16, 66),
-    surface_1=ColorScale(240, 18, 3),
-    surface_2=ColorScale(240, 15, 5),
-    surface_3=ColorScale(240, 12, 8),
+    background=ColorScale.of(240, 20, 5),
+    foreground=ColorScale.of(0, 0, 92),
+    card=ColorScale.of(240, 18, 8),
+    card_foreground=ColorScale.of(0, 0, 92),
+    popover=ColorScale.of(240, 18, 8),
+    popover_foreground=ColorScale.of(0, 0, 92),
+    primary=ColorScale.of(214, 16, 66),
+    primary_foreground=ColorScale.of(0, 0, 10),
+    secondary=ColorScale.of(240, 15, 12),
+    secondary_foreground=ColorScale.of(0, 0, 92),
+    muted=ColorScale.of(240, 15, 12),
+    muted_foreground=ColorScale.of(0, 0, 55),
+    accent=ColorScale.of(240, 15, 12),
+    accent_foreground=ColorScale.of(214, 16, 80),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(142, 71, 45),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(214, 16, 66),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(214, 16, 66),
+    link_hover=ColorScale.of(214, 16, 76),
+    code=ColorScale.of(240, 18, 6),
+    code_foreground=ColorScale.of(0, 0, 92),
+    selection=ColorScale.of(214, 16, 66),
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(214, 16, 66),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(240, 15, 12),
+    input=ColorScale.of(240, 18, 8),
+    ring=ColorScale.of(214, 16, 66),
+    surface_1=ColorScale.of(240, 18, 3),
+    surface_2=ColorScale.of(240, 15, 5),
+    surface_3=ColorScale.of(240, 12, 8),
 )
 
 PRESET = ThemePreset(
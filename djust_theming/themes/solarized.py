@@ -20,81 +20,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(44, 87, 94),
-    foreground=ColorScale(194, 14, 40),
-    card=ColorScale(46, 42, 88),
-    card_foreground=ColorScale(194, 14, 40),
-    popover=ColorScale(46, 42, 88),
-    popover_foreground=ColorScale(194, 14, 40),
-    primary=ColorScale(205, 82, 33),
-    primary_foreground=ColorScale(44, 87, 94),
-    secondary=ColorScale(46, 42, 88),
-    secondary_foreground=ColorScale(194, 14, 40),
-    muted=ColorScale(46, 42, 88),
-    muted_foreground=ColorScale(196, 13, 55),
-    accent=ColorScale(175, 59, 40),
-    accent_foreground=ColorScale(44, 87, 94),
-    destructive=ColorScale(1, 71, 52),
-    destructive_foreground=ColorScale(44, 87, 94),
-    success=ColorScale(68, 100, 30),
-    success_foreground=ColorScale(44, 87, 94),
-    warning=ColorScale(45, 100, 35),
-    warning_foreground=ColorScale(194, 14, 40),
-    info=ColorScale(175, 59, 40),
-    info_foreground=ColorScale(44, 87, 94),
-    link=ColorScale(205, 82, 33),
-    link_hover=ColorScale(237, 45, 52),
-    code=ColorScale(46, 42, 85),
-    code_foreground=ColorScale(1, 71, 52),
-    selection=ColorScale(205, 80, 85),
-    selection_foreground=ColorScale(205, 10, 15),
-    brand=ColorScale(175, 74, 63),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(44, 20, 78),
-    input=ColorScale(44, 20, 78),
-    ring=ColorScale(205, 82, 33),
-    surface_1=ColorScale(205, 5, 96),
-    surface_2=ColorScale(205, 5, 93),
-    surface_3=ColorScale(205, 5, 90),
+    background=ColorScale.of(44, 87, 94),
+    foreground=ColorScale.of(194, 14, 40),
+    card=ColorScale.of(46, 42, 88),
+    card_foreground=ColorScale.of(194, 14, 40),
+    popover=ColorScale.of(46, 42, 88),
+    popover_foreground=ColorScale.of(194, 14, 40),
+    primary=ColorScale.of(205, 82, 33),
+    primary_foreground=ColorScale.of(44, 87, 94),
+    secondary=ColorScale.of(46, 42, 88),
+    secondary_foreground=ColorScale.of(194, 14, 40),
+    muted=ColorScale.of(46, 42, 88),
+    muted_foreground=ColorScale.of(196, 13, 55),
+    accent=ColorScale.of(175, 59, 40),
+    accent_foreground=ColorScale.of(44, 87, 94),
+    destructive=ColorScale.of(1, 71, 52),
+    destructive_foreground=ColorScale.of(44, 87, 94),
+    success=ColorScale.of(68, 100, 30),
+    success_foreground=ColorScale.of(44, 87, 94),
+    warning=ColorScale.of(45, 100, 35),
+    warning_foreground=ColorScale.of(194, 14, 40),
+    info=ColorScale.of(175, 59, 40),
+    info_foreground=ColorScale.of(44, 87, 94),
+    link=ColorScale.of(205, 82, 33),
+    link_hover=ColorScale.of(237, 45, 52),
+    code=ColorScale.of(46, 42, 85),
+    code_foreground=ColorScale.of(1, 71, 52),
+    selection=ColorScale.of(205, 80, 85),
+    selection_foreground=ColorScale.of(205, 10, 15),
+    brand=ColorScale.of(175, 74, 63),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(44, 20, 78),
+    input=ColorScale.of(44, 20, 78),
+    ring=ColorScale.of(205, 82, 33),
+    surface_1=ColorScale.of(205, 5, 96),
+    surface_2=ColorScale.of(205, 5, 93),
+    surface_3=ColorScale.of(205, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(192, 100, 11),
-    foreground=ColorScale(44, 87, 94),
-    card=ColorScale(192, 81, 14),
-    card_foreground=ColorScale(44, 87, 94),
-    popover=ColorScale(192, 81, 14),
-    popover_foreground=ColorScale(44, 87, 94),
-    primary=ColorScale(205, 82, 33),
-    primary_foreground=ColorScale(44, 87, 94),
-    secondary=ColorScale(192, 81, 18),
-    secondary_foreground=ColorScale(44, 87, 94),
-    muted=ColorScale(192, 81, 18),
-    muted_foreground=ColorScale(180, 9, 63),
-    accent=ColorScale(175, 59, 40),
-    accent_foreground=ColorScale(44, 87, 94),
-    destructive=ColorScale(1, 71, 52),
-    destructive_foreground=ColorScale(44, 87, 94),
-    success=ColorScale(68, 100, 30),
-    success_foreground=ColorScale(44, 87, 94),
-    warning=ColorScale(45, 100, 35),
-    warning_foreground=ColorScale(192, 100, 11),
-    info=ColorScale(175, 59, 40),
-    info_foreground=ColorScale(44, 87, 94),
-    link=ColorScale(205, 82, 33),
-    link_hover=ColorScale(237, 45, 52),
-    code=ColorScale(192, 81, 16),
-    code_foreground=ColorScale(68, 100, 30),
-    selection=ColorScale(205, 80, 25),
-    selection_foreground=ColorScale(205, 10, 90),
-    brand=ColorScale(175, 74, 63),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(192, 81, 20),
-    input=ColorScale(192, 81, 20),
-    ring=ColorScale(205, 82, 33),
-    surface_1=ColorScale(205, 5, 6),
-    surface_2=ColorScale(205, 5, 10),
-    surface_3=ColorScale(205, 5, 14),
+    background=ColorScale.of(192, 100, 11),
+    foreground=ColorScale.of(44, 87, 94),
+    card=ColorScale.of(192, 81, 14),
+    card_foreground=ColorScale.of(44, 87, 94),
+    popover=ColorScale.of(192, 81, 14),
+    popover_foreground=ColorScale.of(44, 87, 94),
+    primary=ColorScale.of(205, 82, 33),
+    primary_foreground=ColorScale.of(44, 87, 94),
+    secondary=ColorScale.of(192, 81, 18),
+    secondary_foreground=ColorScale.of(44, 87, 94),
+    muted=ColorScale.of(192, 81, 18),
+    muted_foreground=ColorScale.of(180, 9, 63),
+    accent=ColorScale.of(175, 59, 40),
+    accent_foreground=ColorScale.of(44, 87, 94),
+    destructive=ColorScale.of(1, 71, 52),
+    destructive_foreground=ColorScale.of(44, 87, 94),
+    success=ColorScale.of(68, 100, 30),
+    success_foreground=ColorScale.of(44, 87, 94),
+    warning=ColorScale.of(45, 100, 35),
+    warning_foreground=ColorScale.of(192, 100, 11),
+    info=ColorScale.of(175, 59, 40),
+    info_foreground=ColorScale.of(44, 87, 94),
+    link=ColorScale.of(205, 82, 33),
+    link_hover=ColorScale.of(237, 45, 52),
+    code=ColorScale.of(192, 81, 16),
+    code_foreground=ColorScale.of(68, 100, 30),
+    selection=ColorScale.of(205, 80, 25),
+    selection_foreground=ColorScale.of(205, 10, 90),
+    brand=ColorScale.of(175, 74, 63),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(192, 81, 20),
+    input=ColorScale.of(192, 81, 20),
+    ring=ColorScale.of(205, 82, 33),
+    surface_1=ColorScale.of(205, 5, 6),
+    surface_2=ColorScale.of(205, 5, 10),
+    surface_3=ColorScale.of(205, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -21,81 +21,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(45, 40, 96),
-    foreground=ColorScale(145, 30, 15),
-    card=ColorScale(45, 35, 93),
-    card_foreground=ColorScale(145, 30, 15),
-    popover=ColorScale(45, 35, 93),
-    popover_foreground=ColorScale(145, 30, 15),
-    primary=ColorScale(145, 63, 42),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(45, 30, 88),
-    secondary_foreground=ColorScale(145, 30, 15),
-    muted=ColorScale(45, 30, 88),
-    muted_foreground=ColorScale(145, 15, 40),
-    accent=ColorScale(35, 80, 55),
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 65, 50),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 63, 42),
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(35, 80, 55),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(190, 55, 45),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(145, 63, 38),
-    link_hover=ColorScale(145, 63, 30),
-    code=ColorScale(45, 30, 90),
-    code_foreground=ColorScale(145, 63, 35),
-    selection=ColorScale(145, 63, 85),
-    selection_foreground=ColorScale(145, 10, 15),
-    brand=ColorScale(145, 63, 42),
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(45, 20, 78),
-    input=ColorScale(45, 20, 78),
-    ring=ColorScale(145, 63, 42),
-    surface_1=ColorScale(145, 5, 96),
-    surface_2=ColorScale(145, 5, 93),
-    surface_3=ColorScale(145, 5, 90),
+    background=ColorScale.of(45, 40, 96),
+    foreground=ColorScale.of(145, 30, 15),
+    card=ColorScale.of(45, 35, 93),
+    card_foreground=ColorScale.of(145, 30, 15),
+    popover=ColorScale.of(45, 35, 93),
+    popover_foreground=ColorScale.of(145, 30, 15),
+    primary=ColorScale.of(145, 63, 42),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(45, 30, 88),
+    secondary_foreground=ColorScale.of(145, 30, 15),
+    muted=ColorScale.of(45, 30, 88),
+    muted_foreground=ColorScale.of(145, 15, 40),
+    accent=ColorScale.of(35, 80, 55),
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 65, 50),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 63, 42),
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(35, 80, 55),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(190, 55, 45),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(145, 63, 38),
+    link_hover=ColorScale.of(145, 63, 30),
+    code=ColorScale.of(45, 30, 90),
+    code_foreground=ColorScale.of(145, 63, 35),
+    selection=ColorScale.of(145, 63, 85),
+    selection_foreground=ColorScale.of(145, 10, 15),
+    brand=ColorScale.of(145, 63, 42),
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(45, 20, 78),
+    input=ColorScale.of(45, 20, 78),
+    ring=ColorScale.of(145, 63, 42),
+    surface_1=ColorScale.of(145, 5, 96),
+    surface_2=ColorScale.of(145, 5, 93),
+    surface_3=ColorScale.of(145, 5, 90),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(150, 30, 10),
-    foreground=ColorScale(45, 40, 90),
-    card=ColorScale(150, 25, 14),
-    card_foreground=ColorScale(45, 40, 90),
-    popover=ColorScale(150, 25, 14),
-    popover_foreground=ColorScale(45, 40, 90),
-    primary=ColorScale(145, 63, 52),
-    primary_foreground=ColorScale(150, 30, 10),
-    secondary=ColorScale(150, 25, 18),
-    secondary_foreground=ColorScale(45, 40, 90),
-    muted=ColorScale(150, 25, 18),
-    muted_foreground=ColorScale(120, 15, 55),
-    accent=ColorScale(35, 80, 60),
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 65, 55),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(145, 63, 52),
-    success_foreground=ColorScale(150, 30, 10),
-    warning=ColorScale(35, 80, 60),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(190, 55, 55),
-    info_foreground=ColorScale(150, 30, 10),
-    link=ColorScale(145, 63, 52),
-    link_hover=ColorScale(80, 60, 65),
-    code=ColorScale(150, 25, 16),
-    code_foreground=ColorScale(80, 60, 60),
-    selection=ColorScale(145, 63, 25),
-    selection_foreground=ColorScale(145, 10, 90),
-    brand=ColorScale(145, 63, 52),
-    brand_foreground=ColorScale(150, 30, 10),
-    border=ColorScale(150, 25, 22),
-    input=ColorScale(150, 25, 22),
-    ring=ColorScale(145, 63, 52),
-    surface_1=ColorScale(145, 5, 6),
-    surface_2=ColorScale(145, 5, 10),
-    surface_3=ColorScale(145, 5, 14),
+    background=ColorScale.of(150, 30, 10),
+    foreground=ColorScale.of(45, 40, 90),
+    card=ColorScale.of(150, 25, 14),
+    card_foreground=ColorScale.of(45, 40, 90),
+    popover=ColorScale.of(150, 25, 14),
+    popover_foreground=ColorScale.of(45, 40, 90),
+    primary=ColorScale.of(145, 63, 52),
+    primary_foreground=ColorScale.of(150, 30, 10),
+    secondary=ColorScale.of(150, 25, 18),
+    secondary_foreground=ColorScale.of(45, 40, 90),
+    muted=ColorScale.of(150, 25, 18),
+    muted_foreground=ColorScale.of(120, 15, 55),
+    accent=ColorScale.of(35, 80, 60),
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 65, 55),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(145, 63, 52),
+    success_foreground=ColorScale.of(150, 30, 10),
+    warning=ColorScale.of(35, 80, 60),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(190, 55, 55),
+    info_foreground=ColorScale.of(150, 30, 10),
+    link=ColorScale.of(145, 63, 52),
+    link_hover=ColorScale.of(80, 60, 65),
+    code=ColorScale.of(150, 25, 16),
+    code_foreground=ColorScale.of(80, 60, 60),
+    selection=ColorScale.of(145, 63, 25),
+    selection_foreground=ColorScale.of(145, 10, 90),
+    brand=ColorScale.of(145, 63, 52),
+    brand_foreground=ColorScale.of(150, 30, 10),
+    border=ColorScale.of(150, 25, 22),
+    input=ColorScale.of(150, 25, 22),
+    ring=ColorScale.of(145, 63, 52),
+    surface_1=ColorScale.of(145, 5, 6),
+    surface_2=ColorScale.of(145, 5, 10),
+    surface_3=ColorScale.of(145, 5, 14),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # - Cool gray-blue tones throughout (210° hue base)
 
 LIGHT = ThemeTokens(
-    background=ColorScale(207, 43, 98),            # #F6F9FC — Stripe's cool white
-    foreground=ColorScale(210, 73, 15),            # #0A2540 — Downriver navy (not pure black)
-    card=ColorScale(0, 0, 100),                    # Pure white cards
-    card_foreground=ColorScale(210, 73, 15),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(235, 12, 21),    # #30313D — Stripe text color
-    primary=ColorScale(210, 96, 45),               # #0570DE — Action blue (CTAs)
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(207, 43, 96),             # #F0F5F9 — Subtle cool bg
-    secondary_foreground=ColorScale(210, 73, 15),
-    muted=ColorScale(213, 24, 91),                 # #E3E8EE — Cool gray border/muted
-    muted_foreground=ColorScale(219, 12, 47),      # #697386 — Muted text
-    accent=ColorScale(207, 43, 96),                # Cool hover surface
-    accent_foreground=ColorScale(210, 73, 15),
-    destructive=ColorScale(348, 78, 49),           # #DF1B41 — Stripe's danger red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(168, 100, 42),              # #00D4AA — Stripe green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(44, 100, 50),               # #FFBB00 — Stripe amber
-    warning_foreground=ColorScale(210, 73, 15),
-    info=ColorScale(210, 96, 45),                  # Action blue doubles as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(243, 100, 68),                 # #635BFF — Blurple links (signature!)
-    link_hover=ColorScale(210, 96, 40),            # Deeper action blue on hover
-    code=ColorScale(210, 73, 15),                  # Downriver code bg (dark)
-    code_foreground=ColorScale(207, 43, 96),       # Light text on dark code
-    selection=ColorScale(243, 100, 90),            # Pale blurple selection
-    selection_foreground=ColorScale(210, 73, 15),
-    brand=ColorScale(243, 100, 68),                # #635BFF — Blurple (the Stripe identity)
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(213, 24, 91),                # #E3E8EE — Subtle cool border
-    input=ColorScale(213, 24, 91),                 # Same subtle border for inputs
-    ring=ColorScale(210, 96, 45),                  # Action blue focus ring
-    surface_1=ColorScale(207, 43, 98),             # Lightest cool white
-    surface_2=ColorScale(207, 43, 96),             # Mid cool
-    surface_3=ColorScale(213, 24, 93),             # Slightly deeper
+    background=ColorScale.of(207, 43, 98),            # #F6F9FC — Stripe's cool white
+    foreground=ColorScale.of(210, 73, 15),            # #0A2540 — Downriver navy (not pure black)
+    card=ColorScale.of(0, 0, 100),                    # Pure white cards
+    card_foreground=ColorScale.of(210, 73, 15),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(235, 12, 21),    # #30313D — Stripe text color
+    primary=ColorScale.of(210, 96, 45),               # #0570DE — Action blue (CTAs)
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(207, 43, 96),             # #F0F5F9 — Subtle cool bg
+    secondary_foreground=ColorScale.of(210, 73, 15),
+    muted=ColorScale.of(213, 24, 91),                 # #E3E8EE — Cool gray border/muted
+    muted_foreground=ColorScale.of(219, 12, 47),      # #697386 — Muted text
+    accent=ColorScale.of(207, 43, 96),                # Cool hover surface
+    accent_foreground=ColorScale.of(210, 73, 15),
+    destructive=ColorScale.of(348, 78, 49),           # #DF1B41 — Stripe's danger red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(168, 100, 42),              # #00D4AA — Stripe green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(44, 100, 50),               # #FFBB00 — Stripe amber
+    warning_foreground=ColorScale.of(210, 73, 15),
+    info=ColorScale.of(210, 96, 45),                  # Action blue doubles as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(243, 100, 68),                 # #635BFF — Blurple links (signature!)
+    link_hover=ColorScale.of(210, 96, 40),            # Deeper action blue on hover
+    code=ColorScale.of(210, 73, 15),                  # Downriver code bg (dark)
+    code_foreground=ColorScale.of(207, 43, 96),       # Light text on dark code
+    selection=ColorScale.of(243, 100, 90),            # Pale blurple selection
+    selection_foreground=ColorScale.of(210, 73, 15),
+    brand=ColorScale.of(243, 100, 68),                # #635BFF — Blurple (the Stripe identity)
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(213, 24, 91),                # #E3E8EE — Subtle cool border
+    input=ColorScale.of(213, 24, 91),                 # Same subtle border for inputs
+    ring=ColorScale.of(210, 96, 45),                  # Action blue focus ring
+    surface_1=ColorScale.of(207, 43, 98),             # Lightest cool white
+    surface_2=ColorScale.of(207, 43, 96),             # Mid cool
+    surface_3=ColorScale.of(213, 24, 93),             # Slightly deeper
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(210, 73, 15),            # #0A2540 — Downriver navy
-    foreground=ColorScale(207, 43, 96),            # #F0F5F9 — Cool white text
-    card=ColorScale(210, 50, 18),                  # Slightly lighter navy card
-    card_foreground=ColorScale(207, 43, 96),
-    popover=ColorScale(210, 50, 18),
-    popover_foreground=ColorScale(207, 43, 96),
-    primary=ColorScale(210, 96, 55),               # Action blue — brightened for dark
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 40, 22),             # Dark navy panel
-    secondary_foreground=ColorScale(207, 43, 96),
-    muted=ColorScale(210, 30, 25),                 # Dark muted
-    muted_foreground=ColorScale(213, 20, 60),      # Muted text on dark
-    accent=ColorScale(210, 40, 22),                # Subtle dark hover surface
-    accent_foreground=ColorScale(207, 43, 96),
-    destructive=ColorScale(348, 78, 55),           # Danger red — brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(168, 100, 48),              # Green — brightened
-    success_foreground=ColorScale(210, 73, 15),
-    warning=ColorScale(44, 100, 55),               # Amber — brightened
-    warning_foreground=ColorScale(210, 73, 15),
-    info=ColorScale(210, 96, 55),                  # Action blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(243, 100, 75),                 # Blurple — brightened for dark
-    link_hover=ColorScale(210, 96, 65),            # Lighter action blue
-    code=ColorScale(210, 60, 10),                  # Very dark navy code bg
-    code_foreground=ColorScale(168, 100, 60),      # Green code text
-    border=ColorScale(210, 30, 28),                # Dark border
-    input=ColorScale(210, 30, 28),
-    ring=ColorScale(210, 96, 55),                  # Action blue focus ring
-    selection=ColorScale(243, 80, 30),             # Deep blurple selection
-    selection_foreground=ColorScale(207, 43, 96),
-    brand=ColorScale(243, 100, 75),                # Blurple — brightened for dark bg
-    brand_foreground=ColorScale(0, 0, 100),
-    surface_1=ColorScale(210, 73, 10),             # Deepest navy
-    surface_2=ColorScale(210, 60, 14),             # Mid navy
-    surface_3=ColorScale(210, 50, 18),             # Elevated navy
+    background=ColorScale.of(210, 73, 15),            # #0A2540 — Downriver navy
+    foreground=ColorScale.of(207, 43, 96),            # #F0F5F9 — Cool white text
+    card=ColorScale.of(210, 50, 18),                  # Slightly lighter navy card
+    card_foreground=ColorScale.of(207, 43, 96),
+    popover=ColorScale.of(210, 50, 18),
+    popover_foreground=ColorScale.of(207, 43, 96),
+    primary=ColorScale.of(210, 96, 55),               # Action blue — brightened for dark
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 40, 22),             # Dark navy panel
+    secondary_foreground=ColorScale.of(207, 43, 96),
+    muted=ColorScale.of(210, 30, 25),                 # Dark muted
+    muted_foreground=ColorScale.of(213, 20, 60),      # Muted text on dark
+    accent=ColorScale.of(210, 40, 22),                # Subtle dark hover surface
+    accent_foreground=ColorScale.of(207, 43, 96),
+    destructive=ColorScale.of(348, 78, 55),           # Danger red — brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(168, 100, 48),              # Green — brightened
+    success_foreground=ColorScale.of(210, 73, 15),
+    warning=ColorScale.of(44, 100, 55),               # Amber — brightened
+    warning_foreground=ColorScale.of(210, 73, 15),
+    info=ColorScale.of(210, 96, 55),                  # Action blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(243, 100, 75),                 # Blurple — brightened for dark
+    link_hover=ColorScale.of(210, 96, 65),            # Lighter action blue
+    code=ColorScale.of(210, 60, 10),                  # Very dark navy code bg
+    code_foreground=ColorScale.of(168, 100, 60),      # Green code text
+    border=ColorScale.of(210, 30, 28),                # Dark border
+    input=ColorScale.of(210, 30, 28),
+    ring=ColorScale.of(210, 96, 55),                  # Action blue focus ring
+    selection=ColorScale.of(243, 80, 30),             # Deep blurple selection
+    selection_foreground=ColorScale.of(207, 43, 96),
+    brand=ColorScale.of(243, 100, 75),                # Blurple — brightened for dark bg
+    brand_foreground=ColorScale.of(0, 0, 100),
+    surface_1=ColorScale.of(210, 73, 10),             # Deepest navy
+    surface_2=ColorScale.of(210, 60, 14),             # Mid navy
+    surface_3=ColorScale.of(210, 50, 18),             # Elevated navy
 )
 
 PRESET = ThemePreset(
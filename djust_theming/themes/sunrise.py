@@ -16,81 +16,81 @@ from ._base import (
 # Optimistic, energetic, inviting.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(30, 40, 98),                 # Warm white
-    foreground=ColorScale(20, 20, 18),                 # Warm dark
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(20, 20, 18),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(20, 20, 18),
-    primary=ColorScale(12, 80, 60),                    # Coral
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(30, 30, 95),                  # Warm pale bg
-    secondary_foreground=ColorScale(20, 20, 18),
-    muted=ColorScale(30, 20, 91),                      # Warm muted
-    muted_foreground=ColorScale(20, 15, 42),           # Warm gray text
-    accent=ColorScale(30, 30, 95),                     # Warm hover surface
-    accent_foreground=ColorScale(20, 20, 18),
-    destructive=ColorScale(0, 70, 50),                 # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 50, 45),                   # Warm green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 90, 55),                    # Golden yellow
-    warning_foreground=ColorScale(20, 20, 18),
-    info=ColorScale(210, 60, 55),                      # Warm blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(12, 80, 52),                       # Coral links
-    link_hover=ColorScale(42, 90, 48),                 # Golden on hover
-    code=ColorScale(20, 20, 12),                       # Dark warm code bg
-    code_foreground=ColorScale(12, 80, 72),            # Coral code text
-    selection=ColorScale(12, 60, 90),                  # Pale coral selection
-    selection_foreground=ColorScale(20, 20, 18),
-    brand=ColorScale(42, 90, 55),                      # Golden yellow
-    brand_foreground=ColorScale(20, 20, 18),
-    border=ColorScale(30, 20, 86),                     # Warm border
-    input=ColorScale(30, 15, 90),                      # Warm input
-    ring=ColorScale(12, 80, 60),                       # Coral focus ring
-    surface_1=ColorScale(30, 40, 98),                  # Warm white
-    surface_2=ColorScale(30, 30, 96),                  # Slightly deeper
-    surface_3=ColorScale(30, 25, 93),                  # Deeper still
+    background=ColorScale.of(30, 40, 98),                 # Warm white
+    foreground=ColorScale.of(20, 20, 18),                 # Warm dark
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(20, 20, 18),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(20, 20, 18),
+    primary=ColorScale.of(12, 80, 60),                    # Coral
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(30, 30, 95),                  # Warm pale bg
+    secondary_foreground=ColorScale.of(20, 20, 18),
+    muted=ColorScale.of(30, 20, 91),                      # Warm muted
+    muted_foreground=ColorScale.of(20, 15, 42),           # Warm gray text
+    accent=ColorScale.of(30, 30, 95),                     # Warm hover surface
+    accent_foreground=ColorScale.of(20, 20, 18),
+    destructive=ColorScale.of(0, 70, 50),                 # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 50, 45),                   # Warm green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 90, 55),                    # Golden yellow
+    warning_foreground=ColorScale.of(20, 20, 18),
+    info=ColorScale.of(210, 60, 55),                      # Warm blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(12, 80, 52),                       # Coral links
+    link_hover=ColorScale.of(42, 90, 48),                 # Golden on hover
+    code=ColorScale.of(20, 20, 12),                       # Dark warm code bg
+    code_foreground=ColorScale.of(12, 80, 72),            # Coral code text
+    selection=ColorScale.of(12, 60, 90),                  # Pale coral selection
+    selection_foreground=ColorScale.of(20, 20, 18),
+    brand=ColorScale.of(42, 90, 55),                      # Golden yellow
+    brand_foreground=ColorScale.of(20, 20, 18),
+    border=ColorScale.of(30, 20, 86),                     # Warm border
+    input=ColorScale.of(30, 15, 90),                      # Warm input
+    ring=ColorScale.of(12, 80, 60),                       # Coral focus ring
+    surface_1=ColorScale.of(30, 40, 98),                  # Warm white
+    surface_2=ColorScale.of(30, 30, 96),                  # Slightly deeper
+    surface_3=ColorScale.of(30, 25, 93),                  # Deeper still
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(20, 30, 10),                 # Deep warm
-    foreground=ColorScale(30, 30, 90),                 # Warm light
-    card=ColorScale(20, 25, 13),                       # Dark warm card
-    card_foreground=ColorScale(30, 30, 90),
-    popover=ColorScale(20, 25, 13),
-    popover_foreground=ColorScale(30, 30, 90),
-    primary=ColorScale(12, 80, 65),                    # Coral brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(20, 20, 15),                  # Dark warm panel
-    secondary_foreground=ColorScale(30, 30, 90),
-    muted=ColorScale(20, 18, 20),                      # Dark muted
-    muted_foreground=ColorScale(30, 15, 55),           # Muted warm text
-    accent=ColorScale(20, 20, 15),                     # Dark warm hover
-    accent_foreground=ColorScale(30, 30, 90),
-    destructive=ColorScale(0, 70, 55),                 # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(140, 50, 50),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(42, 90, 60),                    # Gold brightened
-    warning_foreground=ColorScale(20, 20, 10),
-    info=ColorScale(210, 60, 60),                      # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(12, 80, 68),                       # Coral brightened
-    link_hover=ColorScale(42, 90, 62),                 # Golden hover
-    code=ColorScale(20, 30, 6),                        # Deepest warm code
-    code_foreground=ColorScale(42, 90, 65),            # Gold code text
-    selection=ColorScale(12, 60, 22),                  # Deep coral selection
-    selection_foreground=ColorScale(30, 30, 90),
-    brand=ColorScale(42, 90, 60),                      # Gold brightened
-    brand_foreground=ColorScale(20, 20, 10),
-    border=ColorScale(20, 18, 22),                     # Dark warm border
-    input=ColorScale(20, 15, 18),                      # Dark input
-    ring=ColorScale(12, 80, 65),                       # Coral focus ring
-    surface_1=ColorScale(20, 30, 8),                   # Deepest
-    surface_2=ColorScale(20, 25, 11),                  # Mid dark
-    surface_3=ColorScale(20, 22, 14),                  # Elevated
+    background=ColorScale.of(20, 30, 10),                 # Deep warm
+    foreground=ColorScale.of(30, 30, 90),                 # Warm light
+    card=ColorScale.of(20, 25, 13),                       # Dark warm card
+    card_foreground=ColorScale.of(30, 30, 90),
+    popover=ColorScale.of(20, 25, 13),
+    popover_foreground=ColorScale.of(30, 30, 90),
+    primary=ColorScale.of(12, 80, 65),                    # Coral brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(20, 20, 15),                  # Dark warm panel
+    secondary_foreground=ColorScale.of(30, 30, 90),
+    muted=ColorScale.of(20, 18, 20),                      # Dark muted
+    muted_foreground=ColorScale.of(30, 15, 55),           # Muted warm text
+    accent=ColorScale.of(20, 20, 15),                     # Dark warm hover
+    accent_foreground=ColorScale.of(30, 30, 90),
+    destructive=ColorScale.of(0, 70, 55),                 # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(140, 50, 50),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(42, 90, 60),                    # Gold brightened
+    warning_foreground=ColorScale.of(20, 20, 10),
+    info=ColorScale.of(210, 60, 60),                      # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(12, 80, 68),                       # Coral brightened
+    link_hover=ColorScale.of(42, 90, 62),                 # Golden hover
+    code=ColorScale.of(20, 30, 6),                        # Deepest warm code
+    code_foreground=ColorScale.of(42, 90, 65),            # Gold code text
+    selection=ColorScale.of(12, 60, 22),                  # Deep coral selection
+    selection_foreground=ColorScale.of(30, 30, 90),
+    brand=ColorScale.of(42, 90, 60),                      # Gold brightened
+    brand_foreground=ColorScale.of(20, 20, 10),
+    border=ColorScale.of(20, 18, 22),                     # Dark warm border
+    input=ColorScale.of(20, 15, 18),                      # Dark input
+    ring=ColorScale.of(12, 80, 65),                       # Coral focus ring
+    surface_1=ColorScale.of(20, 30, 8),                   # Deepest
+    surface_2=ColorScale.of(20, 25, 11),                  # Mid dark
+    surface_3=ColorScale.of(20, 22, 14),                  # Elevated
 )
 
 PRESET = ThemePreset(
@@ -18,81 +18,81 @@ from ._base import (
 # - Border #282828, Muted #a1a1aa
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),                  # Pure white
-    foreground=ColorScale(0, 0, 10),                   # Near-black
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(0, 0, 10),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 10),
-    primary=ColorScale(153, 60, 53),                   # Green #3ecf8e
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 96),
-    secondary_foreground=ColorScale(0, 0, 10),
-    muted=ColorScale(0, 0, 91),
-    muted_foreground=ColorScale(0, 0, 45),
-    accent=ColorScale(0, 0, 96),                       # Subtle hover
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 70, 55),                 # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),                   # Emerald #059669
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 90, 50),                    # Amber
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(153, 60, 53),                      # Green doubles as info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(153, 60, 53),                      # Green
-    link_hover=ColorScale(153, 60, 43),
-    code=ColorScale(0, 0, 9),                          # Dark code bg
-    code_foreground=ColorScale(153, 60, 63),           # Green code text
-    selection=ColorScale(153, 50, 90),                 # Pale green selection
-    selection_foreground=ColorScale(0, 0, 10),
-    brand=ColorScale(160, 84, 39),                     # Emerald
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 89),
-    input=ColorScale(0, 0, 93),
-    ring=ColorScale(153, 60, 53),
-    surface_1=ColorScale(0, 0, 100),
-    surface_2=ColorScale(0, 0, 97),
-    surface_3=ColorScale(0, 0, 94),
+    background=ColorScale.of(0, 0, 100),                  # Pure white
+    foreground=ColorScale.of(0, 0, 10),                   # Near-black
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(0, 0, 10),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 10),
+    primary=ColorScale.of(153, 60, 53),                   # Green #3ecf8e
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 96),
+    secondary_foreground=ColorScale.of(0, 0, 10),
+    muted=ColorScale.of(0, 0, 91),
+    muted_foreground=ColorScale.of(0, 0, 45),
+    accent=ColorScale.of(0, 0, 96),                       # Subtle hover
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 70, 55),                 # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),                   # Emerald #059669
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 90, 50),                    # Amber
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(153, 60, 53),                      # Green doubles as info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(153, 60, 53),                      # Green
+    link_hover=ColorScale.of(153, 60, 43),
+    code=ColorScale.of(0, 0, 9),                          # Dark code bg
+    code_foreground=ColorScale.of(153, 60, 63),           # Green code text
+    selection=ColorScale.of(153, 50, 90),                 # Pale green selection
+    selection_foreground=ColorScale.of(0, 0, 10),
+    brand=ColorScale.of(160, 84, 39),                     # Emerald
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 89),
+    input=ColorScale.of(0, 0, 93),
+    ring=ColorScale.of(153, 60, 53),
+    surface_1=ColorScale.of(0, 0, 100),
+    surface_2=ColorScale.of(0, 0, 97),
+    surface_3=ColorScale.of(0, 0, 94),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 9),                    # #171717
-    foreground=ColorScale(0, 0, 93),                   # #ededed
-    card=ColorScale(0, 0, 12),
-    card_foreground=ColorScale(0, 0, 93),
-    popover=ColorScale(0, 0, 12),
-    popover_foreground=ColorScale(0, 0, 93),
-    primary=ColorScale(153, 60, 53),                   # Green #3ecf8e
-    primary_foreground=ColorScale(0, 0, 9),
-    secondary=ColorScale(0, 0, 15),
-    secondary_foreground=ColorScale(0, 0, 93),
-    muted=ColorScale(0, 0, 18),
-    muted_foreground=ColorScale(0, 0, 55),
-    accent=ColorScale(0, 0, 15),                       # Subtle dark hover
-    accent_foreground=ColorScale(0, 0, 93),
-    destructive=ColorScale(0, 70, 55),                 # Red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),                   # Emerald
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(40, 90, 50),                    # Amber
-    warning_foreground=ColorScale(0, 0, 9),
-    info=ColorScale(153, 60, 53),                      # Green
-    info_foreground=ColorScale(0, 0, 9),
-    link=ColorScale(153, 60, 63),                      # Green brightened
-    link_hover=ColorScale(153, 60, 72),
-    code=ColorScale(0, 0, 6),                          # Very dark code bg
-    code_foreground=ColorScale(153, 60, 63),           # Green code text
-    selection=ColorScale(153, 40, 18),                 # Dark green selection
-    selection_foreground=ColorScale(0, 0, 93),
-    brand=ColorScale(160, 84, 39),                     # Emerald
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 18),                       # #282828
-    input=ColorScale(0, 0, 18),
-    ring=ColorScale(153, 60, 53),
-    surface_1=ColorScale(0, 0, 6),
-    surface_2=ColorScale(0, 0, 9),
-    surface_3=ColorScale(0, 0, 13),
+    background=ColorScale.of(0, 0, 9),                    # #171717
+    foreground=ColorScale.of(0, 0, 93),                   # #ededed
+    card=ColorScale.of(0, 0, 12),
+    card_foreground=ColorScale.of(0, 0, 93),
+    popover=ColorScale.of(0, 0, 12),
+    popover_foreground=ColorScale.of(0, 0, 93),
+    primary=ColorScale.of(153, 60, 53),                   # Green #3ecf8e
+    primary_foreground=ColorScale.of(0, 0, 9),
+    secondary=ColorScale.of(0, 0, 15),
+    secondary_foreground=ColorScale.of(0, 0, 93),
+    muted=ColorScale.of(0, 0, 18),
+    muted_foreground=ColorScale.of(0, 0, 55),
+    accent=ColorScale.of(0, 0, 15),                       # Subtle dark hover
+    accent_foreground=ColorScale.of(0, 0, 93),
+    destructive=ColorScale.of(0, 70, 55),                 # Red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),                   # Emerald
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(40, 90, 50),                    # Amber
+    warning_foreground=ColorScale.of(0, 0, 9),
+    info=ColorScale.of(153, 60, 53),                      # Green
+    info_foreground=ColorScale.of(0, 0, 9),
+    link=ColorScale.of(153, 60, 63),                      # Green brightened
+    link_hover=ColorScale.of(153, 60, 72),
+    code=ColorScale.of(0, 0, 6),                          # Very dark code bg
+    code_foreground=ColorScale.of(153, 60, 63),           # Green code text
+    selection=ColorScale.of(153, 40, 18),                 # Dark green selection
+    selection_foreground=ColorScale.of(0, 0, 93),
+    brand=ColorScale.of(160, 84, 39),                     # Emerald
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 18),                       # #282828
+    input=ColorScale.of(0, 0, 18),
+    ring=ColorScale.of(153, 60, 53),
+    surface_1=ColorScale.of(0, 0, 6),
+    surface_2=ColorScale.of(0, 0, 9),
+    surface_3=ColorScale.of(0, 0, 13),
 )
 
 PRESET = ThemePreset(
@@ -16,81 +16,81 @@ from ._base import (
 # No warm/cool tinting — pure neutral grays throughout.
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),                 # Pure white
-    foreground=ColorScale(0, 0, 0),                    # Pure black
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(0, 0, 0),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 0),
-    primary=ColorScale(0, 100, 45),                    # Swiss red
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 95),                    # Neutral light gray
-    secondary_foreground=ColorScale(0, 0, 0),
-    muted=ColorScale(0, 0, 90),                        # Pure gray muted
-    muted_foreground=ColorScale(0, 0, 40),             # Mid gray text
-    accent=ColorScale(0, 0, 95),                       # Neutral hover surface
-    accent_foreground=ColorScale(0, 0, 0),
-    destructive=ColorScale(0, 100, 45),                # Same red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 60, 35),                   # Clean green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 80, 50),                    # Clean yellow
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(210, 70, 45),                      # Clean blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(0, 100, 45),                       # Red links
-    link_hover=ColorScale(0, 100, 35),                 # Darker red on hover
-    code=ColorScale(0, 0, 5),                          # Near-black code bg
-    code_foreground=ColorScale(0, 100, 60),            # Red code text
-    selection=ColorScale(0, 80, 90),                   # Pale red selection
-    selection_foreground=ColorScale(0, 0, 0),
-    brand=ColorScale(0, 100, 45),                      # Swiss red
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 0),                        # Black borders
-    input=ColorScale(0, 0, 88),                        # Gray input border
-    ring=ColorScale(0, 100, 45),                       # Red focus ring
-    surface_1=ColorScale(0, 0, 100),                   # White
-    surface_2=ColorScale(0, 0, 96),                    # Light gray
-    surface_3=ColorScale(0, 0, 92),                    # Mid gray
+    background=ColorScale.of(0, 0, 100),                 # Pure white
+    foreground=ColorScale.of(0, 0, 0),                    # Pure black
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(0, 0, 0),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 0),
+    primary=ColorScale.of(0, 100, 45),                    # Swiss red
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 95),                    # Neutral light gray
+    secondary_foreground=ColorScale.of(0, 0, 0),
+    muted=ColorScale.of(0, 0, 90),                        # Pure gray muted
+    muted_foreground=ColorScale.of(0, 0, 40),             # Mid gray text
+    accent=ColorScale.of(0, 0, 95),                       # Neutral hover surface
+    accent_foreground=ColorScale.of(0, 0, 0),
+    destructive=ColorScale.of(0, 100, 45),                # Same red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 60, 35),                   # Clean green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 80, 50),                    # Clean yellow
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(210, 70, 45),                      # Clean blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(0, 100, 45),                       # Red links
+    link_hover=ColorScale.of(0, 100, 35),                 # Darker red on hover
+    code=ColorScale.of(0, 0, 5),                          # Near-black code bg
+    code_foreground=ColorScale.of(0, 100, 60),            # Red code text
+    selection=ColorScale.of(0, 80, 90),                   # Pale red selection
+    selection_foreground=ColorScale.of(0, 0, 0),
+    brand=ColorScale.of(0, 100, 45),                      # Swiss red
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 0),                        # Black borders
+    input=ColorScale.of(0, 0, 88),                        # Gray input border
+    ring=ColorScale.of(0, 100, 45),                       # Red focus ring
+    surface_1=ColorScale.of(0, 0, 100),                   # White
+    surface_2=ColorScale.of(0, 0, 96),                    # Light gray
+    surface_3=ColorScale.of(0, 0, 92),                    # Mid gray
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 0),                    # Pure black
-    foreground=ColorScale(0, 0, 100),                  # Pure white
-    card=ColorScale(0, 0, 6),                          # Near-black card
-    card_foreground=ColorScale(0, 0, 100),
-    popover=ColorScale(0, 0, 6),
-    popover_foreground=ColorScale(0, 0, 100),
-    primary=ColorScale(0, 100, 55),                    # Red brightened
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 10),                    # Dark panel
-    secondary_foreground=ColorScale(0, 0, 100),
-    muted=ColorScale(0, 0, 15),                        # Dark muted
-    muted_foreground=ColorScale(0, 0, 60),             # Muted text
-    accent=ColorScale(0, 0, 10),                       # Dark hover
-    accent_foreground=ColorScale(0, 0, 100),
-    destructive=ColorScale(0, 100, 55),                # Red brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 60, 45),                   # Green brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(45, 80, 55),                    # Yellow brightened
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(210, 70, 55),                      # Blue brightened
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(0, 100, 60),                       # Red brightened for dark
-    link_hover=ColorScale(0, 100, 70),                 # Lighter red
-    code=ColorScale(0, 0, 3),                          # Deepest black code bg
-    code_foreground=ColorScale(0, 100, 65),            # Red code text
-    selection=ColorScale(0, 80, 20),                   # Deep red selection
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(0, 100, 55),                      # Red brightened
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 100),                      # White borders on black
-    input=ColorScale(0, 0, 18),                        # Dark input
-    ring=ColorScale(0, 100, 55),                       # Red focus ring
-    surface_1=ColorScale(0, 0, 0),                     # Pure black
-    surface_2=ColorScale(0, 0, 4),                     # Near-black
-    surface_3=ColorScale(0, 0, 8),                     # Slightly lighter
+    background=ColorScale.of(0, 0, 0),                    # Pure black
+    foreground=ColorScale.of(0, 0, 100),                  # Pure white
+    card=ColorScale.of(0, 0, 6),                          # Near-black card
+    card_foreground=ColorScale.of(0, 0, 100),
+    popover=ColorScale.of(0, 0, 6),
+    popover_foreground=ColorScale.of(0, 0, 100),
+    primary=ColorScale.of(0, 100, 55),                    # Red brightened
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 10),                    # Dark panel
+    secondary_foreground=ColorScale.of(0, 0, 100),
+    muted=ColorScale.of(0, 0, 15),                        # Dark muted
+    muted_foreground=ColorScale.of(0, 0, 60),             # Muted text
+    accent=ColorScale.of(0, 0, 10),                       # Dark hover
+    accent_foreground=ColorScale.of(0, 0, 100),
+    destructive=ColorScale.of(0, 100, 55),                # Red brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 60, 45),                   # Green brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(45, 80, 55),                    # Yellow brightened
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(210, 70, 55),                      # Blue brightened
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(0, 100, 60),                       # Red brightened for dark
+    link_hover=ColorScale.of(0, 100, 70),                 # Lighter red
+    code=ColorScale.of(0, 0, 3),                          # Deepest black code bg
+    code_foreground=ColorScale.of(0, 100, 65),            # Red code text
+    selection=ColorScale.of(0, 80, 20),                   # Deep red selection
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(0, 100, 55),                      # Red brightened
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 100),                      # White borders on black
+    input=ColorScale.of(0, 0, 18),                        # Dark input
+    ring=ColorScale.of(0, 100, 55),                       # Red focus ring
+    surface_1=ColorScale.of(0, 0, 0),                     # Pure black
+    surface_2=ColorScale.of(0, 0, 4),                     # Near-black
+    surface_3=ColorScale.of(0, 0, 8),                     # Slightly lighter
 )
 
 PRESET = ThemePreset(
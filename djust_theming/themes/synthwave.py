@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 98),
-    foreground=ColorScale(255, 26, 25),
-    card=ColorScale(255, 26, 95),
-    card_foreground=ColorScale(255, 26, 25),
-    popover=ColorScale(255, 26, 95),
-    popover_foreground=ColorScale(255, 26, 25),
-    primary=ColorScale(320, 100, 74),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(255, 26, 88),
-    secondary_foreground=ColorScale(255, 26, 25),
-    muted=ColorScale(255, 26, 88),
-    muted_foreground=ColorScale(255, 26, 45),
-    accent=ColorScale(154, 83, 70),
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(154, 83, 70),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(45, 100, 70),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(267, 41, 69),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(320, 100, 74),
-    link_hover=ColorScale(320, 100, 64),
-    code=ColorScale(255, 26, 95),
-    code_foreground=ColorScale(255, 26, 25),
-    selection=ColorScale(320, 100, 84),
-    selection_foreground=ColorScale(255, 26, 25),
-    brand=ColorScale(154, 83, 70),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(255, 26, 88),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(320, 100, 74),
-    surface_1=ColorScale(280, 20, 98),
-    surface_2=ColorScale(280, 15, 96),
-    surface_3=ColorScale(280, 12, 93),
+    background=ColorScale.of(0, 0, 98),
+    foreground=ColorScale.of(255, 26, 25),
+    card=ColorScale.of(255, 26, 95),
+    card_foreground=ColorScale.of(255, 26, 25),
+    popover=ColorScale.of(255, 26, 95),
+    popover_foreground=ColorScale.of(255, 26, 25),
+    primary=ColorScale.of(320, 100, 74),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(255, 26, 88),
+    secondary_foreground=ColorScale.of(255, 26, 25),
+    muted=ColorScale.of(255, 26, 88),
+    muted_foreground=ColorScale.of(255, 26, 45),
+    accent=ColorScale.of(154, 83, 70),
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(154, 83, 70),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(45, 100, 70),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(267, 41, 69),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(320, 100, 74),
+    link_hover=ColorScale.of(320, 100, 64),
+    code=ColorScale.of(255, 26, 95),
+    code_foreground=ColorScale.of(255, 26, 25),
+    selection=ColorScale.of(320, 100, 84),
+    selection_foreground=ColorScale.of(255, 26, 25),
+    brand=ColorScale.of(154, 83, 70),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(255, 26, 88),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(320, 100, 74),
+    surface_1=ColorScale.of(280, 20, 98),
+    surface_2=ColorScale.of(280, 15, 96),
+    surface_3=ColorScale.of(280, 12, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(255, 26, 17),
-    foreground=ColorScale(320, 100, 95),
-    card=ColorScale(255, 26, 22),
-    card_foreground=ColorScale(320, 100, 95),
-    popover=ColorScale(255, 26, 22),
-    popover_foreground=ColorScale(320, 100, 95),
-    primary=ColorScale(320, 100, 74),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(255, 26, 30),
-    secondary_foreground=ColorScale(320, 100, 95),
-    muted=ColorScale(255, 26, 30),
-    muted_foreground=ColorScale(267, 41, 69),
-    accent=ColorScale(154, 83, 70),
-    accent_foreground=ColorScale(0, 0, 10),
-    destructive=ColorScale(0, 84, 60),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(154, 83, 70),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(45, 100, 70),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(267, 41, 69),
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(320, 100, 74),
-    link_hover=ColorScale(320, 100, 84),
-    code=ColorScale(255, 26, 14),
-    code_foreground=ColorScale(320, 100, 95),
-    selection=ColorScale(320, 100, 74),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(154, 83, 70),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(255, 26, 30),
-    input=ColorScale(255, 26, 22),
-    ring=ColorScale(320, 100, 74),
-    surface_1=ColorScale(255, 25, 6),
-    surface_2=ColorScale(255, 20, 10),
-    surface_3=ColorScale(255, 15, 14),
+    background=ColorScale.of(255, 26, 17),
+    foreground=ColorScale.of(320, 100, 95),
+    card=ColorScale.of(255, 26, 22),
+    card_foreground=ColorScale.of(320, 100, 95),
+    popover=ColorScale.of(255, 26, 22),
+    popover_foreground=ColorScale.of(320, 100, 95),
+    primary=ColorScale.of(320, 100, 74),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(255, 26, 30),
+    secondary_foreground=ColorScale.of(320, 100, 95),
+    muted=ColorScale.of(255, 26, 30),
+    muted_foreground=ColorScale.of(267, 41, 69),
+    accent=ColorScale.of(154, 83, 70),
+    accent_foreground=ColorScale.of(0, 0, 10),
+    destructive=ColorScale.of(0, 84, 60),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(154, 83, 70),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(45, 100, 70),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(267, 41, 69),
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(320, 100, 74),
+    link_hover=ColorScale.of(320, 100, 84),
+    code=ColorScale.of(255, 26, 14),
+    code_foreground=ColorScale.of(320, 100, 95),
+    selection=ColorScale.of(320, 100, 74),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(154, 83, 70),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(255, 26, 30),
+    input=ColorScale.of(255, 26, 22),
+    ring=ColorScale.of(320, 100, 74),
+    surface_1=ColorScale.of(255, 25, 6),
+    surface_2=ColorScale.of(255, 20, 10),
+    surface_3=ColorScale.of(255, 15, 14),
 )
 
 PRESET = ThemePreset(
@@ -18,81 +18,81 @@ from ._base import (
 # - Emerald 600 #059669, Amber 500 #f59e0b, Rose 500 #f43f5e
 
 LIGHT = ThemeTokens(
-    background=ColorScale(210, 40, 98),                # Slate 50
-    foreground=ColorScale(222, 47, 11),                # Slate 900
-    card=ColorScale(0, 0, 100),
-    card_foreground=ColorScale(222, 47, 11),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(222, 47, 11),
-    primary=ColorScale(199, 89, 48),                   # Sky 500 #0ea5e9
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(210, 40, 96),
-    secondary_foreground=ColorScale(222, 47, 11),
-    muted=ColorScale(214, 32, 91),                     # Slate 200
-    muted_foreground=ColorScale(215, 20, 65),          # Slate 400
-    accent=ColorScale(210, 40, 96),                    # Subtle hover
-    accent_foreground=ColorScale(222, 47, 11),
-    destructive=ColorScale(0, 84, 60),                 # Rose 500
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),                   # Emerald 600
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),                    # Amber 500
-    warning_foreground=ColorScale(222, 47, 11),
-    info=ColorScale(199, 89, 48),                      # Sky 500
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(199, 89, 48),                      # Sky 500
-    link_hover=ColorScale(199, 89, 38),                # Sky 600
-    code=ColorScale(222, 47, 11),                      # Slate 900 code bg
-    code_foreground=ColorScale(199, 89, 65),           # Sky code text
-    selection=ColorScale(199, 80, 90),                 # Pale sky selection
-    selection_foreground=ColorScale(222, 47, 11),
-    brand=ColorScale(199, 89, 48),                     # Sky 500
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(214, 32, 91),                    # Slate 200
-    input=ColorScale(214, 32, 91),
-    ring=ColorScale(199, 89, 48),
-    surface_1=ColorScale(210, 40, 98),
-    surface_2=ColorScale(210, 40, 96),
-    surface_3=ColorScale(214, 32, 93),
+    background=ColorScale.of(210, 40, 98),                # Slate 50
+    foreground=ColorScale.of(222, 47, 11),                # Slate 900
+    card=ColorScale.of(0, 0, 100),
+    card_foreground=ColorScale.of(222, 47, 11),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(222, 47, 11),
+    primary=ColorScale.of(199, 89, 48),                   # Sky 500 #0ea5e9
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(210, 40, 96),
+    secondary_foreground=ColorScale.of(222, 47, 11),
+    muted=ColorScale.of(214, 32, 91),                     # Slate 200
+    muted_foreground=ColorScale.of(215, 20, 65),          # Slate 400
+    accent=ColorScale.of(210, 40, 96),                    # Subtle hover
+    accent_foreground=ColorScale.of(222, 47, 11),
+    destructive=ColorScale.of(0, 84, 60),                 # Rose 500
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),                   # Emerald 600
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),                    # Amber 500
+    warning_foreground=ColorScale.of(222, 47, 11),
+    info=ColorScale.of(199, 89, 48),                      # Sky 500
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(199, 89, 48),                      # Sky 500
+    link_hover=ColorScale.of(199, 89, 38),                # Sky 600
+    code=ColorScale.of(222, 47, 11),                      # Slate 900 code bg
+    code_foreground=ColorScale.of(199, 89, 65),           # Sky code text
+    selection=ColorScale.of(199, 80, 90),                 # Pale sky selection
+    selection_foreground=ColorScale.of(222, 47, 11),
+    brand=ColorScale.of(199, 89, 48),                     # Sky 500
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(214, 32, 91),                    # Slate 200
+    input=ColorScale.of(214, 32, 91),
+    ring=ColorScale.of(199, 89, 48),
+    surface_1=ColorScale.of(210, 40, 98),
+    surface_2=ColorScale.of(210, 40, 96),
+    surface_3=ColorScale.of(214, 32, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(222, 47, 11),                # Slate 900
-    foreground=ColorScale(210, 40, 98),                # Slate 50
-    card=ColorScale(217, 33, 17),                      # Slate 800
-    card_foreground=ColorScale(210, 40, 98),
-    popover=ColorScale(217, 33, 17),
-    popover_foreground=ColorScale(210, 40, 98),
-    primary=ColorScale(199, 89, 48),                   # Sky 500
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(217, 33, 20),
-    secondary_foreground=ColorScale(210, 40, 98),
-    muted=ColorScale(217, 25, 24),
-    muted_foreground=ColorScale(215, 20, 65),          # Slate 400
-    accent=ColorScale(217, 33, 20),                    # Subtle dark hover
-    accent_foreground=ColorScale(210, 40, 98),
-    destructive=ColorScale(0, 84, 60),                 # Rose 500
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(160, 84, 39),                   # Emerald 600
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 92, 50),                    # Amber 500
-    warning_foreground=ColorScale(222, 47, 11),
-    info=ColorScale(199, 89, 48),                      # Sky 500
-    info_foreground=ColorScale(222, 47, 11),
-    link=ColorScale(199, 89, 58),                      # Sky brightened
-    link_hover=ColorScale(199, 89, 68),
-    code=ColorScale(222, 47, 7),                       # Very dark code bg
-    code_foreground=ColorScale(199, 89, 65),           # Sky code text
-    selection=ColorScale(199, 60, 20),                 # Deep sky selection
-    selection_foreground=ColorScale(210, 40, 95),
-    brand=ColorScale(199, 89, 48),                     # Sky 500
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(217, 25, 24),
-    input=ColorScale(217, 25, 24),
-    ring=ColorScale(199, 89, 48),
-    surface_1=ColorScale(222, 47, 7),
-    surface_2=ColorScale(222, 47, 11),
-    surface_3=ColorScale(217, 33, 17),
+    background=ColorScale.of(222, 47, 11),                # Slate 900
+    foreground=ColorScale.of(210, 40, 98),                # Slate 50
+    card=ColorScale.of(217, 33, 17),                      # Slate 800
+    card_foreground=ColorScale.of(210, 40, 98),
+    popover=ColorScale.of(217, 33, 17),
+    popover_foreground=ColorScale.of(210, 40, 98),
+    primary=ColorScale.of(199, 89, 48),                   # Sky 500
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(217, 33, 20),
+    secondary_foreground=ColorScale.of(210, 40, 98),
+    muted=ColorScale.of(217, 25, 24),
+    muted_foreground=ColorScale.of(215, 20, 65),          # Slate 400
+    accent=ColorScale.of(217, 33, 20),                    # Subtle dark hover
+    accent_foreground=ColorScale.of(210, 40, 98),
+    destructive=ColorScale.of(0, 84, 60),                 # Rose 500
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(160, 84, 39),                   # Emerald 600
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 92, 50),                    # Amber 500
+    warning_foreground=ColorScale.of(222, 47, 11),
+    info=ColorScale.of(199, 89, 48),                      # Sky 500
+    info_foreground=ColorScale.of(222, 47, 11),
+    link=ColorScale.of(199, 89, 58),                      # Sky brightened
+    link_hover=ColorScale.of(199, 89, 68),
+    code=ColorScale.of(222, 47, 7),                       # Very dark code bg
+    code_foreground=ColorScale.of(199, 89, 65),           # Sky code text
+    selection=ColorScale.of(199, 60, 20),                 # Deep sky selection
+    selection_foreground=ColorScale.of(210, 40, 95),
+    brand=ColorScale.of(199, 89, 48),                     # Sky 500
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(217, 25, 24),
+    input=ColorScale.of(217, 25, 24),
+    ring=ColorScale.of(199, 89, 48),
+    surface_1=ColorScale.of(222, 47, 7),
+    surface_2=ColorScale.of(222, 47, 11),
+    surface_3=ColorScale.of(217, 33, 17),
 )
 
 PRESET = ThemePreset(
@@ -17,81 +17,81 @@ from ._base import (
 
 LIGHT = ThemeTokens(
     # Light "terminal" = white terminal (like a paper printout)
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(0, 0, 5),
-    card=ColorScale(0, 0, 98),
-    card_foreground=ColorScale(0, 0, 5),
-    popover=ColorScale(0, 0, 98),
-    popover_foreground=ColorScale(0, 0, 5),
-    primary=ColorScale(120, 80, 35),               # Terminal green
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 95),
-    secondary_foreground=ColorScale(0, 0, 5),
-    muted=ColorScale(0, 0, 93),
-    muted_foreground=ColorScale(0, 0, 40),
-    accent=ColorScale(0, 0, 96),
-    accent_foreground=ColorScale(0, 0, 5),
-    destructive=ColorScale(0, 80, 50),             # Red error
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(120, 80, 35),               # Green = success = terminal
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(38, 100, 50),               # Amber warning
-    warning_foreground=ColorScale(0, 0, 5),
-    info=ColorScale(200, 60, 50),                  # Cyan info
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(120, 80, 30),                  # Green links
-    link_hover=ColorScale(120, 80, 20),
-    code=ColorScale(0, 0, 5),                      # Black code bg
-    code_foreground=ColorScale(120, 80, 55),       # Green code text
-    selection=ColorScale(120, 80, 85),
-    selection_foreground=ColorScale(0, 0, 5),
-    brand=ColorScale(120, 80, 35),                 # Green IS the brand
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 75),                   # Gray border
-    input=ColorScale(0, 0, 96),
-    ring=ColorScale(120, 80, 35),
-    surface_1=ColorScale(0, 0, 100),
-    surface_2=ColorScale(0, 0, 98),
-    surface_3=ColorScale(0, 0, 95),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(0, 0, 5),
+    card=ColorScale.of(0, 0, 98),
+    card_foreground=ColorScale.of(0, 0, 5),
+    popover=ColorScale.of(0, 0, 98),
+    popover_foreground=ColorScale.of(0, 0, 5),
+    primary=ColorScale.of(120, 80, 35),               # Terminal green
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 95),
+    secondary_foreground=ColorScale.of(0, 0, 5),
+    muted=ColorScale.of(0, 0, 93),
+    muted_foreground=ColorScale.of(0, 0, 40),
+    accent=ColorScale.of(0, 0, 96),
+    accent_foreground=ColorScale.of(0, 0, 5),
+    destructive=ColorScale.of(0, 80, 50),             # Red error
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(120, 80, 35),               # Green = success = terminal
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(38, 100, 50),               # Amber warning
+    warning_foreground=ColorScale.of(0, 0, 5),
+    info=ColorScale.of(200, 60, 50),                  # Cyan info
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(120, 80, 30),                  # Green links
+    link_hover=ColorScale.of(120, 80, 20),
+    code=ColorScale.of(0, 0, 5),                      # Black code bg
+    code_foreground=ColorScale.of(120, 80, 55),       # Green code text
+    selection=ColorScale.of(120, 80, 85),
+    selection_foreground=ColorScale.of(0, 0, 5),
+    brand=ColorScale.of(120, 80, 35),                 # Green IS the brand
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 75),                   # Gray border
+    input=ColorScale.of(0, 0, 96),
+    ring=ColorScale.of(120, 80, 35),
+    surface_1=ColorScale.of(0, 0, 100),
+    surface_2=ColorScale.of(0, 0, 98),
+    surface_3=ColorScale.of(0, 0, 95),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 0),                # Pure black — CRT off-state
-    foreground=ColorScale(120, 80, 55),            # #33CC33-ish — phosphor green
-    card=ColorScale(0, 0, 4),                      # Near-black card
-    card_foreground=ColorScale(120, 80, 55),
-    popover=ColorScale(0, 0, 4),
-    popover_foreground=ColorScale(120, 80, 55),
-    primary=ColorScale(120, 80, 45),               # Bright phosphor green
-    primary_foreground=ColorScale(0, 0, 0),        # Black on green
-    secondary=ColorScale(0, 0, 8),
-    secondary_foreground=ColorScale(120, 80, 55),
-    muted=ColorScale(0, 0, 8),
-    muted_foreground=ColorScale(120, 40, 35),      # Dim green
-    accent=ColorScale(0, 0, 6),                    # Very dark hover
-    accent_foreground=ColorScale(120, 80, 55),
-    destructive=ColorScale(0, 80, 50),             # Red error
-    destructive_foreground=ColorScale(0, 0, 0),
-    success=ColorScale(120, 80, 45),               # Bright green
-    success_foreground=ColorScale(0, 0, 0),
-    warning=ColorScale(38, 100, 50),               # Amber
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(200, 60, 55),                  # Cyan
-    info_foreground=ColorScale(0, 0, 0),
-    link=ColorScale(120, 80, 55),                  # Green links
-    link_hover=ColorScale(120, 80, 70),            # Brighter on hover
-    code=ColorScale(0, 0, 0),                      # Pure black code
-    code_foreground=ColorScale(120, 80, 55),       # Green
-    selection=ColorScale(120, 80, 20),             # Dark green selection
-    selection_foreground=ColorScale(120, 80, 70),
-    brand=ColorScale(120, 80, 45),                 # Phosphor green
-    brand_foreground=ColorScale(0, 0, 0),
-    border=ColorScale(120, 40, 20),                # Dark green-tinted border
-    input=ColorScale(0, 0, 6),                     # Near-black input
-    ring=ColorScale(120, 80, 45),                  # Green ring
-    surface_1=ColorScale(0, 0, 0),                 # Pure black
-    surface_2=ColorScale(0, 0, 3),
-    surface_3=ColorScale(0, 0, 6),
+    background=ColorScale.of(0, 0, 0),                # Pure black — CRT off-state
+    foreground=ColorScale.of(120, 80, 55),            # #33CC33-ish — phosphor green
+    card=ColorScale.of(0, 0, 4),                      # Near-black card
+    card_foreground=ColorScale.of(120, 80, 55),
+    popover=ColorScale.of(0, 0, 4),
+    popover_foreground=ColorScale.of(120, 80, 55),
+    primary=ColorScale.of(120, 80, 45),               # Bright phosphor green
+    primary_foreground=ColorScale.of(0, 0, 0),        # Black on green
+    secondary=ColorScale.of(0, 0, 8),
+    secondary_foreground=ColorScale.of(120, 80, 55),
+    muted=ColorScale.of(0, 0, 8),
+    muted_foreground=ColorScale.of(120, 40, 35),      # Dim green
+    accent=ColorScale.of(0, 0, 6),                    # Very dark hover
+    accent_foreground=ColorScale.of(120, 80, 55),
+    destructive=ColorScale.of(0, 80, 50),             # Red error
+    destructive_foreground=ColorScale.of(0, 0, 0),
+    success=ColorScale.of(120, 80, 45),               # Bright green
+    success_foreground=ColorScale.of(0, 0, 0),
+    warning=ColorScale.of(38, 100, 50),               # Amber
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(200, 60, 55),                  # Cyan
+    info_foreground=ColorScale.of(0, 0, 0),
+    link=ColorScale.of(120, 80, 55),                  # Green links
+    link_hover=ColorScale.of(120, 80, 70),            # Brighter on hover
+    code=ColorScale.of(0, 0, 0),                      # Pure black code
+    code_foreground=ColorScale.of(120, 80, 55),       # Green
+    selection=ColorScale.of(120, 80, 20),             # Dark green selection
+    selection_foreground=ColorScale.of(120, 80, 70),
+    brand=ColorScale.of(120, 80, 45),                 # Phosphor green
+    brand_foreground=ColorScale.of(0, 0, 0),
+    border=ColorScale.of(120, 40, 20),                # Dark green-tinted border
+    input=ColorScale.of(0, 0, 6),                     # Near-black input
+    ring=ColorScale.of(120, 80, 45),                  # Green ring
+    surface_1=ColorScale.of(0, 0, 0),                 # Pure black
+    surface_2=ColorScale.of(0, 0, 3),
+    surface_3=ColorScale.of(0, 0, 6),
 )
 
 PRESET = ThemePreset(
@@ -19,81 +19,81 @@ from ._base import (
 # --- Color Preset ---
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),
-    foreground=ColorScale(224, 18, 20),
-    card=ColorScale(219, 28, 97),
-    card_foreground=ColorScale(224, 18, 20),
-    popover=ColorScale(219, 28, 97),
-    popover_foreground=ColorScale(224, 18, 20),
-    primary=ColorScale(217, 89, 72),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(219, 20, 92),
-    secondary_foreground=ColorScale(224, 18, 20),
-    muted=ColorScale(219, 20, 92),
-    muted_foreground=ColorScale(224, 18, 45),
-    accent=ColorScale(219, 20, 92),
-    accent_foreground=ColorScale(267, 85, 78),
-    destructive=ColorScale(355, 89, 72),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(89, 59, 64),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(41, 70, 65),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 100, 74),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 85, 78),
-    link_hover=ColorScale(267, 85, 68),
-    code=ColorScale(219, 28, 97),
-    code_foreground=ColorScale(224, 18, 20),
-    selection=ColorScale(217, 89, 82),
-    selection_foreground=ColorScale(224, 18, 20),
-    brand=ColorScale(190, 80, 55),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(219, 20, 92),
-    input=ColorScale(0, 0, 100),
-    ring=ColorScale(217, 89, 72),
-    surface_1=ColorScale(234, 18, 98),
-    surface_2=ColorScale(234, 14, 96),
-    surface_3=ColorScale(234, 10, 93),
+    background=ColorScale.of(0, 0, 100),
+    foreground=ColorScale.of(224, 18, 20),
+    card=ColorScale.of(219, 28, 97),
+    card_foreground=ColorScale.of(224, 18, 20),
+    popover=ColorScale.of(219, 28, 97),
+    popover_foreground=ColorScale.of(224, 18, 20),
+    primary=ColorScale.of(217, 89, 72),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(219, 20, 92),
+    secondary_foreground=ColorScale.of(224, 18, 20),
+    muted=ColorScale.of(219, 20, 92),
+    muted_foreground=ColorScale.of(224, 18, 45),
+    accent=ColorScale.of(219, 20, 92),
+    accent_foreground=ColorScale.of(267, 85, 78),
+    destructive=ColorScale.of(355, 89, 72),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(89, 59, 64),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(41, 70, 65),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 100, 74),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 85, 78),
+    link_hover=ColorScale.of(267, 85, 68),
+    code=ColorScale.of(219, 28, 97),
+    code_foreground=ColorScale.of(224, 18, 20),
+    selection=ColorScale.of(217, 89, 82),
+    selection_foreground=ColorScale.of(224, 18, 20),
+    brand=ColorScale.of(190, 80, 55),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(219, 20, 92),
+    input=ColorScale.of(0, 0, 100),
+    ring=ColorScale.of(217, 89, 72),
+    surface_1=ColorScale.of(234, 18, 98),
+    surface_2=ColorScale.of(234, 14, 96),
+    surface_3=ColorScale.of(234, 10, 93),
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(234, 16, 13),
-    foreground=ColorScale(219, 72, 85),
-    card=ColorScale(233, 15, 18),
-    card_foreground=ColorScale(219, 72, 85),
-    popover=ColorScale(233, 15, 18),
-    popover_foreground=ColorScale(219, 72, 85),
-    primary=ColorScale(217, 89, 72),
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(234, 13, 20),
-    secondary_foreground=ColorScale(219, 72, 85),
-    muted=ColorScale(234, 13, 20),
-    muted_foreground=ColorScale(225, 12, 68),
-    accent=ColorScale(234, 13, 20),
-    accent_foreground=ColorScale(267, 85, 78),
-    destructive=ColorScale(355, 89, 72),
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(89, 59, 64),
-    success_foreground=ColorScale(0, 0, 10),
-    warning=ColorScale(41, 70, 65),
-    warning_foreground=ColorScale(0, 0, 10),
-    info=ColorScale(189, 100, 74),
-    info_foreground=ColorScale(0, 0, 10),
-    link=ColorScale(267, 85, 78),
-    link_hover=ColorScale(267, 85, 88),
-    code=ColorScale(233, 17, 10),
-    code_foreground=ColorScale(219, 72, 85),
-    selection=ColorScale(267, 85, 78),
-    selection_foreground=ColorScale(0, 0, 100),
-    brand=ColorScale(190, 80, 70),
-    brand_foreground=ColorScale(0, 0, 10),
-    border=ColorScale(234, 13, 20),
-    input=ColorScale(233, 15, 18),
-    ring=ColorScale(217, 89, 72),
-    surface_1=ColorScale(234, 18, 5),
-    surface_2=ColorScale(234, 15, 8),
-    surface_3=ColorScale(234, 12, 12),
+    background=ColorScale.of(234, 16, 13),
+    foreground=ColorScale.of(219, 72, 85),
+    card=ColorScale.of(233, 15, 18),
+    card_foreground=ColorScale.of(219, 72, 85),
+    popover=ColorScale.of(233, 15, 18),
+    popover_foreground=ColorScale.of(219, 72, 85),
+    primary=ColorScale.of(217, 89, 72),
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(234, 13, 20),
+    secondary_foreground=ColorScale.of(219, 72, 85),
+    muted=ColorScale.of(234, 13, 20),
+    muted_foreground=ColorScale.of(225, 12, 68),
+    accent=ColorScale.of(234, 13, 20),
+    accent_foreground=ColorScale.of(267, 85, 78),
+    destructive=ColorScale.of(355, 89, 72),
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(89, 59, 64),
+    success_foreground=ColorScale.of(0, 0, 10),
+    warning=ColorScale.of(41, 70, 65),
+    warning_foreground=ColorScale.of(0, 0, 10),
+    info=ColorScale.of(189, 100, 74),
+    info_foreground=ColorScale.of(0, 0, 10),
+    link=ColorScale.of(267, 85, 78),
+    link_hover=ColorScale.of(267, 85, 88),
+    code=ColorScale.of(233, 17, 10),
+    code_foreground=ColorScale.of(219, 72, 85),
+    selection=ColorScale.of(267, 85, 78),
+    selection_foreground=ColorScale.of(0, 0, 100),
+    brand=ColorScale.of(190, 80, 70),
+    brand_foreground=ColorScale.of(0, 0, 10),
+    border=ColorScale.of(234, 13, 20),
+    input=ColorScale.of(233, 15, 18),
+    ring=ColorScale.of(217, 89, 72),
+    surface_1=ColorScale.of(234, 18, 5),
+    surface_2=ColorScale.of(234, 15, 8),
+    surface_3=ColorScale.of(234, 12, 12),
 )
 
 PRESET = ThemePreset(
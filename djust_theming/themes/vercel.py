@@ -18,81 +18,81 @@ from ._base import (
 # - Hairline borders, no shadows, extreme minimalism
 
 LIGHT = ThemeTokens(
-    background=ColorScale(0, 0, 100),                  # Pure white
-    foreground=ColorScale(0, 0, 9),                    # #171717 — near-black
-    card=ColorScale(0, 0, 100),                        # White cards
-    card_foreground=ColorScale(0, 0, 9),
-    popover=ColorScale(0, 0, 100),
-    popover_foreground=ColorScale(0, 0, 9),
-    primary=ColorScale(212, 100, 48),                  # #0070F3 — Vercel blue
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 96),                    # Near-white bg
-    secondary_foreground=ColorScale(0, 0, 9),
-    muted=ColorScale(0, 0, 96),                        # Light gray
-    muted_foreground=ColorScale(0, 0, 40),             # Mid gray text
-    accent=ColorScale(0, 0, 97),                       # Lightest hover
-    accent_foreground=ColorScale(0, 0, 9),
-    destructive=ColorScale(0, 100, 47),                # Pure red
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(143, 70, 45),                   # Green
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(37, 100, 50),                   # Amber
-    warning_foreground=ColorScale(0, 0, 9),
-    info=ColorScale(212, 100, 48),                     # Primary blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(212, 100, 48),                     # Same blue
-    link_hover=ColorScale(212, 100, 40),               # Darker blue
-    code=ColorScale(0, 0, 96),                         # Light gray code bg
-    code_foreground=ColorScale(0, 0, 9),               # Dark code text
-    selection=ColorScale(212, 100, 90),                # Pale blue selection
-    selection_foreground=ColorScale(0, 0, 9),
-    brand=ColorScale(212, 100, 48),                    # #0070F3 — blue IS the brand
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 92),                       # #EAEAEA — hairline
-    input=ColorScale(0, 0, 92),
-    ring=ColorScale(212, 100, 48),                     # Blue focus ring
-    surface_1=ColorScale(0, 0, 100),                   # Pure white
-    surface_2=ColorScale(0, 0, 98),                    # Barely gray
-    surface_3=ColorScale(0, 0, 96),                    # Light gray
+    background=ColorScale.of(0, 0, 100),                  # Pure white
+    foreground=ColorScale.of(0, 0, 9),                    # #171717 — near-black
+    card=ColorScale.of(0, 0, 100),                        # White cards
+    card_foreground=ColorScale.of(0, 0, 9),
+    popover=ColorScale.of(0, 0, 100),
+    popover_foreground=ColorScale.of(0, 0, 9),
+    primary=ColorScale.of(212, 100, 48),                  # #0070F3 — Vercel blue
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 96),                    # Near-white bg
+    secondary_foreground=ColorScale.of(0, 0, 9),
+    muted=ColorScale.of(0, 0, 96),                        # Light gray
+    muted_foreground=ColorScale.of(0, 0, 40),             # Mid gray text
+    accent=ColorScale.of(0, 0, 97),                       # Lightest hover
+    accent_foreground=ColorScale.of(0, 0, 9),
+    destructive=ColorScale.of(0, 100, 47),                # Pure red
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(143, 70, 45),                   # Green
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(37, 100, 50),                   # Amber
+    warning_foreground=ColorScale.of(0, 0, 9),
+    info=ColorScale.of(212, 100, 48),                     # Primary blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(212, 100, 48),                     # Same blue
+    link_hover=ColorScale.of(212, 100, 40),               # Darker blue
+    code=ColorScale.of(0, 0, 96),                         # Light gray code bg
+    code_foreground=ColorScale.of(0, 0, 9),               # Dark code text
+    selection=ColorScale.of(212, 100, 90),                # Pale blue selection
+    selection_foreground=ColorScale.of(0, 0, 9),
+    brand=ColorScale.of(212, 100, 48),                    # #0070F3 — blue IS the brand
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 92),                       # #EAEAEA — hairline
+    input=ColorScale.of(0, 0, 92),
+    ring=ColorScale.of(212, 100, 48),                     # Blue focus ring
+    surface_1=ColorScale.of(0, 0, 100),                   # Pure white
+    surface_2=ColorScale.of(0, 0, 98),                    # Barely gray
+    surface_3=ColorScale.of(0, 0, 96),                    # Light gray
 )
 
 DARK = ThemeTokens(
-    background=ColorScale(0, 0, 0),                    # Pure black
-    foreground=ColorScale(0, 0, 98),                   # #FAFAFA — near-white
-    card=ColorScale(0, 0, 7),                          # Very dark card
-    card_foreground=ColorScale(0, 0, 98),
-    popover=ColorScale(0, 0, 7),
-    popover_foreground=ColorScale(0, 0, 98),
-    primary=ColorScale(212, 100, 48),                  # Same blue — pure on black
-    primary_foreground=ColorScale(0, 0, 100),
-    secondary=ColorScale(0, 0, 10),                    # Near-black panel
-    secondary_foreground=ColorScale(0, 0, 98),
-    muted=ColorScale(0, 0, 14),                        # Dark muted
-    muted_foreground=ColorScale(0, 0, 63),             # Mid gray text
-    accent=ColorScale(0, 0, 10),                       # Dark hover
-    accent_foreground=ColorScale(0, 0, 98),
-    destructive=ColorScale(0, 100, 52),                # Red — slightly brightened
-    destructive_foreground=ColorScale(0, 0, 100),
-    success=ColorScale(143, 70, 50),                   # Green — brightened
-    success_foreground=ColorScale(0, 0, 100),
-    warning=ColorScale(37, 100, 55),                   # Amber — brightened
-    warning_foreground=ColorScale(0, 0, 0),
-    info=ColorScale(212, 100, 48),                     # Blue
-    info_foreground=ColorScale(0, 0, 100),
-    link=ColorScale(212, 100, 55),                     # Blue — brightened for dark
-    link_hover=ColorScale(212, 100, 65),               # Lighter blue
-    code=ColorScale(0, 0, 7),                          # Near-black code bg
-    code_foreground=ColorScale(0, 0, 92),              # Light code text
-    selection=ColorScale(212, 80, 25),                 # Deep blue selection
-    selection_foreground=ColorScale(0, 0, 98),
-    brand=ColorScale(212, 100, 48),                    # Same blue — works on black
-    brand_foreground=ColorScale(0, 0, 100),
-    border=ColorScale(0, 0, 20),                       # #333 — dark hairline
-    input=ColorScale(0, 0, 20),
-    ring=ColorScale(212, 100, 48),                     # Blue focus ring
-    surface_1=ColorScale(0, 0, 0),                     # Pure black
-    surface_2=ColorScale(0, 0, 4),                     # Near-black
-    surface_3=ColorScale(0, 0, 7),                     # Slightly elevated
+    background=ColorScale.of(0, 0, 0),                    # Pure black
+    foreground=ColorScale.of(0, 0, 98),                   # #FAFAFA — near-white
+    card=ColorScale.of(0, 0, 7),                          # Very dark card
+    card_foreground=ColorScale.of(0, 0, 98),
+    popover=ColorScale.of(0, 0, 7),
+    popover_foreground=ColorScale.of(0, 0, 98),
+    primary=ColorScale.of(212, 100, 48),                  # Same blue — pure on black
+    primary_foreground=ColorScale.of(0, 0, 100),
+    secondary=ColorScale.of(0, 0, 10),                    # Near-black panel
+    secondary_foreground=ColorScale.of(0, 0, 98),
+    muted=ColorScale.of(0, 0, 14),                        # Dark muted
+    muted_foreground=ColorScale.of(0, 0, 63),             # Mid gray text
+    accent=ColorScale.of(0, 0, 10),                       # Dark hover
+    accent_foreground=ColorScale.of(0, 0, 98),
+    destructive=ColorScale.of(0, 100, 52),                # Red — slightly brightened
+    destructive_foreground=ColorScale.of(0, 0, 100),
+    success=ColorScale.of(143, 70, 50),                   # Green — brightened
+    success_foreground=ColorScale.of(0, 0, 100),
+    warning=ColorScale.of(37, 100, 55),                   # Amber — brightened
+    warning_foreground=ColorScale.of(0, 0, 0),
+    info=ColorScale.of(212, 100, 48),                     # Blue
+    info_foreground=ColorScale.of(0, 0, 100),
+    link=ColorScale.of(212, 100, 55),                     # Blue — brightened for dark
+    link_hover=ColorScale.of(212, 100, 65),               # Lighter blue
+    code=ColorScale.of(0, 0, 7),                          # Near-black code bg
+    code_foreground=ColorScale.of(0, 0, 92),              # Light code text
+    selection=ColorScale.of(212, 80, 25),                 # Deep blue selection
+    selection_foreground=ColorScale.of(0, 0, 98),
+    brand=ColorScale.of(212, 100, 48),                    # Same blue — works on black
+    brand_foreground=ColorScale.of(0, 0, 100),
+    border=ColorScale.of(0, 0, 20),                       # #333 — dark hairline
+    input=ColorScale.of(0, 0, 20),
+    ring=ColorScale.of(212, 100, 48),                     # Blue focus ring
+    surface_1=ColorScale.of(0, 0, 0),                     # Pure black
+    surface_2=ColorScale.of(0, 0, 4),                     # Near-black
+    surface_3=ColorScale.of(0, 0, 7),                     # Slightly elevated
 )
 
 PRESET = ThemePreset(
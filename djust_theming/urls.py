@@ -6,6 +6,11 @@ app_name = "djust_theming"
 
 urlpatterns = [
     path("theme.css", views.theme_css_view, name="theme_css"),
+    path(
+        "css/<str:theme>/<str:preset>/<str:version>.css",
+        views.versioned_theme_css_view,
+        name="versioned_theme_css",
+    ),
     path("deferred.css", views.deferred_theme_css_view, name="deferred_theme_css"),
     path("gallery/", include("djust_theming.gallery.urls")),
 ]
@@ -1,14 +1,66 @@
-from django.http import HttpResponse
+import gzip
+import re
+from functools import lru_cache
+
+from django.http import Http404, HttpResponse
 from django.views.decorators.cache import cache_control
 from django.views.decorators.http import etag
-from django.utils.cache import patch_vary_headers
+from django.utils.cache import patch_cache_control, quote_etag
 
 from .manager import (
+    ThemeState,
     generate_css_for_state,
     generate_deferred_css_for_state,
     get_css_prefix,
+    get_css_version,
+    get_theme_config,
     get_theme_manager,
 )
+from .registry import get_registry
+
+# One year; versioned URLs change whenever the generated CSS changes.
+VERSIONED_CSS_MAX_AGE = 31536000
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+@lru_cache(maxsize=64)
+def _encoded_css(css: str) -> bytes:
+    """UTF-8 bytes of generated CSS, encoded once per distinct string."""
+    return css.encode()
+
+
+@lru_cache(maxsize=64)
+def _gzip_css(css: str) -> bytes:
+    """Gzip generated CSS once per distinct string (mtime=0 keeps it stable)."""
+    return gzip.compress(_encoded_css(css), mtime=0)
+
+
+def _css_response(request, css, etag_value, vary=()):
+    """Build a text/css response, pre-gzipped when ``gzip_css`` is enabled.
+
+    The compressed bytes are cached alongside the generated CSS, so
+    GZipMiddleware (which skips responses that already carry a
+    Content-Encoding) no longer recompresses the same stylesheet per request.
+    As GZipMiddleware does, the ETag is weakened for the encoded variant.
+
+    The response is new, so ``vary`` is written to the Vary header directly
+    rather than merged through ``patch_vary_headers``.
+    """
+    if get_theme_config().get("gzip_css") and _ACCEPTS_GZIP.search(
+        request.META.get("HTTP_ACCEPT_ENCODING", "")
+    ):
+        body = _gzip_css(css)
+        response = HttpResponse(body, content_type="text/css")
+        response["Content-Encoding"] = "gzip"
+        response["Content-Length"] = str(len(body))
+        response["ETag"] = "W/" + quote_etag(etag_value)
+        vary = (*vary, "Accept-Encoding")
+    else:
+        response = HttpResponse(_encoded_css(css), content_type="text/css")
+    if vary:
+        response["Vary"] = ", ".join(vary)
+    return response
 
 
 def _generate_css_content(request):
@@ -19,10 +71,13 @@ def _generate_css_content(request):
 
 
 def _css_etag(request, *args, **kwargs):
-    """Generate ETag based on theme state."""
-    manager = get_theme_manager(request)
-    state = manager.get_state()
-    return f"{state.theme}-{state.preset}-{state.mode}-{state.pack}"
+    """ETag from the content hash of the generated CSS.
+
+    Unlike a theme-state string, it changes when the CSS itself changes
+    (config, theme definitions, a deploy) and is shared by states that
+    produce identical CSS. Both the CSS and its hash are cached.
+    """
+    return get_css_version(_generate_css_content(request))
 
 
 @cache_control(max_age=3600, private=True)  # Cache for 1 hour, private (vary by user)
@@ -36,16 +91,19 @@ def theme_css_view(request):
     while respecting user-specific theme settings.
     """
     css = _generate_css_content(request)
-    response = HttpResponse(css, content_type="text/css")
-    patch_vary_headers(response, ["Cookie"])
+    response = _css_response(request, css, get_css_version(css), vary=("Cookie",))
     return response
 
 
+def _deferred_css_content(request):
+    """Generate the deferred CSS content based on the request."""
+    state = get_theme_manager(request).get_state()
+    return generate_deferred_css_for_state(state, css_prefix=get_css_prefix())
+
+
 def _deferred_css_etag(request, *args, **kwargs):
-    """Generate ETag for deferred CSS based on theme state."""
-    manager = get_theme_manager(request)
-    state = manager.get_state()
-    return f"deferred-{state.theme}-{state.preset}-{state.mode}-{state.pack}"
+    """ETag from the content hash of the deferred CSS (see :func:`_css_etag`)."""
+    return get_css_version(_deferred_css_content(request))
 
 
 @cache_control(max_age=3600, private=True)
@@ -58,9 +116,53 @@ def deferred_theme_css_view(request):
     when the ``critical_css`` config option is enabled. Contains styles
     that are not needed for first paint.
     """
-    manager = get_theme_manager(request)
-    state = manager.get_state()
-    css = generate_deferred_css_for_state(state, css_prefix=get_css_prefix())
-    response = HttpResponse(css, content_type="text/css")
-    patch_vary_headers(response, ["Cookie"])
+    css = _deferred_css_content(request)
+    response = _css_response(request, css, get_css_version(css), vary=("Cookie",))
+    return response
+
+
+def _versioned_css_content(request, theme, preset):
+    """Generate CSS for the theme/preset (and optional ``pk`` pack) in the URL."""
+    registry = get_registry()
+    if not registry.has_theme(theme) or not registry.has_preset(preset):
+        raise Http404("Unknown theme or preset")
+    pack = request.GET.get("pk") or None
+    if pack is not None and not registry.has_pack(pack):
+        # Unknown packs would otherwise be ignored yet still served as a
+        # public, cacheable URL of its own.
+        raise Http404("Unknown theme pack")
+    state = ThemeState(
+        theme=theme,
+        preset=preset,
+        mode="light",
+        resolved_mode="light",
+        pack=pack,
+    )
+    return generate_css_for_state(state, css_prefix=get_css_prefix())
+
+
+def _versioned_css_etag(request, theme, preset, version):
+    """ETag for versioned CSS: the content hash."""
+    return get_css_version(_versioned_css_content(request, theme, preset))
+
+
+@etag(_versioned_css_etag)
+def versioned_theme_css_view(request, theme, preset, version):
+    """
+    Serve theme CSS from a content-versioned URL.
+
+    Unlike :func:`theme_css_view`, the theme and preset come from the URL
+    rather than the visitor's cookies, so the response is public and the
+    same for every visitor. When ``version`` matches the current content
+    hash it is marked immutable and cached for a year; a stale version
+    (e.g. after a deploy) is served with the regular one-hour lifetime.
+    """
+    css = _versioned_css_content(request, theme, preset)
+    response = _css_response(request, css, get_css_version(css))
+    if version == get_css_version(css):
+        patch_cache_control(
+            response, public=True, max_age=VERSIONED_CSS_MAX_AGE, immutable=True
+        )
+    else:
+        patch_cache_control(response, public=True, max_age=3600)
     return response
@@ -5,6 +5,7 @@ Django management command to build static theme files.
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 import os
+from pathlib import Path
 
 try:
     from djust_theming.build_themes import build_themes
@@ -40,6 +41,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip manifest.json generation'
         )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=1,
+            help='Worker processes for theme generation (default: 1 = serial, 0 = CPU count)'
+        )
         parser.add_argument(
             '--verbose',
             action='store_true',
@@ -50,22 +57,24 @@ class Command(BaseCommand):
         """Execute the build command."""
         
         # Get options
-        output_dir = options['output_dir']
+        output_dir = Path(options['output_dir'])
         minify = not options['no_minify']
         source_maps = options['source_maps']
         manifest = not options['no_manifest']
+        processes = options['processes'] or None
         verbose = options['verbose']
 
         # Make output directory relative to Django project if not absolute
-        if not os.path.isabs(output_dir):
-            base_dir = getattr(settings, 'BASE_DIR', os.getcwd())
-            output_dir = os.path.join(base_dir, output_dir)
+        if not output_dir.is_absolute():
+            output_dir = Path(getattr(settings, 'BASE_DIR', os.getcwd())) / output_dir
 
         if verbose:
-            self.stdout.write(f"Building themes to: {output_dir}")
-            self.stdout.write(f"Minify: {minify}")
-            self.stdout.write(f"Source maps: {source_maps}")
-            self.stdout.write(f"Manifest: {manifest}")
+            self.stdout.write("\n".join([
+                f"Building themes to: {output_dir}",
+                f"Minify: {minify}",
+                f"Source maps: {source_maps}",
+                f"Manifest: {manifest}",
+            ]))
 
         try:
             # Run the build process
@@ -73,30 +82,32 @@ class Command(BaseCommand):
                 output_dir=output_dir,
                 minify=minify,
                 source_maps=source_maps,
-                manifest=manifest
+                manifest=manifest,
+                processes=processes
             )
 
-            # Report results
-            self.stdout.write(
-                self.style.SUCCESS(f"✅ Theme build completed successfully!")
-            )
+            # Report results, buffered into a single write
+            lines = [self.style.SUCCESS(f"✅ Theme build completed successfully!")]
             
             if verbose:
-                self.stdout.write("Generated artifacts:")
+                lines.append("Generated artifacts:")
                 for artifact_type, paths in artifacts.items():
                     if isinstance(paths, list):
-                        self.stdout.write(f"  {artifact_type}: {len(paths)} files")
+                        lines.append(f"  {artifact_type}: {len(paths)} files")
                     else:
-                        self.stdout.write(f"  {artifact_type}: {os.path.basename(paths)}")
+                        lines.append(f"  {artifact_type}: {os.path.basename(paths)}")
 
             # Usage instructions
-            self.stdout.write("\n📖 Usage Instructions:")
-            self.stdout.write("1. Include the bundle in your HTML:")
-            self.stdout.write('   <link rel="stylesheet" href="/static/themes/djust-theming-bundle.min.css">')
-            self.stdout.write('   <script src="/static/themes/djust-theme-switcher.min.js"></script>')
-            self.stdout.write("\n2. Switch themes with JavaScript:")
-            self.stdout.write("   djustTheme.setTheme('brutalist', 'ocean')")
-            self.stdout.write("   djustTheme.setThemeByName('elegant-sunset')")
+            lines.extend([
+                "\n📖 Usage Instructions:",
+                "1. Include the bundle in your HTML:",
+                '   <link rel="stylesheet" href="/static/themes/djust-theming-bundle.min.css">',
+                '   <script src="/static/themes/djust-theme-switcher.min.js"></script>',
+                "\n2. Switch themes with JavaScript:",
+                "   djustTheme.setTheme('brutalist', 'ocean')",
+                "   djustTheme.setThemeByName('elegant-sunset')",
+            ])
+            self.stdout.write("\n".join(lines))
             
         except Exception as e:
             raise CommandError(f"Theme build failed: {str(e)}")
@@ -1,9 +1,23 @@
-from django.urls import path
-from django.views.generic import RedirectView
+from functools import lru_cache
+
+from django.http import HttpResponsePermanentRedirect
+from django.urls import path, reverse
 from . import views
 
 app_name = 'theme_demo'
 
+
+@lru_cache(maxsize=None)
+def _reverse(pattern_name):
+    return reverse(pattern_name)
+
+
+def _permanent_redirect(pattern_name):
+    """Permanent redirect whose target URL is reversed once, on first use."""
+    def view(request, *args, **kwargs):
+        return HttpResponsePermanentRedirect(_reverse(pattern_name))
+    return view
+
 urlpatterns = [
     # Primary pages
     path('', views.index, name='index'),
@@ -25,11 +39,11 @@ urlpatterns = [
     path('theme-css-api/', views.theme_css_api, name='css_api'),
 
     # Redirects for old URLs
-    path('design-systems/', RedirectView.as_view(pattern_name='theme_demo:themes', permanent=True)),
-    path('presets/', RedirectView.as_view(pattern_name='theme_demo:themes', permanent=True)),
-    path('tailwind/', RedirectView.as_view(pattern_name='theme_demo:index', permanent=True)),
-    path('forms/', RedirectView.as_view(pattern_name='theme_demo:components', permanent=True)),
-    path('layouts/', RedirectView.as_view(pattern_name='theme_demo:docs', permanent=True)),
-    path('pages/', RedirectView.as_view(pattern_name='theme_demo:docs', permanent=True)),
-    path('djust-components/', RedirectView.as_view(pattern_name='theme_demo:components', permanent=True)),
+    path('design-systems/', _permanent_redirect('theme_demo:themes')),
+    path('presets/', _permanent_redirect('theme_demo:themes')),
+    path('tailwind/', _permanent_redirect('theme_demo:index')),
+    path('forms/', _permanent_redirect('theme_demo:components')),
+    path('layouts/', _permanent_redirect('theme_demo:docs')),
+    path('pages/', _permanent_redirect('theme_demo:docs')),
+    path('djust-components/', _permanent_redirect('theme_demo:components')),
 ]
@@ -1,14 +1,86 @@
 """
 Demo views showcasing djust-theming features across Phases 1-9.
 """
+from functools import lru_cache
+
 from django import forms
 from django.shortcuts import render
-from djust_theming.presets import THEME_PRESETS
-from djust_theming.theme_packs import get_all_theme_packs, get_all_design_systems
-from djust_theming.manager import ThemeManager, get_theme_manager
+from djust_theming.design_system_css import generate_design_system_css
+from djust_theming.gallery.component_registry import COMPONENT_CATEGORIES
+from djust_theming.presets import THEME_PRESETS, list_presets
+from djust_theming.theme_packs import design_systems_view, theme_packs_view
+from djust_theming.manager import get_theme_manager
+from djust_theming.registry import get_registry
 from djust_theming.inspector import theme_inspector_view, theme_inspector_api, theme_css_api
 
 
+def _preset_swatches():
+    """Name, display name and primary swatches for every preset.
+
+    Each call gets its own row dicts, so a view can't leak edits into
+    later requests.
+    """
+    return [dict(row) for row in _cached_preset_swatches(get_registry().generation)]
+
+
+@lru_cache(maxsize=1)
+def _cached_preset_swatches(generation):
+    """Swatch rows, rebuilt once per registry generation."""
+    return tuple(
+        {
+            'name': name,
+            'display_name': preset.display_name,
+            'light_primary': preset.light.primary.to_hsl_func(),
+            'dark_primary': preset.dark.primary.to_hsl_func(),
+        }
+        for name, preset in THEME_PRESETS.items()
+    )
+
+
+@lru_cache(maxsize=8)
+def _design_summaries(names):
+    """Per-design-system summary rows, rebuilt only when the set of names changes."""
+    designs = design_systems_view()
+    design_list = []
+    for name in names:
+        design = designs[name]
+        design_list.append({
+            'name': name,
+            'display_name': design.display_name,
+            'description': design.description,
+            'category': design.category,
+            'typography_name': design.typography.name,
+            'layout_name': design.layout.name,
+            'surface_name': design.surface.name,
+            'icon_style': design.icons.style,
+            'animation_name': design.animation.name,
+            'interaction_name': design.interaction.name,
+        })
+    return tuple(design_list)
+
+
+@lru_cache(maxsize=8)
+def _pack_summaries(names):
+    """Per-pack summary rows, rebuilt only when the set of names changes."""
+    packs = theme_packs_view()
+    pack_list = []
+    for name in names:
+        pack = packs[name]
+        pack_list.append({
+            'name': name,
+            'display_name': pack.display_name,
+            'description': pack.description,
+            'category': pack.category,
+            'design_theme': pack.design_theme,
+            'color_preset': pack.color_preset,
+            'icon_style': pack.icon_style.style,
+            'animation_style': pack.animation_style.name,
+            'pattern_style': pack.pattern_style.background_pattern,
+            'surface_style': pack.pattern_style.surface_style,
+        })
+    return tuple(pack_list)
+
+
 def index(request):
     """Homepage with overview of features."""
     return render(request, 'theme_demo/index.html', {
@@ -18,7 +90,6 @@ def index(request):
 
 def components(request):
     """Showcase all theme components — 24 template-tag components plus category overview."""
-    from djust_theming.gallery.component_registry import COMPONENT_CATEGORIES
     category_overview = [
         {'name': cat, 'components': comps, 'count': len(comps)}
         for cat, comps in COMPONENT_CATEGORIES.items()
@@ -105,18 +176,9 @@ def components(request):
 
 def presets(request):
     """Show all 19 available theme presets."""
-    preset_list = []
-    for name, preset in THEME_PRESETS.items():
-        preset_list.append({
-            'name': name,
-            'display_name': preset.display_name,
-            'light_primary': preset.light.primary.to_hsl_func(),
-            'dark_primary': preset.dark.primary.to_hsl_func(),
-        })
-
     return render(request, 'theme_demo/presets.html', {
         'title': 'Theme Presets',
-        'presets': preset_list,
+        'presets': _preset_swatches(),
     })
 
 
@@ -132,37 +194,16 @@ def design_systems(request):
     manager = get_theme_manager(request)
     theme_state = manager.get_state()
 
-    design_list = []
-    for name, design in get_all_design_systems().items():
-        design_list.append({
-            'name': name,
-            'display_name': design.display_name,
-            'description': design.description,
-            'category': design.category,
-            'typography_name': design.typography.name,
-            'layout_name': design.layout.name,
-            'surface_name': design.surface.name,
-            'icon_style': design.icons.style,
-            'animation_name': design.animation.name,
-            'interaction_name': design.interaction.name,
-        })
+    design_list = _design_summaries(tuple(design_systems_view()))
 
     # Get available color presets for selection
-    color_list = []
-    for name, preset in THEME_PRESETS.items():
-        color_list.append({
-            'name': name,
-            'display_name': preset.display_name,
-            'light_primary': preset.light.primary.to_hsl_func(),
-            'dark_primary': preset.dark.primary.to_hsl_func(),
-        })
+    color_list = _preset_swatches()
 
     # Get current design system and color from request or defaults
     current_design = request.GET.get('design', 'minimalist')
     current_color = request.GET.get('color', 'default')
 
-    # Generate CSS for current combination
-    from djust_theming.design_system_css import generate_design_system_css
+    # Generate CSS for current combination (cached by design/color)
     current_css = generate_design_system_css(current_design, current_color)
 
     return render(request, 'theme_demo/design_systems.html', {
@@ -181,20 +222,7 @@ def packs(request):
     manager = get_theme_manager(request)
     theme_state = manager.get_state()
 
-    pack_list = []
-    for name, pack in get_all_theme_packs().items():
-        pack_list.append({
-            'name': name,
-            'display_name': pack.display_name,
-            'description': pack.description,
-            'category': pack.category,
-            'design_theme': pack.design_theme,
-            'color_preset': pack.color_preset,
-            'icon_style': pack.icon_style.style,
-            'animation_style': pack.animation_style.name,
-            'pattern_style': pack.pattern_style.background_pattern,
-            'surface_style': pack.pattern_style.surface_style,
-        })
+    pack_list = _pack_summaries(tuple(theme_packs_view()))
 
     return render(request, 'theme_demo/packs.html', {
         'title': 'Theme Packs',
@@ -343,8 +371,6 @@ def djust_components_demo(request):
 
 def themes(request):
     """Themes page — design systems + color presets combined."""
-    from djust_theming.presets import list_presets, THEME_PRESETS
-    from djust_theming.theme_packs import get_all_design_systems
 
     # Add color swatch data to presets
     presets_with_colors = []
@@ -356,7 +382,7 @@ def themes(request):
             'dark_primary': preset_obj.dark.primary.to_hsl_func() if preset_obj else None,
         })
 
-    design_systems = get_all_design_systems()
+    design_systems = design_systems_view()
     combination_count = len(presets_with_colors) * len(design_systems)
 
     return render(request, 'theme_demo/themes.html', {
@@ -371,15 +397,14 @@ def themes(request):
 
 def docs(request):
     """Documentation page — getting started, layouts, pages."""
-    from djust_theming.presets import list_presets
-    from djust_theming.theme_packs import get_all_design_systems
-    from djust_theming.gallery.component_registry import COMPONENT_CATEGORIES
+    preset_count = len(list_presets())
+    design_system_count = len(design_systems_view())
     return render(request, 'theme_demo/docs.html', {
         'title': 'Documentation',
-        'preset_count': len(list_presets()),
-        'design_system_count': len(get_all_design_systems()),
+        'preset_count': preset_count,
+        'design_system_count': design_system_count,
         'component_count': sum(len(c) for c in COMPONENT_CATEGORIES.values()),
-        'combination_count': len(list_presets()) * len(get_all_design_systems()),
+        'combination_count': preset_count * design_system_count,
     })
 
 
@@ -392,10 +417,9 @@ def integration(request):
 
 def customize(request):
     """Customization guide — presets, design systems, token overrides, custom themes."""
-    from djust_theming.theme_packs import get_all_theme_packs
     pack_list = [
         (name, pack.description)
-        for name, pack in get_all_theme_packs().items()
+        for name, pack in theme_packs_view().items()
     ]
     return render(request, 'theme_demo/customize.html', {
         'title': 'Customize',
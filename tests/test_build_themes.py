@@ -0,0 +1,61 @@
+"""
+Tests for build-time theme generation (djust_theming.build_themes).
+"""
+
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+
+from tests.conftest import *  # noqa: F401,F403  — ensure Django is configured
+
+from djust_theming import build_themes as build_module
+from djust_theming.build_themes import BuildTimeGenerator
+from djust_theming.presets import THEME_PRESETS
+from djust_theming.theme_css_generator import minify_css
+from djust_theming.theme_packs import design_systems_view
+
+
+@pytest.fixture
+def few_combinations():
+    """Limit the build to a 2 x 2 grid of design systems and presets."""
+    designs = dict(list(design_systems_view().items())[:2])
+    presets = {name: THEME_PRESETS[name] for name in ("default", "blue")}
+    with patch.object(build_module, "design_systems_view", lambda: designs), \
+            patch.object(build_module, "THEME_PRESETS", presets):
+        yield
+
+
+def _build(output_dir, processes):
+    generator = BuildTimeGenerator(
+        output_dir=output_dir, generate_manifest=False, processes=processes
+    )
+    return {
+        filename: (output_dir / filename).read_bytes()
+        for filename, _ in generator.generate_individual_themes()
+    }
+
+
+class TestGenerateIndividualThemes:
+
+    def test_serial_by_default(self, tmp_path):
+        assert BuildTimeGenerator(output_dir=tmp_path).processes == 1
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="process pool requires the fork start method",
+    )
+    def test_pool_output_matches_serial(self, tmp_path, few_combinations):
+        serial = _build(tmp_path / "serial", processes=1)
+        pooled = _build(tmp_path / "pooled", processes=2)
+        assert len(serial) == 4
+        assert pooled == serial
+
+    def test_uses_shared_minifier(self, tmp_path, few_combinations):
+        files = _build(tmp_path, processes=1)
+        name = next(iter(files))
+        design, preset = name[: -len(".min.css")].split("-", 1)
+        expected = minify_css(
+            build_module.generate_design_system_css(design, preset)
+        )
+        assert files[name].decode() == expected
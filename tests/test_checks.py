@@ -387,5 +387,61 @@ class TestCheckDesignSystemValid:
         assert "material" in errors[0].hint
 
 
+
+class TestCheckCachedTemplateLoader:
+    """Tests for W003: explicit loaders without cached.Loader."""
+
+    def _check(self, loaders, debug=False):
+        from djust_theming.checks import check_cached_template_loader
+
+        templates = [{
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {"loaders": loaders} if loaders is not None else {},
+        }]
+        with patch.object(settings, "TEMPLATES", templates), \
+                patch.object(settings, "DEBUG", debug):
+            return check_cached_template_loader(app_configs=None)
+
+    def test_w003_fires_for_uncached_loaders(self):
+        errors = self._check(["django.template.loaders.app_directories.Loader"])
+        assert [e.id for e in errors] == ["djust_theming.W003"]
+
+    def test_w003_passes_for_wrapped_loaders(self):
+        errors = self._check([(
+            "django.template.loaders.cached.Loader",
+            ["django.template.loaders.app_directories.Loader"],
+        )])
+        assert errors == []
+
+    def test_w003_passes_for_default_loaders_and_debug(self):
+        assert self._check(None) == []
+        assert self._check(["django.template.loaders.app_directories.Loader"], debug=True) == []
+
+
+
+class TestCheckDesignSystemAnimationValues:
+    """Tests for W004: unrecognised animation effects in design systems."""
+
+    def test_w004_passes_for_builtin_design_systems(self):
+        from djust_theming.checks import check_design_system_animation_values
+
+        assert check_design_system_animation_values(app_configs=None) == []
+
+    def test_w004_fires_for_unknown_effect(self):
+        from dataclasses import replace
+
+        from djust_theming.checks import check_design_system_animation_values
+        from djust_theming.theme_packs import DESIGN_MATERIAL
+
+        ds = replace(
+            DESIGN_MATERIAL,
+            animation=replace(DESIGN_MATERIAL.animation, entrance_effect="fdae"),
+        )
+        with patch("djust_theming.checks.get_registry") as mock_reg:
+            mock_reg.return_value.list_themes.return_value = {"custom": ds}
+            warnings = check_design_system_animation_values(app_configs=None)
+        assert [w.id for w in warnings] == ["djust_theming.W004"]
+        assert "fdae" in warnings[0].msg
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,40 @@
+"""
+Tests for the `djust_theme collect-css` management command.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from tests.conftest import *  # noqa: F401,F403  — ensure Django is configured
+
+from djust_theming.theme_css_generator import generate_theme_css
+
+
+def _call_collect(*args):
+    out = StringIO()
+    call_command("djust_theme", "collect-css", *args, stdout=out)
+    return out.getvalue()
+
+
+class TestCollectCSS:
+
+    def test_writes_configured_preset(self, tmp_path):
+        _call_collect("--output-dir", str(tmp_path))
+        path = tmp_path / "material-default.css"
+        assert path.read_text() == generate_theme_css("material", "default", "")
+
+    def test_writes_requested_presets(self, tmp_path):
+        output = _call_collect(
+            "--theme", "material", "--preset", "blue", "--preset", "dracula",
+            "--output-dir", str(tmp_path),
+        )
+        assert (tmp_path / "material-blue.css").exists()
+        assert (tmp_path / "material-dracula.css").exists()
+        assert "Wrote 2 theme stylesheet(s)" in output
+
+    def test_unknown_preset_raises(self, tmp_path):
+        with pytest.raises(CommandError, match="Unknown preset"):
+            _call_collect("--preset", "nope", "--output-dir", str(tmp_path))
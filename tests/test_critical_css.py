@@ -12,7 +12,7 @@ urlpatterns = [
 ]
 
 from djust_theming.css_generator import ThemeCSSGenerator
-from djust_theming.theme_css_generator import CompleteThemeCSSGenerator
+from djust_theming.theme_css_generator import CompleteThemeCSSGenerator, get_design_css
 from djust_theming.manager import (
     ThemeState,
     generate_critical_css_for_state,
@@ -129,6 +129,30 @@ class TestThemeCSSGeneratorCriticalSplit:
 # CompleteThemeCSSGenerator critical/deferred split
 # ---------------------------------------------------------------------------
 
+class TestRenderThemeCSS:
+    """render_theme_css is the preset's :root color block without selectors."""
+
+    def test_matches_generator_root_block(self):
+        from djust_theming.css_generator import render_theme_css
+        from djust_theming.presets import get_preset
+
+        block = render_theme_css("default", "light")
+        generator = ThemeCSSGenerator(preset_name="default")
+        indented = "\n".join(f"  {line}" for line in block.splitlines())
+        assert generator._tokens_to_css_vars(get_preset("default").light) == indented
+
+    def test_pins_output(self):
+        from djust_theming.css_generator import render_theme_css
+        from djust_theming.presets import get_preset
+
+        tokens = get_preset("default").dark
+        lines = render_theme_css("default", "dark").splitlines()
+        assert lines[0] == f"--background: {tokens.background.to_hsl()};"
+        assert f"--primary-foreground: {tokens.primary_foreground.to_hsl()};" in lines
+        assert f"--sidebar-primary: {tokens.primary.to_hsl()};" in lines
+        assert render_theme_css("default", "unknown") == render_theme_css("default", "light")
+
+
 class TestCompleteThemeCSSGeneratorCriticalSplit:
     """CompleteThemeCSSGenerator.generate_critical_css() vs generate_deferred_css()."""
 
@@ -172,6 +196,19 @@ class TestCompleteThemeCSSGeneratorCriticalSplit:
         assert "--primary:" not in css
         assert "--font-sans:" not in css
 
+    def test_theme_vars_shared_across_presets(self):
+        other = CompleteThemeCSSGenerator(theme_name="material", color_preset="blue")
+        assert other._generate_theme_vars() is self.gen._generate_theme_vars()
+
+    def test_get_design_css(self):
+        css = get_design_css("material")
+        assert css.startswith(":root {")
+        assert css is self.gen._generate_theme_vars()
+
+    def test_get_design_css_unknown(self):
+        with pytest.raises(ValueError):
+            get_design_css("nonexistent")
+
 
 # ---------------------------------------------------------------------------
 # Manager-level functions
@@ -211,6 +248,64 @@ class TestManagerCriticalDeferredFunctions:
         # Critical CSS should still work with prefix
         assert "--primary:" in css
 
+    def test_critical_and_deferred_are_cached(self):
+        from djust_theming.cache import clear_css_cache
+
+        clear_css_cache()
+        assert generate_critical_css_for_state(self.state) is generate_critical_css_for_state(self.state)
+        assert generate_deferred_css_for_state(self.state) is generate_deferred_css_for_state(self.state)
+
+    def test_css_caches_cleared_when_config_changes(self):
+        from djust_theming.theme_css_generator import generate_theme_critical_css
+
+        generate_critical_css_for_state(self.state)
+        assert generate_theme_critical_css.cache_info().currsize > 0
+        with override_settings(LIVEVIEW_CONFIG={"theme": {"critical_css": False}}):
+            assert generate_theme_critical_css.cache_info().currsize == 0
+
+    def test_warm_css_cache_fills_default_entries(self):
+        from djust_theming.cache import clear_css_cache, warm_css_cache
+        from djust_theming.theme_css_generator import (
+            generate_theme_critical_css,
+            generate_theme_css,
+            generate_theme_deferred_css,
+        )
+
+        clear_css_cache()
+        warm_css_cache()
+        for fn in (generate_theme_css, generate_theme_critical_css, generate_theme_deferred_css):
+            assert fn.cache_info().currsize == 1
+        before = generate_theme_critical_css.cache_info().hits
+        generate_critical_css_for_state(self.state)
+        assert generate_theme_critical_css.cache_info().hits == before + 1
+
+    def test_minify_css_option(self):
+        full = generate_critical_css_for_state(self.state)
+        with override_settings(LIVEVIEW_CONFIG={"theme": {"minify_css": True}}):
+            minified = generate_critical_css_for_state(self.state)
+        assert len(minified) < len(full)
+        assert "/*" not in minified
+        assert "\n" not in minified
+        assert "--primary:" in minified
+
+    def test_minify_css_option_applies_to_packs(self):
+        from djust_theming.manager import generate_css_for_state
+
+        state = ThemeState(
+            theme="material", preset="default", mode="light",
+            resolved_mode="light", pack="corporate",
+        )
+        with override_settings(LIVEVIEW_CONFIG={"theme": {"minify_css": True}}):
+            outputs = (
+                generate_css_for_state(state),
+                generate_critical_css_for_state(state),
+                generate_deferred_css_for_state(state),
+            )
+        for css in outputs:
+            assert css
+            assert "\n" not in css
+            assert "/*" not in css
+
 
 # ---------------------------------------------------------------------------
 # Config default
@@ -254,6 +349,15 @@ class TestDeferredCSSView(TestCase):
         response = client.get("/djust-theming/deferred.css")
         assert "max-age" in response.get("Cache-Control", "")
 
+    def test_deferred_css_etag_is_content_hash(self):
+        from django.test import Client
+        from djust_theming.manager import get_css_version
+        client = Client()
+        response = client.get("/djust-theming/deferred.css")
+        assert response["ETag"] == f'"{get_css_version(response.content.decode())}"'
+        cached = client.get("/djust-theming/deferred.css", HTTP_IF_NONE_MATCH=response["ETag"])
+        assert cached.status_code == 304
+
     def test_deferred_css_contains_styles(self):
         from django.test import Client
         client = Client()
@@ -325,3 +429,78 @@ class TestThemeHeadCriticalCSS(TestCase):
         # Deferred CSS link also present
         assert "deferred.css" in html
         assert 'rel="preload"' in html
+
+
+# ---------------------------------------------------------------------------
+# Versioned theme CSS
+# ---------------------------------------------------------------------------
+
+@override_settings(ROOT_URLCONF="tests.test_critical_css")
+class TestVersionedThemeCSS(TestCase):
+    """theme_head link_css=True links a long-cached, content-versioned URL."""
+
+    def _render_theme_head(self):
+        from django.template import Template, Context
+
+        request = RequestFactory().get("/")
+        request.session = {}
+        tpl = Template("{% load theme_tags %}{% theme_head link_css=True %}")
+        return tpl.render(Context({"request": request}))
+
+    def test_link_points_at_versioned_url_served_immutable(self):
+        import re
+        from django.test import Client
+
+        html = self._render_theme_head()
+        href = re.search(r'href="([^"]*/css/[^"]+\.css)"', html).group(1)
+        response = Client().get(href)
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/css"
+        assert "immutable" in response["Cache-Control"]
+        assert "public" in response["Cache-Control"]
+        assert "--primary:" in response.content.decode()
+
+        etag = response["ETag"]
+        cached = Client().get(href, HTTP_IF_NONE_MATCH=etag)
+        assert cached.status_code == 304
+
+    def test_stale_version_is_not_immutable(self):
+        from django.test import Client
+
+        response = Client().get("/djust-theming/css/material/default/stale.css")
+        assert response.status_code == 200
+        assert "immutable" not in response["Cache-Control"]
+
+    def test_unknown_theme_is_404(self):
+        from django.test import Client
+
+        response = Client().get("/djust-theming/css/nope/default/abc.css")
+        assert response.status_code == 404
+
+    def test_unknown_pack_is_404(self):
+        from django.test import Client
+
+        url = "/djust-theming/css/material/default/abc.css"
+        assert Client().get(url, {"pk": "does-not-exist"}).status_code == 404
+        assert Client().get(url, {"pk": "corporate"}).status_code == 200
+
+    @override_settings(LIVEVIEW_CONFIG={"theme": {"gzip_css": True}})
+    def test_gzip_css_serves_precompressed_body(self):
+        import gzip
+        from django.test import Client
+
+        url = "/djust-theming/css/material/default/v.css"
+        response = Client().get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert response["ETag"].startswith("W/")
+        assert "--primary:" in gzip.decompress(response.content).decode()
+
+        cached = Client().get(
+            url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        assert cached.status_code == 304
+
+        plain = Client().get(url)
+        assert not plain.has_header("Content-Encoding")
+        assert "--primary:" in plain.content.decode()
@@ -11,7 +11,12 @@ from django.test import RequestFactory, override_settings
 from django.urls import resolve, reverse
 
 from djust_theming.gallery.views import diff_view, editor_export_view, editor_view
-from djust_theming.gallery.context import serialize_preset, serialize_tokens
+from djust_theming.gallery.context import (
+    serialize_all_presets,
+    serialize_all_presets_json,
+    serialize_preset,
+    serialize_tokens,
+)
 from djust_theming.presets import get_preset, ThemeTokens, ColorScale
 
 
@@ -56,6 +61,10 @@ class TestSerializeTokens:
         assert "background" in result["light"]
         assert "background" in result["dark"]
 
+    def test_serialize_all_presets_json_matches_dumps(self):
+        """serialize_all_presets_json() is byte-identical to json.dumps()."""
+        assert serialize_all_presets_json() == json.dumps(serialize_all_presets())
+
 
 # ---------------------------------------------------------------------------
 # URL resolution
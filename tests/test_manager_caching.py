@@ -40,3 +40,112 @@ class TestGetThemeManager(TestCase):
         m2 = get_theme_manager(None)
         assert isinstance(m1, ThemeManager)
         assert m1 is not m2
+
+    def test_state_resolved_once_and_reset_by_setters(self):
+        request = self.factory.get("/")
+        manager = get_theme_manager(request)
+        request.session = {manager._session_key: {"mode": "light"}}
+        state = manager.get_state()
+        assert manager.get_state() is state
+
+        manager.set_mode("dark")
+        new_state = manager.get_state()
+        assert new_state is not state
+        assert new_state.mode == "dark"
+
+
+class TestVaryOnTheme(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = 0
+
+    def _view(self):
+        from django.http import HttpResponse
+        from djust_theming.cache import vary_on_theme
+
+        @vary_on_theme(60)
+        def view(request):
+            self.calls += 1
+            return HttpResponse(f"render {self.calls}")
+
+        return view
+
+    def test_caches_per_theme_state(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        view = self._view()
+        first = view(self.factory.get("/page/"))
+        again = view(self.factory.get("/page/"))
+        other = view(self.factory.get("/page/", HTTP_COOKIE="djust_theme_preset=nord"))
+
+        assert again.content == first.content
+        assert other.content != first.content
+        assert self.calls == 2
+        assert "Cookie" in first["Vary"]
+
+    def test_post_is_not_cached(self):
+        view = self._view()
+        view(self.factory.post("/page/"))
+        view(self.factory.post("/page/"))
+        assert self.calls == 2
+
+    def test_csrf_token_use_is_not_cached(self):
+        from django.core.cache import cache
+        from django.http import HttpResponse
+        from django.middleware.csrf import get_token
+        from djust_theming.cache import vary_on_theme
+
+        @vary_on_theme(60)
+        def view(request):
+            self.calls += 1
+            return HttpResponse(get_token(request))
+
+        cache.clear()
+        first = view(self.factory.get("/form/"))
+        second = view(self.factory.get("/form/"))
+        assert self.calls == 2
+        assert first.content != second.content
+
+    def test_session_access_is_not_cached(self):
+        from django.contrib.sessions.backends.signed_cookies import SessionStore
+        from django.core.cache import cache
+        from django.http import HttpResponse
+        from djust_theming.cache import vary_on_theme
+
+        @vary_on_theme(60)
+        def view(request):
+            self.calls += 1
+            return HttpResponse(request.session.get("name", "anon"))
+
+        cache.clear()
+        for _ in range(2):
+            request = self.factory.get("/me/")
+            request.session = SessionStore()
+            view(request)
+        assert self.calls == 2
+
+    def test_head_and_get_are_cached_separately(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        view = self._view()
+        view(self.factory.get("/page/"))
+        view(self.factory.head("/page/"))
+        assert self.calls == 2
+
+
+class TestThemeStateTag(TestCase):
+    def test_theme_state_tag_matches_shortcuts(self):
+        from django.template import Context, Template
+
+        request = RequestFactory().get("/", HTTP_COOKIE="djust_theme_preset=nord")
+        html = Template(
+            "{% load theme_tags %}{% theme_state as ts %}"
+            "{{ ts.preset }}|{{ ts.mode }}|{{ ts.resolved_mode }}|"
+            "{% theme_preset %}|{% theme_mode %}|{% theme_resolved_mode %}"
+        ).render(Context({"request": request}))
+        state = get_theme_manager(request).get_state()
+        expected = f"{state.preset}|{state.mode}|{state.resolved_mode}"
+        assert html == f"{expected}|{expected}"
+        assert state.preset == "nord"
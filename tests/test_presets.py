@@ -13,32 +13,27 @@ def test_all_presets_exist():
         assert preset_name in THEME_PRESETS, f"Preset '{preset_name}' not found"
 
 
-def test_preset_structure():
+@pytest.mark.parametrize("name", list(THEME_PRESETS))
+def test_preset_structure(name):
     """Test that each preset has the correct structure."""
-    for name, preset in THEME_PRESETS.items():
-        assert isinstance(preset, ThemePreset), f"Preset '{name}' is not a ThemePreset"
-        assert preset.name == name, f"Preset name mismatch: {preset.name} != {name}"
-        assert preset.display_name, f"Preset '{name}' has no display_name"
-        assert preset.description, f"Preset '{name}' has no description"
-        assert preset.light, f"Preset '{name}' has no light theme"
-        assert preset.dark, f"Preset '{name}' has no dark theme"
+    preset = THEME_PRESETS[name]
+    assert isinstance(preset, ThemePreset), f"Preset '{name}' is not a ThemePreset"
+    assert preset.name == name, f"Preset name mismatch: {preset.name} != {name}"
+    assert preset.display_name, f"Preset '{name}' has no display_name"
+    assert preset.description, f"Preset '{name}' has no description"
+    assert preset.light, f"Preset '{name}' has no light theme"
+    assert preset.dark, f"Preset '{name}' has no dark theme"
 
 
-def test_theme_tokens():
+@pytest.mark.parametrize("mode", ["light", "dark"])
+def test_theme_tokens(mode):
     """Test that theme tokens have valid values."""
-    preset = THEME_PRESETS['default']
-
-    # Test light mode tokens
-    assert preset.light.background is not None
-    assert preset.light.foreground is not None
-    assert preset.light.primary is not None
-    assert preset.light.primary_foreground is not None
+    tokens = getattr(THEME_PRESETS['default'], mode)
 
-    # Test dark mode tokens
-    assert preset.dark.background is not None
-    assert preset.dark.foreground is not None
-    assert preset.dark.primary is not None
-    assert preset.dark.primary_foreground is not None
+    assert tokens.background is not None
+    assert tokens.foreground is not None
+    assert tokens.primary is not None
+    assert tokens.primary_foreground is not None
 
 
 def test_preset_get():
@@ -55,5 +50,103 @@ def test_invalid_preset():
     assert preset is None
 
 
+def test_get_preset_sees_registered_presets():
+    """Test that the get_preset memo is invalidated when THEME_PRESETS changes."""
+    from dataclasses import replace
+    from djust_theming.presets import get_preset, list_presets
+
+    assert get_preset('test_custom').name == 'default'
+    custom = replace(THEME_PRESETS['blue'], name='test_custom')
+    THEME_PRESETS['test_custom'] = custom
+    try:
+        assert get_preset('test_custom') is custom
+        assert 'test_custom' in [p['name'] for p in list_presets()]
+    finally:
+        del THEME_PRESETS['test_custom']
+    assert get_preset('test_custom').name == 'default'
+
+
+def test_theme_presets_is_a_dict():
+    """Test that THEME_PRESETS and the preset constants keep their plain types."""
+    from djust_theming.presets import DEFAULT_THEME, DRACULA_THEME, get_preset
+
+    assert isinstance(THEME_PRESETS, dict)
+    assert type(THEME_PRESETS.copy()) is dict
+    assert THEME_PRESETS['dracula'] is DRACULA_THEME
+    assert get_preset('nonexistent') is DEFAULT_THEME
+
+
+def test_color_scale_interning():
+    """Test that ColorScale.of returns shared instances for equal triples."""
+    from djust_theming.presets import ColorScale
+
+    assert ColorScale.of(0, 0, 100) is ColorScale.of(0, 0, 100)
+    assert ColorScale.of(0, 0, 100) == ColorScale(0, 0, 100)
+    rose_pine = THEME_PRESETS['rose_pine']
+    assert rose_pine.light.background is rose_pine.light.primary_foreground
+
+
+def test_color_scale_fields_exclude_cached_strings():
+    """Test that the precomputed CSS strings are not dataclass fields."""
+    from dataclasses import asdict
+    from djust_theming.presets import ColorScale
+
+    color = ColorScale(210, 50, 40)
+    assert asdict(color) == {'h': 210, 's': 50, 'lightness': 40}
+    assert color.to_hsl_func() == 'hsl(210, 50%, 40%)'
+    assert not hasattr(color, '__dict__')
+
+
+def test_color_scale_packed_round_trip():
+    """Test that packing an HSL triple into one int round-trips."""
+    from djust_theming.presets import ColorScale
+
+    color = ColorScale(343, 76, 68)
+    assert ColorScale.from_packed(color.packed) == color
+    assert ColorScale.from_packed(ColorScale(360, 100, 100).packed) == ColorScale(360, 100, 100)
+    with pytest.raises(ValueError):
+        ColorScale(0, 128, 0).packed
+    with pytest.raises(ValueError):
+        ColorScale(210, 50.5, 40).packed
+
+
+def test_presets_pickle_compactly():
+    """Test that pickled presets reuse interned colors and drop cached values."""
+    import pickle
+
+    preset = THEME_PRESETS['nord']
+    preset.dark.hsl_values  # populate caches
+    restored = pickle.loads(pickle.dumps(preset))
+    assert restored.dark == preset.dark
+    assert restored.dark.background is preset.dark.background
+    assert 'hsl_values' not in vars(restored.dark)
+
+
+def test_theme_preset_is_frozen_and_hashable():
+    """Test that presets are immutable and usable as cache keys."""
+    import dataclasses
+
+    preset = THEME_PRESETS['default']
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        preset.radius = 1.0
+    assert {(preset, 'dark'): 1}[(preset, 'dark')] == 1
+    variant = dataclasses.replace(preset, radius=1.0)
+    assert variant.radius == 1.0 and variant != preset
+    assert dataclasses.replace(preset) == preset
+    assert hash(dataclasses.replace(preset)) == hash(preset)
+
+
+def test_presets_with_extra_css_vars_are_hashable():
+    """Test that dict-valued fields don't break hashing or value equality."""
+    import dataclasses
+
+    preset = dataclasses.replace(
+        THEME_PRESETS['default'], extra_css_vars={'--brand': '#fff'}
+    )
+    assert {preset: 1}[preset] == 1
+    assert preset != THEME_PRESETS['default']
+    assert preset == dataclasses.replace(preset, extra_css_vars={'--brand': '#fff'})
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -111,6 +111,17 @@ class TestRegisterTheme:
         reg = get_registry()
         assert reg.has_theme("nope") is False
 
+    def test_choices_refresh_after_registration(self):
+        from djust_theming.theme_packs import design_system_choices
+
+        reg = get_registry()
+        before = design_system_choices()
+        assert design_system_choices() is before
+        reg.register_theme("zz_custom", object())
+        after = design_system_choices()
+        assert after is not before
+        assert after[-1] == {"name": "zz_custom", "display_name": "Zz Custom"}
+
 
 class TestRegisterManifest:
 
@@ -141,6 +152,15 @@ class TestListAPIs:
         result["c"] = 3
         assert not reg.has_preset("c")
 
+    def test_presets_view_is_live_and_read_only(self):
+        reg = get_registry()
+        view = reg.presets
+        reg.register_preset("a", 1)
+        assert view["a"] == 1
+        assert reg.presets is view
+        with pytest.raises(TypeError):
+            view["b"] = 2
+
     def test_list_themes_returns_copy(self):
         reg = get_registry()
         reg.register_theme("x", 10)
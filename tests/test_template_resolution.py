@@ -134,6 +134,22 @@ class TestFallbackChainOrdering:
         assert candidates[0] == "djust_theming/themes/material/components/button.html"
         assert candidates[1] == "djust_theming/components/button.html"
 
+    def test_resolution_memoized_per_request(self):
+        """Repeated lookups in one request reuse the resolved template."""
+        from django.template.loader import select_template
+
+        request = MagicMock()
+        request.COOKIES = {}
+        request.session = {}
+        request._djust_theme_manager = None
+        with patch.object(settings, "LIVEVIEW_CONFIG", {}, create=True), patch(
+            "djust_theming.template_resolver.select_template", wraps=select_template
+        ) as spy:
+            first = resolve_component_template(request, "button")
+            second = resolve_component_template(request, "button")
+        assert first is second
+        assert spy.call_count == 1
+
     def test_theme_template_chain_has_two_candidates(self):
         """The theme template resolver constructs correct candidate list."""
         from djust_theming.template_resolver import _get_theme_template_candidates